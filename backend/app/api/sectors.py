@@ -0,0 +1,26 @@
+"""
+업종 집계 API
+GET /api/sectors  - 업종별 + 시장 전체 감성점수 (댓글 수 가중)
+"""
+from fastapi import APIRouter
+
+from ..board import get_board
+from ..concurrency import run_in_threadpool
+
+router = APIRouter()
+
+
+def _sector_payload(snapshot) -> dict:
+    from ..board.sectors import get_sector_board  # numpy - 첫 요청 시 로드
+
+    return get_sector_board().for_snapshot(snapshot)
+
+
+@router.get("")
+async def get_sectors():
+    """
+    업종별 / 시장 전체 집계
+    - score: 댓글 수 가중 평균, avg_score: 단순 평균
+    - hot_count/cold_count: 70점 이상 / 30점 이하 종목 수
+    """
+    return await run_in_threadpool(_sector_payload, get_board().snapshot)
@@ -2,17 +2,25 @@
 감성분석 API
 POST /api/sentiment/analyze  - 텍스트 단건 분석
 GET  /api/sentiment/{code}   - 종목 최신 감성 요약
-GET  /api/sentiment/{code}/history - 점수 추이
+GET  /api/sentiment/{code}/history - 점수 추이 (Accept: application/vnd.goksori.columnar 이면 컬럼형 바이너리)
 """
-from fastapi import APIRouter, HTTPException
+from typing import Optional
+
+from fastapi import APIRouter, Header, HTTPException, Query, Response
 from pydantic import BaseModel
-from datetime import datetime, timedelta
-import random
 
-from ..sentiment.analyzer import RuleBasedSentimentAnalyzer, SentimentAggregator
+from ..board import get_board
+from ..board.columnar import MEDIA_TYPE, accepts_columnar, encode_history
+from ..board.payloads import history_payload, stock_row
+from ..cache import SingleFlight
+from ..concurrency import run_in_threadpool
+from ..config import get_settings
+from ..sentiment.loader import get_analyzer
 
 router = APIRouter()
-analyzer = RuleBasedSentimentAnalyzer()
+
+# 같은 종목/기간 추이를 동시에 요청하면 계산 한 번을 함께 기다림
+history_flight = SingleFlight("score_history", grace=get_settings().singleflight_grace_seconds)
 
 
 class AnalyzeRequest(BaseModel):
@@ -24,7 +32,7 @@ async def analyze_text(req: AnalyzeRequest):
     """단일 텍스트 감성분석"""
     if not req.text.strip():
         raise HTTPException(status_code=400, detail="텍스트를 입력해주세요")
-    result = analyzer.analyze(req.text)
+    result = get_analyzer().analyze(req.text)
     return {
         "text": req.text,
         "score": result.score,
@@ -37,13 +45,15 @@ async def analyze_text(req: AnalyzeRequest):
 
 
 @router.get("/{stock_code}/history")
-async def get_score_history(stock_code: str, days: int = 30):
+async def get_score_history(stock_code: str, days: int = Query(30, ge=1, le=365),
+                            accept: Optional[str] = Header(None)):
     """종목 감성점수 추이 (최근 N일)"""
-    random.seed(hash(stock_code) % 10000)
-    base = random.uniform(30, 75)
-    history = []
-    for i in range(days, 0, -1):
-        date = (datetime.now() - timedelta(days=i)).strftime("%Y-%m-%d")
-        score = round(max(10, min(90, base + random.uniform(-12, 12))), 1)
-        history.append({"date": date, "score": score})
+    snapshot = get_board().snapshot
+    row = stock_row(snapshot, stock_code)
+    history = await history_flight.do(
+        (snapshot.generation, stock_code, days),
+        lambda: run_in_threadpool(history_payload, row, days),
+    )
+    if accepts_columnar(accept):
+        return Response(encode_history(stock_code, history), media_type=MEDIA_TYPE)
     return {"stock_code": stock_code, "history": history}
@@ -1,43 +1,51 @@
 """
 공유 API
-GET /api/share/{stock_code} - 카카오톡 공유용 종목 요약 데이터
+GET /api/share/{stock_code}       - 카카오톡 공유용 종목 요약 데이터
+GET /api/share/cards/{filename}   - 공유 카드 이미지 (og_{code}.{hash}.png, 장기 캐시)
 """
-from fastapi import APIRouter
-import random
-from datetime import datetime
+import re
+
+from fastapi import APIRouter, HTTPException
+from fastapi.responses import FileResponse, RedirectResponse
+
+from ..board import get_board
+from ..board.payloads import share_payload, stock_row
+from ..cards import card_key, card_url, get_card_store
+from ..concurrency import run_in_threadpool
 
 router = APIRouter()
 
+CARD_FILENAME = re.compile(r"^og_(?P<code>[0-9A-Za-z]+)(?:\.(?P<key>[0-9a-f]+))?\.png$")
+IMMUTABLE = "public, max-age=31536000, immutable"
+
+
+@router.get("/cards/{filename}")
+async def get_share_card(filename: str):
+    """
+    공유 카드 이미지
+    - 해시가 현재 내용과 같으면 PNG (장기 캐시)
+    - 해시가 없거나 이전 내용이면 현재 카드로 리다이렉트
+    """
+    match = CARD_FILENAME.match(filename)
+    if not match:
+        raise HTTPException(status_code=404, detail="카드를 찾을 수 없습니다")
+
+    store = get_card_store()
+    path = store.path_for(filename)
+    if match["key"] and path.exists():
+        return FileResponse(path, media_type="image/png", headers={"Cache-Control": IMMUTABLE})
+
+    row = get_board().snapshot.get(match["code"])
+    if row is None:
+        raise HTTPException(status_code=404, detail="종목을 찾을 수 없습니다")
+    if match["key"] != card_key(row):
+        return RedirectResponse(card_url(row), status_code=302, headers={"Cache-Control": "no-cache"})
+
+    path = await run_in_threadpool(store.get, row)
+    return FileResponse(path, media_type="image/png", headers={"Cache-Control": IMMUTABLE})
+
 
 @router.get("/{stock_code}")
 async def get_share_data(stock_code: str):
-    """카카오톡 공유용 종목 데이터"""
-    random.seed(hash(stock_code) % 10000)
-    score = round(random.uniform(20, 85), 1)
-    grade = "A" if score >= 80 else "B" if score >= 65 else "C" if score >= 45 else "D" if score >= 30 else "E"
-    emoji = "🔥" if score >= 70 else "📈" if score >= 55 else "😐" if score >= 45 else "📉" if score >= 30 else "💀"
-    trend = "상승" if score > 55 else "하락" if score < 45 else "중립"
-
-    share_text = (
-        f"{emoji} 곡소리 매매법 알림\n"
-        f"종목: {stock_code}\n"
-        f"감성점수: {score}점 ({grade}등급)\n"
-        f"추세: {trend}\n"
-        f"업데이트: {datetime.now().strftime('%m/%d %H:%M')}\n"
-        f"👉 https://goksori.com/stock/{stock_code}"
-    )
-
-    return {
-        "stock_code": stock_code,
-        "score": score,
-        "grade": grade,
-        "emoji": emoji,
-        "trend": trend,
-        "share_text": share_text,
-        "kakao_share": {
-            "title": f"{emoji} {stock_code} 곡소리 감성점수: {score}점",
-            "description": f"등급: {grade} | 추세: {trend} | {datetime.now().strftime('%m/%d %H:%M')} 기준",
-            "link_url": f"https://goksori.com/stock/{stock_code}",
-            "image_url": f"https://goksori.com/static/images/og_{stock_code}.png",
-        },
-    }
+    """카카오톡 공유용 종목 데이터 (목록/상세와 같은 스냅샷 점수)"""
+    return share_payload(stock_row(get_board().snapshot, stock_code))
@@ -0,0 +1,47 @@
+"""
+급변 신호 API
+GET /api/signals         - 최근 신호 (종목/종류/시각 필터)
+GET /api/signals/{code}  - 종목별 최근 신호
+"""
+from datetime import datetime
+from typing import Optional
+
+from fastapi import APIRouter, HTTPException, Query
+
+from ..concurrency import run_in_threadpool
+from ..signals import SIGNAL_KINDS, get_signal_store
+
+router = APIRouter()
+
+
+async def _recent(stock_code: Optional[str], kind: Optional[str], since: Optional[datetime], limit: int) -> dict:
+    if kind is not None and kind not in SIGNAL_KINDS:
+        raise HTTPException(status_code=400, detail=f"알 수 없는 신호 종류: {kind} (가능: {', '.join(SIGNAL_KINDS)})")
+    events = await run_in_threadpool(get_signal_store().recent, stock_code, kind, since, limit)
+    return {"signals": [e.to_dict() for e in events], "count": len(events)}
+
+
+@router.get("/")
+async def list_signals(
+    code: Optional[str] = None,
+    kind: Optional[str] = None,
+    since: Optional[datetime] = None,
+    limit: int = Query(50, ge=1, le=500),
+):
+    """
+    최근 급변 신호 (최신순)
+    - kind: panic / volume_spike / negative_spike / negative_shift
+    - since: 이 시각 이후에 끝난 구간만
+    """
+    return await _recent(code, kind, since, limit)
+
+
+@router.get("/{stock_code}")
+async def stock_signals(
+    stock_code: str,
+    kind: Optional[str] = None,
+    since: Optional[datetime] = None,
+    limit: int = Query(50, ge=1, le=500),
+):
+    """종목별 최근 급변 신호"""
+    return {"stock_code": stock_code, **await _recent(stock_code, kind, since, limit)}
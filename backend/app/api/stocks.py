@@ -1,66 +1,33 @@
 """
 주식 목록 API
-GET /api/stocks/       - 코스피200 전체 목록 + 최신 감성점수
-GET /api/stocks/{code} - 특정 종목 상세 (댓글, 공시, 차트)
+GET /api/stocks/              - 코스피200 전체 목록 + 최신 감성점수 (spark=N 이면 행마다 N일 추이)
+GET /api/stocks/autocomplete  - 종목명/코드/초성 자동완성
+GET /api/stocks/bundle        - 여러 종목 번들 (그리드 미리 불러오기)
+GET /api/stocks/{code}        - 특정 종목 상세 (댓글, 공시, 차트)
+GET /api/stocks/{code}/comments - 최근 댓글 페이지 (메모리 버퍼, 캐시 없이 바로 반영)
+GET /api/stocks/{code}/bundle - 상세 + 댓글 + 공유 + 추이 한 번에
+목록은 Accept: application/vnd.goksori.columnar 이면 컬럼형 바이너리로 응답 (board.columnar)
+상세/번들은 버퍼 댓글을 담으므로 새 댓글이 들어오면 해당 캐시 응답을 버린다 (carries_comments)
 """
-from fastapi import APIRouter, Query
+from fastapi import APIRouter, Header, HTTPException, Query, Response
 from typing import Optional
-import random
-from datetime import datetime
 
-router = APIRouter()
-
-
-def _mock_sentiment_data(stock_code: str, stock_name: str) -> dict:
-    """
-    개발용 목업 데이터 (실제 DB 연결 전까지 사용)
-    실제 구현 시 DB 쿼리로 대체
-    """
-    # 종목코드를 시드로 사용해 일관된 랜덤값 생성
-    random.seed(hash(stock_code) % 10000)
-    score = random.uniform(20, 85)
-    pos = random.randint(10, 80)
-    neg = random.randint(5, 60)
-    neu = random.randint(5, 40)
-    total = pos + neg + neu
-    trend = "up" if score > 55 else "down" if score < 45 else "neutral"
+from ..board import get_board
+from ..board.columnar import MEDIA_TYPE, accepts_columnar, encode_stocks
+from ..cache import SingleFlight
+from ..comments import get_recent_comments
+from ..concurrency import run_in_threadpool
+from ..config import get_settings
+from ..board.payloads import comments_payload, detail_payload, history_payload, share_payload, stock_row
 
-    return {
-        "code": stock_code,
-        "name": stock_name,
-        "score": round(score, 1),
-        "grade": "A" if score >= 80 else "B" if score >= 65 else "C" if score >= 45 else "D" if score >= 30 else "E",
-        "emoji": "🔥" if score >= 70 else "📈" if score >= 55 else "😐" if score >= 45 else "📉" if score >= 30 else "💀",
-        "trend": trend,
-        "score_change": round(random.uniform(-10, 10), 1),
-        "positive_count": pos,
-        "negative_count": neg,
-        "neutral_count": neu,
-        "total_count": total,
-        "updated_at": datetime.now().isoformat(),
-    }
+router = APIRouter()
 
+BUNDLE_FIELDS = ("detail", "comments", "share", "history")
+MAX_BUNDLE_CODES = 50
+MAX_SPARK_DAYS = 90
 
-# 코스피200 샘플 목록
-SAMPLE_STOCKS = [
-    ("005930", "삼성전자"), ("000660", "SK하이닉스"), ("207940", "삼성바이오로직스"),
-    ("005380", "현대차"), ("068270", "셀트리온"), ("035420", "NAVER"),
-    ("051910", "LG화학"), ("006400", "삼성SDI"), ("003550", "LG"),
-    ("028260", "삼성물산"), ("012330", "현대모비스"), ("035720", "카카오"),
-    ("055550", "신한지주"), ("373220", "LG에너지솔루션"), ("096770", "SK이노베이션"),
-    ("003490", "대한항공"), ("034730", "SK"), ("105560", "KB금융"),
-    ("086790", "하나금융지주"), ("030200", "KT"), ("017670", "SK텔레콤"),
-    ("032830", "삼성생명"), ("009150", "삼성전기"), ("018260", "삼성에스디에스"),
-    ("066570", "LG전자"), ("000270", "기아"), ("011200", "HMM"),
-    ("316140", "우리금융지주"), ("015760", "한국전력"), ("032640", "LG유플러스"),
-    ("000100", "유한양행"), ("011170", "롯데케미칼"), ("024110", "기업은행"),
-    ("078930", "GS"), ("036570", "엔씨소프트"), ("010950", "S-Oil"),
-    ("000810", "삼성화재"), ("011790", "SKC"), ("009540", "한국조선해양"),
-    ("042660", "한화오션"), ("047050", "포스코인터내셔널"), ("000120", "CJ대한통운"),
-    ("010140", "삼성중공업"), ("021240", "코웨이"), ("161390", "한국타이어앤테크놀로지"),
-    ("004020", "현대제철"), ("005945", "NH투자증권"), ("034020", "두산에너빌리티"),
-    ("009900", "OCI"), ("029780", "삼성카드"),
-]
+# 같은 종목 상세를 동시에 요청하면 계산 한 번을 함께 기다림
+detail_flight = SingleFlight("stock_detail", grace=get_settings().singleflight_grace_seconds)
 
 
 @router.get("/")
@@ -69,84 +36,153 @@ async def get_stocks(
     size: int = Query(50, ge=1, le=200),
     sort: str = Query("score_desc", pattern="^(score_desc|score_asc|name|trend_up|trend_down)$"),
     search: Optional[str] = None,
+    spark: int = Query(0, ge=0, le=MAX_SPARK_DAYS),
+    accept: Optional[str] = Header(None),
 ):
     """
     코스피200 종목 목록 + 감성점수
     - page/size: 페이지네이션
     - sort: 정렬 기준
     - search: 종목명/코드 검색
+    - spark: 행마다 최근 N일 점수 추이 (그리드 스파크라인)
     """
-    stocks = [_mock_sentiment_data(code, name) for code, name in SAMPLE_STOCKS]
-
-    # 검색 필터
-    if search:
-        search = search.strip().lower()
-        stocks = [s for s in stocks if search in s["name"].lower() or search in s["code"]]
-
-    # 정렬
-    if sort == "score_desc":
-        stocks.sort(key=lambda x: x["score"])  # 낮은 점수가 먼저 (위험한 종목)
-    elif sort == "score_asc":
-        stocks.sort(key=lambda x: x["score"], reverse=True)  # 높은 점수가 먼저
-    elif sort == "name":
-        stocks.sort(key=lambda x: x["name"])
-    elif sort == "trend_up":
-        stocks = [s for s in stocks if s["trend"] == "up"] + \
-                 [s for s in stocks if s["trend"] != "up"]
-    elif sort == "trend_down":
-        stocks = [s for s in stocks if s["trend"] == "down"] + \
-                 [s for s in stocks if s["trend"] != "down"]
-
-    # 페이지네이션
-    total = len(stocks)
-    start = (page - 1) * size
-    end = start + size
-    paginated = stocks[start:end]
+    # 미리 계산된 정렬 순서에서 검색 필터 + 슬라이스
+    total, paginated = get_board().snapshot.page(sort, page, size, search)
+    stocks = [{**row, "spark": history_payload(row, spark)} for row in paginated] if spark else list(paginated)
 
+    if accepts_columnar(accept):
+        return Response(encode_stocks(total, page, size, stocks, spark), media_type=MEDIA_TYPE)
     return {
         "total": total,
         "page": page,
         "size": size,
-        "stocks": paginated,
+        "stocks": stocks,
     }
 
 
-@router.get("/{stock_code}")
-async def get_stock_detail(stock_code: str):
-    """특정 종목 상세 정보"""
-    # 종목명 찾기
-    stock_name = next((name for code, name in SAMPLE_STOCKS if code == stock_code), stock_code)
-
-    base_data = _mock_sentiment_data(stock_code, stock_name)
-
-    # 최근 댓글 목업
-    random.seed(hash(stock_code) % 10000 + 1)
-    mock_comments = [
-        {
-            "id": i,
-            "content": f"{'긍정 의견: 이 종목 좋아보임' if i % 3 == 0 else '부정 의견: 조심해야함' if i % 3 == 1 else '중립: 지켜봐야할듯'}",
-            "author": f"투자자{i:03d}",
-            "likes": random.randint(0, 50),
-            "sentiment": "positive" if i % 3 == 0 else "negative" if i % 3 == 1 else "neutral",
-            "source": "naver_discuss",
-            "crawled_at": datetime.now().isoformat(),
-        }
-        for i in range(1, 21)
-    ]
-
-    # 최근 7일 점수 추이 목업
-    score_history = []
-    base_score = base_data["score"]
-    for i in range(7, 0, -1):
-        score_history.append({
-            "date": f"2026-02-{20-i:02d}",
-            "score": round(max(10, min(90, base_score + random.uniform(-15, 15))), 1),
-        })
+@router.get("/autocomplete")
+async def autocomplete(
+    q: str = Query(..., min_length=1, max_length=50),
+    limit: int = Query(10, ge=1, le=50),
+):
+    """
+    종목 자동완성
+    - 종목명/코드 접두어, 부분 문자열, 초성(예: ㅅㅅㅈㅈ) 검색
+    - 정확 일치 > 접두어 > 부분 문자열 순으로 정렬
+    """
+    hits = get_board().snapshot.search_index.search(q, limit=limit)
+    return {
+        "query": q,
+        "results": [{"code": hit.code, "name": hit.name} for hit in hits],
+    }
+
+
+@router.get("/bundle")
+async def get_bundles(
+    codes: str = Query(..., description="쉼표로 구분한 종목코드 (최대 50개)"),
+    fields: str = Query("detail,share"),
+    days: int = Query(30, ge=1, le=365),
+    comments_size: int = Query(20, ge=1, le=100),
+):
+    """
+    여러 종목 번들 (화면에 보이는 그리드 행 미리 불러오기용)
+    모든 종목이 같은 스냅샷에서 계산된다
+    """
+    code_list = list(dict.fromkeys(c.strip() for c in codes.split(",") if c.strip()))
+    if not code_list:
+        raise HTTPException(status_code=400, detail="종목코드를 입력해주세요")
+    if len(code_list) > MAX_BUNDLE_CODES:
+        raise HTTPException(status_code=400, detail=f"한 번에 최대 {MAX_BUNDLE_CODES}개 종목까지 조회할 수 있습니다")
+    selected = _parse_fields(fields)
+
+    snapshot = get_board().snapshot
+    return {
+        "generation": snapshot.generation,
+        "bundles": {
+            code: _build_bundle(snapshot, code, selected, days, 1, comments_size)
+            for code in code_list
+        },
+    }
 
+
+@router.get("/{stock_code}/bundle")
+async def get_bundle(
+    stock_code: str,
+    fields: str = Query(",".join(BUNDLE_FIELDS)),
+    days: int = Query(30, ge=1, le=365),
+    comments_page: int = Query(1, ge=1),
+    comments_size: int = Query(20, ge=1, le=100),
+):
+    """
+    종목 모달용 번들 (상세 + 댓글 페이지 + 공유 + 추이를 한 번에)
+    - fields: detail,comments,share,history 중 필요한 항목만
+    """
+    selected = _parse_fields(fields)
+    snapshot = get_board().snapshot
     return {
-        **base_data,
-        "comments": mock_comments,
-        "score_history": score_history,
-        "sources": ["naver_discuss"],
-        "dart_url": f"https://dart.fss.or.kr/dsearch/main.do?rcpNo=&textCrpCik={stock_code}",
+        "code": stock_code,
+        "generation": snapshot.generation,
+        **_build_bundle(snapshot, stock_code, selected, days, comments_page, comments_size),
     }
+
+
+@router.get("/{stock_code}/comments")
+async def get_stock_comments(
+    stock_code: str,
+    page: int = Query(1, ge=1),
+    size: int = Query(20, ge=1, le=100),
+):
+    """종목 최근 댓글 (최신순)"""
+    return {"stock_code": stock_code, **comments_payload(stock_code, page, size)}
+
+
+@router.get("/{stock_code}")
+async def get_stock_detail(stock_code: str):
+    """특정 종목 상세 정보"""
+    snapshot = get_board().snapshot
+    return await detail_flight.do(
+        (snapshot.generation, stock_code, get_recent_comments().latest_id(stock_code)),
+        lambda: run_in_threadpool(_build_detail, snapshot, stock_code),
+    )
+
+
+def carries_comments(cache_key: str, stock_codes: set[str]) -> bool:
+    """응답 캐시 키가 stock_codes 중 한 종목의 버퍼 댓글을 담는 응답인지 (상세, 종목 번들, 여러 종목 번들)"""
+    parts = cache_key.split("?", 1)[0].split("/")  # ["", "api", "stocks", code, ("bundle")]
+    if len(parts) < 4 or parts[1:3] != ["api", "stocks"]:
+        return False
+    if parts[3:] == ["bundle"]:
+        return True  # 여러 종목 번들 - 쿼리의 codes 를 풀지 않고 모두 버림
+    return parts[3] in stock_codes and parts[4:] in ([], ["bundle"])
+
+
+def _build_detail(snapshot, stock_code: str) -> dict:
+    row = stock_row(snapshot, stock_code)
+    return detail_payload(row, comments=comments_payload(stock_code)["comments"])
+
+
+def _parse_fields(fields: str) -> tuple[str, ...]:
+    selected = tuple(dict.fromkeys(f.strip() for f in fields.split(",") if f.strip()))
+    unknown = [f for f in selected if f not in BUNDLE_FIELDS]
+    if unknown or not selected:
+        raise HTTPException(
+            status_code=400,
+            detail=f"fields 는 {', '.join(BUNDLE_FIELDS)} 중에서 선택해주세요",
+        )
+    return selected
+
+
+def _build_bundle(snapshot, stock_code: str, fields: tuple[str, ...], days: int,
+                  comments_page: int, comments_size: int) -> dict:
+    """스냅샷 행 하나에서 요청된 항목만 계산"""
+    row = stock_row(snapshot, stock_code)
+    bundle = {}
+    if "detail" in fields:
+        bundle["detail"] = detail_payload(row)
+    if "comments" in fields:
+        bundle["comments"] = comments_payload(stock_code, comments_page, comments_size)
+    if "share" in fields:
+        bundle["share"] = share_payload(row, snapshot)
+    if "history" in fields:
+        bundle["history"] = history_payload(row, days)
+    return bundle
@@ -0,0 +1,69 @@
+"""
+실시간 점수 스트림 API (Server-Sent Events)
+GET /api/stream/scores - 점수 변경 델타 푸시
+  - 재접속 시 Last-Event-ID 헤더(또는 ?since=)로 놓친 이벤트부터 이어받기
+  - 커서가 보관 범위를 벗어나거나 다른 워커/재시작 전 프로세스의 id 면 reset 이벤트 → 클라이언트가 목록을 다시 조회
+"""
+from fastapi import APIRouter, Header, Query
+from fastapi.responses import StreamingResponse
+from typing import Optional
+
+from ..config import get_settings
+from ..stream import get_broadcaster
+
+router = APIRouter()
+settings = get_settings()
+
+RETRY_MS = 3000
+
+
+def _format(event: str, data: str, event_id: Optional[str] = None) -> str:
+    lines = []
+    if event_id is not None:
+        lines.append(f"id: {event_id}")
+    lines.append(f"event: {event}")
+    lines.append(f"data: {data}")
+    return "\n".join(lines) + "\n\n"
+
+
+@router.get("/scores")
+async def stream_scores(
+    since: Optional[str] = Query(None),
+    last_event_id: Optional[str] = Header(None),
+):
+    """점수 변경 이벤트 스트림"""
+    broadcaster = get_broadcaster()
+    requested = since or last_event_id
+    cursor = broadcaster.parse_event_id(requested) if requested else broadcaster.latest_seq  # 새 연결은 현재 시점부터
+    resync = cursor is None  # 이 프로세스가 준 id 가 아님 → 어디까지 받았는지 알 수 없음
+    if resync:
+        cursor = broadcaster.latest_seq
+
+    async def event_stream():
+        nonlocal cursor
+        broadcaster.connections += 1
+        try:
+            current = broadcaster.event_id(cursor)
+            yield f"retry: {RETRY_MS}\n" + _format("ready", current, current)
+            if resync:
+                yield _format("reset", current, current)
+            while True:
+                events, reset = await broadcaster.wait(cursor, settings.stream_keepalive_seconds)
+                if reset:
+                    cursor = broadcaster.latest_seq
+                    current = broadcaster.event_id(cursor)
+                    yield _format("reset", current, current)
+                elif events:
+                    for event in events:
+                        yield _format("scores", event.data, broadcaster.event_id(event.seq))
+                    cursor = events[-1].seq
+                else:
+                    yield ": ping\n\n"
+        finally:
+            broadcaster.connections -= 1
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -0,0 +1,14 @@
+from .data import load_prices, load_scores_file, load_scores_db, align_scores, synthetic_universe
+from .engine import Backtest, BacktestResult, Rule, parse_rule
+
+__all__ = [
+    "load_prices",
+    "load_scores_file",
+    "load_scores_db",
+    "align_scores",
+    "synthetic_universe",
+    "Backtest",
+    "BacktestResult",
+    "Rule",
+    "parse_rule",
+]
@@ -0,0 +1,159 @@
+"""
+백테스트 입력 데이터
+- 일별 종가: CSV/Parquet (파일 1개 또는 디렉터리)
+    긴 형식: date, code, close        (여러 종목이 한 파일에)
+    종목별 파일: date, close          (파일명 = 종목코드, 예: 005930.csv)
+- 감성 점수: SentimentScore 이력 (DB) 또는 같은 형식의 파일 (date 대신 period_end 도 허용)
+    열: period_end, code, score [, total_count, trend]
+
+모두 (날짜 × 종목) 넓은 형식 DataFrame 으로 맞춘다
+"""
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+PRICE_SUFFIXES = (".csv", ".parquet")
+STALE_DAYS = 5  # 점수 수집이 끊긴 종목은 마지막 점수를 이 거래일 수까지만 유지
+
+
+def _read_table(path: Path) -> pd.DataFrame:
+    if path.suffix == ".parquet":
+        return pd.read_parquet(path)
+    return pd.read_csv(path, dtype={"code": str})
+
+
+def _table_files(path: Path) -> list[Path]:
+    path = Path(path)
+    if path.is_dir():
+        return sorted(p for p in path.iterdir() if p.suffix in PRICE_SUFFIXES)
+    return [path]
+
+
+def _normalize_code(codes: pd.Series) -> pd.Series:
+    return codes.astype(str).str.zfill(6)
+
+
+def load_prices(path: Path, column: str = "close") -> pd.DataFrame:
+    """종가 파일(들) → 넓은 형식 (index: 거래일, columns: 종목코드)"""
+    frames = []
+    for file in _table_files(path):
+        frame = _read_table(file)
+        if "code" not in frame.columns:
+            frame = frame.assign(code=file.stem)
+        frames.append(frame[["date", "code", column]])
+    if not frames:
+        raise FileNotFoundError(f"종가 파일이 없습니다: {path}")
+
+    prices = pd.concat(frames, ignore_index=True)
+    prices["date"] = pd.to_datetime(prices["date"]).dt.normalize()
+    prices["code"] = _normalize_code(prices["code"])
+    wide = prices.pivot_table(index="date", columns="code", values=column, aggfunc="last")
+    return wide.sort_index().astype(np.float64)
+
+
+def scores_frame(records) -> pd.DataFrame:
+    """(period_end, code, score, total_count, trend) 행 → 긴 형식 DataFrame"""
+    frame = pd.DataFrame.from_records(records, columns=["period_end", "code", "score", "total_count", "trend"])
+    return _clean_scores(frame)
+
+
+def _clean_scores(frame: pd.DataFrame) -> pd.DataFrame:
+    if "period_end" not in frame.columns:
+        frame = frame.rename(columns={"date": "period_end"})
+    frame = frame.copy()
+    # 타임존이 있으면 한국 시간 기준 날짜로
+    period_end = pd.to_datetime(frame["period_end"])
+    if period_end.dt.tz is not None:
+        period_end = period_end.dt.tz_convert("Asia/Seoul").dt.tz_localize(None)
+    frame["period_end"] = period_end
+    frame["code"] = _normalize_code(frame["code"])
+    return frame
+
+
+def load_scores_file(path: Path) -> pd.DataFrame:
+    """점수 파일(들) (CSV/Parquet) → 긴 형식"""
+    files = _table_files(path)
+    if not files:
+        raise FileNotFoundError(f"점수 파일이 없습니다: {path}")
+    return _clean_scores(pd.concat([_read_table(f) for f in files], ignore_index=True))
+
+
+def load_scores_db(session_factory=None, since=None) -> pd.DataFrame:
+    """sentiment_scores 이력 (DB) → 긴 형식"""
+    from sqlalchemy import select
+    from ..models import SentimentScore, Stock
+
+    if session_factory is None:
+        from ..db.session import SessionLocal
+        session_factory = SessionLocal
+
+    query = (
+        select(SentimentScore.period_end, Stock.code, SentimentScore.score,
+               SentimentScore.total_count, SentimentScore.trend)
+        .join(Stock, SentimentScore.stock_id == Stock.id)
+        .order_by(SentimentScore.period_end)
+    )
+    if since is not None:
+        query = query.where(SentimentScore.period_end >= since)
+    session = session_factory()
+    try:
+        return scores_frame(session.execute(query).all())
+    finally:
+        session.close()
+
+
+def align_scores(scores: pd.DataFrame, prices: pd.DataFrame, column: str = "score",
+                 stale_days: Optional[int] = STALE_DAYS) -> pd.DataFrame:
+    """
+    긴 형식 점수 → 종가와 같은 (거래일 × 종목) 격자
+    거래일 d 의 값 = d 0시까지 끝난 마지막 집계 (d 당일 장중 정보는 d 종가 진입에 쓰지 않음 - 미래 참조 방지)
+    """
+    frame = scores[["period_end", "code", column]].sort_values("period_end", kind="stable")
+    days = prices.index.values
+    position = np.searchsorted(days, frame["period_end"].values.astype("datetime64[ns]"), side="left")
+    valid = position < len(days)
+    frame = frame[valid].assign(date=days[position[valid]])
+
+    frame = frame.drop_duplicates(["date", "code"], keep="last")
+    wide = frame.pivot(index="date", columns="code", values=column)
+    wide = wide.reindex(index=prices.index, columns=prices.columns)
+    return wide.ffill(limit=stale_days)
+
+
+def synthetic_universe(stocks: int = 200, days: int = 2500, seed: int = 7,
+                       edge: float = 0.002) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    합성 종가 + 일별 감성 점수 (부하/속도 확인용)
+    edge: 점수가 극단(30 미만)일 때 다음 거래일 수익률에 더하는 평균 회귀 효과
+    → (넓은 형식 종가, 긴 형식 점수)
+    """
+    rng = np.random.default_rng(seed)
+    dates = pd.bdate_range("2016-01-04", periods=days)
+    codes = [f"{100000 + i:06d}" for i in range(stocks)]
+
+    # 점수: 종목별 AR(1) (평소 50 부근, 가끔 극단)
+    score = np.empty((days, stocks))
+    score[0] = rng.normal(50, 10, stocks)
+    noise = rng.normal(0, 6, (days, stocks))
+    for t in range(1, days):
+        score[t] = 50 + 0.8 * (score[t - 1] - 50) + noise[t]
+    score = np.clip(score, 0, 100)
+
+    returns = rng.normal(0.0003, 0.02, (days, stocks))
+    returns[1:] += edge * (score[:-1] < 30)
+    close = 10000 * np.cumprod(1 + returns, axis=0)
+    prices = pd.DataFrame(close, index=dates, columns=pd.Index(codes, name="code"))
+
+    # 점수는 그날 밤 집계 → 다음 거래일 0시 이전에 끝난 기간
+    period_end = np.repeat(dates.values, stocks) + np.timedelta64(20, "h")
+    flat = score.ravel()
+    scores = pd.DataFrame({
+        "period_end": period_end,
+        "code": np.tile(codes, days),
+        "score": flat.round(1),
+        "total_count": rng.integers(10, 200, days * stocks),
+        "trend": np.where(flat > 55, "up", np.where(flat < 45, "down", "neutral")),
+    })
+    return prices, scores
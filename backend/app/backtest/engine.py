@@ -0,0 +1,244 @@
+"""
+감성 신호 백테스트 (벡터화)
+- 전 종목 × 전 기간을 (거래일 × 종목) 배열 한 장으로 놓고 규칙 조건 / 진입 / 수익률을 배열 연산으로 계산
+- 규칙 예: "score<30x2"   점수 30 미만이 2거래일 연속이면 그날 종가 매수, hold 거래일 뒤 종가 매도
+          "grade==E"     등급 E (SentimentResult.grade 기준)
+          "trend==down x3"
+- 결과: 적중률(수익 > 0 비율), 평균/중앙 수익률, 전체 평균 대비 초과 수익, 동일 가중 포트폴리오 누적 수익 / 최대 낙폭
+"""
+import re
+from dataclasses import asdict, dataclass
+from itertools import product
+from typing import Iterable, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+from .data import align_scores
+
+FIELDS = ("score", "grade", "trend")
+OPS = ("<", "<=", ">", ">=", "==", "!=")
+GRADES = "EDCBA"                          # 등급 순위 (E=0 … A=4)
+GRADE_BOUNDS = (30.0, 45.0, 65.0, 80.0)   # SentimentResult.grade 경계
+TRADING_DAYS = 252
+
+_RULE = re.compile(r"^\s*(\w+)\s*(<=|>=|==|!=|<|>)\s*(-?\d+(?:\.\d+)?|[A-Za-z]+?)\s*(?:x\s*(\d+))?\s*$")
+
+
+@dataclass(frozen=True)
+class Rule:
+    field: str = "score"
+    op: str = "<"
+    value: Union[float, str] = 30.0
+    periods: int = 1     # 조건이 연속으로 성립해야 하는 거래일 수
+    hold: int = 5        # 보유 거래일 수
+    side: str = "long"   # long / short
+
+    def __post_init__(self):
+        if self.field not in FIELDS:
+            raise ValueError(f"지원하지 않는 필드: {self.field} ({'/'.join(FIELDS)})")
+        if self.op not in OPS:
+            raise ValueError(f"지원하지 않는 비교: {self.op}")
+        if self.field == "trend" and self.op not in ("==", "!="):
+            raise ValueError("trend 는 == / != 만 지원")
+        if self.field == "grade" and str(self.value) not in GRADES:
+            raise ValueError(f"등급은 {'/'.join(GRADES)} 중 하나")
+        if self.periods < 1 or self.hold < 1:
+            raise ValueError("periods / hold 는 1 이상")
+        if self.side not in ("long", "short"):
+            raise ValueError("side 는 long / short")
+
+    @property
+    def label(self) -> str:
+        value = f"{self.value:g}" if isinstance(self.value, float) else self.value
+        return f"{self.field}{self.op}{value}x{self.periods} hold{self.hold}" + (" short" if self.side == "short" else "")
+
+
+def parse_rule(text: str, hold: int = 5, side: str = "long") -> Rule:
+    """'score<30x2' → Rule"""
+    match = _RULE.match(text)
+    if match is None:
+        raise ValueError(f"규칙 형식 오류: {text!r} (예: score<30x2, grade==E, trend==down x3)")
+    field, op, value, periods = match.groups()
+    value = float(value) if field == "score" else value
+    return Rule(field, op, value, int(periods or 1), hold, side)
+
+
+@dataclass
+class BacktestResult:
+    rule: str
+    trades: int
+    hit_rate: float          # 수익 > 0 인 거래 비율
+    avg_return: float        # 거래당 평균 수익률
+    median_return: float
+    excess_return: float     # 전체 (종목, 거래일) 평균 hold 수익률 대비
+    total_return: float      # 동일 가중 포트폴리오 누적 수익률
+    annual_return: float
+    max_drawdown: float      # 음수 (예: -0.23)
+    exposure: float          # 포지션이 있었던 거래일 비율
+
+    def to_dict(self) -> dict:
+        return {k: (round(v, 4) if isinstance(v, float) else v) for k, v in asdict(self).items()}
+
+
+def _compare(values: np.ndarray, op: str, threshold) -> np.ndarray:
+    with np.errstate(invalid="ignore"):
+        if op == "<":
+            return values < threshold
+        if op == "<=":
+            return values <= threshold
+        if op == ">":
+            return values > threshold
+        if op == ">=":
+            return values >= threshold
+        if op == "==":
+            return values == threshold
+        return values != threshold
+
+
+def _window_sum(counts: np.ndarray, window: int) -> np.ndarray:
+    """행 방향 누적합 기준 [t-window+1, t] 합 (window 이전 구간은 0부터)"""
+    out = counts.copy()
+    out[window:] -= counts[:-window]
+    return out
+
+
+class Backtest:
+    """
+    prices: 넓은 형식 종가 (load_prices), scores: 긴 형식 점수 (load_scores_*)
+    규칙마다 바뀌지 않는 배열(수익률, 등급, 보유 기간별 수익률)은 한 번만 계산해 재사용
+    """
+
+    def __init__(self, prices: pd.DataFrame, scores: pd.DataFrame, stale_days: Optional[int] = None):
+        kwargs = {} if stale_days is None else {"stale_days": stale_days}
+        self.prices = prices
+        self.dates = prices.index
+        self.codes = prices.columns
+        self.close = prices.to_numpy(dtype=np.float64)
+        self.score = align_scores(scores, prices, "score", **kwargs).to_numpy(dtype=np.float64)
+        self.trend = None
+        if "trend" in scores.columns:
+            trend = align_scores(scores, prices, "trend", **kwargs)
+            self.trend = trend.to_numpy(dtype=object)
+            self._has_trend = trend.notna().to_numpy()
+        self._has_score = ~np.isnan(self.score)
+        with np.errstate(invalid="ignore"):
+            grade = np.digitize(self.score, GRADE_BOUNDS).astype(np.float64)
+        grade[~self._has_score] = np.nan
+        self.grade = grade
+
+        daily = np.full_like(self.close, np.nan)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            daily[1:] = self.close[1:] / self.close[:-1] - 1
+        self.daily = daily
+        self._forward: dict[int, np.ndarray] = {}
+        self._baseline: dict[int, float] = {}
+        self._conditions: dict[tuple, np.ndarray] = {}
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        return self.close.shape
+
+    def forward(self, hold: int) -> np.ndarray:
+        """[t, n] = t 종가 매수 → t+hold 종가 매도 수익률 (끝부분/결측은 NaN)"""
+        cached = self._forward.get(hold)
+        if cached is None:
+            cached = np.full_like(self.close, np.nan)
+            with np.errstate(invalid="ignore", divide="ignore"):
+                cached[:-hold] = self.close[hold:] / self.close[:-hold] - 1
+            self._forward[hold] = cached
+        return cached
+
+    def baseline(self, hold: int) -> float:
+        """전체 (종목, 거래일) 평균 hold 수익률 - 아무 날이나 샀을 때"""
+        cached = self._baseline.get(hold)
+        if cached is None:
+            forward = self.forward(hold)
+            cached = self._baseline[hold] = float(np.nanmean(forward)) if np.isfinite(forward).any() else 0.0
+        return cached
+
+    def condition(self, rule: Rule) -> np.ndarray:
+        key = (rule.field, rule.op, rule.value)
+        cached = self._conditions.get(key)
+        if cached is None:
+            # 점수가 없는 칸은 어떤 비교도 성립하지 않음 (!= 포함)
+            if rule.field == "score":
+                cached = _compare(self.score, rule.op, float(rule.value)) & self._has_score
+            elif rule.field == "grade":
+                cached = _compare(self.grade, rule.op, GRADES.index(str(rule.value))) & self._has_score
+            else:
+                if self.trend is None:
+                    raise ValueError("점수 데이터에 trend 열이 없습니다")
+                cached = _compare(self.trend, rule.op, rule.value).astype(bool) & self._has_trend
+            self._conditions[key] = cached
+        return cached
+
+    def entries(self, rule: Rule) -> np.ndarray:
+        """조건이 처음으로 periods 거래일 연속 성립한 날 (계속 성립하는 동안 재진입 없음)"""
+        cond = self.condition(rule)
+        periods = rule.periods
+        if periods == 1:
+            entry = cond.copy()
+            entry[1:] &= ~cond[:-1]
+            return entry
+        counts = np.cumsum(cond, axis=0, dtype=np.int32)
+        streak = _window_sum(counts, periods) == periods
+        entry = streak.copy()
+        entry[periods:] &= ~cond[:-periods]
+        return entry
+
+    def run(self, rule: Union[Rule, str]) -> BacktestResult:
+        if isinstance(rule, str):
+            rule = parse_rule(rule)
+        entry = self.entries(rule)
+        forward = self.forward(rule.hold)
+        sign = 1.0 if rule.side == "long" else -1.0
+
+        returns = sign * forward[entry]
+        returns = returns[~np.isnan(returns)]
+        baseline = sign * self.baseline(rule.hold)
+
+        equity, exposure = self._portfolio(entry, rule.hold, sign)
+        years = len(self.dates) / TRADING_DAYS
+        total = float(equity[-1] - 1) if len(equity) else 0.0
+        peak = np.maximum.accumulate(equity) if len(equity) else equity
+        trades = int(returns.size)
+        return BacktestResult(
+            rule=rule.label,
+            trades=trades,
+            hit_rate=float(np.mean(returns > 0)) if trades else 0.0,
+            avg_return=float(returns.mean()) if trades else 0.0,
+            median_return=float(np.median(returns)) if trades else 0.0,
+            excess_return=float(returns.mean() - baseline) if trades else 0.0,
+            total_return=total,
+            annual_return=float((1 + total) ** (1 / years) - 1) if years > 0 and total > -1 else -1.0,
+            max_drawdown=float((equity / peak - 1).min()) if len(equity) else 0.0,
+            exposure=exposure,
+        )
+
+    def _portfolio(self, entry: np.ndarray, hold: int, sign: float) -> tuple[np.ndarray, float]:
+        """진입 다음 날부터 hold 거래일 동안 보유, 보유 종목 동일 가중 → (누적 자산 곡선, 노출 비율)"""
+        counts = np.cumsum(entry, axis=0, dtype=np.int32)
+        held = np.zeros(entry.shape, dtype=bool)
+        # held[t] = entry 가 [t-hold, t-1] 에 있음
+        held[1:] = _window_sum(counts, hold)[:-1] > 0
+        live = held & ~np.isnan(self.daily)
+        n = live.sum(axis=1)
+        gross = np.where(live, self.daily, 0.0).sum(axis=1)
+        daily = np.divide(sign * gross, n, out=np.zeros(len(n)), where=n > 0)
+        return np.cumprod(1 + daily), float(np.mean(n > 0)) if len(n) else 0.0
+
+    def sweep(self, field: str = "score", op: str = "<", values: Iterable = (20, 25, 30, 35, 40),
+              periods: Iterable[int] = (1, 2, 3), holds: Iterable[int] = (1, 5, 20),
+              side: str = "long", min_trades: int = 30) -> pd.DataFrame:
+        """파라미터 격자 전체 결과 (초과 수익 내림차순, 거래 수가 min_trades 미만인 조합은 제외)"""
+        rows = []
+        for value, period, hold in product(values, periods, holds):
+            value = float(value) if field == "score" else value
+            result = self.run(Rule(field, op, value, period, hold, side))
+            if result.trades >= min_trades:
+                rows.append({"value": value, "periods": period, "hold": hold, **result.to_dict()})
+        frame = pd.DataFrame(rows)
+        if frame.empty:
+            return frame
+        return frame.sort_values("excess_return", ascending=False, ignore_index=True)
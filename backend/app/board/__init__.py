@@ -0,0 +1,3 @@
+from .board import StockBoard, BoardSnapshot, SORT_KEYS, get_board
+
+__all__ = ["StockBoard", "BoardSnapshot", "SORT_KEYS", "get_board"]
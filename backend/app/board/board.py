@@ -0,0 +1,130 @@
+"""
+종목 보드 (프로세스 내 현재 감성점수 모델)
+- 현재 행을 한 번만 보관하고, 정렬 기준별 순서를 미리 계산
+- 새 점수가 들어오면 스냅샷 전체를 새로 만들어 원자적으로 교체
+- 요청 처리 = 미리 계산된 순서에서 슬라이스 (+ 검색 필터)
+"""
+import logging
+import threading
+from typing import Callable, Iterable, Optional
+
+from ..cache.generation import bump_generation, current_generation
+from ..search import StockSearchIndex, get_search_index
+
+logger = logging.getLogger(__name__)
+
+SORT_KEYS = ("score_desc", "score_asc", "name", "trend_up", "trend_down")
+
+BoardListener = Callable[[Optional["BoardSnapshot"], "BoardSnapshot"], None]
+
+
+def _partition(rows: list[dict], trend: str) -> tuple[dict, ...]:
+    """지정 추세 종목을 앞으로 (안정 분할)"""
+    return tuple([r for r in rows if r["trend"] == trend] + [r for r in rows if r["trend"] != trend])
+
+
+def build_orderings(rows: list[dict]) -> dict[str, tuple[dict, ...]]:
+    """정렬 기준별 순서 계산"""
+    return {
+        "score_desc": tuple(sorted(rows, key=lambda x: x["score"])),  # 낮은 점수가 먼저 (위험한 종목)
+        "score_asc": tuple(sorted(rows, key=lambda x: x["score"], reverse=True)),  # 높은 점수가 먼저
+        "name": tuple(sorted(rows, key=lambda x: x["name"])),
+        "trend_up": _partition(rows, "up"),
+        "trend_down": _partition(rows, "down"),
+    }
+
+
+class BoardSnapshot:
+    """불변 보드 스냅샷 - 교체만 되고 수정되지 않는다"""
+
+    __slots__ = ("rows", "by_code", "orderings", "search_index", "generation")
+
+    def __init__(self, rows: Iterable[dict], generation: int):
+        self.rows: tuple[dict, ...] = tuple(rows)
+        self.by_code: dict[str, dict] = {r["code"]: r for r in self.rows}
+        self.orderings = build_orderings(list(self.rows))
+        self.search_index: StockSearchIndex = get_search_index((r["code"], r["name"]) for r in self.rows)
+        self.generation = generation
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def get(self, stock_code: str) -> Optional[dict]:
+        return self.by_code.get(stock_code)
+
+    def ordered(self, sort: str = "score_desc", search: Optional[str] = None) -> tuple[dict, ...]:
+        """정렬 순서 (검색어가 있으면 일치 종목만)"""
+        ordering = self.orderings[sort]
+        if search and search.strip():
+            matched = self.search_index.match_codes(search)
+            return tuple(r for r in ordering if r["code"] in matched)
+        return ordering
+
+    def page(self, sort: str, page: int, size: int, search: Optional[str] = None) -> tuple[int, tuple[dict, ...]]:
+        """(전체 개수, 해당 페이지 행)"""
+        ordering = self.ordered(sort, search)
+        start = (page - 1) * size
+        return len(ordering), ordering[start:start + size]
+
+
+class StockBoard:
+    """
+    현재 스냅샷 보관 + 갱신 알림
+    loader: 최초 조회 시 초기 행을 불러오는 함수
+    """
+
+    def __init__(self, loader: Optional[Callable[[], list[dict]]] = None):
+        self._loader = loader
+        self._snapshot: Optional[BoardSnapshot] = None
+        self._lock = threading.Lock()
+        self._listeners: list[BoardListener] = []
+
+    @property
+    def snapshot(self) -> BoardSnapshot:
+        snapshot = self._snapshot
+        if snapshot is None:
+            with self._lock:
+                if self._snapshot is None:
+                    rows = self._loader() if self._loader else []
+                    self._snapshot = BoardSnapshot(rows, current_generation())
+                snapshot = self._snapshot
+        return snapshot
+
+    def subscribe(self, listener: BoardListener) -> None:
+        """갱신 시 listener(이전 스냅샷, 새 스냅샷) 호출"""
+        self._listeners.append(listener)
+
+    def refresh(self, rows: Iterable[dict]) -> BoardSnapshot:
+        """
+        새 점수로 스냅샷 교체 (집계 주기 종료 시 호출)
+        정렬 계산은 잠금 밖에서 끝내고, 교체와 세대 증가만 잠금 안에서 수행
+        """
+        snapshot = BoardSnapshot(rows, current_generation())
+        with self._lock:
+            previous = self._snapshot
+            self._snapshot = snapshot
+            # 교체 후 세대 증가: 교체 도중 이전 세대로 저장된 캐시 응답은 세대 증가와 함께 버려진다
+            snapshot.generation = bump_generation()
+
+        logger.info(f"종목 보드 갱신: {len(snapshot)}개 종목 (세대 {snapshot.generation})")
+        for listener in list(self._listeners):
+            try:
+                listener(previous, snapshot)
+            except Exception as e:
+                logger.error(f"보드 갱신 알림 실패 {listener}: {e}")
+        return snapshot
+
+
+_board: Optional[StockBoard] = None
+_board_lock = threading.Lock()
+
+
+def get_board() -> StockBoard:
+    """공유 종목 보드 (초기 데이터: BOARD_SOURCE - DB 최신 점수 또는 목업)"""
+    global _board
+    if _board is None:
+        with _board_lock:
+            if _board is None:
+                from .scores import get_row_source
+                _board = StockBoard(loader=get_row_source())
+    return _board
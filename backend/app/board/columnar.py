@@ -0,0 +1,155 @@
+"""
+컬럼형 바이너리 응답 (Accept: application/vnd.goksori.columnar)
+행마다 키 이름과 ISO 날짜를 반복하는 JSON 대신 열마다 숫자 배열 하나 → 프론트는 TypedArray 로 바로 읽는다
+
+  "GKC1" | u32 헤더 길이 | 헤더 JSON (UTF-8, 4바이트 경계까지 공백) | 열 데이터 (열마다 4바이트 경계)
+  헤더: {"kind": ..., "rows": 행 수, …메타, "columns": [{"name", "type", "offset", "length", …}]}
+    type  u8/u16/i16/u32 - 리틀 엔디언 정수 배열 (scale 이 있으면 실제 값 = 정수 / scale)
+          enum - u8 인덱스 배열, 실제 값은 values
+          str  - UTF-8 문자열을 줄바꿈으로 이은 바이트 (length 는 바이트 수)
+    offset 은 열 데이터 시작 기준
+  날짜는 헤더 base_date + 일 단위 오프셋(u16), 점수는 0.1 단위 정수(u16, scale 10), 값 없음은 MISSING
+"""
+import json
+import struct
+import sys
+from array import array
+from datetime import date, datetime
+from typing import Optional
+
+from ..cache.response_cache import accepts_media_type
+
+MEDIA_TYPE = "application/vnd.goksori.columnar"
+MAGIC = b"GKC1"
+MISSING = 0xFFFF  # u16 열의 빈 값 (스파크라인에 없는 날짜)
+SCORE_SCALE = 10
+
+_TYPECODES = {"u8": "B", "u16": "H", "i16": "h", "u32": "I"}
+
+
+def accepts_columnar(accept: Optional[str]) -> bool:
+    """Accept 헤더에 컬럼형 형식이 있는지 (응답 캐시 미들웨어와 같은 판단)"""
+    return accepts_media_type(accept, MEDIA_TYPE)
+
+
+class ColumnarWriter:
+    """열을 추가한 뒤 to_bytes() 로 직렬화"""
+
+    def __init__(self, kind: str, rows: int, **meta):
+        self.header = {"kind": kind, "rows": rows, **meta, "columns": []}
+        self._chunks: list[bytes] = []
+        self._size = 0
+
+    def _add(self, spec: dict, data: bytes) -> None:
+        spec["offset"] = self._size
+        self.header["columns"].append(spec)
+        data += b"\0" * (-len(data) % 4)
+        self._chunks.append(data)
+        self._size += len(data)
+
+    def numbers(self, name: str, values, type: str, scale: Optional[int] = None) -> None:
+        """정수 열 (scale 이 있으면 값 × scale 을 반올림해 저장, None 은 MISSING)"""
+        if scale is not None:
+            values = [MISSING if v is None else round(v * scale) for v in values]
+        data = array(_TYPECODES[type], values)
+        if sys.byteorder == "big":
+            data.byteswap()
+        spec = {"name": name, "type": type, "length": len(data)}
+        if scale is not None:
+            spec["scale"] = scale
+        self._add(spec, data.tobytes())
+
+    def enum(self, name: str, values: list[str]) -> None:
+        """값 종류가 적은 문자열 열 (등급, 추세, 이모지)"""
+        vocabulary = list(dict.fromkeys(values))
+        index = {v: i for i, v in enumerate(vocabulary)}
+        self._add(
+            {"name": name, "type": "enum", "length": len(values), "values": vocabulary},
+            array("B", [index[v] for v in values]).tobytes(),
+        )
+
+    def strings(self, name: str, values: list[str]) -> None:
+        data = "\n".join(values).encode("utf-8")
+        self._add({"name": name, "type": "str", "length": len(data)}, data)
+
+    def to_bytes(self) -> bytes:
+        header = json.dumps(self.header, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        header += b" " * (-(len(MAGIC) + 4 + len(header)) % 4)
+        return MAGIC + struct.pack("<I", len(header)) + header + b"".join(self._chunks)
+
+
+def _day(value: str) -> date:
+    return date.fromisoformat(value[:10])
+
+
+def encode_stocks(total: int, page: int, size: int, stocks: list[dict], spark_days: int = 0) -> bytes:
+    """GET /api/stocks/ 응답 (spark_days > 0 이면 행마다 spark 점수 목록 → 행 × 일 행렬 한 열)"""
+    updated = [datetime.fromisoformat(s["updated_at"]) for s in stocks]
+    base_time = min(updated) if updated else datetime.now()
+    meta = {"total": total, "page": page, "size": size, "base_time": base_time.isoformat()}
+
+    spark_dates = sorted({h["date"] for s in stocks for h in s.get("spark", ())})
+    if spark_days:
+        meta["spark"] = {"base_date": spark_dates[0] if spark_dates else None, "days": spark_days}
+
+    writer = ColumnarWriter("stocks", len(stocks), **meta)
+    writer.strings("code", [s["code"] for s in stocks])
+    writer.strings("name", [s["name"] for s in stocks])
+    writer.strings("sector", [s.get("sector", "") for s in stocks])
+    writer.numbers("score", [s["score"] for s in stocks], "u16", SCORE_SCALE)
+    writer.enum("grade", [s["grade"] for s in stocks])
+    writer.enum("emoji", [s["emoji"] for s in stocks])
+    writer.enum("trend", [s["trend"] for s in stocks])
+    writer.numbers("score_change", [s["score_change"] for s in stocks], "i16", SCORE_SCALE)
+    for key in ("positive_count", "negative_count", "neutral_count", "total_count"):
+        writer.numbers(key, [s[key] for s in stocks], "u32")
+    writer.numbers("updated_at", [round((t - base_time).total_seconds()) for t in updated], "u32")
+
+    if spark_days:
+        base = _day(spark_dates[0]) if spark_dates else None
+        matrix: list[Optional[float]] = [None] * (len(stocks) * spark_days)
+        for row, stock in enumerate(stocks):
+            for point in stock.get("spark", ()):
+                offset = (_day(point["date"]) - base).days
+                if offset < spark_days:
+                    matrix[row * spark_days + offset] = point["score"]
+        writer.numbers("spark", matrix, "u16", SCORE_SCALE)
+    return writer.to_bytes()
+
+
+def encode_history(stock_code: str, history: list[dict]) -> bytes:
+    """GET /api/sentiment/{code}/history 응답 (base_date + 일 오프셋, 0.1 단위 점수)"""
+    base = _day(history[0]["date"]) if history else None
+    writer = ColumnarWriter("history", len(history), stock_code=stock_code,
+                            base_date=base.isoformat() if base else None)
+    writer.numbers("day", [(_day(h["date"]) - base).days for h in history], "u16")
+    writer.numbers("score", [h["score"] for h in history], "u16", SCORE_SCALE)
+    return writer.to_bytes()
+
+
+def decode(data: bytes) -> dict:
+    """바이너리 → {"header": …, "columns": {이름: 값 목록}} (테스트/디버깅용, 프론트 디코더와 같은 규칙)"""
+    if data[:4] != MAGIC:
+        raise ValueError("컬럼형 응답이 아닙니다")
+    (length,) = struct.unpack_from("<I", data, 4)
+    header = json.loads(data[8:8 + length])
+    base = 8 + length
+    columns = {}
+    for col in header["columns"]:
+        start = base + col["offset"]
+        if col["type"] == "str":
+            text = data[start:start + col["length"]].decode("utf-8")
+            columns[col["name"]] = text.split("\n") if header["rows"] else []
+        elif col["type"] == "enum":
+            columns[col["name"]] = [col["values"][i] for i in data[start:start + col["length"]]]
+        else:
+            values = array(_TYPECODES[col["type"]])
+            values.frombytes(data[start:start + col["length"] * values.itemsize])
+            if sys.byteorder == "big":
+                values.byteswap()
+            scale = col.get("scale")
+            columns[col["name"]] = [
+                None if scale and v == MISSING and col["type"] == "u16" else v / scale if scale else v
+                for v in values
+            ]
+    return {"header": header, "columns": columns}
@@ -0,0 +1,135 @@
+"""
+개발용 목업 데이터 (실제 DB 연결 전까지 사용)
+실제 구현 시 DB 쿼리로 대체
+"""
+import random
+import zlib
+from datetime import datetime, timedelta
+
+
+def stock_seed(stock_code: str) -> int:
+    """
+    종목코드 기반 시드 - 프로세스/워커가 달라도 같은 값
+    (내장 hash()는 프로세스마다 달라 워커 간 점수가 어긋남)
+    """
+    return zlib.crc32(stock_code.encode()) % 10000
+
+
+def mock_sentiment_row(stock_code: str, stock_name: str, sector: str = "") -> dict:
+    """종목 1개의 목업 감성 데이터 (전역 random 상태를 건드리지 않음)"""
+    rng = random.Random(stock_seed(stock_code))
+    score = rng.uniform(20, 85)
+    pos = rng.randint(10, 80)
+    neg = rng.randint(5, 60)
+    neu = rng.randint(5, 40)
+    total = pos + neg + neu
+    trend = "up" if score > 55 else "down" if score < 45 else "neutral"
+
+    return {
+        "code": stock_code,
+        "name": stock_name,
+        "sector": sector or SECTORS.get(stock_code, ""),
+        "score": round(score, 1),
+        "grade": "A" if score >= 80 else "B" if score >= 65 else "C" if score >= 45 else "D" if score >= 30 else "E",
+        "emoji": "🔥" if score >= 70 else "📈" if score >= 55 else "😐" if score >= 45 else "📉" if score >= 30 else "💀",
+        "trend": trend,
+        "score_change": round(rng.uniform(-10, 10), 1),
+        "positive_count": pos,
+        "negative_count": neg,
+        "neutral_count": neu,
+        "total_count": total,
+        "updated_at": datetime.now().isoformat(),
+    }
+
+
+# 코스피200 샘플 목록
+SAMPLE_STOCKS = [
+    ("005930", "삼성전자"), ("000660", "SK하이닉스"), ("207940", "삼성바이오로직스"),
+    ("005380", "현대차"), ("068270", "셀트리온"), ("035420", "NAVER"),
+    ("051910", "LG화학"), ("006400", "삼성SDI"), ("003550", "LG"),
+    ("028260", "삼성물산"), ("012330", "현대모비스"), ("035720", "카카오"),
+    ("055550", "신한지주"), ("373220", "LG에너지솔루션"), ("096770", "SK이노베이션"),
+    ("003490", "대한항공"), ("034730", "SK"), ("105560", "KB금융"),
+    ("086790", "하나금융지주"), ("030200", "KT"), ("017670", "SK텔레콤"),
+    ("032830", "삼성생명"), ("009150", "삼성전기"), ("018260", "삼성에스디에스"),
+    ("066570", "LG전자"), ("000270", "기아"), ("011200", "HMM"),
+    ("316140", "우리금융지주"), ("015760", "한국전력"), ("032640", "LG유플러스"),
+    ("000100", "유한양행"), ("011170", "롯데케미칼"), ("024110", "기업은행"),
+    ("078930", "GS"), ("036570", "엔씨소프트"), ("010950", "S-Oil"),
+    ("000810", "삼성화재"), ("011790", "SKC"), ("009540", "한국조선해양"),
+    ("042660", "한화오션"), ("047050", "포스코인터내셔널"), ("000120", "CJ대한통운"),
+    ("010140", "삼성중공업"), ("021240", "코웨이"), ("161390", "한국타이어앤테크놀로지"),
+    ("004020", "현대제철"), ("005945", "NH투자증권"), ("034020", "두산에너빌리티"),
+    ("009900", "OCI"), ("029780", "삼성카드"),
+]
+
+# 샘플 종목 업종 (Stock.sector)
+SECTORS = {
+    "005930": "반도체", "000660": "반도체", "009150": "전기전자", "066570": "전기전자",
+    "018260": "IT서비스", "035420": "인터넷", "035720": "인터넷", "036570": "게임",
+    "207940": "바이오", "068270": "바이오", "000100": "제약",
+    "005380": "자동차", "000270": "자동차", "012330": "자동차부품", "161390": "자동차부품",
+    "373220": "2차전지", "006400": "2차전지", "051910": "화학", "011170": "화학",
+    "096770": "에너지", "010950": "에너지", "015760": "유틸리티", "034020": "기계",
+    "009900": "화학", "011790": "화학",
+    "055550": "금융", "105560": "금융", "086790": "금융", "316140": "금융", "024110": "금융",
+    "005945": "증권", "029780": "카드", "032830": "보험", "000810": "보험",
+    "030200": "통신", "017670": "통신", "032640": "통신",
+    "003550": "지주", "034730": "지주", "078930": "지주", "028260": "지주",
+    "003490": "운송", "011200": "운송", "000120": "운송", "047050": "상사",
+    "009540": "조선", "042660": "조선", "010140": "조선",
+    "004020": "철강", "021240": "생활용품",
+}
+
+
+def mock_rows() -> list[dict]:
+    """샘플 종목 전체의 목업 행"""
+    return [mock_sentiment_row(code, name) for code, name in SAMPLE_STOCKS]
+
+
+def mock_history(stock_code: str, base_score: float, days: int) -> list[dict]:
+    """최근 N일 점수 추이 목업 (같은 종목/날짜면 조회 기간과 무관하게 같은 값)"""
+    seed = stock_seed(stock_code)
+    today = datetime.now().date()
+    history = []
+    for i in range(days, 0, -1):
+        day = today - timedelta(days=i)
+        noise = random.Random(seed * 1_000_000 + day.toordinal()).uniform(-12, 12)
+        history.append({"date": day.strftime("%Y-%m-%d"), "score": round(max(10, min(90, base_score + noise)), 1)})
+    return history
+
+
+def mock_comments(stock_code: str, count: int = 20) -> list[dict]:
+    """최근 댓글 목업"""
+    rng = random.Random(stock_seed(stock_code) + 1)
+    crawled_at = datetime.now().isoformat()
+    return [
+        {
+            "id": i,
+            "content": f"{'긍정 의견: 이 종목 좋아보임' if i % 3 == 0 else '부정 의견: 조심해야함' if i % 3 == 1 else '중립: 지켜봐야할듯'}",
+            "author": f"투자자{i:03d}",
+            "likes": rng.randint(0, 50),
+            "sentiment": "positive" if i % 3 == 0 else "negative" if i % 3 == 1 else "neutral",
+            "source": "naver_discuss",
+            "crawled_at": crawled_at,
+        }
+        for i in range(1, count + 1)
+    ]
+
+
+def fake_rows(seed: int, count: int = len(SAMPLE_STOCKS)) -> list[dict]:
+    """
+    부하 테스트용 가짜 보드 (DB 대신 사용)
+    샘플 종목 뒤에 시드로 만든 가상 종목을 붙여 count 개를 만든다 - 같은 시드면 같은 행
+    """
+    rows = [mock_sentiment_row(code, name) for code, name in SAMPLE_STOCKS[:count]]
+    rng = random.Random(seed)
+    used = {code for code, _ in SAMPLE_STOCKS}
+    sectors = sorted(set(SECTORS.values()))
+    while len(rows) < count:
+        code = f"{rng.randrange(100000, 1000000):06d}"
+        if code in used:
+            continue
+        used.add(code)
+        rows.append(mock_sentiment_row(code, f"가상종목{len(rows):03d}", rng.choice(sectors)))
+    return rows
@@ -0,0 +1,87 @@
+"""
+보드 스냅샷 기반 응답 페이로드
+상세/공유/추이/댓글을 같은 스냅샷 행에서 만들어 점수·등급이 항상 일치하도록 한다
+"""
+from datetime import datetime
+from typing import Optional
+
+from ..cards.store import card_url
+from ..comments.buffer import get_recent_comments
+from .board import BoardSnapshot
+from .mock import mock_comments, mock_history, mock_sentiment_row
+
+TREND_KO = {"up": "상승", "down": "하락", "neutral": "중립"}
+DETAIL_HISTORY_DAYS = 7
+
+
+def stock_row(snapshot: BoardSnapshot, stock_code: str) -> dict:
+    """스냅샷 행 (보드에 없는 종목은 목업으로 생성)"""
+    return snapshot.get(stock_code) or mock_sentiment_row(stock_code, stock_code)
+
+
+def history_payload(row: dict, days: int) -> list[dict]:
+    """최근 N일 점수 추이"""
+    return mock_history(row["code"], row["score"], days)
+
+
+def comments_payload(stock_code: str, page: int = 1, size: int = 20) -> dict:
+    """최근 댓글 페이지 (메모리 버퍼에 없는 종목은 목업)"""
+    recent = get_recent_comments()
+    if recent.has(stock_code):
+        total, comments = recent.page(stock_code, page, size)
+    else:
+        all_comments = mock_comments(stock_code)
+        start = (page - 1) * size
+        total, comments = len(all_comments), all_comments[start:start + size]
+    return {
+        "total": total,
+        "page": page,
+        "size": size,
+        "comments": comments,
+    }
+
+
+def detail_payload(row: dict, comments: Optional[list[dict]] = None) -> dict:
+    """종목 상세 (comments=None 이면 댓글 제외)"""
+    payload = {
+        **row,
+        "score_history": history_payload(row, DETAIL_HISTORY_DAYS),
+        "sources": ["naver_discuss"],
+        "dart_url": f"https://dart.fss.or.kr/dsearch/main.do?rcpNo=&textCrpCik={row['code']}",
+    }
+    if comments is not None:
+        payload["comments"] = comments
+    return payload
+
+
+def share_payload(row: dict, snapshot=None) -> dict:
+    """카카오톡 공유용 데이터 (snapshot(기본: 현재 보드)에 없는 종목은 카드 이미지 없음 - image_url None)"""
+    stock_code = row["code"]
+    score, grade, emoji = row["score"], row["grade"], row["emoji"]
+    trend = TREND_KO.get(row["trend"], row["trend"])
+    updated = datetime.now().strftime("%m/%d %H:%M")
+    image = card_url(row, snapshot)
+
+    share_text = (
+        f"{emoji} 곡소리 매매법 알림\n"
+        f"종목: {stock_code}\n"
+        f"감성점수: {score}점 ({grade}등급)\n"
+        f"추세: {trend}\n"
+        f"업데이트: {updated}\n"
+        f"👉 https://goksori.com/stock/{stock_code}"
+    )
+
+    return {
+        "stock_code": stock_code,
+        "score": score,
+        "grade": grade,
+        "emoji": emoji,
+        "trend": trend,
+        "share_text": share_text,
+        "kakao_share": {
+            "title": f"{emoji} {stock_code} 곡소리 감성점수: {score}점",
+            "description": f"등급: {grade} | 추세: {trend} | {updated} 기준",
+            "link_url": f"https://goksori.com/stock/{stock_code}",
+            "image_url": f"https://goksori.com{image}" if image else None,
+        },
+    }
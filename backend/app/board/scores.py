@@ -0,0 +1,75 @@
+"""
+보드 행 소스 (BOARD_SOURCE)
+- database: 종목별 가장 최근 sentiment_scores 행 (jobs.aggregate 가 집계 주기마다 기록) + 종목 마스터
+- mock: 개발용 목업 (board.mock)
+"""
+from functools import partial
+from typing import Callable, Optional
+
+RowSource = Callable[[], list[dict]]
+
+
+def latest_score_rows(session_factory=None) -> list[dict]:
+    """활성 종목별 최신 점수 1행 → 보드 행 (점수가 아직 없는 종목은 빠진다)"""
+    from sqlalchemy import func, select
+    from ..models import SentimentScore, Stock
+    from ..sentiment.analyzer import score_emoji, score_grade
+
+    if session_factory is None:
+        from ..db.session import SessionLocal
+        session_factory = SessionLocal
+
+    rank = func.row_number().over(
+        partition_by=SentimentScore.stock_id,
+        order_by=(SentimentScore.period_end.desc(), SentimentScore.id.desc()),
+    ).label("rank")
+    latest = select(SentimentScore, rank).subquery("latest")
+    query = (
+        select(Stock.code, Stock.name, Stock.sector, latest)
+        .join(latest, latest.c.stock_id == Stock.id)
+        .where(latest.c.rank == 1, Stock.is_active == 1)
+        .order_by(Stock.code)
+    )
+    with session_factory() as session:
+        rows = session.execute(query).mappings().all()
+    return [
+        {
+            "code": r["code"],
+            "name": r["name"],
+            "sector": r["sector"] or "",
+            "score": r["score"],
+            "grade": score_grade(r["score"]),
+            "emoji": score_emoji(r["score"]),
+            "trend": r["trend"] or "neutral",
+            "score_change": r["score_change"] or 0.0,
+            "positive_count": r["positive_count"] or 0,
+            "negative_count": r["negative_count"] or 0,
+            "neutral_count": r["neutral_count"] or 0,
+            "total_count": r["total_count"] or 0,
+            "updated_at": r["period_end"].isoformat(),
+        }
+        for r in rows
+    ]
+
+
+def latest_score_id(session_factory=None) -> Optional[int]:
+    """가장 최근에 기록된 점수 행 id (집계가 새로 돌았는지 확인용 DB 버전)"""
+    from sqlalchemy import func, select
+    from ..models import SentimentScore
+
+    if session_factory is None:
+        from ..db.session import SessionLocal
+        session_factory = SessionLocal
+    with session_factory() as session:
+        return session.scalar(select(func.max(SentimentScore.id)))
+
+
+def get_row_source(name: Optional[str] = None, session_factory=None) -> RowSource:
+    """설정(BOARD_SOURCE)에 맞는 보드 행 소스"""
+    if name is None:
+        from ..config import get_settings
+        name = get_settings().board_source
+    if name == "database":
+        return partial(latest_score_rows, session_factory)
+    from .mock import mock_rows
+    return mock_rows
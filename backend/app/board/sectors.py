@@ -0,0 +1,170 @@
+"""
+업종별 / 시장 전체 감성 집계
+- 보드 스냅샷의 종목 행을 열 배열로 바꿔 업종 인덱스 기준으로 한 번에 합산 (numpy)
+- 점수는 댓글 수(total_count)로 가중 평균 → 댓글이 많은 종목의 분위기가 더 크게 반영
+- 다음 스냅샷에서 종목 구성이 같으면 점수가 바뀐 종목의 차이만 더해 갱신 (바뀐 업종만 다시 직렬화)
+"""
+import threading
+from typing import Optional
+
+import numpy as np
+
+from .board import BoardSnapshot
+
+UNCLASSIFIED = "기타"
+HOT_SCORE = 70.0   # 🔥 급등 시그널 (프론트 통계 바와 같은 기준)
+COLD_SCORE = 30.0  # 💀 급락 시그널
+REBUILD_EVERY = 100  # 증분 갱신 누적 오차 방지용 전체 재계산 주기
+
+# 종목별 열 (합산 대상)
+COLUMNS = (
+    "weighted_score",  # score * total_count
+    "comment_count",   # total_count (가중치)
+    "score",
+    "stock_count",
+    "positive_count",
+    "negative_count",
+    "neutral_count",
+    "hot_count",
+    "cold_count",
+    "up_count",
+    "down_count",
+)
+_COL = {name: i for i, name in enumerate(COLUMNS)}
+
+
+def row_columns(rows) -> np.ndarray:
+    """종목 행 → (종목 수, 열 수) 배열"""
+    raw = np.array(
+        [
+            (r["score"], r.get("total_count", 0), r.get("positive_count", 0), r.get("negative_count", 0),
+             r.get("neutral_count", 0), r["trend"] == "up", r["trend"] == "down")
+            for r in rows
+        ],
+        dtype=np.float64,
+    ).reshape(-1, 7)
+    score, weight = raw[:, 0], raw[:, 1]
+    out = np.empty((len(raw), len(COLUMNS)), dtype=np.float64)
+    out[:, _COL["weighted_score"]] = score * weight
+    out[:, _COL["comment_count"]] = weight
+    out[:, _COL["score"]] = score
+    out[:, _COL["stock_count"]] = 1.0
+    out[:, _COL["positive_count"]:_COL["neutral_count"] + 1] = raw[:, 2:5]
+    out[:, _COL["hot_count"]] = score >= HOT_SCORE
+    out[:, _COL["cold_count"]] = score <= COLD_SCORE
+    out[:, _COL["up_count"]:_COL["down_count"] + 1] = raw[:, 5:7]
+    return out
+
+
+def summarize(sums: np.ndarray) -> dict:
+    """합산 행 1개 → 응답 항목"""
+    count = int(sums[_COL["stock_count"]])
+    comments = sums[_COL["comment_count"]]
+    simple = sums[_COL["score"]] / count if count else 50.0
+    score = sums[_COL["weighted_score"]] / comments if comments > 0 else simple
+    return {
+        "score": round(float(score), 1),
+        "avg_score": round(float(simple), 1),
+        "trend": "up" if score > 55 else "down" if score < 45 else "neutral",
+        "stock_count": count,
+        "comment_count": int(comments),
+        "positive_count": int(sums[_COL["positive_count"]]),
+        "negative_count": int(sums[_COL["negative_count"]]),
+        "neutral_count": int(sums[_COL["neutral_count"]]),
+        "hot_count": int(sums[_COL["hot_count"]]),
+        "cold_count": int(sums[_COL["cold_count"]]),
+        "up_count": int(sums[_COL["up_count"]]),
+        "down_count": int(sums[_COL["down_count"]]),
+    }
+
+
+class SectorAggregates:
+    """한 종목 구성(코드 + 업종)에 대한 업종별 합계 - 점수 변경은 update 로 증분 반영"""
+
+    def __init__(self, rows):
+        rows = list(rows)
+        self.codes = tuple(r["code"] for r in rows)
+        names = [r.get("sector") or UNCLASSIFIED for r in rows]
+        self.sectors = sorted(set(names))
+        index = {name: i for i, name in enumerate(self.sectors)}
+        self.sector_idx = np.fromiter((index[n] for n in names), dtype=np.intp, count=len(names))
+        self.layout = tuple(zip(self.codes, names))
+        self.columns = row_columns(rows)
+        self.sums = np.zeros((len(self.sectors), len(COLUMNS)), dtype=np.float64)
+        np.add.at(self.sums, self.sector_idx, self.columns)
+        self.updates = 0
+        self._items: dict[int, dict] = {}
+
+    def same_layout(self, rows) -> bool:
+        return tuple((r["code"], r.get("sector") or UNCLASSIFIED) for r in rows) == self.layout
+
+    def update(self, rows) -> np.ndarray:
+        """같은 구성의 새 행 반영 → 바뀐 업종 인덱스"""
+        columns = row_columns(rows)
+        changed = np.flatnonzero(np.any(columns != self.columns, axis=1))
+        if len(changed):
+            np.add.at(self.sums, self.sector_idx[changed], columns[changed] - self.columns[changed])
+            self.columns = columns
+            self.updates += 1
+        touched = np.unique(self.sector_idx[changed])
+        for i in touched:
+            self._items.pop(int(i), None)
+        return touched
+
+    def sector_item(self, i: int) -> dict:
+        item = self._items.get(i)
+        if item is None:
+            item = self._items[i] = {"sector": self.sectors[i], **summarize(self.sums[i])}
+        return item
+
+    def payload(self) -> dict:
+        return {
+            "market": summarize(self.sums.sum(axis=0)),
+            "sectors": [self.sector_item(i) for i in range(len(self.sectors))],
+        }
+
+
+class SectorBoard:
+    """보드 스냅샷 세대별 업종 집계 (이전 세대 상태에서 증분 갱신)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._state: Optional[SectorAggregates] = None
+        self._current: Optional[tuple[int, dict]] = None  # (세대, 응답)
+        self.full_builds = 0
+        self.incremental_updates = 0
+
+    def for_snapshot(self, snapshot: BoardSnapshot) -> dict:
+        current = self._current
+        if current is None or current[0] != snapshot.generation:
+            with self._lock:
+                current = self._current
+                if current is None or current[0] != snapshot.generation:
+                    current = self._current = (snapshot.generation, self._apply(snapshot))
+        return current[1]
+
+    def _apply(self, snapshot: BoardSnapshot) -> dict:
+        state = self._state
+        if state is not None and state.updates < REBUILD_EVERY and state.same_layout(snapshot.rows):
+            state.update(snapshot.rows)
+            self.incremental_updates += 1
+        else:
+            state = self._state = SectorAggregates(snapshot.rows)
+            self.full_builds += 1
+        return {"generation": snapshot.generation, **state.payload()}
+
+    def stats(self) -> dict:
+        return {"full_builds": self.full_builds, "incremental_updates": self.incremental_updates}
+
+
+_sector_board: Optional[SectorBoard] = None
+_sector_board_lock = threading.Lock()
+
+
+def get_sector_board() -> SectorBoard:
+    global _sector_board
+    if _sector_board is None:
+        with _sector_board_lock:
+            if _sector_board is None:
+                _sector_board = SectorBoard()
+    return _sector_board
@@ -0,0 +1,13 @@
+from .generation import current_generation, bump_generation
+from .response_cache import ResponseCache, ResponseCacheMiddleware, CachedResponse
+from .singleflight import SingleFlight, singleflight_stats
+
+__all__ = [
+    "current_generation",
+    "bump_generation",
+    "ResponseCache",
+    "ResponseCacheMiddleware",
+    "CachedResponse",
+    "SingleFlight",
+    "singleflight_stats",
+]
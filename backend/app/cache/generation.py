@@ -0,0 +1,22 @@
+"""
+데이터 세대(generation) 카운터
+크롤링/집계 주기가 끝나 데이터가 바뀔 때마다 1씩 증가
+응답 캐시 등은 이 값이 바뀌면 무효화된다
+"""
+import threading
+
+_lock = threading.Lock()
+_generation = 0
+
+
+def current_generation() -> int:
+    """현재 데이터 세대"""
+    return _generation
+
+
+def bump_generation() -> int:
+    """데이터 갱신 완료 시 호출 - 새 세대 번호 반환"""
+    global _generation
+    with _lock:
+        _generation += 1
+        return _generation
@@ -0,0 +1,242 @@
+"""
+읽기 API 응답 캐시
+- 라우트 + 쿼리 파라미터 기준으로 직렬화된 응답 바이트를 보관 (gzip 사전 압축 포함)
+- Accept 로 형식을 고르는 경로(variants)는 형식별로 따로 보관 (Vary: Accept)
+- 데이터 세대(generation)가 바뀌면 전체 무효화, discard 로 일부 키만 무효화 (예: 새 댓글이 들어온 종목)
+- ETag / If-None-Match → 304 Not Modified
+"""
+import gzip
+import hashlib
+import re
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Optional, Sequence
+from urllib.parse import parse_qsl, urlencode
+
+from starlette.datastructures import Headers
+
+from .generation import current_generation
+
+GZIP_MIN_SIZE = 500
+GZIP_LEVEL = 6
+
+# 캐시 응답에서 다시 계산하는 헤더
+_DROP_HEADERS = {b"content-length", b"content-encoding", b"etag", b"cache-control", b"vary"}
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    """직렬화가 끝난 응답 한 건"""
+    status: int
+    headers: tuple[tuple[bytes, bytes], ...]
+    body: bytes
+    gzip_body: Optional[bytes]
+    etag: str
+
+
+def make_etag(body: bytes) -> str:
+    return '"' + hashlib.blake2b(body, digest_size=8).hexdigest() + '"'
+
+
+def accepts_media_type(accept: Optional[str], media_type: str) -> bool:
+    """Accept 헤더가 media_type 을 받는지 (q=0 은 거부로 본다)"""
+    for part in (accept or "").split(","):
+        media, *params = [p.strip() for p in part.split(";")]
+        if media.lower() != media_type:
+            continue
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    return float(value) > 0
+                except ValueError:
+                    return False
+        return True
+    return False
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match 헤더가 ETag와 일치하는지 (약한 비교)"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
+
+
+class ResponseCache:
+    """
+    세대 기반 LRU 응답 캐시
+    get/put 시 전달된 세대가 저장된 세대와 다르면 전체를 비운다
+    discards: discard 호출 횟수 - 렌더링 전에 읽어 put 에 넘기면 도중에 무효화된 응답은 저장하지 않음
+    """
+
+    def __init__(self, max_entries: int = 2048):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, CachedResponse]" = OrderedDict()
+        self._generation = current_generation()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.discards = 0
+        self.discarded = 0
+
+    def _sync(self, generation: int) -> None:
+        if generation != self._generation:
+            self._entries.clear()
+            self._generation = generation
+
+    def get(self, key: str, generation: int) -> Optional[CachedResponse]:
+        with self._lock:
+            self._sync(generation)
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def put(self, key: str, generation: int, entry: CachedResponse, discards: Optional[int] = None) -> None:
+        with self._lock:
+            if generation < self._generation:
+                return  # 렌더링 도중 데이터가 갱신됨 - 오래된 응답은 저장하지 않음
+            if discards is not None and discards != self.discards:
+                return  # 렌더링 도중 일부 키가 무효화됨 - 이 응답이 그 대상일 수 있다
+            self._sync(generation)
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def discard(self, predicate: Callable[[str], bool]) -> int:
+        """predicate(키) 가 참인 항목 제거 → 제거한 수"""
+        with self._lock:
+            keys = [k for k in self._entries if predicate(k)]
+            for key in keys:
+                del self._entries[key]
+            self.discards += 1
+            self.discarded += len(keys)
+            return len(keys)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        return {
+            "generation": self._generation,
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "discarded": self.discarded,
+        }
+
+
+def build_entry(status: int, raw_headers: Sequence[tuple[bytes, bytes]], body: bytes) -> CachedResponse:
+    """다운스트림 응답으로 캐시 엔트리 생성 (gzip 사전 압축)"""
+    headers = tuple((k, v) for k, v in raw_headers if k.lower() not in _DROP_HEADERS)
+    gzip_body = gzip.compress(body, compresslevel=GZIP_LEVEL, mtime=0) if len(body) >= GZIP_MIN_SIZE else None
+    return CachedResponse(status=status, headers=headers, body=body, gzip_body=gzip_body, etag=make_etag(body))
+
+
+class ResponseCacheMiddleware:
+    """
+    GET 응답 캐시 ASGI 미들웨어
+    paths: 캐시 대상 경로 정규식 목록
+    cache: 공유 ResponseCache (없으면 새로 생성)
+    variants: Accept 헤더로 고를 수 있는 다른 응답 형식 (예: application/vnd.goksori.columnar)
+    """
+
+    def __init__(self, app, paths: Sequence[str], cache: Optional[ResponseCache] = None, max_age: int = 0,
+                 variants: Sequence[str] = ()):
+        self.app = app
+        self.patterns = [re.compile(p) for p in paths]
+        self.cache = cache if cache is not None else ResponseCache()
+        self.cache_control = f"public, max-age={max_age}, must-revalidate".encode()
+        self.variants = tuple(variants)
+        self.vary = b"Accept-Encoding, Accept" if self.variants else b"Accept-Encoding"
+
+    def _cacheable(self, scope) -> bool:
+        return (
+            scope["type"] == "http"
+            and scope["method"] == "GET"
+            and any(p.match(scope["path"]) for p in self.patterns)
+        )
+
+    @staticmethod
+    def cache_key(scope, variant: str = "") -> str:
+        """경로 + 정렬된 쿼리 파라미터 (+ Accept 로 고른 형식)"""
+        query = scope.get("query_string", b"").decode("latin-1")
+        params = sorted(parse_qsl(query, keep_blank_values=True))
+        key = scope["path"] + "?" + urlencode(params)
+        return f"{key}#{variant}" if variant else key
+
+    def _variant(self, scope) -> str:
+        if not self.variants:
+            return ""
+        accept = Headers(scope=scope).get("accept")
+        return next((v for v in self.variants if accepts_media_type(accept, v)), "")
+
+    async def __call__(self, scope, receive, send):
+        if not self._cacheable(scope):
+            await self.app(scope, receive, send)
+            return
+
+        key = self.cache_key(scope, self._variant(scope))
+        generation = current_generation()
+        discards = self.cache.discards
+        entry = self.cache.get(key, generation)
+        status = b"HIT"
+
+        if entry is None:
+            status = b"MISS"
+            messages = []
+
+            async def capture(message):
+                messages.append(message)
+
+            await self.app(scope, receive, capture)
+
+            start = messages[0] if messages else None
+            if start is None or start["status"] != 200:
+                for message in messages:
+                    await send(message)
+                return
+
+            body = b"".join(m.get("body", b"") for m in messages[1:] if m["type"] == "http.response.body")
+            entry = build_entry(start["status"], start.get("headers", []), body)
+            self.cache.put(key, generation, entry, discards)
+
+        await self._respond(scope, send, entry, status)
+
+    async def _respond(self, scope, send, entry: CachedResponse, cache_status: bytes) -> None:
+        request_headers = Headers(scope=scope)
+        headers = [
+            (b"etag", entry.etag.encode()),
+            (b"cache-control", self.cache_control),
+            (b"vary", self.vary),
+            (b"x-cache", cache_status),
+        ]
+
+        if etag_matches(request_headers.get("if-none-match"), entry.etag):
+            await send({"type": "http.response.start", "status": 304, "headers": headers})
+            await send({"type": "http.response.body", "body": b""})
+            return
+
+        body = entry.body
+        if entry.gzip_body is not None and "gzip" in request_headers.get("accept-encoding", ""):
+            body = entry.gzip_body
+            headers.append((b"content-encoding", b"gzip"))
+
+        headers.extend(entry.headers)
+        headers.append((b"content-length", str(len(body)).encode()))
+        await send({"type": "http.response.start", "status": entry.status, "headers": headers})
+        await send({"type": "http.response.body", "body": body})
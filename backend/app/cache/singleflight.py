@@ -0,0 +1,88 @@
+"""
+동일 요청 병합 (single-flight)
+같은 키로 동시에 들어온 요청은 진행 중인 계산 하나를 함께 기다린다
+grace 가 있으면 계산이 끝난 뒤에도 그 시간 동안 결과를 재사용
+"""
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Optional, TypeVar
+
+T = TypeVar("T")
+
+MAX_RECENT = 4096
+
+_registry: dict[str, "SingleFlight"] = {}
+
+
+class SingleFlight:
+    """
+    name: 통계 구분용 이름
+    grace: 완료된 결과 재사용 시간 (초, 0이면 진행 중인 요청만 병합)
+    """
+
+    def __init__(self, name: str, grace: float = 0.0):
+        self.name = name
+        self.grace = grace
+        self._inflight: dict[Any, asyncio.Future] = {}
+        self._recent: dict[Any, tuple[float, Any]] = {}
+        self.calls = 0
+        self.executions = 0
+        self.coalesced = 0
+        self.grace_hits = 0
+        _registry[name] = self
+
+    async def do(self, key, fn: Callable[[], Awaitable[T]]) -> T:
+        """key 로 진행 중인 계산이 있으면 합류, 없으면 fn() 실행"""
+        self.calls += 1
+
+        if self.grace > 0:
+            recent = self._recent.get(key)
+            if recent is not None:
+                if recent[0] > time.monotonic():
+                    self.grace_hits += 1
+                    return recent[1]
+                del self._recent[key]
+
+        task = self._inflight.get(key)
+        if task is None:
+            # 계산은 별도 태스크로 - 처음 요청한 쪽이 취소(클라이언트 연결 끊김)돼도 다른 요청은 결과를 받는다
+            task = asyncio.ensure_future(fn())
+            task.add_done_callback(lambda t: self._done(key, t))
+            self._inflight[key] = task
+            self.executions += 1
+        else:
+            self.coalesced += 1
+        # shield: 기다리던 요청이 취소되면 그 요청만 빠지고 공유 계산은 계속
+        return await asyncio.shield(task)
+
+    def _done(self, key, task: asyncio.Future) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if task.cancelled():
+            return
+        if task.exception() is not None:  # 확인 처리 - 기다리는 요청이 모두 빠졌어도 경고가 남지 않도록
+            return
+        if self.grace > 0:
+            self._remember(key, task.result())
+
+    def _remember(self, key, result) -> None:
+        now = time.monotonic()
+        if len(self._recent) >= MAX_RECENT:
+            self._recent = {k: v for k, v in self._recent.items() if v[0] > now}
+            if len(self._recent) >= MAX_RECENT:
+                self._recent.clear()
+        self._recent[key] = (now + self.grace, result)
+
+    def stats(self) -> dict:
+        return {
+            "calls": self.calls,
+            "executions": self.executions,
+            "coalesced": self.coalesced,
+            "grace_hits": self.grace_hits,
+            "inflight": len(self._inflight),
+        }
+
+
+def singleflight_stats() -> dict[str, dict]:
+    """이름별 병합 통계"""
+    return {name: flight.stats() for name, flight in _registry.items()}
@@ -0,0 +1,4 @@
+from .renderer import render_card, card_key
+from .store import ShareCardStore, card_filename, card_url, get_card_store
+
+__all__ = ["render_card", "card_key", "ShareCardStore", "card_filename", "card_url", "get_card_store"]
@@ -0,0 +1,173 @@
+"""
+공유 카드(OG 이미지) 렌더러
+점수, 등급, 이모지, 추세를 1200x630 PNG로 그린다
+이미지 라이브러리 없이 zlib + 비트맵 폰트로 직접 인코딩 (서버 의존성 추가 없음)
+"""
+import hashlib
+import struct
+import zlib
+
+WIDTH = 1200
+HEIGHT = 630
+RENDERER_VERSION = "1"
+
+Color = tuple[int, int, int]
+
+BG: Color = (13, 15, 20)          # #0d0f14
+PANEL: Color = (28, 34, 48)       # #1c2230
+TEXT: Color = (232, 234, 240)     # #e8eaf0
+MUTED: Color = (136, 144, 168)    # #8890a8
+POSITIVE: Color = (38, 217, 127)  # #26d97f
+NEGATIVE: Color = (240, 80, 96)   # #f05060
+ACCENT: Color = (79, 142, 247)    # #4f8ef7
+NEUTRAL: Color = (240, 184, 64)
+
+GRADE_COLORS: dict[str, Color] = {
+    "A": POSITIVE, "B": (120, 200, 100), "C": NEUTRAL, "D": (240, 130, 80), "E": NEGATIVE,
+}
+TREND_COLORS: dict[str, Color] = {"up": POSITIVE, "down": NEGATIVE, "neutral": MUTED}
+
+# 5x7 비트맵 폰트 (각 행 5비트)
+FONT: dict[str, tuple[int, ...]] = {
+    "0": (0b01110, 0b10001, 0b10011, 0b10101, 0b11001, 0b10001, 0b01110),
+    "1": (0b00100, 0b01100, 0b00100, 0b00100, 0b00100, 0b00100, 0b01110),
+    "2": (0b01110, 0b10001, 0b00001, 0b00010, 0b00100, 0b01000, 0b11111),
+    "3": (0b11111, 0b00010, 0b00100, 0b00010, 0b00001, 0b10001, 0b01110),
+    "4": (0b00010, 0b00110, 0b01010, 0b10010, 0b11111, 0b00010, 0b00010),
+    "5": (0b11111, 0b10000, 0b11110, 0b00001, 0b00001, 0b10001, 0b01110),
+    "6": (0b00110, 0b01000, 0b10000, 0b11110, 0b10001, 0b10001, 0b01110),
+    "7": (0b11111, 0b00001, 0b00010, 0b00100, 0b01000, 0b01000, 0b01000),
+    "8": (0b01110, 0b10001, 0b10001, 0b01110, 0b10001, 0b10001, 0b01110),
+    "9": (0b01110, 0b10001, 0b10001, 0b01111, 0b00001, 0b00010, 0b01100),
+    ".": (0, 0, 0, 0, 0, 0b01100, 0b01100),
+    "-": (0, 0, 0, 0b11111, 0, 0, 0),
+    "+": (0, 0b00100, 0b00100, 0b11111, 0b00100, 0b00100, 0),
+    "A": (0b01110, 0b10001, 0b10001, 0b11111, 0b10001, 0b10001, 0b10001),
+    "B": (0b11110, 0b10001, 0b10001, 0b11110, 0b10001, 0b10001, 0b11110),
+    "C": (0b01110, 0b10001, 0b10000, 0b10000, 0b10000, 0b10001, 0b01110),
+    "D": (0b11100, 0b10010, 0b10001, 0b10001, 0b10001, 0b10010, 0b11100),
+    "E": (0b11111, 0b10000, 0b10000, 0b11110, 0b10000, 0b10000, 0b11111),
+    " ": (0, 0, 0, 0, 0, 0, 0),
+}
+
+# 7x7 추세 화살표
+TREND_ICONS: dict[str, tuple[int, ...]] = {
+    "up": (0b0001000, 0b0011100, 0b0111110, 0b1111111, 0b0011100, 0b0011100, 0b0011100),
+    "down": (0b0011100, 0b0011100, 0b0011100, 0b1111111, 0b0111110, 0b0011100, 0b0001000),
+    "neutral": (0b0001000, 0b0001100, 0b1111110, 0b1111111, 0b1111110, 0b0001100, 0b0001000),
+}
+
+# 7x7 이모지 픽토그램 (색상 포함)
+EMOJI_ICONS: dict[str, tuple[Color, tuple[int, ...]]] = {
+    "🔥": ((255, 120, 40), (0b0001000, 0b0011000, 0b0011100, 0b0111110, 0b1111111, 0b1111111, 0b0111110)),
+    "📈": (POSITIVE, (0b0000001, 0b0000011, 0b0000110, 0b1001100, 0b1111000, 0b0110000, 0b1111111)),
+    "😐": (NEUTRAL, (0b0111110, 0b1000001, 0b1010101, 0b1000001, 0b1011101, 0b1000001, 0b0111110)),
+    "📉": (NEGATIVE, (0b1000000, 0b1100000, 0b0110000, 0b0011001, 0b0001111, 0b0000110, 0b1111111)),
+    "💀": (TEXT, (0b0111110, 0b1111111, 0b1001001, 0b1111111, 0b0110110, 0b0111110, 0b0101010)),
+}
+
+
+def card_key(row: dict) -> str:
+    """카드 내용을 결정하는 값의 해시 - 같으면 같은 PNG (콘텐츠 해시 파일명에 사용)"""
+    raw = "|".join([
+        RENDERER_VERSION, row["code"], f"{row['score']:.1f}", row["grade"], row["emoji"], row["trend"],
+    ])
+    return hashlib.blake2b(raw.encode("utf-8"), digest_size=6).hexdigest()
+
+
+class Canvas:
+    """RGB 스캔라인 버퍼 - 사각형 채우기 단위로만 그린다"""
+
+    def __init__(self, width: int, height: int, bg: Color):
+        self.width = width
+        self.height = height
+        line = bytes(bg) * width
+        self.rows = [bytearray(line) for _ in range(height)]
+
+    def rect(self, x: int, y: int, w: int, h: int, color: Color) -> None:
+        x0, x1 = max(0, x), min(self.width, x + w)
+        y0, y1 = max(0, y), min(self.height, y + h)
+        if x0 >= x1 or y0 >= y1:
+            return
+        fill = bytes(color) * (x1 - x0)
+        for row in self.rows[y0:y1]:
+            row[x0 * 3:x1 * 3] = fill
+
+    def bitmap(self, x: int, y: int, rows: tuple[int, ...], bits: int, scale: int, color: Color) -> None:
+        """비트맵을 scale 배로 그리기 (연속된 1 비트는 한 번에 채움)"""
+        for r, mask in enumerate(rows):
+            c = 0
+            while c < bits:
+                if mask >> (bits - 1 - c) & 1:
+                    start = c
+                    while c < bits and mask >> (bits - 1 - c) & 1:
+                        c += 1
+                    self.rect(x + start * scale, y + r * scale, (c - start) * scale, scale, color)
+                else:
+                    c += 1
+
+    def text(self, x: int, y: int, text: str, scale: int, color: Color) -> int:
+        """5x7 폰트로 문자열 그리기, 다음 x 위치 반환"""
+        for ch in text:
+            glyph = FONT.get(ch, FONT[" "])
+            self.bitmap(x, y, glyph, 5, scale, color)
+            x += 6 * scale
+        return x
+
+    def to_png(self) -> bytes:
+        raw = b"".join(b"\x00" + bytes(row) for row in self.rows)
+
+        def chunk(tag: bytes, data: bytes) -> bytes:
+            return struct.pack(">I", len(data)) + tag + data + struct.pack(">I", zlib.crc32(tag + data) & 0xFFFFFFFF)
+
+        header = struct.pack(">IIBBBBB", self.width, self.height, 8, 2, 0, 0, 0)
+        return (
+            b"\x89PNG\r\n\x1a\n"
+            + chunk(b"IHDR", header)
+            + chunk(b"IDAT", zlib.compress(raw, 6))
+            + chunk(b"IEND", b"")
+        )
+
+
+def text_width(text: str, scale: int) -> int:
+    return len(text) * 6 * scale - scale
+
+
+def render_card(row: dict) -> bytes:
+    """종목 행 하나로 공유 카드 PNG 생성"""
+    score = float(row["score"])
+    grade = row["grade"]
+    grade_color = GRADE_COLORS.get(grade, ACCENT)
+    trend_color = TREND_COLORS.get(row["trend"], MUTED)
+
+    canvas = Canvas(WIDTH, HEIGHT, BG)
+    canvas.rect(0, 0, WIDTH, 16, grade_color)
+    canvas.rect(60, 70, WIDTH - 120, 400, PANEL)
+
+    # 종목코드
+    canvas.text(100, 100, row["code"], 6, MUTED)
+
+    # 이모지
+    emoji_color, emoji_bits = EMOJI_ICONS.get(row["emoji"], EMOJI_ICONS["😐"])
+    canvas.bitmap(WIDTH - 100 - 7 * 14, 100, emoji_bits, 7, 14, emoji_color)
+
+    # 점수
+    score_text = f"{score:.1f}"
+    canvas.text(100, 200, score_text, 22, TEXT)
+
+    # 추세 화살표
+    arrow_x = 100 + text_width(score_text, 22) + 50
+    canvas.bitmap(arrow_x, 240, TREND_ICONS.get(row["trend"], TREND_ICONS["neutral"]), 7, 14, trend_color)
+
+    # 등급 배지
+    badge = 190
+    bx, by = WIDTH - 100 - badge, 250
+    canvas.rect(bx, by, badge, badge, grade_color)
+    canvas.text(bx + (badge - text_width(grade, 20)) // 2, by + (badge - 7 * 20) // 2, grade, 20, BG)
+
+    # 점수 바 (0~100)
+    bar_y, bar_w = 520, WIDTH - 120
+    canvas.rect(60, bar_y, bar_w, 40, PANEL)
+    canvas.rect(60, bar_y, int(bar_w * max(0.0, min(100.0, score)) / 100), 40, grade_color)
+
+    return canvas.to_png()
@@ -0,0 +1,133 @@
+"""
+공유 카드 캐시
+- 파일명에 내용 해시를 넣어 (og_{code}.{key}.png) 한 번 만든 URL은 내용이 바뀌지 않음 → 장기 캐시 가능
+- 보드가 갱신되면 점수/등급/추세가 바뀐 카드만 백그라운드 풀에서 다시 렌더링
+- 아직 렌더링되지 않은 카드가 요청되면 그 자리에서 한 번 렌더링
+- 저장 디렉터리는 첫 렌더링 때 만든다 (앱 import 만으로는 파일시스템을 건드리지 않음)
+"""
+import logging
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Optional
+
+from .renderer import card_key, render_card
+
+logger = logging.getLogger(__name__)
+
+CARD_URL_PREFIX = "/api/share/cards"
+KEEP_PER_STOCK = 2  # 이미 공유된 이전 URL을 위해 직전 카드 1개 보관
+
+
+def card_filename(code: str, key: str) -> str:
+    return f"og_{code}.{key}.png"
+
+
+def card_url(row: dict, snapshot=None) -> Optional[str]:
+    """
+    행에 해당하는 카드 URL 경로 (렌더링 여부와 무관하게 내용으로 결정됨)
+    카드 API 는 보드에 있는 종목만 서빙하므로, 보드(snapshot, 기본: 공유 보드)에 없는 종목은 None
+    """
+    if snapshot is None:
+        from ..board import get_board
+        snapshot = get_board().snapshot
+    if snapshot.get(row["code"]) is None:
+        return None
+    return f"{CARD_URL_PREFIX}/{card_filename(row['code'], card_key(row))}"
+
+
+class ShareCardStore:
+    """
+    directory: 카드 PNG 저장 디렉터리
+    workers: 백그라운드 렌더링 스레드 수
+    """
+
+    def __init__(self, directory: Path, workers: int = 2):
+        self.directory = Path(directory)
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="share-card")
+        self._lock = threading.Lock()
+        self._current: dict[str, str] = {}         # 종목코드 → 현재 카드 키
+        self._pending: dict[str, Future] = {}      # 파일명 → 렌더링 중인 작업
+        self.rendered = 0
+        self.skipped = 0
+
+    def path_for(self, filename: str) -> Path:
+        return self.directory / filename
+
+    def on_board_refresh(self, previous, snapshot) -> None:
+        """StockBoard.subscribe 용 리스너 - 바뀐 카드만 백그라운드 렌더링 예약"""
+        changed = 0
+        for row in snapshot.rows:
+            key = card_key(row)
+            if self._current.get(row["code"]) == key and self.path_for(card_filename(row["code"], key)).exists():
+                self.skipped += 1
+                continue
+            self.submit(row)
+            changed += 1
+        if changed:
+            logger.info(f"공유 카드 렌더링 예약: {changed}개 (변경 없음 {len(snapshot) - changed}개)")
+
+    def submit(self, row: dict) -> Future:
+        """렌더링 예약 (같은 카드가 이미 진행 중이면 그 작업을 공유)"""
+        filename = card_filename(row["code"], card_key(row))
+        with self._lock:
+            future = self._pending.get(filename)
+            if future is None:
+                future = self._pool.submit(self._render, dict(row), filename)
+                self._pending[filename] = future
+        return future
+
+    def get(self, row: dict, timeout: float = 10.0) -> Path:
+        """카드 파일 경로 (없으면 렌더링될 때까지 대기)"""
+        path = self.path_for(card_filename(row["code"], card_key(row)))
+        if path.exists():
+            return path
+        return self.submit(row).result(timeout=timeout)
+
+    def _render(self, row: dict, filename: str) -> Path:
+        try:
+            path = self.path_for(filename)
+            if not path.exists():
+                self.directory.mkdir(parents=True, exist_ok=True)
+                tmp = path.with_name(f".{filename}.{os.getpid()}.tmp")
+                tmp.write_bytes(render_card(row))
+                os.replace(tmp, path)
+                self.rendered += 1
+            with self._lock:
+                self._current[row["code"]] = card_key(row)
+            self._prune(row["code"], keep=filename)
+            return path
+        finally:
+            with self._lock:
+                self._pending.pop(filename, None)
+
+    def _prune(self, code: str, keep: str) -> None:
+        old = sorted(
+            (p for p in self.directory.glob(f"og_{code}.*.png") if p.name != keep),
+            key=lambda p: p.stat().st_mtime,
+            reverse=True,
+        )
+        for p in old[KEEP_PER_STOCK - 1:]:
+            p.unlink(missing_ok=True)
+
+    def stats(self) -> dict:
+        return {"rendered": self.rendered, "skipped": self.skipped, "pending": len(self._pending)}
+
+    def shutdown(self) -> None:
+        self._pool.shutdown(wait=False)
+
+
+_store: Optional[ShareCardStore] = None
+_store_lock = threading.Lock()
+
+
+def get_card_store() -> ShareCardStore:
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                from ..config import get_settings
+                settings = get_settings()
+                _store = ShareCardStore(settings.share_card_dir, workers=settings.share_card_workers)
+    return _store
@@ -0,0 +1,15 @@
+from .buffer import CommentRecord, CommentRing, RecentComments, get_recent_comments
+from .bulk import CommentWriter
+from .ingest import CommentTail, CrawlSink, ingest, warm_load
+
+__all__ = [
+    "CommentRecord",
+    "CommentRing",
+    "CommentTail",
+    "CommentWriter",
+    "CrawlSink",
+    "RecentComments",
+    "get_recent_comments",
+    "ingest",
+    "warm_load",
+]
@@ -0,0 +1,213 @@
+"""
+종목별 최근 댓글 메모리 버퍼
+- 종목마다 고정 크기 링 버퍼 (리스트 배열 + 다음 쓰기 위치) → 새 댓글은 가장 오래된 칸을 덮어씀
+- 댓글 1건 = __slots__ 레코드 (dict 대비 작고, 출처/감성 라벨 문자열은 공유)
+- 종목 수도 max_stocks 로 제한 (가장 오래 갱신되지 않은 종목부터 제거) → 전체 메모리 상한
+    댓글 수 ≤ capacity × max_stocks, 본문은 max_chars 글자까지만 보관
+- subscribe: 배치 반영이 끝나면 새 댓글이 들어간 종목 코드로 listener 호출 (댓글을 담은 응답 캐시 무효화)
+"""
+import logging
+import sys
+import threading
+from collections import Counter, OrderedDict
+from datetime import datetime
+from typing import Callable, Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+_LABELS = {"긍정": "positive", "부정": "negative", "중립": "neutral"}
+
+
+class CommentRecord:
+    __slots__ = ("id", "content", "author", "likes", "sentiment", "source", "crawled_at")
+
+    def __init__(self, id: int, content: str, author: str, likes: int, sentiment: str, source: str,
+                 crawled_at: float):
+        self.id = id
+        self.content = content
+        self.author = author
+        self.likes = likes
+        self.sentiment = sentiment
+        self.source = source
+        self.crawled_at = crawled_at  # epoch 초
+
+    @property
+    def key(self) -> tuple[str, str]:
+        """재수집 중복 판별 (같은 작성자의 같은 글)"""
+        return self.author, self.content
+
+    def nbytes(self) -> int:
+        """대략적인 점유 메모리 (공유 문자열 제외)"""
+        return sys.getsizeof(self) + sys.getsizeof(self.content) + sys.getsizeof(self.author)
+
+    def to_dict(self) -> dict:
+        return {
+            "id": self.id,
+            "content": self.content,
+            "author": self.author,
+            "likes": self.likes,
+            "sentiment": self.sentiment,
+            "source": self.source,
+            "crawled_at": datetime.fromtimestamp(self.crawled_at).isoformat(),
+        }
+
+
+class CommentRing:
+    """고정 크기 링 버퍼 (최신순 조회)"""
+
+    __slots__ = ("capacity", "_items", "_next", "_size", "_keys")
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self._items: list[Optional[CommentRecord]] = [None] * capacity
+        self._next = 0
+        self._size = 0
+        self._keys: Counter = Counter()
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __contains__(self, key: tuple[str, str]) -> bool:
+        return key in self._keys
+
+    def push(self, record: CommentRecord) -> Optional[CommentRecord]:
+        """추가 → 밀려난 레코드 (없으면 None)"""
+        old = self._items[self._next]
+        if old is not None:
+            key = old.key
+            self._keys[key] -= 1
+            if not self._keys[key]:
+                del self._keys[key]
+        self._items[self._next] = record
+        self._keys[record.key] += 1
+        self._next = (self._next + 1) % self.capacity
+        self._size = min(self._size + 1, self.capacity)
+        return old
+
+    def newest(self, offset: int = 0, limit: int = 20) -> list[CommentRecord]:
+        items, last = self._items, self._next - 1
+        end = min(offset + limit, self._size)
+        return [items[(last - i) % self.capacity] for i in range(offset, end)]
+
+    def records(self) -> list[CommentRecord]:
+        return self.newest(0, self._size)
+
+
+class RecentComments:
+    """
+    capacity: 종목당 보관 댓글 수, max_stocks: 보관 종목 수 상한
+    max_chars: 본문 보관 글자 수 (초과분은 잘라냄)
+    """
+
+    def __init__(self, capacity: int = 100, max_stocks: int = 400, max_chars: int = 300):
+        self.capacity = capacity
+        self.max_stocks = max_stocks
+        self.max_chars = max_chars
+        self._rings: OrderedDict[str, CommentRing] = OrderedDict()  # 오래 갱신 안 된 종목이 앞
+        self._lock = threading.Lock()
+        self._seq = 0
+        self._bytes = 0
+        self.pushed = 0
+        self.skipped = 0
+        self.evicted_stocks = 0
+        self._listeners: list[Callable[[set[str]], None]] = []
+
+    def subscribe(self, listener: Callable[[set[str]], None]) -> None:
+        """배치 반영 후 listener(새 댓글이 들어간 종목 코드 집합) 호출"""
+        self._listeners.append(listener)
+
+    def notify(self, stock_codes: Iterable[str]) -> None:
+        """배치 반영 끝 (ingest / CommentTail) → 구독자에게 바뀐 종목 알림"""
+        codes = set(stock_codes)
+        if not codes:
+            return
+        for listener in list(self._listeners):
+            try:
+                listener(codes)
+            except Exception as e:
+                logger.error(f"최근 댓글 알림 실패 {listener}: {e}")
+
+    def add(self, stock_code: str, content: str, author: str = "", likes: int = 0, sentiment: str = "neutral",
+            source: str = "naver_discuss", crawled_at: Optional[datetime] = None) -> bool:
+        """댓글 1건 추가 (같은 종목 버퍼에 같은 작성자의 같은 글이 있으면 건너뜀) → 추가 여부"""
+        content = content[:self.max_chars]
+        with self._lock:
+            ring = self._ring(stock_code)
+            if (author, content) in ring:
+                self.skipped += 1
+                return False
+            self._seq += 1
+            record = CommentRecord(
+                self._seq, content, author, likes,
+                sys.intern(_LABELS.get(sentiment, sentiment)), sys.intern(source),
+                (crawled_at or datetime.now()).timestamp(),
+            )
+            old = ring.push(record)
+            self._bytes += record.nbytes() - (old.nbytes() if old is not None else 0)
+            self.pushed += 1
+            return True
+
+    def _ring(self, stock_code: str) -> CommentRing:
+        ring = self._rings.get(stock_code)
+        if ring is None:
+            ring = self._rings[stock_code] = CommentRing(self.capacity)
+            while len(self._rings) > self.max_stocks:
+                _, dropped = self._rings.popitem(last=False)
+                self._bytes -= sum(r.nbytes() for r in dropped.records())
+                self.evicted_stocks += 1
+        else:
+            self._rings.move_to_end(stock_code)
+        return ring
+
+    def has(self, stock_code: str) -> bool:
+        ring = self._rings.get(stock_code)
+        return ring is not None and len(ring) > 0
+
+    def latest_id(self, stock_code: str) -> int:
+        """종목의 가장 최근 댓글 번호 (없으면 0) - 댓글을 담은 계산 결과의 재사용 키"""
+        with self._lock:
+            ring = self._rings.get(stock_code)
+            newest = ring.newest(0, 1) if ring is not None else []
+            return newest[0].id if newest else 0
+
+    def page(self, stock_code: str, page: int = 1, size: int = 20) -> tuple[int, list[dict]]:
+        """최신순 페이지 → (보관 중인 전체 수, 댓글 목록)"""
+        with self._lock:
+            ring = self._rings.get(stock_code)
+            if ring is None:
+                return 0, []
+            return len(ring), [r.to_dict() for r in ring.newest((page - 1) * size, size)]
+
+    def stats(self) -> dict:
+        with self._lock:
+            comments = sum(len(r) for r in self._rings.values())
+            stocks = len(self._rings)
+            slots = sys.getsizeof([None] * self.capacity) * stocks  # 링 배열 자체
+            return {
+                "stocks": stocks,
+                "comments": comments,
+                "bytes": self._bytes + slots,
+                "max_comments": self.capacity * self.max_stocks,
+                "pushed": self.pushed,
+                "skipped_duplicates": self.skipped,
+                "evicted_stocks": self.evicted_stocks,
+            }
+
+
+_recent: Optional[RecentComments] = None
+_recent_lock = threading.Lock()
+
+
+def get_recent_comments() -> RecentComments:
+    global _recent
+    if _recent is None:
+        with _recent_lock:
+            if _recent is None:
+                from ..config import get_settings
+                settings = get_settings()
+                _recent = RecentComments(
+                    capacity=settings.comment_buffer_size,
+                    max_stocks=settings.comment_buffer_max_stocks,
+                    max_chars=settings.comment_buffer_max_chars,
+                )
+    return _recent
@@ -0,0 +1,159 @@
+"""
+댓글 DB 일괄 저장 (대량 수집/백필용)
+댓글 배치 → 감성분석 → comments + comment_sentiments 를 트랜잭션 하나에서 다중 행 INSERT
+- 게시글마다 post_key (종목/출처/작성자/게시 시각/본문 해시) → 이미 저장된 글은 ON CONFLICT DO NOTHING 으로 건너뜀
+  (백필 재개, 밀린 페이지 재수집, 정기 수집이 같은 글을 다시 보내도 한 번만 저장)
+- 게시 시각이 없는 소스는 수집 시각을 게시 시각으로 쓴다 (그런 소스는 재수집 중복을 막지 못함)
+- 배치를 유사 중복 색인(sentiment.dedup)에 넣고 묶음 id 해시를 comment_sentiments.cluster 에 저장
+  가중치는 저장하지 않는다 - 묶음이 나중 배치에서 커져도 DB 집계가 기간 안의 묶음 크기로 계산 (jobs.aggregate)
+- 종목 마스터(stocks)에 없는 종목의 댓글은 저장하지 않고 경고만 남긴다
+"""
+import hashlib
+import logging
+import threading
+import time
+
+from ..metrics.instruments import DB_WRITE_ROWS, DB_WRITE_SECONDS
+from .buffer import _LABELS
+
+_DB_LABELS = {english: korean for korean, english in _LABELS.items()}  # comment_sentiments.label 은 긍정/부정/중립
+
+logger = logging.getLogger(__name__)
+
+_WRITE_SECONDS = DB_WRITE_SECONDS.labels("comments")
+_WRITE_ROWS = DB_WRITE_ROWS.labels("comments")
+
+
+def post_key(comment) -> str:
+    """게시글 식별 해시 (comments.post_key)"""
+    posted_at = comment.posted_at or comment.crawled_at
+    text = "\x1f".join((comment.stock_code, comment.source, comment.author or "", posted_at.isoformat(), comment.content))
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def cluster_hash(cluster) -> str:
+    """유사 중복 묶음 id (원본 댓글의 색인 key) → comment_sentiments.cluster"""
+    text = "\x1f".join(map(str, cluster))
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _insert_ignore(session, table):
+    """중복 키는 건너뛰는 INSERT (PostgreSQL/SQLite ON CONFLICT DO NOTHING)"""
+    dialect = session.get_bind().dialect.name
+    if dialect == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    elif dialect == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert
+    else:
+        raise NotImplementedError(f"지원하지 않는 DB: {dialect}")
+    return insert(table).on_conflict_do_nothing()
+
+
+class CommentWriter:
+    """
+    session_factory: SQLAlchemy 세션 생성 함수 (기본: app.db.session.SessionLocal)
+    analyzer: 감성분석기 (기본: 공유 분석기)
+    dedup_index: 유사 중복 색인 (기본: 공유 색인, False 면 묶지 않음 = 가중치 모두 1)
+    여러 스레드에서 write 를 동시에 불러도 된다 (호출마다 세션 하나)
+    """
+
+    def __init__(self, session_factory=None, analyzer=None, dedup_index=None):
+        if session_factory is None:
+            from ..db.session import SessionLocal
+            session_factory = SessionLocal
+        if analyzer is None:
+            from ..sentiment.loader import get_analyzer
+            analyzer = get_analyzer()
+        if dedup_index is None:
+            from ..sentiment.dedup import get_duplicate_index
+            dedup_index = get_duplicate_index()
+        self.session_factory = session_factory
+        self.analyzer = analyzer
+        self.dedup_index = dedup_index
+        self._stock_ids: dict[str, int] = {}
+        self._lock = threading.Lock()
+        self.written = 0
+
+    def _resolve(self, session, codes: set[str]) -> dict[str, int]:
+        from sqlalchemy import select
+        from ..models import Stock
+
+        missing = codes - self._stock_ids.keys()
+        if missing:
+            rows = session.execute(select(Stock.code, Stock.id).where(Stock.code.in_(missing))).all()
+            with self._lock:
+                self._stock_ids.update({code: stock_id for code, stock_id in rows})
+        return self._stock_ids
+
+    def _clusters(self, comments: list) -> list:
+        """댓글별 유사 중복 묶음 해시 (색인을 안 쓰면 None)"""
+        if not self.dedup_index:
+            return [None] * len(comments)
+        from ..sentiment.dedup import comment_key
+
+        return [cluster_hash(self.dedup_index.add(comment_key(c), c.content, c.author)) for c in comments]
+
+    def write(self, comments: list) -> int:
+        """CommentData 배치 저장 → 새로 저장한 댓글 수 (이미 저장된 글 제외)"""
+        return len(self.insert(comments))
+
+    def insert(self, comments: list) -> list:
+        """CommentData 배치 저장 → 새로 저장한 (댓글, SentimentResult) 목록 (입력 순서, 이미 저장된 글 제외)"""
+        from sqlalchemy import insert
+        from ..models import Comment, CommentSentiment
+
+        if not comments:
+            return []
+        started = time.perf_counter()
+        inserted, results = [], []
+        session = self.session_factory()
+        try:
+            ids = self._resolve(session, {c.stock_code for c in comments})
+            kept = {}
+            for c in comments:
+                if c.stock_code in ids:
+                    kept.setdefault(post_key(c), c)  # 배치 안의 같은 글은 하나만
+            skipped = sum(c.stock_code not in ids for c in comments)
+            if skipped:
+                logger.warning(f"종목 마스터에 없는 종목의 댓글 {skipped}건 저장 생략")
+            if kept:
+                comment_ids = dict(session.execute(
+                    _insert_ignore(session, Comment).returning(Comment.post_key, Comment.id),
+                    [
+                        {
+                            "stock_id": ids[c.stock_code],
+                            "source": c.source,
+                            "content": c.content,
+                            "author": c.author,
+                            "likes": c.likes,
+                            "dislikes": c.dislikes,
+                            "original_url": c.original_url,
+                            "crawled_at": c.crawled_at,
+                            "posted_at": c.posted_at or c.crawled_at,
+                            "post_key": key,
+                        }
+                        for key, c in kept.items()
+                    ],
+                ).all())
+                inserted = [(comment_ids[key], c) for key, c in kept.items() if key in comment_ids]
+                results = [self.analyzer.analyze(c.content) for _, c in inserted]
+                clusters = self._clusters([c for _, c in inserted])
+                if inserted:
+                    session.execute(insert(CommentSentiment), [
+                        {
+                            "comment_id": cid,
+                            "score": r.score,
+                            "label": _DB_LABELS[r.label.value],
+                            "confidence": r.confidence,
+                            "cluster": cluster,
+                        }
+                        for (cid, _), r, cluster in zip(inserted, results, clusters)
+                    ])
+                session.commit()
+        finally:
+            session.close()
+        _WRITE_SECONDS.observe(time.perf_counter() - started)
+        _WRITE_ROWS.inc(len(inserted))
+        with self._lock:
+            self.written += len(inserted)
+        return [(c, r) for (_, c), r in zip(inserted, results)]
@@ -0,0 +1,170 @@
+"""
+수집 댓글 반영
+- ingest: 크롤러가 가져온 CommentData 배치 → 감성분석 → 최근 댓글 버퍼 + 급변 감지기
+    (배치 끝에 buffer.notify → 댓글을 담은 캐시 응답 무효화)
+- CrawlSink: 크롤러 기본 sink - DB 저장(CommentWriter) 후 새로 저장된 댓글만 ingest (다시 수집한 글은 감지기에 두 번 안 들어감)
+- warm_load: 기동 시 comments 테이블에서 종목별 최근 댓글을 읽어 버퍼 채우기
+- CommentTail: 수집을 하지 않는 워커가 다른 프로세스가 저장한 새 댓글을 id 순으로 버퍼에 이어 붙이기
+"""
+import logging
+import time
+from typing import Optional
+
+from .buffer import RecentComments, get_recent_comments
+
+logger = logging.getLogger(__name__)
+
+
+def ingest(comments: list, analyzer=None, buffer: Optional[RecentComments] = None, detector=None,
+           newest_first: bool = True, results: Optional[list] = None) -> list:
+    """
+    comments: CommentData 목록 (토론방 목록 순서 = 최신순이면 newest_first=True)
+    detector: 급변 감지기 (None 이면 공유 감지기, False 면 건너뜀)
+    results: 이미 분석한 SentimentResult 목록 (있으면 다시 분석하지 않음)
+    → 댓글별 SentimentResult (입력 순서)
+    """
+    if analyzer is None and results is None:
+        from ..sentiment.loader import get_analyzer
+        analyzer = get_analyzer()
+    if buffer is None:
+        buffer = get_recent_comments()
+    if detector is None:
+        from ..signals import get_detector
+        detector = get_detector()
+
+    if results is None:
+        results = [analyzer.analyze(c.content) for c in comments]
+    pairs = list(zip(comments, results))
+    if newest_first:
+        pairs.reverse()  # 오래된 것부터 넣어야 버퍼의 최신순이 맞다
+    # 게시 시각 기준 (warm_load 와 같은 시각, 몇 시간치 수집 배치가 감지기의 한 구간에 몰리지 않게)
+    timed = sorted(((c.posted_at or c.crawled_at, c, r) for c, r in pairs), key=lambda t: t[0])
+    changed = set()
+    for posted_at, comment, result in timed:
+        label = result.label.value
+        if buffer.add(comment.stock_code, comment.content, comment.author, comment.likes, label,
+                      comment.source, posted_at):
+            changed.add(comment.stock_code)
+        if detector:
+            detector.observe(comment.stock_code, posted_at.timestamp(), label == "negative")
+    buffer.notify(changed)
+    flush = getattr(detector.sink, "flush", None) if detector else None
+    if flush is not None:
+        flush()  # 배치 중 발생한 신호를 한 번에 저장
+    return results
+
+
+class CrawlSink:
+    """
+    크롤러 sink: DB 저장 → 새로 저장된 댓글만 최근 댓글 버퍼 + 급변 감지기
+    writer: CommentWriter (기본: 첫 호출 때 생성), DB 저장이 실패하면 배치 전체를 ingest 만 한다 (DB 없는 개발 환경)
+    """
+
+    def __init__(self, writer=None, buffer: Optional[RecentComments] = None, detector=None):
+        self.writer = writer
+        self.buffer = buffer
+        self.detector = detector
+
+    def __call__(self, comments: list) -> list:
+        try:
+            if self.writer is None:
+                from .bulk import CommentWriter
+                self.writer = CommentWriter()
+            saved = self.writer.insert(comments)
+        except Exception as e:
+            logger.warning(f"댓글 DB 저장 실패, 메모리에만 반영: {e}")
+            return ingest(comments, buffer=self.buffer, detector=self.detector)
+        if not saved:
+            return []
+        return ingest([c for c, _ in saved], buffer=self.buffer, detector=self.detector,
+                      results=[r for _, r in saved])
+
+
+class CommentTail:
+    """
+    다른 프로세스가 저장한 새 댓글 → 버퍼 (comments.id 순, 첫 호출은 현재 위치만 기억)
+    호출마다 최대 limit 건
+    """
+
+    def __init__(self, buffer: Optional[RecentComments] = None, session_factory=None, limit: int = 5000):
+        self.buffer = buffer
+        self.session_factory = session_factory
+        self.limit = limit
+        self.last_id: Optional[int] = None
+
+    def __call__(self) -> int:
+        from sqlalchemy import func, select
+        from ..models import Comment, CommentSentiment, Stock
+
+        buffer = self.buffer or get_recent_comments()
+        session_factory = self.session_factory
+        if session_factory is None:
+            from ..db.session import SessionLocal
+            session_factory = SessionLocal
+
+        with session_factory() as session:
+            if self.last_id is None:
+                self.last_id = session.scalar(select(func.max(Comment.id))) or 0
+                return 0
+            rows = session.execute(
+                select(Comment.id, Stock.code, Comment.source, Comment.content, Comment.author, Comment.likes,
+                       func.coalesce(Comment.posted_at, Comment.crawled_at), CommentSentiment.label)
+                .join(Stock, Stock.id == Comment.stock_id)
+                .outerjoin(CommentSentiment, CommentSentiment.comment_id == Comment.id)
+                .where(Comment.id > self.last_id)
+                .order_by(Comment.id)
+                .limit(self.limit)
+            ).all()
+        if rows:
+            self.last_id = rows[-1][0]
+        # 한 배치는 목록 순서(최신순)로 저장되므로 게시 시각순으로 넣는다
+        changed = set()
+        for _, code, source, content, author, likes, posted_at, label in sorted(rows, key=lambda r: (r[6], r[0])):
+            if buffer.add(code, content, author or "", likes or 0, label or "neutral", source, posted_at):
+                changed.add(code)
+        buffer.notify(changed)
+        return len(rows)
+
+
+def warm_load(buffer: Optional[RecentComments] = None, session_factory=None, per_stock: Optional[int] = None) -> int:
+    """종목별 최근 per_stock 개 댓글 (감성 라벨 포함) → 버퍼, 읽은 댓글 수 반환"""
+    from sqlalchemy import func, select
+    from ..models import Comment, CommentSentiment, Stock
+
+    if buffer is None:
+        buffer = get_recent_comments()
+    if session_factory is None:
+        from ..db.session import SessionLocal
+        session_factory = SessionLocal
+    per_stock = per_stock or buffer.capacity
+
+    started = time.perf_counter()
+    posted_at = func.coalesce(Comment.posted_at, Comment.crawled_at)  # 백필한 옛 글이 최근 글로 섞이지 않게 게시 시각 기준
+    rank = func.row_number().over(
+        partition_by=Comment.stock_id, order_by=(posted_at.desc(), Comment.id.desc())
+    ).label("rank")
+    ranked = (
+        select(Comment.id, Comment.stock_id, Comment.source, Comment.content, Comment.author, Comment.likes,
+               posted_at.label("posted_at"), CommentSentiment.label, rank)
+        .outerjoin(CommentSentiment, CommentSentiment.comment_id == Comment.id)
+        .subquery()
+    )
+    # 종목별로 오래된 것부터 넣는다
+    query = (
+        select(Stock.code, ranked.c.source, ranked.c.content, ranked.c.author, ranked.c.likes,
+               ranked.c.posted_at, ranked.c.label)
+        .join(Stock, Stock.id == ranked.c.stock_id)
+        .where(ranked.c.rank <= per_stock)
+        .order_by(ranked.c.stock_id, ranked.c.posted_at, ranked.c.id)
+    )
+
+    session = session_factory()
+    try:
+        count = 0
+        for code, source, content, author, likes, posted_at, label in session.execute(query):
+            buffer.add(code, content, author or "", likes or 0, label or "neutral", source, posted_at)
+            count += 1
+    finally:
+        session.close()
+    logger.info(f"최근 댓글 버퍼 적재: {count}건 ({time.perf_counter() - started:.2f}초)")
+    return count
@@ -0,0 +1,32 @@
+"""
+스레드 풀 실행
+- run_in_threadpool: fastapi.concurrency.run_in_threadpool 과 같고, 현재 컨텍스트에 호출 래퍼가 걸려 있으면
+    스레드 풀 쪽 호출을 그 래퍼로 감싼다 (예: 프로파일 중인 요청의 스레드 풀 실행도 함께 기록)
+- wrap_threadpool_calls: with 블록 안에서 넘긴 작업에 호출 래퍼 적용 (컨텍스트 변수라 다른 요청에는 영향 없음)
+"""
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, Iterator, Optional, TypeVar
+
+from starlette.concurrency import run_in_threadpool as _run
+
+T = TypeVar("T")
+
+# 래퍼(func, *args, **kwargs) → func 실행 결과
+_call_wrapper: ContextVar[Optional[Callable]] = ContextVar("threadpool_call_wrapper", default=None)
+
+
+@contextmanager
+def wrap_threadpool_calls(wrapper: Callable) -> Iterator[None]:
+    token = _call_wrapper.set(wrapper)
+    try:
+        yield
+    finally:
+        _call_wrapper.reset(token)
+
+
+async def run_in_threadpool(func: Callable[..., T], *args, **kwargs) -> T:
+    wrapper = _call_wrapper.get()
+    if wrapper is None:
+        return await _run(func, *args, **kwargs)
+    return await _run(wrapper, func, *args, **kwargs)
@@ -0,0 +1,377 @@
+"""
+토론방 과거 댓글 백필 (종목 추가/새 지표 도입 시 수개월치 이력 채우기)
+- 종목의 페이지 범위를 구간(chunk)으로 나눠 스레드 풀에서 병렬 수집 - 요청 속도는 공용 엔진의 호스트 예산을 따른다
+- 진행 상황은 체크포인트 파일에 쪽 번호와 함께 저장한 가장 오래된 게시 시각(커서)으로 기록
+  최신 글이 앞에 오는 게시판이라 새 글이 올라오면 쪽 번호가 밀린다 → 재개할 때는 쪽 번호가 아니라 커서로 이어서
+  (커서보다 새 글만 있는 쪽은 건너뛰고, 글이 지워져 당겨졌으면 커서가 나올 때까지 한 쪽씩 되돌아감)
+- 구간이 끝 쪽에 닿아도 다음 구간이 처음 본 글까지 내려가지 못했으면 (그사이 새 글에 밀림) 그 글까지 계속 → 구간 사이 빈틈 없음
+- 겹쳐 다시 보낸 글은 sink 가 걸러낸다 (CommentWriter 는 post_key ON CONFLICT DO NOTHING)
+- 게시 시각을 주지 않는 소스는 쪽 번호로만 이어서 (저장된 쪽 다음부터, 재요청 없음)
+- 댓글은 flush_size 건마다 바로 sink(기본: DB 일괄 저장)로 흘려보냄 → 페이지 수와 무관하게 메모리 일정
+- 빈 페이지(또는 어댑터의 next_cursor 가 None)를 만나면 그 종목의 끝으로 기록하고 뒤쪽 구간은 건너뜀
+
+sink 는 작업 스레드에서 호출되므로 스레드 안전해야 한다 (CommentWriter 는 호출마다 세션 하나)
+sink 반영과 체크포인트 기록 사이에 죽으면 마지막 배치 하나는 다시 sink 로 간다 (CommentWriter 는 걸러냄)
+
+실행: python -m app.crawler.backfill --stocks 005930,000660 --pages 1-3000 [--checkpoint backfill.jsonl]
+"""
+import argparse
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Callable, Optional
+
+from ..metrics.instruments import CRAWL_PARSE_SECONDS
+from .engine import FetchEngine
+from .sources import CommentData, SourceAdapter
+
+logger = logging.getLogger(__name__)
+
+Sink = Callable[[list[CommentData]], object]
+
+
+@dataclass(frozen=True)
+class Chunk:
+    """소스 하나, 종목 하나의 연속된 페이지 구간 [start, end]"""
+    source: str
+    stock_code: str
+    start: int
+    end: int
+
+    @property
+    def key(self) -> str:
+        return f"{self.source}:{self.stock_code}:{self.start}-{self.end}"
+
+
+def plan_chunks(sources: list[str], stock_codes: list[str], first_page: int, last_page: int,
+                chunk_pages: int) -> list[Chunk]:
+    """앞 구간부터 모든 종목·소스를 번갈아 배치 → 최근 이력부터 고르게 채워짐"""
+    return [
+        Chunk(source, code, start, min(start + chunk_pages - 1, last_page))
+        for start in range(first_page, last_page + 1, chunk_pages)
+        for code in stock_codes
+        for source in sources
+    ]
+
+
+class Checkpoint:
+    """
+    추가 전용 JSON Lines 파일 (한 줄 = 반영 기록 하나)
+        {"chunk": "naver_discuss:005930:1-50", "page": 0, "newest": "2025-03-03T09:12:00"}  첫 쪽의 가장 새 글
+        {"chunk": "naver_discuss:005930:1-50", "page": 37, "oldest": "2025-02-27T14:05:00"}  37쪽(그 시각)까지 저장 완료
+        {"chunk": "naver_discuss:005930:1-50", "page": 50, "done": true}  구간 완료
+        {"chunk": "naver_discuss:005930:51-100", "page": 63, "done": true, "end": true}  63쪽이 게시판 끝
+    기록마다 flush + fsync, 쓰다 만 마지막 줄은 읽을 때 잘라냄
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.progress: dict[str, int] = {}
+        self.done: set[str] = set()
+        self.ends: dict[tuple[str, str], int] = {}  # (소스, 종목) → 마지막 페이지
+        self.oldest: dict[str, datetime] = {}  # 구간 → 저장한 가장 오래된 게시 시각 (재개 커서)
+        self.newest: dict[tuple[str, str, int], datetime] = {}  # (소스, 종목, 시작 쪽) → 구간이 처음 본 가장 새 글
+        self._lock = threading.Lock()
+        self._load()
+        self._file = open(path, "a", encoding="utf-8")
+
+    def _load(self) -> None:
+        if not os.path.exists(self.path):
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            return
+        with open(self.path, "rb") as f:
+            data = f.read()
+        complete = data.rfind(b"\n") + 1
+        if complete < len(data):
+            logger.warning(f"체크포인트 마지막 줄이 불완전해 잘라냄: {self.path}")
+            with open(self.path, "r+b") as f:
+                f.truncate(complete)
+        for line in data[:complete].decode("utf-8").splitlines():
+            if line.strip():
+                self._apply(json.loads(line))
+
+    def _apply(self, entry: dict) -> None:
+        key, page = entry["chunk"], entry["page"]
+        self.progress[key] = max(self.progress.get(key, 0), page)
+        if entry.get("oldest"):
+            oldest = datetime.fromisoformat(entry["oldest"])
+            self.oldest[key] = min(self.oldest.get(key, oldest), oldest)
+        if entry.get("newest"):
+            source, code, pages = key.split(":")
+            self.newest.setdefault((source, code, int(pages.split("-")[0])), datetime.fromisoformat(entry["newest"]))
+        if entry.get("done"):
+            self.done.add(key)
+        if entry.get("end"):
+            source, code, _ = key.split(":")
+            stream = (source, code)
+            self.ends[stream] = min(self.ends.get(stream, page), page)
+
+    def resume_page(self, chunk: Chunk) -> Optional[int]:
+        """
+        이 구간에서 다음에 가져올 페이지 (할 일이 없으면 None)
+        끝 쪽을 넘어 다음 구간 쪽으로 이어 가던 중이었으면 끝 쪽보다 클 수 있다
+        """
+        with self._lock:
+            if chunk.key in self.done:
+                return None
+            page = max(chunk.start, self.progress.get(chunk.key, 0) + 1)
+            end = self.ends.get((chunk.source, chunk.stock_code))
+        if end is not None and page > end:
+            return None
+        return page
+
+    def cursor(self, chunk: Chunk) -> Optional[datetime]:
+        """이 구간에서 저장한 가장 오래된 게시 시각 (없으면 None)"""
+        with self._lock:
+            return self.oldest.get(chunk.key)
+
+    def first_seen(self, source: str, stock_code: str, start: int) -> Optional[datetime]:
+        """start 쪽에서 시작하는 구간이 처음 본 가장 새 글의 게시 시각 (아직 시작 전이면 None)"""
+        with self._lock:
+            return self.newest.get((source, stock_code, start))
+
+    def end_page(self, source: str, stock_code: str) -> Optional[int]:
+        with self._lock:
+            return self.ends.get((source, stock_code))
+
+    def record(self, chunk: Chunk, page: int, done: bool = False, end: bool = False,
+               oldest: Optional[datetime] = None, newest: Optional[datetime] = None) -> None:
+        entry: dict = {"chunk": chunk.key, "page": page}
+        if oldest is not None:
+            entry["oldest"] = oldest.isoformat()
+        if newest is not None:
+            entry["newest"] = newest.isoformat()
+        if done:
+            entry["done"] = True
+        if end:
+            entry["end"] = True
+        line = json.dumps(entry) + "\n"
+        with self._lock:
+            self._file.write(line)
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self._apply(entry)
+
+    def close(self) -> None:
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+@dataclass
+class BackfillReport:
+    chunks: int = 0
+    skipped: int = 0
+    pages: int = 0
+    comments: int = 0
+    errors: int = 0
+    elapsed: float = 0.0
+
+    def to_dict(self) -> dict:
+        data = vars(self).copy()
+        data["elapsed"] = round(self.elapsed, 2)
+        return data
+
+
+class Backfill:
+    """
+    engine: 공용 HTTP 엔진, adapters: 백필할 소스 (페이지 번호 커서만 지원)
+    checkpoint: 진행 기록, sink: 댓글 배치 반영 함수
+    workers: 동시에 진행할 구간 수, flush_size: sink 한 번에 넘기는 댓글 수
+    """
+
+    def __init__(self, engine: FetchEngine, adapters: list[SourceAdapter], checkpoint: Checkpoint, sink: Sink,
+                 workers: int = 4, flush_size: int = 200):
+        self.engine = engine
+        self.adapters = {a.name: a for a in adapters}
+        self.checkpoint = checkpoint
+        self.sink = sink
+        self.workers = workers
+        self.flush_size = flush_size
+        for adapter in adapters:
+            if adapter.first_cursor("") != 1:
+                raise ValueError(f"페이지 번호 커서가 아닌 소스는 구간 백필 불가: {adapter.name}")
+
+    def run(self, chunks: list[Chunk]) -> BackfillReport:
+        started = time.perf_counter()
+        report = BackfillReport(chunks=len(chunks))
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="backfill") as pool:
+            futures = {pool.submit(self._run_chunk, chunk): chunk for chunk in chunks}
+            for future in as_completed(futures):
+                chunk = futures[future]
+                try:
+                    pages, comments = future.result()
+                except Exception as e:
+                    report.errors += 1
+                    logger.error(f"[{chunk.key}] 백필 실패 (다음 실행 때 이어서): {e}")
+                    continue
+                if pages == 0:
+                    report.skipped += 1
+                report.pages += pages
+                report.comments += comments
+
+        report.elapsed = time.perf_counter() - started
+        logger.info(
+            f"백필 완료: 구간 {report.chunks} (건너뜀 {report.skipped}, 실패 {report.errors}), "
+            f"페이지 {report.pages}, 댓글 {report.comments}, {report.elapsed:.1f}초"
+        )
+        return report
+
+    def _fetch(self, adapter: SourceAdapter, chunk: Chunk, page: int) -> list[CommentData]:
+        url = adapter.build_url(chunk.stock_code, page)
+        result = self.engine.fetch(url, adapter.name, encoding=adapter.encoding, headers=adapter.headers)
+        started = time.perf_counter()
+        parsed = adapter.parse(result.text, chunk.stock_code, url)
+        CRAWL_PARSE_SECONDS.labels(adapter.name).observe(time.perf_counter() - started)
+        return parsed
+
+    def _seek(self, adapter: SourceAdapter, chunk: Chunk, page: int,
+              cursor: datetime) -> tuple[int, Optional[list[CommentData]], int]:
+        """
+        재개 위치 찾기: 커서(저장한 가장 오래된 글)가 있는 쪽
+        → (쪽, 그 쪽에서 아직 저장 안 한 댓글 - None 이면 그 쪽을 새로 가져옴, 요청한 페이지 수)
+        커서와 같은 시각의 글은 저장됐는지 알 수 없어 다시 보낸다 (sink 가 중복을 걸러냄)
+        """
+        requests = 0
+        forward = backward = False
+        while True:
+            parsed = self._fetch(adapter, chunk, page)
+            requests += 1
+            dated = [c.posted_at for c in parsed if c.posted_at is not None]
+            if not dated:
+                return page, parsed, requests
+            if min(dated) > cursor:  # 새 글에 밀려 전부 이미 저장한 글보다 새 글
+                if backward:  # 되돌아오다 지나침 → 경계는 이 쪽 바로 뒤
+                    return page + 1, None, requests
+                forward = True
+                page += 1
+                continue
+            if max(dated) < cursor and not forward and page > chunk.start:  # 글이 지워져 당겨짐
+                backward = True
+                page -= 1
+                continue
+            return page, [c for c in parsed if c.posted_at is None or c.posted_at <= cursor], requests
+
+    def _behind_next(self, chunk: Chunk, oldest: Optional[datetime]) -> bool:
+        """다음 구간이 처음 본 글까지 아직 못 내려왔는지 (새 글에 밀려 끝 쪽을 넘어가야 함)"""
+        newest = self.checkpoint.first_seen(chunk.source, chunk.stock_code, chunk.end + 1)
+        return oldest is not None and newest is not None and oldest > newest
+
+    def _run_chunk(self, chunk: Chunk) -> tuple[int, int]:
+        """구간 하나 수집 → (요청한 페이지 수, 반영한 댓글 수)"""
+        page = self.checkpoint.resume_page(chunk)
+        if page is None:
+            return 0, 0
+        adapter = self.adapters[chunk.source]
+        batch: list[CommentData] = []
+        pages = comments = 0
+        oldest = self.checkpoint.cursor(chunk)
+        pending = None
+        if oldest is not None:
+            page, pending, pages = self._seek(adapter, chunk, page, oldest)
+        first = self.checkpoint.first_seen(chunk.source, chunk.stock_code, chunk.start) is None
+
+        def flush(last_page: int, done: bool = False, end: bool = False) -> None:
+            nonlocal batch, comments
+            if batch:
+                self.sink(batch)
+                comments += len(batch)
+                batch = []
+            self.checkpoint.record(chunk, last_page, done=done, end=end, oldest=oldest)
+
+        while page <= chunk.end or self._behind_next(chunk, oldest):
+            end = self.checkpoint.end_page(chunk.source, chunk.stock_code)
+            if end is not None and page > end:  # 다른 구간이 게시판 끝을 찾음
+                flush(page - 1, done=True)
+                return pages, comments
+            if pending is not None:
+                parsed, pending = pending, None
+            else:
+                parsed = self._fetch(adapter, chunk, page)
+                pages += 1
+            if not parsed:
+                flush(page - 1, done=True, end=True)
+                return pages, comments
+            dated = [c.posted_at for c in parsed if c.posted_at is not None]
+            if dated:
+                if first:  # 앞 구간이 어디까지 내려와야 하는지 알 수 있게 바로 기록
+                    self.checkpoint.record(chunk, page - 1, newest=max(dated))
+                    first = False
+                oldest = min(dated) if oldest is None else min(oldest, min(dated))
+            batch.extend(parsed)
+            if adapter.next_cursor(page, parsed) is None:
+                flush(page, done=True, end=True)
+                return pages, comments
+            if len(batch) >= self.flush_size:
+                flush(page)
+            page += 1
+
+        flush(page - 1, done=True)
+        return pages, comments
+
+
+def parse_pages(text: str) -> tuple[int, int]:
+    """'1-3000' 또는 '3000' (1쪽부터) → (첫 페이지, 마지막 페이지)"""
+    first, _, last = text.partition("-")
+    if not last:
+        first, last = "1", first
+    first_page, last_page = int(first), int(last)
+    if not 1 <= first_page <= last_page:
+        raise ValueError(f"잘못된 페이지 범위: {text}")
+    return first_page, last_page
+
+
+def main(argv=None) -> int:
+    from ..comments.bulk import CommentWriter
+    from ..config import get_settings
+    from ..metrics import write_textfile
+    from .engine import get_fetch_engine
+    from .sources import create_adapters
+
+    settings = get_settings()
+    parser = argparse.ArgumentParser(description="토론방 과거 댓글 백필 (중단 후 재실행하면 이어서)")
+    parser.add_argument("--stocks", required=True, help="쉼표로 구분한 종목코드")
+    parser.add_argument("--pages", default="1-1000", help="페이지 범위 (예: 1-3000)")
+    parser.add_argument("--sources", help="쉼표로 구분한 소스 (기본: CRAWL_SOURCES)")
+    parser.add_argument("--chunk", type=int, default=settings.backfill_chunk_pages, help="구간당 페이지 수")
+    parser.add_argument("--workers", type=int, default=settings.backfill_workers)
+    parser.add_argument("--checkpoint", default=settings.backfill_checkpoint_path)
+    parser.add_argument("--json", action="store_true", help="결과를 JSON 으로 출력")
+    args = parser.parse_args(argv)
+
+    first_page, last_page = parse_pages(args.pages)
+    names = (args.sources or settings.crawl_sources).split(",")
+    adapters = create_adapters([n.strip() for n in names if n.strip()])
+    codes = [c.strip() for c in args.stocks.split(",") if c.strip()]
+    chunks = plan_chunks([a.name for a in adapters], codes, first_page, last_page, args.chunk)
+
+    writer = CommentWriter()
+    with Checkpoint(args.checkpoint) as checkpoint:
+        backfill = Backfill(get_fetch_engine(), adapters, checkpoint, writer.write,
+                            workers=args.workers, flush_size=settings.backfill_flush_size)
+        report = backfill.run(chunks)
+    write_textfile("backfill")
+
+    if args.json:
+        print(json.dumps(report.to_dict(), ensure_ascii=False))
+    else:
+        print(f"구간 {report.chunks} (건너뜀 {report.skipped}, 실패 {report.errors})")
+        print(f"페이지 {report.pages} / 댓글 {report.comments} / {report.elapsed:.1f}초")
+        for name, end in sorted(checkpoint.ends.items()):
+            print(f"  {name[0]} {name[1]}: 마지막 페이지 {end}")
+    return 1 if report.errors else 0
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    sys.exit(main())
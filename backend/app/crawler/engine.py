@@ -0,0 +1,177 @@
+"""
+크롤러 공용 HTTP 엔진
+- 모든 수집 소스가 requests.Session 하나를 공유 (호스트별 keep-alive 연결 풀)
+- 호스트별 요청 예산 (토큰 버킷): 같은 사이트에는 초당 rate 회까지만, 다른 사이트는 서로 기다리지 않음
+- 호스트별 동시 연결 수는 pool_maxsize 로 제한 (풀이 가득 차면 기다림 → 소스를 늘려도 연결이 늘지 않음)
+"""
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Optional
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from ..metrics.instruments import CRAWL_FETCH_BYTES, CRAWL_FETCH_SECONDS, CRAWL_FETCH_TOTAL
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) "
+        "Chrome/120.0.0.0 Safari/537.36"
+    ),
+    "Accept-Language": "ko-KR,ko;q=0.9,en-US;q=0.8",
+}
+
+
+class RateBudget:
+    """
+    토큰 버킷 (rate: 초당 요청 수, burst: 몰아서 보낼 수 있는 요청 수)
+    acquire() 는 자리를 먼저 예약하고 락 밖에서 기다린다 → 여러 스레드가 순서대로 간격을 지킴
+    """
+
+    def __init__(self, rate: float, burst: int = 1, clock: Callable[[], float] = time.monotonic,
+                 sleep: Callable[[float], None] = time.sleep):
+        self.rate = rate
+        self.burst = burst
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = float(burst)
+        self._updated = clock()
+        self._lock = threading.Lock()
+        self.waited = 0.0
+
+    def acquire(self) -> float:
+        """요청 1회 허가 → 기다린 시간 (초)"""
+        if self.rate <= 0:
+            return 0.0
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+            self.waited += wait
+        if wait > 0:
+            self._sleep(wait)
+        return wait
+
+
+@dataclass
+class FetchResult:
+    url: str
+    status: int
+    text: str
+    size: int
+
+
+class FetchEngine:
+    """
+    rate: 호스트별 기본 초당 요청 수 (0 이면 제한 없음)
+    host_rates: 호스트별 예외 {"finance.naver.com": 2.0}
+    pool_maxsize: 호스트당 최대 동시 연결 수
+    """
+
+    def __init__(self, rate: float = 1.0, host_rates: Optional[dict[str, float]] = None, pool_maxsize: int = 4,
+                 timeout: float = 10.0, headers: Optional[dict] = None):
+        self.rate = rate
+        self.host_rates = dict(host_rates or {})
+        self.timeout = timeout
+        self.session = requests.Session()
+        self.session.headers.update(headers or DEFAULT_HEADERS)
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=pool_maxsize, pool_block=True)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self._budgets: dict[str, RateBudget] = {}
+        self._lock = threading.Lock()
+        self._requests: dict[str, int] = {}
+
+    def budget(self, host: str) -> RateBudget:
+        budget = self._budgets.get(host)
+        if budget is None:
+            with self._lock:
+                budget = self._budgets.get(host)
+                if budget is None:
+                    budget = self._budgets[host] = RateBudget(self.host_rates.get(host, self.rate))
+        return budget
+
+    def fetch(self, url: str, source: str, encoding: Optional[str] = None,
+              headers: Optional[dict] = None) -> FetchResult:
+        """GET (호스트 예산만큼 기다린 뒤) → 본문, HTTP 오류는 requests.RequestException"""
+        host = urlsplit(url).netloc
+        self.budget(host).acquire()
+        with self._lock:
+            self._requests[host] = self._requests.get(host, 0) + 1
+
+        started = time.perf_counter()
+        try:
+            response = self.session.get(url, headers=headers, timeout=self.timeout)
+        except requests.RequestException as e:
+            CRAWL_FETCH_TOTAL.labels(source, "error").inc()
+            logger.error(f"HTTP 요청 실패 {url}: {e}")
+            raise
+        finally:
+            CRAWL_FETCH_SECONDS.labels(source).observe(time.perf_counter() - started)
+
+        CRAWL_FETCH_TOTAL.labels(source, str(response.status_code)).inc()
+        size = len(response.content or b"")
+        CRAWL_FETCH_BYTES.labels(source).observe(size)
+        try:
+            response.raise_for_status()
+        except requests.RequestException as e:
+            logger.error(f"HTTP 요청 실패 {url}: {e}")
+            raise
+        if encoding:
+            response.encoding = encoding
+        return FetchResult(url, response.status_code, response.text, size)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                host: {"requests": count, "waited_seconds": round(self._budgets[host].waited, 3)}
+                for host, count in self._requests.items()
+            }
+
+    def close(self) -> None:
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+def parse_host_rates(text: str) -> dict[str, float]:
+    """'finance.naver.com=2,example.com=0.5' → {호스트: 초당 요청 수}"""
+    rates = {}
+    for item in text.split(","):
+        if "=" in item:
+            host, rate = item.split("=", 1)
+            rates[host.strip()] = float(rate)
+    return rates
+
+
+_engine: Optional[FetchEngine] = None
+_engine_lock = threading.Lock()
+
+
+def get_fetch_engine() -> FetchEngine:
+    """모든 소스가 공유하는 엔진 (설정: request_delay_seconds → 호스트별 기본 간격)"""
+    global _engine
+    if _engine is None:
+        with _engine_lock:
+            if _engine is None:
+                from ..config import get_settings
+                settings = get_settings()
+                delay = settings.request_delay_seconds
+                _engine = FetchEngine(
+                    rate=1 / delay if delay > 0 else 0,
+                    host_rates=parse_host_rates(settings.crawl_host_rates),
+                    pool_maxsize=settings.crawl_pool_size,
+                )
+    return _engine
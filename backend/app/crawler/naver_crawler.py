@@ -1,106 +1,50 @@
 """
 네이버 종목토론방 크롤러
 TDD: tests/test_crawler/test_naver_crawler.py 참조
+- NaverDiscussAdapter: 토론방 URL/파싱 (스케줄러가 다른 소스와 함께 공용 엔진으로 수집)
+- NaverDiscussCrawler: 한 종목씩 직접 수집하는 기존 인터페이스
 """
-import requests
 from bs4 import BeautifulSoup
+import re
 import time
 import logging
-from typing import Optional
-from dataclasses import dataclass, field
 from datetime import datetime
+from types import MappingProxyType
+from typing import Optional
+
+from ..metrics.instruments import CRAWL_PARSE_SECONDS
+from ..profiling.profiler import JobProfiler, get_job_profiler
+from .engine import DEFAULT_HEADERS, FetchEngine
+from .sources import CommentData, SourceAdapter, register_source
 
 logger = logging.getLogger(__name__)
 
+SOURCE = "naver_discuss"
 
-@dataclass
-class CommentData:
-    """크롤링된 댓글 데이터 구조"""
-    stock_code: str
-    source: str
-    content: str
-    author: str = ""
-    likes: int = 0
-    dislikes: int = 0
-    original_url: str = ""
-    crawled_at: datetime = field(default_factory=datetime.now)
+# 라벨 자식 미리 바인딩 (요청마다 라벨 조회 없음)
+_PARSE_SECONDS = CRAWL_PARSE_SECONDS.labels(SOURCE)
 
+_POSTED_AT = re.compile(r"(\d{4})\.(\d{2})\.(\d{2})\s+(\d{2}):(\d{2})")  # 날짜 칸: 2025.03.03 09:12
 
-class NaverDiscussCrawler:
+__all__ = ["CommentData", "NaverDiscussAdapter", "NaverDiscussCrawler"]
+
+
+@register_source
+class NaverDiscussAdapter(SourceAdapter):
     """
-    네이버 종목토론방 크롤러
-    URL: https://finance.naver.com/item/board.naver?code={stock_code}
+    네이버 종목토론방
+    URL: https://finance.naver.com/item/board.naver?code={stock_code}&page={page}
     """
 
+    name = SOURCE
+    encoding = "euc-kr"
+    headers = MappingProxyType({"Referer": "https://finance.naver.com"})
     BASE_URL = "https://finance.naver.com/item/board.naver"
-    HEADERS = {
-        "User-Agent": (
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-            "AppleWebKit/537.36 (KHTML, like Gecko) "
-            "Chrome/120.0.0.0 Safari/537.36"
-        ),
-        "Referer": "https://finance.naver.com",
-        "Accept-Language": "ko-KR,ko;q=0.9,en-US;q=0.8",
-    }
-
-    def __init__(self, delay: float = 1.0, max_pages: int = 5):
-        """
-        Args:
-            delay: 요청 간 딜레이 (초) - 서버 부하 방지
-            max_pages: 최대 크롤링 페이지 수
-        """
-        self.delay = delay
-        self.max_pages = max_pages
-        self.session = requests.Session()
-        self.session.headers.update(self.HEADERS)
-
-    def get_comments(self, stock_code: str, max_comments: int = 100) -> list[CommentData]:
-        """
-        특정 종목의 토론방 댓글 수집
-
-        Args:
-            stock_code: 종목코드 (예: '005930' for 삼성전자)
-            max_comments: 최대 수집 댓글 수
-
-        Returns:
-            CommentData 리스트
-        """
-        comments = []
-        page = 1
 
-        while len(comments) < max_comments and page <= self.max_pages:
-            try:
-                page_comments = self._fetch_page(stock_code, page)
-                if not page_comments:
-                    logger.info(f"{stock_code} 페이지 {page}: 댓글 없음, 중단")
-                    break
-
-                comments.extend(page_comments)
-                logger.info(f"{stock_code} 페이지 {page}: {len(page_comments)}개 수집")
-
-                page += 1
-                time.sleep(self.delay)
-
-            except Exception as e:
-                logger.error(f"{stock_code} 페이지 {page} 크롤링 실패: {e}")
-                break
-
-        return comments[:max_comments]
-
-    def _fetch_page(self, stock_code: str, page: int) -> list[CommentData]:
-        """특정 페이지의 댓글 파싱"""
-        url = f"{self.BASE_URL}?code={stock_code}&page={page}"
+    def build_url(self, stock_code: str, cursor: int) -> str:
+        return f"{self.BASE_URL}?code={stock_code}&page={cursor}"
 
-        try:
-            response = self.session.get(url, timeout=10)
-            response.raise_for_status()
-            response.encoding = "euc-kr"
-            return self._parse_comments(response.text, stock_code, url)
-        except requests.RequestException as e:
-            logger.error(f"HTTP 요청 실패 {url}: {e}")
-            raise
-
-    def _parse_comments(self, html: str, stock_code: str, url: str) -> list[CommentData]:
+    def parse(self, html: str, stock_code: str, url: str) -> list[CommentData]:
         """HTML에서 댓글 파싱"""
         soup = BeautifulSoup(html, "lxml")
         comments = []
@@ -141,6 +85,14 @@ class NaverDiscussCrawler:
             author_cell = row.find("td", class_="writer")
             author = author_cell.get_text(strip=True) if author_cell else ""
 
+            # 작성 시각 (날짜 칸)
+            posted_at = None
+            for td in cells:
+                match = _POSTED_AT.fullmatch(td.get_text(strip=True))
+                if match:
+                    posted_at = datetime(*map(int, match.groups()))
+                    break
+
             # 좋아요/싫어요
             likes, dislikes = 0, 0
             td_list = row.find_all("td")
@@ -155,19 +107,97 @@ class NaverDiscussCrawler:
 
             return CommentData(
                 stock_code=stock_code,
-                source="naver_discuss",
+                source=SOURCE,
                 content=content,
                 author=author,
                 likes=likes,
                 dislikes=dislikes,
                 original_url=url,
+                posted_at=posted_at,
             )
         except Exception as e:
             logger.warning(f"행 파싱 실패: {e}")
             return None
 
+
+class NaverDiscussCrawler:
+    """
+    네이버 종목토론방 크롤러 (한 종목씩 직접 수집)
+    여러 소스/종목을 한꺼번에 수집할 때는 crawler.scheduler.CrawlScheduler 사용
+    """
+
+    BASE_URL = NaverDiscussAdapter.BASE_URL
+    HEADERS = {**DEFAULT_HEADERS, **NaverDiscussAdapter.headers}
+
+    def __init__(self, delay: float = 1.0, max_pages: int = 5, profiler: Optional[JobProfiler] = None,
+                 engine: Optional[FetchEngine] = None):
+        """
+        Args:
+            delay: 요청 간 딜레이 (초) - 서버 부하 방지 (엔진의 호스트 예산으로 적용)
+            max_pages: 최대 크롤링 페이지 수
+            profiler: N번째 종목 수집마다 프로파일을 남기는 훅 (기본: profile_job_every 설정)
+            engine: 공용 HTTP 엔진 (없으면 이 크롤러 전용으로 만들고 close 때 닫음)
+        """
+        self.delay = delay
+        self.max_pages = max_pages
+        self.profiler = profiler if profiler is not None else get_job_profiler("crawl")
+        self.adapter = NaverDiscussAdapter()
+        self._owns_engine = engine is None
+        self.engine = engine or FetchEngine(rate=1 / delay if delay > 0 else 0)
+        self.session = self.engine.session
+
+    def get_comments(self, stock_code: str, max_comments: int = 100) -> list[CommentData]:
+        """
+        특정 종목의 토론방 댓글 수집
+
+        Args:
+            stock_code: 종목코드 (예: '005930' for 삼성전자)
+            max_comments: 최대 수집 댓글 수
+
+        Returns:
+            CommentData 리스트
+        """
+        with self.profiler.cycle(stock_code):
+            return self._collect(stock_code, max_comments)
+
+    def _collect(self, stock_code: str, max_comments: int) -> list[CommentData]:
+        comments = []
+        page = 1
+
+        while len(comments) < max_comments and page <= self.max_pages:
+            try:
+                page_comments = self._fetch_page(stock_code, page)
+                if not page_comments:
+                    logger.info(f"{stock_code} 페이지 {page}: 댓글 없음, 중단")
+                    break
+
+                comments.extend(page_comments)
+                logger.info(f"{stock_code} 페이지 {page}: {len(page_comments)}개 수집")
+                page += 1
+
+            except Exception as e:
+                logger.error(f"{stock_code} 페이지 {page} 크롤링 실패: {e}")
+                break
+
+        return comments[:max_comments]
+
+    def _fetch_page(self, stock_code: str, page: int) -> list[CommentData]:
+        """특정 페이지의 댓글 파싱"""
+        url = self.adapter.build_url(stock_code, page)
+        result = self.engine.fetch(url, SOURCE, encoding=self.adapter.encoding, headers=self.adapter.headers)
+        return self._parse_comments(result.text, stock_code, url)
+
+    def _parse_comments(self, html: str, stock_code: str, url: str) -> list[CommentData]:
+        """HTML에서 댓글 파싱"""
+        started = time.perf_counter()
+        try:
+            return self.adapter.parse(html, stock_code, url)
+        finally:
+            _PARSE_SECONDS.observe(time.perf_counter() - started)
+
     def close(self):
-        self.session.close()
+        if self._owns_engine:
+            self.engine.close()
 
     def __enter__(self):
         return self
@@ -0,0 +1,192 @@
+"""
+수집 스케줄러 (전 소스 공용)
+- (소스, 종목) 작업을 소스가 번갈아 나오도록 섞어 스레드 풀에서 실행 → 한 사이트가 속도 제한으로 기다리는 동안 다른 사이트 수집
+- 모든 요청은 공용 FetchEngine 하나로 (연결 풀/호스트 예산 공유)
+- 종목 하나가 끝날 때마다 sink(댓글 목록) 호출 - 기본은 comments.CrawlSink (DB 저장 → 새 댓글만 버퍼 + 급변 감지기)
+  sink 는 스케줄러 스레드에서 순서대로 호출되므로 스레드 안전하지 않아도 된다
+
+실행: python -m app.crawler.scheduler [--once] [--sources naver_discuss] [--sample]
+"""
+import argparse
+import logging
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from itertools import zip_longest
+from typing import Callable, Optional
+
+import requests
+
+from ..metrics.instruments import CRAWL_PARSE_SECONDS
+from ..profiling.profiler import JobProfiler
+from .engine import FetchEngine
+from .sources import CommentData, SourceAdapter
+
+logger = logging.getLogger(__name__)
+
+Sink = Callable[[list[CommentData]], None]
+
+
+@dataclass
+class SourceReport:
+    stocks: int = 0
+    pages: int = 0
+    comments: int = 0
+    errors: int = 0
+
+
+@dataclass
+class CrawlReport:
+    elapsed: float = 0.0
+    sources: dict[str, SourceReport] = field(default_factory=dict)
+
+    @property
+    def comments(self) -> int:
+        return sum(r.comments for r in self.sources.values())
+
+    def to_dict(self) -> dict:
+        return {
+            "elapsed": round(self.elapsed, 2),
+            "comments": self.comments,
+            "sources": {name: vars(r) for name, r in self.sources.items()},
+        }
+
+
+def crawl_stock(engine: FetchEngine, adapter: SourceAdapter, stock_code: str,
+                max_comments: int) -> tuple[list[CommentData], int, int]:
+    """
+    소스 하나에서 종목 하나 수집 (커서를 따라 페이지 넘김) → (댓글, 요청한 페이지 수, 실패한 요청 수)
+    중간 페이지 요청이 실패하면 거기서 멈추고 앞 페이지까지 모은 댓글은 돌려준다
+    """
+    parse_seconds = CRAWL_PARSE_SECONDS.labels(adapter.name)
+    comments: list[CommentData] = []
+    cursor = adapter.first_cursor(stock_code)
+    pages = errors = 0
+    while cursor is not None and len(comments) < max_comments and pages < adapter.max_pages:
+        url = adapter.build_url(stock_code, cursor)
+        pages += 1
+        try:
+            result = engine.fetch(url, adapter.name, encoding=adapter.encoding, headers=adapter.headers)
+        except requests.RequestException as e:
+            errors += 1
+            logger.error(f"[{adapter.name}] {stock_code} 페이지 {cursor} 수집 실패, {len(comments)}건까지 사용: {e}")
+            break
+        started = time.perf_counter()
+        page = adapter.parse(result.text, stock_code, url)
+        parse_seconds.observe(time.perf_counter() - started)
+        if not page:
+            break
+        comments.extend(page)
+        cursor = adapter.next_cursor(cursor, page)
+    return comments[:max_comments], pages, errors
+
+
+class CrawlScheduler:
+    """
+    engine: 공용 HTTP 엔진, adapters: 수집할 소스들
+    workers: 동시에 진행할 (소스, 종목) 작업 수 - 실제 요청 속도는 엔진의 호스트 예산이 정한다
+    """
+
+    def __init__(self, engine: FetchEngine, adapters: list[SourceAdapter], workers: int = 4,
+                 max_comments: int = 100, sink: Optional[Sink] = None, profiler: Optional[JobProfiler] = None):
+        self.engine = engine
+        self.adapters = adapters
+        self.workers = workers
+        self.max_comments = max_comments
+        self.sink = sink
+        self.profiler = profiler
+        self.runs = 0
+
+    def tasks(self, stock_codes: list[str]) -> list[tuple[SourceAdapter, str]]:
+        """소스별 작업을 번갈아 배치 (a1, b1, a2, b2, …)"""
+        per_source = [[(adapter, code) for code in stock_codes] for adapter in self.adapters]
+        return [task for group in zip_longest(*per_source) for task in group if task is not None]
+
+    def _task(self, adapter: SourceAdapter, stock_code: str) -> tuple[list[CommentData], int, int]:
+        if self.profiler is None:
+            return crawl_stock(self.engine, adapter, stock_code, self.max_comments)
+        with self.profiler.cycle(f"{adapter.name}-{stock_code}"):
+            return crawl_stock(self.engine, adapter, stock_code, self.max_comments)
+
+    def run(self, stock_codes: list[str]) -> CrawlReport:
+        """전 소스 × 전 종목 1회 수집"""
+        started = time.perf_counter()
+        report = CrawlReport(sources={a.name: SourceReport() for a in self.adapters})
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="crawl") as pool:
+            futures = {pool.submit(self._task, adapter, code): (adapter, code) for adapter, code in self.tasks(stock_codes)}
+            for future in as_completed(futures):
+                adapter, code = futures[future]
+                source = report.sources[adapter.name]
+                source.stocks += 1
+                try:
+                    comments, pages, errors = future.result()
+                except Exception as e:
+                    source.errors += 1
+                    logger.error(f"[{adapter.name}] {code} 수집 실패: {e}")
+                    continue
+                source.errors += errors
+                source.pages += pages
+                source.comments += len(comments)
+                if comments and self.sink is not None:
+                    try:
+                        self.sink(comments)
+                    except Exception as e:
+                        logger.error(f"[{adapter.name}] {code} 댓글 반영 실패: {e}")
+
+        report.elapsed = time.perf_counter() - started
+        self.runs += 1
+        logger.info(f"수집 #{self.runs} 완료: 댓글 {report.comments}건, {report.elapsed:.1f}초")
+        return report
+
+
+def build_default_scheduler(sources: Optional[list[str]] = None, sink: Optional[Sink] = None) -> CrawlScheduler:
+    """설정에 따른 스케줄러 (공용 엔진, sink 기본값: DB 저장 후 새 댓글만 최근 댓글 버퍼 + 급변 감지기)"""
+    from ..config import get_settings
+    from ..profiling.profiler import get_job_profiler
+    from .engine import get_fetch_engine
+    from .sources import create_adapters
+
+    settings = get_settings()
+    if sink is None:
+        from ..comments import CrawlSink
+        sink = CrawlSink()
+    names = sources or [s.strip() for s in settings.crawl_sources.split(",") if s.strip()]
+    return CrawlScheduler(
+        get_fetch_engine(),
+        create_adapters(names, max_pages=settings.crawl_max_pages),
+        workers=settings.crawl_workers,
+        max_comments=settings.max_comments_per_stock,
+        sink=sink,
+        profiler=get_job_profiler("crawl"),
+    )
+
+
+def main(argv=None) -> int:
+    from ..config import get_settings
+    from ..metrics import write_textfile
+    from .kospi200 import Kospi200Manager
+
+    parser = argparse.ArgumentParser(description="전 소스 댓글 수집")
+    parser.add_argument("--once", action="store_true", help="한 번만 수집하고 종료")
+    parser.add_argument("--sources", help="쉼표로 구분한 소스 (기본: CRAWL_SOURCES)")
+    parser.add_argument("--sample", action="store_true", help="샘플 종목만")
+    args = parser.parse_args(argv)
+
+    settings = get_settings()
+    scheduler = build_default_scheduler(args.sources.split(",") if args.sources else None)
+    interval = settings.crawl_interval_hours * 3600
+    while True:
+        codes = [s.code for s in Kospi200Manager().get_stock_list(use_sample=args.sample)]
+        report = scheduler.run(codes)
+        for name, source in report.sources.items():
+            print(f"  {name:<16} 종목 {source.stocks} / 페이지 {source.pages} / 댓글 {source.comments} / 실패 {source.errors}")
+        write_textfile("crawl")
+        if args.once:
+            return 0
+        time.sleep(max(0.0, interval - report.elapsed))
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    sys.exit(main())
@@ -0,0 +1,85 @@
+"""
+수집 소스 어댑터
+소스마다 다른 것은 URL, 파싱, 다음 페이지 커서뿐 - HTTP 연결/속도 제한/스케줄은 공용 엔진과 스케줄러가 맡는다
+
+새 소스 추가:
+    @register_source
+    class StockplusAdapter(SourceAdapter):
+        name = "stockplus"
+        def build_url(self, stock_code, cursor): ...
+        def parse(self, text, stock_code, url): ...
+"""
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from datetime import datetime
+from types import MappingProxyType
+from typing import Any, Mapping, Optional
+
+
+@dataclass
+class CommentData:
+    """크롤링된 댓글 데이터 구조"""
+    stock_code: str
+    source: str
+    content: str
+    author: str = ""
+    likes: int = 0
+    dislikes: int = 0
+    original_url: str = ""
+    crawled_at: datetime = field(default_factory=datetime.now)
+    posted_at: Optional[datetime] = None  # 게시판에 표시된 작성 시각 (소스가 주지 않으면 None)
+
+
+class SourceAdapter(ABC):
+    """
+    name: Comment.source 에 저장되는 소스 이름
+    encoding: 응답 인코딩 강제 (None 이면 서버 응답 기준)
+    headers: 이 소스에만 붙이는 요청 헤더 (Referer 등, 클래스끼리 공유되지 않도록 읽기 전용 매핑)
+    max_pages: 종목당 최대 페이지 수
+    커서 기본값은 페이지 번호 (1, 2, 3 …) - 마지막 글 id 등으로 넘기는 소스는 first_cursor/next_cursor 재정의
+    """
+
+    name: str = ""
+    encoding: Optional[str] = None
+    headers: Mapping[str, str] = MappingProxyType({})
+    max_pages: int = 5
+
+    def first_cursor(self, stock_code: str) -> Any:
+        return 1
+
+    def next_cursor(self, cursor: Any, comments: list[CommentData]) -> Optional[Any]:
+        """다음 페이지 커서 (None 이면 끝)"""
+        return cursor + 1
+
+    @abstractmethod
+    def build_url(self, stock_code: str, cursor: Any) -> str:
+        ...
+
+    @abstractmethod
+    def parse(self, text: str, stock_code: str, url: str) -> list[CommentData]:
+        ...
+
+
+SOURCES: dict[str, type[SourceAdapter]] = {}
+
+
+def register_source(cls: type[SourceAdapter]) -> type[SourceAdapter]:
+    """소스 등록 (클래스 데코레이터)"""
+    SOURCES[cls.name] = cls
+    return cls
+
+
+def create_adapters(names: list[str], max_pages: Optional[int] = None) -> list[SourceAdapter]:
+    """이름 목록 → 어댑터 (모르는 이름은 ValueError)"""
+    from . import naver_crawler  # noqa: F401  기본 소스 등록
+
+    adapters = []
+    for name in names:
+        cls = SOURCES.get(name)
+        if cls is None:
+            raise ValueError(f"알 수 없는 수집 소스: {name} (등록: {', '.join(sorted(SOURCES))})")
+        adapter = cls()
+        if max_pages is not None:
+            adapter.max_pages = max_pages
+        adapters.append(adapter)
+    return adapters
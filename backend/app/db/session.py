@@ -1,16 +1,38 @@
-"""DB 세션 관리"""
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+"""DB 세션 관리 (엔진은 처음 사용할 때 생성)"""
+import threading
+
 from ..config import get_settings
 
-settings = get_settings()
-engine = create_engine(
-    settings.database_url,
-    pool_pre_ping=True,
-    pool_size=5,
-    max_overflow=10,
-)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+_engine = None
+_session_factory = None
+_lock = threading.Lock()
+
+
+def get_engine():
+    """공유 DB 엔진 - sqlalchemy/DB 드라이버는 이 시점에 import"""
+    global _engine, _session_factory
+    if _engine is None:
+        with _lock:
+            if _engine is None:
+                from sqlalchemy import create_engine
+                from sqlalchemy.orm import sessionmaker
+
+                settings = get_settings()
+                _engine = create_engine(
+                    settings.database_url,
+                    pool_pre_ping=True,
+                    pool_size=5,
+                    max_overflow=10,
+                )
+                _session_factory = sessionmaker(autocommit=False, autoflush=False, bind=_engine)
+    return _engine
+
+
+def SessionLocal():
+    """새 DB 세션"""
+    get_engine()
+    return _session_factory()
+
 
 def get_db():
     db = SessionLocal()
@@ -18,3 +40,10 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+def __getattr__(name):
+    # 기존 `from app.db.session import engine` 호환
+    if name == "engine":
+        return get_engine()
+    raise AttributeError(name)
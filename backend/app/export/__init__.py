@@ -0,0 +1,3 @@
+from .static_export import StaticExporter, index_context, detail_context
+
+__all__ = ["StaticExporter", "index_context", "detail_context"]
@@ -0,0 +1,182 @@
+"""
+정적 스냅샷 내보내기
+집계 주기가 끝날 때마다 메인 페이지, 종목 상세 페이지, 읽기 API JSON을
+버전별 디렉터리에 렌더링하고 current 심볼릭 링크를 원자적으로 교체한다.
+nginx가 current/ 를 직접 서빙하고, 앱은 그 외 요청(쿼리 파라미터 등)의 폴백으로 남는다.
+
+  {root}/versions/{세대}-{시각}/index.html
+                               stock/{code}.html
+                               api/stocks/index.json, api/stocks/{code}.json, api/stocks/{code}/bundle.json
+                               api/share/{code}.json, api/sentiment/{code}/history.json, api/sectors.json
+  {root}/current -> versions/...
+각 파일 옆에 .gz / .br (brotli 설치 시) 사전 압축본을 둔다
+"""
+import gzip
+import json
+import logging
+import os
+import shutil
+import time
+from pathlib import Path
+from typing import Optional
+
+from jinja2 import Environment, FileSystemLoader, select_autoescape
+
+from ..board.board import BoardSnapshot
+from ..board.payloads import comments_payload, detail_payload, history_payload, share_payload
+
+try:
+    import brotli
+except ImportError:  # 선택 의존성
+    brotli = None
+
+logger = logging.getLogger(__name__)
+
+TEMPLATES_DIR = Path(__file__).parent.parent.parent.parent / "frontend" / "templates"
+DEFAULT_PAGE_SIZE = 50
+DEFAULT_HISTORY_DAYS = 30
+COMPRESS_MIN_SIZE = 256
+
+
+def index_context(settings) -> dict:
+    """메인 페이지 템플릿 컨텍스트 (앱 라우트와 공유)"""
+    return {
+        "title": "곡소리 매매법",
+        "adsense_client_id": settings.adsense_client_id,
+        "kakao_js_key": settings.kakao_js_key,
+    }
+
+
+def detail_context(stock_code: str) -> dict:
+    """종목 상세 페이지 템플릿 컨텍스트 (앱 라우트와 공유)"""
+    return {
+        "stock_code": stock_code,
+        "title": f"곡소리 매매법 - {stock_code}",
+    }
+
+
+def dump_json(payload) -> bytes:
+    """FastAPI JSONResponse와 같은 직렬화"""
+    return json.dumps(payload, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")).encode("utf-8")
+
+
+class StaticExporter:
+    """
+    root: 내보내기 루트 디렉터리
+    keep: 보관할 이전 버전 수
+    """
+
+    def __init__(self, root: Path, settings, keep: int = 3, templates_dir: Path = TEMPLATES_DIR):
+        self.root = Path(root)
+        self.settings = settings
+        self.keep = keep
+        self.env = Environment(
+            loader=FileSystemLoader(str(templates_dir)),
+            autoescape=select_autoescape(["html"]),
+        )
+
+    @property
+    def current_link(self) -> Path:
+        return self.root / "current"
+
+    def export(self, snapshot: BoardSnapshot) -> Path:
+        """스냅샷 전체를 새 버전 디렉터리에 쓰고 current 를 교체"""
+        started = time.perf_counter()
+        versions = self.root / "versions"
+        stamp = time.strftime("%Y%m%d%H%M%S") + f"{int(time.time() * 1000) % 1000:03d}"
+        version_dir = versions / f"{stamp}-{snapshot.generation:06d}"  # 시각이 앞 (세대는 프로세스마다 다시 시작)
+        tmp_dir = version_dir.with_name(version_dir.name + ".tmp")
+        if tmp_dir.exists():
+            shutil.rmtree(tmp_dir)
+        tmp_dir.mkdir(parents=True)
+
+        count = self._write_all(tmp_dir, snapshot)
+        tmp_dir.rename(version_dir)
+        self._swap_current(version_dir)
+        self._prune(versions, keep_dir=version_dir)
+
+        logger.info(
+            f"정적 스냅샷 내보내기 완료: {count}개 파일, "
+            f"{time.perf_counter() - started:.2f}초 → {version_dir.name}"
+        )
+        return version_dir
+
+    def _write_all(self, out: Path, snapshot: BoardSnapshot) -> int:
+        count = 0
+        index_tpl = self.env.get_template("index.html")
+        detail_tpl = self.env.get_template("stock_detail.html")
+
+        count += self._write(out / "index.html", index_tpl.render(**index_context(self.settings)).encode("utf-8"))
+
+        # /api/stocks/ 기본 조회 (page=1, size=50, sort=score_desc)
+        total, rows = snapshot.page("score_desc", 1, DEFAULT_PAGE_SIZE)
+        listing = {"total": total, "page": 1, "size": DEFAULT_PAGE_SIZE, "stocks": list(rows)}
+        count += self._write(out / "api" / "stocks" / "index.json", dump_json(listing))
+
+        from ..board.sectors import get_sector_board
+        count += self._write(out / "api" / "sectors.json", dump_json(get_sector_board().for_snapshot(snapshot)))
+
+        for row in snapshot.rows:
+            code = row["code"]
+            comments = comments_payload(code)
+            history = history_payload(row, DEFAULT_HISTORY_DAYS)
+            share = share_payload(row, snapshot)
+
+            count += self._write(out / "stock" / f"{code}.html", detail_tpl.render(**detail_context(code)).encode("utf-8"))
+            count += self._write(
+                out / "api" / "stocks" / f"{code}.json",
+                dump_json(detail_payload(row, comments=comments["comments"])),
+            )
+            count += self._write(
+                out / "api" / "stocks" / code / "bundle.json",
+                dump_json({
+                    "code": code,
+                    "generation": snapshot.generation,
+                    "detail": detail_payload(row),
+                    "comments": comments,
+                    "share": share,
+                    "history": history,
+                }),
+            )
+            count += self._write(out / "api" / "share" / f"{code}.json", dump_json(share))
+            count += self._write(
+                out / "api" / "sentiment" / code / "history.json",
+                dump_json({"stock_code": code, "history": history}),
+            )
+        return count
+
+    @staticmethod
+    def _write(path: Path, data: bytes) -> int:
+        """원본 + 사전 압축본 쓰기, 쓴 파일 수 반환"""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(data)
+        written = 1
+        if len(data) >= COMPRESS_MIN_SIZE:
+            path.with_name(path.name + ".gz").write_bytes(gzip.compress(data, compresslevel=9, mtime=0))
+            written += 1
+            if brotli is not None:
+                path.with_name(path.name + ".br").write_bytes(brotli.compress(data))
+                written += 1
+        return written
+
+    def _swap_current(self, version_dir: Path) -> None:
+        """심볼릭 링크를 임시 이름으로 만든 뒤 rename 으로 원자적 교체"""
+        target = os.path.relpath(version_dir, self.root)
+        tmp_link = self.root / f".current.{os.getpid()}"
+        if tmp_link.is_symlink() or tmp_link.exists():
+            tmp_link.unlink()
+        os.symlink(target, tmp_link)
+        os.replace(tmp_link, self.current_link)
+
+    def _prune(self, versions: Path, keep_dir: Path) -> None:
+        """내보낸 시각순으로 오래된 버전 삭제 (재시작 전 버전도 같은 기준)"""
+        old = sorted(
+            (d for d in versions.iterdir() if d.is_dir() and d != keep_dir),
+            key=lambda d: d.name,
+        )
+        for d in old[:max(0, len(old) - (self.keep - 1))]:
+            shutil.rmtree(d, ignore_errors=True)
+
+    def current_version(self) -> Optional[str]:
+        link = self.current_link
+        return os.readlink(link) if link.is_symlink() else None
@@ -0,0 +1,5 @@
+from .aggregate import aggregate_period
+from .cycle import AggregationCycle, build_default_cycle
+from .runner import JobRunner, build_job_runner
+
+__all__ = ["AggregationCycle", "JobRunner", "aggregate_period", "build_default_cycle", "build_job_runner"]
@@ -0,0 +1,220 @@
+"""
+기간별 종목 감성 점수 집계 (DB 안에서 한 번에)
+댓글/감성 행을 파이썬으로 읽지 않고 INSERT … SELECT … GROUP BY 한 문장으로 sentiment_scores 에 기록
+- 결과는 SentimentAggregator.aggregate(결과, 가중치) 와 같다: 라벨별 개수, 신뢰도 × 댓글 가중치 가중 평균(댓글별 0~100 점수),
+  소수 첫째 자리 반올림, 추세(반올림 전 평균 > 55 up, < 45 down), 직전 기간 점수 대비 변화량
+- 댓글 가중치는 기간 안의 행으로 계산 (sentiment.dedup 과 같은 식, 전 종목 기준)
+    1 / 유사 중복 묶음(comment_sentiments.cluster) 크기 × min(1, DEDUP_AUTHOR_LIMIT / 작성자 댓글 수)
+  → 여러 수집 배치/종목에 걸친 복붙 100개도 기간 점수에는 합쳐서 댓글 1개만큼
+  묶음이 없는 이전 행은 저장된 고정 가중치(comment_sentiments.weight)
+- 활성 종목 전부를 한 번에 기록 (댓글이 없는 종목은 빈 집계와 같이 50점/neutral)
+- 기간은 게시 시각(comments.posted_at) 기준 → 나중에 백필한 옛 글도 올린 날의 기간에 들어간다
+
+실행: python -m app.jobs.aggregate [--hours 4] [--end 2025-01-02T09:00]
+"""
+import argparse
+import logging
+import sys
+import time
+from datetime import datetime, timedelta
+from typing import Optional
+
+from ..metrics.instruments import DB_WRITE_ROWS, DB_WRITE_SECONDS
+
+logger = logging.getLogger(__name__)
+
+_WRITE_SECONDS = DB_WRITE_SECONDS.labels("sentiment_scores")
+_WRITE_ROWS = DB_WRITE_ROWS.labels("sentiment_scores")
+
+_POSITIVE = ("positive", "긍정")
+_NEGATIVE = ("negative", "부정")
+_NEUTRAL = ("neutral", "중립")
+
+
+def round1(x):
+    """
+    파이썬 round(x, 1) 과 같은 SQL 식 (x ≥ 0)
+    SQL ROUND 는 49.55 (실제 값 49.5499…) 를 49.6 으로, 81.25 를 81.3 으로 올리지만
+    파이썬은 저장된 이진수 그대로 반올림하고 정확히 가운데면 짝수 쪽 (49.5, 81.2)
+    → 후보 k = floor(10x + 0.5) 를 구하고, 경계 (2k±1)/20 과의 대소를 20x 의 정확한 값(TwoSum: 16x + 4x)으로 비교해 보정
+    """
+    from sqlalchemy import case, func
+
+    k = func.floor(x * 10.0 + 0.5)
+    a, b = x * 16.0, x * 4.0  # 2의 거듭제곱 배 → 오차 없음
+    s = a + b
+    bb = s - a
+    err = (a - (s - bb)) + (b - bb)  # 20x = s + err (정확히)
+    below = (s - (k * 2.0 - 1.0)) + err  # 20x - (2k - 1) 의 부호
+    above = (s - (k * 2.0 + 1.0)) + err  # 20x - (2k + 1) 의 부호
+    k_even = k - func.floor(k / 2.0) * 2.0 == 0
+    k = case(
+        (below < 0, k - 1.0),
+        (below == 0, case((k_even, k), else_=k - 1.0)),
+        (above > 0, k + 1.0),
+        (above == 0, case((k_even, k), else_=k + 1.0)),
+        else_=k,
+    )
+    return k / 10.0
+
+
+def round1_signed(x):
+    """부호 있는 값의 round(x, 1) (파이썬 반올림은 0을 기준으로 대칭)"""
+    from sqlalchemy import case
+
+    return case((x < 0, -round1(-x)), else_=round1(x))
+
+
+def dedup_weight(author_limit: int):
+    """기간 안의 행 기준 댓글 가중치 식 (묶음 크기 / 작성자 댓글 수는 창 함수)"""
+    from sqlalchemy import String, case, cast, func, literal
+    from ..models import Comment, CommentSentiment
+
+    cluster_size = func.count().over(
+        partition_by=func.coalesce(CommentSentiment.cluster, cast(Comment.id, String))
+    )
+    author_count = func.count().over(partition_by=Comment.author)
+    author_factor = case(
+        (func.coalesce(Comment.author, "") == "", 1.0),
+        (author_count > author_limit, literal(float(author_limit)) / author_count),
+        else_=1.0,
+    )
+    return case(
+        (CommentSentiment.cluster.is_(None), CommentSentiment.weight),
+        else_=author_factor / cluster_size,
+    )
+
+
+def score_select(period_start: datetime, period_end: datetime, author_limit: Optional[int] = None):
+    """sentiment_scores 에 넣을 SELECT (활성 종목별 1행), author_limit 기본: DEDUP_AUTHOR_LIMIT"""
+    from sqlalchemy import case, func, literal, select
+    from ..models import Comment, CommentSentiment, SentimentScore, Stock
+
+    if author_limit is None:
+        from ..config import get_settings
+        author_limit = get_settings().dedup_author_limit
+
+    rows = (
+        select(
+            Comment.stock_id,
+            (((CommentSentiment.score + 1.0) / 2.0) * 100.0).label("x"),
+            CommentSentiment.confidence,
+            dedup_weight(author_limit).label("weight"),
+            CommentSentiment.label,
+        )
+        .join(CommentSentiment, CommentSentiment.comment_id == Comment.id)
+        .where(Comment.posted_at >= period_start, Comment.posted_at < period_end)
+        .subquery("period_rows")
+    )
+    normalized = round1(rows.c.x)  # SentimentResult.normalized_score
+    grouped = (
+        select(
+            rows.c.stock_id,
+            func.count(case((rows.c.label.in_(_POSITIVE), 1))).label("positive"),
+            func.count(case((rows.c.label.in_(_NEGATIVE), 1))).label("negative"),
+            func.count(case((rows.c.label.in_(_NEUTRAL), 1))).label("neutral"),
+            func.count().label("total"),
+            func.sum(normalized * rows.c.confidence * rows.c.weight).label("weighted_sum"),
+            func.sum(rows.c.confidence * rows.c.weight).label("weight_total"),
+        )
+        .group_by(rows.c.stock_id)
+        .subquery("grouped")
+    )
+    previous = (
+        select(SentimentScore.score)
+        .where(SentimentScore.stock_id == Stock.id, SentimentScore.period_end <= period_start)
+        .order_by(SentimentScore.period_end.desc(), SentimentScore.id.desc())
+        .limit(1)
+        .correlate(Stock)
+        .scalar_subquery()
+    )
+    averaged = (
+        select(
+            Stock.id.label("stock_id"),
+            case(
+                (grouped.c.weight_total > 0, grouped.c.weighted_sum / grouped.c.weight_total),
+                else_=50.0,
+            ).label("average"),
+            func.coalesce(grouped.c.positive, 0).label("positive"),
+            func.coalesce(grouped.c.negative, 0).label("negative"),
+            func.coalesce(grouped.c.neutral, 0).label("neutral"),
+            func.coalesce(grouped.c.total, 0).label("total"),
+            previous.label("previous"),
+        )
+        .select_from(Stock)
+        .outerjoin(grouped, grouped.c.stock_id == Stock.id)
+        .where(Stock.is_active == 1)
+        .subquery("averaged")
+    )
+    scored = select(averaged, round1(averaged.c.average).label("score")).subquery("scored")
+    return select(
+        scored.c.stock_id,
+        scored.c.score,
+        scored.c.positive,
+        scored.c.negative,
+        scored.c.neutral,
+        scored.c.total,
+        case((scored.c.average > 55, "up"), (scored.c.average < 45, "down"), else_="neutral"),
+        case(
+            (scored.c.previous.is_(None), 0.0),
+            else_=round1_signed(scored.c.score - scored.c.previous),
+        ),
+        literal(period_start, SentimentScore.period_start.type),
+        literal(period_end, SentimentScore.period_end.type),
+    )
+
+
+def aggregate_period(period_start: datetime, period_end: datetime, session_factory=None) -> int:
+    """[period_start, period_end) 댓글 → 활성 종목별 SentimentScore 1행씩 (문장 하나) → 기록한 행 수"""
+    from sqlalchemy import insert
+    from ..models import SentimentScore
+
+    if session_factory is None:
+        from ..db.session import SessionLocal
+        session_factory = SessionLocal
+
+    statement = insert(SentimentScore).from_select(
+        [
+            SentimentScore.stock_id,
+            SentimentScore.score,
+            SentimentScore.positive_count,
+            SentimentScore.negative_count,
+            SentimentScore.neutral_count,
+            SentimentScore.total_count,
+            SentimentScore.trend,
+            SentimentScore.score_change,
+            SentimentScore.period_start,
+            SentimentScore.period_end,
+        ],
+        score_select(period_start, period_end),
+    )
+    started = time.perf_counter()
+    with session_factory() as session:
+        written = session.execute(statement).rowcount
+        session.commit()
+    elapsed = time.perf_counter() - started
+    _WRITE_SECONDS.observe(elapsed)
+    _WRITE_ROWS.inc(written)
+    logger.info(f"감성 점수 집계 {period_start:%Y-%m-%d %H:%M} ~ {period_end:%Y-%m-%d %H:%M}: {written}종목, {elapsed:.2f}초")
+    return written
+
+
+def main(argv=None) -> int:
+    from ..config import get_settings
+    from ..metrics import write_textfile
+
+    parser = argparse.ArgumentParser(description="기간별 종목 감성 점수 집계 (DB 안에서)")
+    parser.add_argument("--hours", type=float, default=get_settings().crawl_interval_hours, help="집계 기간 (시간)")
+    parser.add_argument("--end", type=datetime.fromisoformat, help="기간 끝 (기본: 지금)")
+    args = parser.parse_args(argv)
+
+    period_end = args.end or datetime.now()
+    written = aggregate_period(period_end - timedelta(hours=args.hours), period_end)
+    write_textfile("aggregate")
+    print(f"{written}종목 기록")
+    return 0
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    sys.exit(main())
@@ -0,0 +1,116 @@
+"""
+집계 주기 작업
+점수 행 생성 → 종목 보드 갱신(세대 증가, 실시간 델타 발행) → 후처리 단계(정적 내보내기 등)
+BOARD_SOURCE=database 이면 점수 행 = 직전 주기 댓글을 DB 안에서 집계(jobs.aggregate)한 뒤 종목별 최신 점수
+실행: python -m app.jobs.cycle
+"""
+import argparse
+import logging
+import sys
+import time
+from datetime import datetime, timedelta
+from functools import partial
+from typing import Callable, Optional
+
+from ..board import BoardSnapshot, StockBoard, get_board
+from ..config import get_settings
+from ..metrics.instruments import CYCLE_SECONDS
+from ..profiling.profiler import JobProfiler, get_job_profiler
+
+logger = logging.getLogger(__name__)
+
+RowSource = Callable[[], list[dict]]
+Stage = Callable[[BoardSnapshot], None]
+
+
+class AggregationCycle:
+    """
+    board: 갱신할 종목 보드
+    row_source: 이번 주기의 종목 점수 행을 만드는 함수
+    profiler: N번째 주기마다 프로파일을 남기는 훅 (선택)
+    """
+
+    def __init__(self, board: StockBoard, row_source: RowSource, profiler: Optional[JobProfiler] = None):
+        self.board = board
+        self.row_source = row_source
+        self.profiler = profiler
+        self.stages: list[tuple[str, Stage]] = []
+        self.runs = 0
+
+    def add_stage(self, name: str, stage: Stage) -> None:
+        """보드 갱신 후 실행할 단계 추가 (등록 순서대로 실행)"""
+        self.stages.append((name, stage))
+
+    def run(self) -> BoardSnapshot:
+        if self.profiler is None:
+            return self._run()
+        with self.profiler.cycle():
+            return self._run()
+
+    def _run(self) -> BoardSnapshot:
+        started = time.perf_counter()
+        rows = self.row_source()
+        if not rows:
+            # 첫 집계 전 (점수 행 없음) - 보드를 비우지 않는다
+            logger.warning("집계 주기: 점수 행이 없어 보드 갱신 생략")
+            return self.board.snapshot
+        snapshot = self.board.refresh(rows)
+
+        for name, stage in self.stages:
+            try:
+                stage(snapshot)
+            except Exception as e:
+                # 후처리 실패가 이미 갱신된 보드를 되돌리지는 않는다
+                logger.error(f"집계 후처리 단계 실패 [{name}]: {e}")
+
+        self.runs += 1
+        elapsed = time.perf_counter() - started
+        CYCLE_SECONDS.observe(elapsed)
+        logger.info(f"집계 주기 #{self.runs} 완료: {elapsed:.2f}초")
+        return snapshot
+
+
+def aggregated_rows(hours: float, session_factory=None) -> list[dict]:
+    """직전 hours 시간 댓글 → sentiment_scores 기록 → 종목별 최신 점수 행"""
+    from ..board.scores import latest_score_rows
+    from .aggregate import aggregate_period
+
+    period_end = datetime.now()
+    aggregate_period(period_end - timedelta(hours=hours), period_end, session_factory)
+    return latest_score_rows(session_factory)
+
+
+def build_default_cycle(board: Optional[StockBoard] = None, session_factory=None) -> AggregationCycle:
+    """설정에 따라 기본 단계를 붙인 집계 주기 (행 소스: BOARD_SOURCE)"""
+    from ..board.scores import get_row_source
+
+    settings = get_settings()
+    if settings.board_source == "database":
+        row_source = partial(aggregated_rows, settings.crawl_interval_hours, session_factory)
+    else:
+        row_source = get_row_source(settings.board_source)
+    cycle = AggregationCycle(board or get_board(), row_source=row_source, profiler=get_job_profiler("aggregate"))
+
+    if settings.static_export_enabled:
+        from ..export import StaticExporter
+        exporter = StaticExporter(settings.static_export_dir, settings, keep=settings.static_export_keep)
+        cycle.add_stage("static_export", exporter.export)
+
+    return cycle
+
+
+def main(argv=None) -> int:
+    from ..metrics import write_textfile
+
+    parser = argparse.ArgumentParser(description="집계 주기 1회 (DB 집계 → 보드 갱신 → 내보내기)")
+    parser.parse_args(argv)
+
+    snapshot = build_default_cycle().run()
+    write_textfile("cycle")
+    print(f"종목 {len(snapshot.rows)}개 갱신")
+    return 0
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    sys.exit(main())
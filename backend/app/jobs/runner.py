@@ -0,0 +1,158 @@
+"""
+앱 프로세스 안의 주기 작업 (JOBS_ENABLED, lifespan 백그라운드 태스크)
+- crawl_interval_hours 마다 수집(DB 저장 → 새 댓글만 최근 댓글 버퍼 + 급변 감지기) 후
+  집계 주기(DB 집계 → 보드 갱신 → SSE 델타/공유 카드 → 정적 내보내기)를 실행
+  보드/버퍼/감지기를 서빙하는 프로세스가 직접 갱신하므로 응답 캐시 세대(ETag), 실시간 스트림, 최근 댓글이 바로 바뀐다
+- 워커가 여럿이면 잠금 파일(JOBS_LOCK_PATH)을 잡은 워커 하나만 주기 작업을 실행하고,
+  나머지 워커는 board_poll_seconds 마다 새 댓글을 id 순으로 버퍼에 이어 붙이고
+  DB 의 최신 점수 id 가 바뀌었을 때만 보드를 다시 읽는다
+"""
+import asyncio
+import logging
+import os
+import time
+from typing import Callable, Optional
+
+from ..concurrency import run_in_threadpool
+from .cycle import AggregationCycle
+
+logger = logging.getLogger(__name__)
+
+
+def acquire_lock(path: str):
+    """잠금 파일을 비차단으로 잡는다 → 잡으면 열린 파일 (프로세스가 끝날 때까지 보관), 다른 프로세스가 잡고 있으면 None"""
+    import fcntl
+
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    handle = open(path, "a")
+    try:
+        fcntl.flock(handle, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        handle.close()
+        return None
+    return handle
+
+
+class JobRunner:
+    """
+    cycle: 주기마다 실행할 집계 주기
+    interval: 주기 (초)
+    crawl: 집계 전에 실행할 수집 작업 (선택)
+    lock_path: 워커 간 잠금 파일 (None 이면 항상 이 프로세스가 실행)
+    follower_cycle / version: 잠금을 못 잡은 워커의 보드 갱신 주기와 DB 점수 버전 함수 (None 이면 보드 갱신 안 함)
+    tail: 잠금을 못 잡은 워커가 확인 주기마다 부르는 새 댓글 반영 함수 (선택)
+    """
+
+    def __init__(self, cycle: AggregationCycle, interval: float, crawl: Optional[Callable[[], object]] = None,
+                 lock_path: Optional[str] = None, follower_cycle: Optional[AggregationCycle] = None,
+                 version: Optional[Callable[[], object]] = None, tail: Optional[Callable[[], object]] = None,
+                 poll_interval: float = 60.0):
+        self.cycle = cycle
+        self.interval = interval
+        self.crawl = crawl
+        self.tail = tail
+        self.lock_path = lock_path
+        self.follower_cycle = follower_cycle
+        self.version = version
+        self.poll_interval = poll_interval
+        self.leader: Optional[bool] = None
+        self._lock_handle = None
+        self._task: Optional[asyncio.Task] = None
+
+    async def run_once(self):
+        """주기 작업 한 번 (스레드 풀에서) - 수집이 실패해도 집계는 한다"""
+        if self.crawl is not None:
+            try:
+                await run_in_threadpool(self.crawl)
+            except Exception as e:
+                logger.error(f"수집 실패: {e}")
+        return await run_in_threadpool(self.cycle.run)
+
+    async def _lead(self) -> None:
+        while True:
+            started = time.perf_counter()
+            try:
+                await self.run_once()
+            except Exception as e:
+                logger.error(f"주기 작업 실패 (다음 주기에 재시도): {e}")
+            await asyncio.sleep(max(0.0, self.interval - (time.perf_counter() - started)))
+
+    async def _follow(self) -> None:
+        refresh = self.follower_cycle is not None and self.version is not None
+        if not refresh and self.tail is None:
+            return
+        seen = None
+        while True:
+            try:
+                if self.tail is not None:
+                    await run_in_threadpool(self.tail)
+                if refresh:
+                    current = await run_in_threadpool(self.version)
+                    if seen is not None and current != seen:
+                        await run_in_threadpool(self.follower_cycle.run)
+                    seen = current
+            except Exception as e:
+                logger.error(f"보드/댓글 갱신 확인 실패: {e}")
+            await asyncio.sleep(self.poll_interval)
+
+    async def run(self) -> None:
+        if self.lock_path is None:
+            self.leader = True
+        else:
+            self._lock_handle = await run_in_threadpool(acquire_lock, self.lock_path)
+            self.leader = self._lock_handle is not None
+        logger.info(f"주기 작업 시작: {'실행' if self.leader else '보드 갱신만 확인'} (pid {os.getpid()})")
+        await (self._lead() if self.leader else self._follow())
+
+    def start(self) -> asyncio.Task:
+        self._task = asyncio.get_running_loop().create_task(self.run())
+        return self._task
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._lock_handle is not None:
+            self._lock_handle.close()
+            self._lock_handle = None
+
+
+def crawl_once(scheduler=None):
+    """코스피 200 전 종목 1회 수집 (기본: 설정에 따른 스케줄러, 기본 sink = DB 저장 + 버퍼 + 감지기)"""
+    from ..crawler.kospi200 import Kospi200Manager
+    from ..crawler.scheduler import build_default_scheduler
+
+    scheduler = scheduler or build_default_scheduler()
+    return scheduler.run([s.code for s in Kospi200Manager().get_stock_list()])
+
+
+def build_job_runner() -> JobRunner:
+    """설정에 따른 앱 내 주기 작업 (주기: CRAWL_INTERVAL_HOURS)"""
+    from functools import partial
+    from ..board import get_board
+    from ..board.scores import get_row_source, latest_score_id
+    from ..comments import CommentTail
+    from ..config import get_settings
+    from ..crawler.scheduler import build_default_scheduler
+    from .cycle import build_default_cycle
+
+    settings = get_settings()
+    follower_cycle = version = tail = None
+    if settings.board_source == "database":
+        follower_cycle = AggregationCycle(get_board(), row_source=get_row_source("database"))
+        version = latest_score_id
+        tail = CommentTail()
+    return JobRunner(
+        build_default_cycle(),
+        interval=settings.crawl_interval_hours * 3600,
+        crawl=partial(crawl_once, build_default_scheduler()),
+        lock_path=settings.jobs_lock_path or None,
+        follower_cycle=follower_cycle,
+        version=version,
+        tail=tail,
+        poll_interval=settings.board_poll_seconds,
+    )
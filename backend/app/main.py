@@ -1,7 +1,10 @@
 """
 곡소리매매법 FastAPI 메인 앱
 """
-from fastapi import FastAPI, Request
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, Request, Response
+from fastapi.concurrency import run_in_threadpool
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 from fastapi.middleware.cors import CORSMiddleware
@@ -9,19 +12,85 @@ from pathlib import Path
 import logging
 
 from .config import get_settings
+from .cache import ResponseCache, ResponseCacheMiddleware
+from .export import index_context, detail_context
+from .board import get_board
+from .board.columnar import MEDIA_TYPE as COLUMNAR_MEDIA_TYPE
+from .cards import get_card_store
+from .stream import get_broadcaster
+from .comments import get_recent_comments
+from .metrics import REGISTRY, MetricsMiddleware, register_stats
+from .profiling import ProfilingMiddleware, get_profile_store
 
 settings = get_settings()
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+
+# ─── 기동/종료 (lifespan) ─────────────────────────────────────────────────────
+def warm_up() -> None:
+    """무거운 구성요소를 첫 요청 전에 미리 로드"""
+    from .sentiment.loader import warm_up as warm_up_analyzer
+    warm_up_analyzer()
+    get_board().snapshot  # 정렬 순서 + 검색 인덱스 생성
+
+
+def warm_load_comments() -> None:
+    """DB의 종목별 최근 댓글 → 메모리 버퍼 (DB 연결 실패 시 빈 버퍼로 시작)"""
+    from .comments import warm_load
+    try:
+        warm_load()
+    except Exception as e:
+        logger.warning(f"최근 댓글 적재 실패, 빈 버퍼로 시작: {e}")
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    if settings.warmup_on_startup:
+        await run_in_threadpool(warm_up)
+        logger.info("워밍업 완료")
+    if settings.comment_buffer_warm_load:
+        await run_in_threadpool(warm_load_comments)
+    runner = None
+    if settings.jobs_enabled:
+        from .jobs.runner import build_job_runner
+        runner = build_job_runner()
+        runner.start()
+    yield
+    if runner is not None:
+        await runner.stop()
+    if settings.share_card_enabled:
+        get_card_store().shutdown()
+
+
 # ─── FastAPI 앱 초기화 ────────────────────────────────────────────────────────
 app = FastAPI(
     title=settings.app_name,
     description="코스피200 종목 감성분석 기반 매매 시그널 서비스",
     version="0.1.0",
     docs_url="/api/docs" if settings.debug else None,
+    lifespan=lifespan,
 )
 
+# 읽기 API 응답 캐시 (데이터 세대가 바뀔 때까지 직렬화된 응답 재사용, ETag/304, 컬럼형 바이너리는 따로 보관)
+CACHED_PATHS = [
+    r"^/api/stocks/$",
+    r"^/api/stocks/[^/]+$",
+    r"^/api/stocks/[^/]+/bundle$",
+    r"^/api/share/[^/]+$",
+    r"^/api/sentiment/[^/]+/history$",
+    r"^/api/sectors$",
+]
+response_cache = ResponseCache(max_entries=settings.response_cache_max_entries)
+if settings.response_cache_enabled:
+    app.add_middleware(
+        ResponseCacheMiddleware,
+        paths=CACHED_PATHS,
+        cache=response_cache,
+        max_age=settings.response_cache_max_age,
+        variants=[COLUMNAR_MEDIA_TYPE],
+    )
+
 # CORS 설정
 app.add_middleware(
     CORSMiddleware,
@@ -31,6 +100,19 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 요청 프로파일링 (비밀 헤더 또는 표본 비율로 켤 때만)
+if settings.profile_secret or settings.profile_sample_rate > 0:
+    app.add_middleware(
+        ProfilingMiddleware,
+        store=get_profile_store(),
+        secret=settings.profile_secret,
+        sample_rate=settings.profile_sample_rate,
+    )
+
+# 요청 시간 메트릭 (가장 바깥에서 측정 - 캐시 적중 응답 포함)
+if settings.metrics_enabled:
+    app.add_middleware(MetricsMiddleware, routes=app.router.routes)
+
 # 정적 파일 / 템플릿
 BASE_DIR = Path(__file__).parent.parent.parent
 FRONTEND_DIR = BASE_DIR / "frontend"
@@ -43,10 +125,35 @@ app.mount(
 templates = Jinja2Templates(directory=str(FRONTEND_DIR / "templates"))
 
 # ─── 라우터 등록 ──────────────────────────────────────────────────────────────
-from .api import stocks, sentiment, share  # noqa: E402
+from .api import stocks, sentiment, share, stream, sectors, signals  # noqa: E402
 app.include_router(stocks.router, prefix="/api/stocks", tags=["주식"])
 app.include_router(sentiment.router, prefix="/api/sentiment", tags=["감성분석"])
 app.include_router(share.router, prefix="/api/share", tags=["공유"])
+app.include_router(stream.router, prefix="/api/stream", tags=["실시간"])
+app.include_router(sectors.router, prefix="/api/sectors", tags=["업종"])
+app.include_router(signals.router, prefix="/api/signals", tags=["급변 신호"])
+
+# ─── 보드 갱신 → 실시간 델타 발행 / 공유 카드 재렌더링 ─────────────────────────
+get_board().subscribe(get_broadcaster().on_board_refresh)
+if settings.share_card_enabled:
+    get_board().subscribe(get_card_store().on_board_refresh)
+
+# ─── 새 댓글 → 그 종목 댓글을 담은 캐시 응답(상세/번들) 무효화 ─────────────────────
+get_recent_comments().subscribe(
+    lambda codes: response_cache.discard(lambda key: stocks.carries_comments(key, codes))
+)
+
+# ─── 메트릭 ───────────────────────────────────────────────────────────────────
+if settings.metrics_enabled:
+    register_stats("goksori_response_cache", "응답 캐시 통계", response_cache.stats)
+    register_stats("goksori_stream", "실시간 스트림 통계", get_broadcaster().stats)
+    register_stats("goksori_comment_buffer", "최근 댓글 버퍼 통계", get_recent_comments().stats)
+    if settings.share_card_enabled:
+        register_stats("goksori_share_cards", "공유 카드 렌더링 통계", get_card_store().stats)
+
+    @app.get("/metrics", include_in_schema=False)
+    async def metrics():
+        return Response(REGISTRY.render(), media_type="text/plain; version=0.0.4; charset=utf-8")
 
 
 # ─── 페이지 라우트 ─────────────────────────────────────────────────────────────
@@ -54,12 +161,7 @@ app.include_router(share.router, prefix="/api/share", tags=["공유"])
 async def index(request: Request):
     return templates.TemplateResponse(
         "index.html",
-        {
-            "request": request,
-            "title": "곡소리 매매법",
-            "adsense_client_id": settings.adsense_client_id,
-            "kakao_js_key": settings.kakao_js_key,
-        },
+        {"request": request, **index_context(settings)},
     )
 
 
@@ -67,11 +169,7 @@ async def index(request: Request):
 async def stock_detail(request: Request, stock_code: str):
     return templates.TemplateResponse(
         "stock_detail.html",
-        {
-            "request": request,
-            "stock_code": stock_code,
-            "title": f"곡소리 매매법 - {stock_code}",
-        },
+        {"request": request, **detail_context(stock_code)},
     )
 
 
@@ -0,0 +1,17 @@
+from .registry import REGISTRY, Registry, Counter, Gauge, Histogram, CallbackGauge
+from .middleware import MetricsMiddleware, route_template
+from .instruments import register_stats
+from .textfile import write_textfile
+
+__all__ = [
+    "REGISTRY",
+    "Registry",
+    "Counter",
+    "Gauge",
+    "Histogram",
+    "CallbackGauge",
+    "MetricsMiddleware",
+    "route_template",
+    "register_stats",
+    "write_textfile",
+]
@@ -0,0 +1,86 @@
+"""
+서비스 메트릭 정의
+핫패스 모듈은 여기서 메트릭을 가져와 라벨 자식을 모듈 로드 시 미리 바인딩해 둔다
+"""
+from .registry import BYTES_BUCKETS, CallbackGauge, Counter, Histogram
+
+FAST_BUCKETS = (0.0001, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1.0)
+
+# HTTP
+HTTP_REQUEST_SECONDS = Histogram(
+    "goksori_http_request_duration_seconds", "HTTP 요청 처리 시간 (라우트 템플릿 기준)",
+    ("method", "route", "status"),
+)
+
+# 크롤러
+CRAWL_FETCH_SECONDS = Histogram(
+    "goksori_crawler_fetch_duration_seconds", "크롤러 페이지 요청 시간", ("source",),
+)
+CRAWL_FETCH_TOTAL = Counter(
+    "goksori_crawler_fetch", "크롤러 페이지 요청 수 (HTTP 상태별, error = 응답 없음)", ("source", "status"),
+)
+CRAWL_FETCH_BYTES = Histogram(
+    "goksori_crawler_fetch_bytes", "크롤러 응답 본문 크기", ("source",), buckets=BYTES_BUCKETS,
+)
+CRAWL_PARSE_SECONDS = Histogram(
+    "goksori_crawler_parse_duration_seconds", "댓글 HTML 파싱 시간", ("source",), buckets=FAST_BUCKETS,
+)
+
+# 감성분석 / 집계
+ANALYZER_TEXTS = Counter(
+    "goksori_analyzer_texts", "감성분석 처리 텍스트 수", ("backend",),
+)
+ANALYZER_SECONDS = Histogram(
+    "goksori_analyzer_duration_seconds", "텍스트 1건 감성분석 시간", ("backend",), buckets=FAST_BUCKETS,
+)
+AGGREGATE_SECONDS = Histogram(
+    "goksori_aggregate_duration_seconds", "종목 단위 감성 집계 시간", buckets=FAST_BUCKETS,
+)
+CYCLE_SECONDS = Histogram(
+    "goksori_cycle_duration_seconds", "집계 주기 전체 시간",
+)
+
+# DB
+DB_WRITE_SECONDS = Histogram(
+    "goksori_db_write_batch_duration_seconds", "DB 배치 쓰기 시간", ("table",),
+)
+DB_WRITE_ROWS = Counter(
+    "goksori_db_write_rows", "DB 배치 쓰기 행 수", ("table",),
+)
+
+
+def _pool_samples():
+    """이미 생성된 엔진의 커넥션 풀 상태 (스크레이프 때문에 엔진을 만들지는 않음)"""
+    from ..db import session
+
+    engine = session._engine
+    pool = getattr(engine, "pool", None)
+    if pool is None or not hasattr(pool, "checkedout"):
+        return []
+    return [
+        ({"state": "size"}, pool.size()),
+        ({"state": "checked_out"}, pool.checkedout()),
+        ({"state": "overflow"}, max(0, pool.overflow())),
+    ]
+
+
+def _singleflight_samples():
+    from ..cache import singleflight_stats
+
+    samples = []
+    for name, stats in singleflight_stats().items():
+        for field, value in stats.items():
+            samples.append(({"name": name, "field": field}, value))
+    return samples
+
+
+DB_POOL = CallbackGauge("goksori_db_pool_connections", "DB 커넥션 풀 상태", _pool_samples)
+SINGLEFLIGHT = CallbackGauge("goksori_singleflight", "동시 요청 병합 통계", _singleflight_samples)
+
+
+def register_stats(name: str, documentation: str, stats) -> CallbackGauge:
+    """stats() → dict 형태 통계를 field 라벨 게이지로 노출"""
+    return CallbackGauge(
+        name, documentation,
+        lambda: [({"field": k}, v) for k, v in stats().items() if isinstance(v, (int, float))],
+    )
@@ -0,0 +1,77 @@
+"""
+HTTP 요청 시간 측정 ASGI 미들웨어
+라벨은 실제 경로가 아닌 라우트 템플릿 (/api/stocks/{stock_code}) → 라벨 수가 라우트 수로 고정
+"""
+import time
+from typing import Optional, Sequence
+
+from .instruments import HTTP_REQUEST_SECONDS
+
+UNMATCHED = "unmatched"
+MAX_RESOLVED_PATHS = 4096
+
+
+def route_template(scope) -> Optional[str]:
+    """라우팅이 끝난 scope 에서 경로 템플릿 추출 (FastAPI 가 scope['route'] 설정)"""
+    return getattr(scope.get("route"), "path", None)
+
+
+class MetricsMiddleware:
+    """
+    routes: 앱 라우트 목록 - 응답 캐시 적중처럼 라우터까지 가지 않은 요청의 템플릿을 찾을 때 사용
+    """
+
+    def __init__(self, app, routes: Sequence = (), histogram=HTTP_REQUEST_SECONDS):
+        self.app = app
+        self.routes = routes
+        self.histogram = histogram
+        self._children: dict[tuple[str, str, str], object] = {}
+        self._resolved: dict[str, str] = {}
+
+    def _child(self, method: str, route: str, status: int):
+        key = (method, route, str(status))
+        child = self._children.get(key)
+        if child is None:
+            child = self._children[key] = self.histogram.labels(*key)
+        return child
+
+    def _resolve(self, scope, path: str, root_path: str) -> str:
+        """
+        라우터를 거치지 않았거나 마운트(정적 파일)로 처리된 요청: 경로별로 한 번만 라우트 매칭
+        마운트가 scope 의 root_path 를 바꾸므로 요청 시작 시점의 값으로 매칭
+        """
+        template = self._resolved.get(path)
+        if template is None:
+            from starlette.routing import Match
+
+            template = UNMATCHED
+            original = {**scope, "path": path, "root_path": root_path}
+            for route in self.routes:
+                match, _ = route.matches(original)
+                if match != Match.NONE:
+                    template = getattr(route, "path", UNMATCHED)
+                    break
+            if len(self._resolved) < MAX_RESOLVED_PATHS:
+                self._resolved[path] = template
+        return template
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        status = 500
+        path, root_path = scope["path"], scope.get("root_path", "")
+
+        async def send_wrapper(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            route = route_template(scope) or self._resolve(scope, path, root_path)
+            self._child(scope["method"], route, status).observe(time.perf_counter() - started)
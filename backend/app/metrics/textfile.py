@@ -0,0 +1,38 @@
+"""
+CLI 작업 메트릭 → node_exporter textfile collector (.prom 파일)
+- 앱 밖에서 도는 작업(수집/백필/집계/집계 주기)의 메트릭은 /metrics 로 보이지 않으므로 작업이 끝날 때마다 파일로 남긴다
+- 작업별 파일 하나 (goksori_<task>.prom), 모든 샘플에 task 라벨 → 여러 파일에 같은 메트릭이 있어도 시계열이 겹치지 않음
+- 임시 파일에 쓴 뒤 os.replace (수집기가 쓰다 만 파일을 읽지 않게)
+"""
+import logging
+import os
+from pathlib import Path
+from typing import Optional
+
+from .registry import REGISTRY, Registry
+
+logger = logging.getLogger(__name__)
+
+
+def write_textfile(task: str, directory: Optional[str] = None, registry: Optional[Registry] = None) -> Optional[Path]:
+    """
+    task: 작업 이름 (파일 이름과 task 라벨)
+    directory: 기본 METRICS_TEXTFILE_DIR (빈 값이면 아무것도 안 함)
+    → 쓴 파일 경로 (쓰지 않았으면 None, 실패해도 작업 결과에는 영향 없음)
+    """
+    if directory is None:
+        from ..config import get_settings
+        directory = get_settings().metrics_textfile_dir
+    if not directory:
+        return None
+    registry = registry if registry is not None else REGISTRY
+    path = Path(directory) / f"goksori_{task}.prom"
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        tmp.write_text(registry.render({"task": task}), encoding="utf-8")
+        os.replace(tmp, path)
+    except OSError as e:
+        logger.warning(f"메트릭 파일 기록 실패 ({path}): {e}")
+        return None
+    return path
@@ -1,4 +1,4 @@
 from .base import Base
-from .stock import Stock, Comment, CommentSentiment, SentimentScore
+from .stock import Stock, Comment, CommentSentiment, SentimentScore, SpikeSignal
 
-__all__ = ["Base", "Stock", "Comment", "CommentSentiment", "SentimentScore"]
+__all__ = ["Base", "Stock", "Comment", "CommentSentiment", "SentimentScore", "SpikeSignal"]
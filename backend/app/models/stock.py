@@ -41,6 +41,9 @@ class Comment(Base):
     dislikes = Column(Integer, default=0, comment="싫어요 수")
     original_url = Column(Text, nullable=True, comment="원본 URL")
     crawled_at = Column(DateTime(timezone=True), server_default=func.now())
+    posted_at = Column(DateTime(timezone=True), nullable=True, comment="게시 시각 (게시판 날짜, 없으면 수집 시각) - 기간 집계 기준")
+    post_key = Column(String(32), nullable=True,
+                      comment="게시글 식별 해시 (종목/출처/작성자/게시 시각/본문) - 재수집 중복 저장 방지")
 
     # Relations
     stock = relationship("Stock", back_populates="comments")
@@ -49,6 +52,8 @@ class Comment(Base):
     __table_args__ = (
         Index("idx_comment_stock_source", "stock_id", "source"),
         Index("idx_comment_crawled_at", "crawled_at"),
+        Index("idx_comment_posted_at", "posted_at"),
+        Index("uq_comment_post", "stock_id", "source", "post_key", unique=True),
     )
 
 
@@ -61,6 +66,10 @@ class CommentSentiment(Base):
     score = Column(Float, nullable=False, comment="감성 점수 (-1.0 ~ 1.0, 양수=긍정)")
     label = Column(String(20), nullable=False, comment="긍정/부정/중립")
     confidence = Column(Float, nullable=True, comment="분석 신뢰도 (0~1)")
+    weight = Column(Float, nullable=False, default=1.0, server_default="1",
+                    comment="고정 집계 가중치 (cluster 가 없는 이전 행만 사용)")
+    cluster = Column(String(32), nullable=True,
+                     comment="유사 중복 묶음 해시 (sentiment.dedup) - 집계 때 기간 안의 묶음 크기/작성자 댓글 수로 가중치 계산")
     analyzed_at = Column(DateTime(timezone=True), server_default=func.now())
 
     comment = relationship("Comment", back_populates="sentiment")
@@ -88,3 +97,27 @@ class SentimentScore(Base):
     __table_args__ = (
         Index("idx_sentiment_stock_period", "stock_id", "period_end"),
     )
+
+
+class SpikeSignal(Base):
+    """댓글 흐름 급변 신호 (곡소리 감지기)"""
+    __tablename__ = "spike_signals"
+
+    id = Column(Integer, primary_key=True, index=True)
+    stock_id = Column(Integer, ForeignKey("stocks.id"), nullable=False)
+    kind = Column(String(20), nullable=False, comment="panic/volume_spike/negative_spike/negative_shift")
+    window_start = Column(DateTime(timezone=True), nullable=False, comment="관측 구간 시작")
+    window_end = Column(DateTime(timezone=True), nullable=False, comment="관측 구간 끝")
+    value = Column(Float, nullable=False, comment="z-score 또는 CUSUM 값")
+    volume = Column(Integer, default=0, comment="구간 댓글 수")
+    negative_rate = Column(Float, default=0.0, comment="구간 부정 댓글 비율")
+    baseline_volume = Column(Float, default=0.0, comment="평소 구간 댓글 수 (EW 평균)")
+    baseline_negative_rate = Column(Float, default=0.0, comment="평소 부정 비율 (EW 평균)")
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    stock = relationship("Stock")
+
+    __table_args__ = (
+        Index("idx_spike_signal_stock_window", "stock_id", "window_end"),
+        Index("idx_spike_signal_window", "window_end"),
+    )
@@ -0,0 +1,10 @@
+from .profiler import ProfileStore, JobProfiler, get_profile_store, get_job_profiler
+from .middleware import ProfilingMiddleware
+
+__all__ = [
+    "ProfileStore",
+    "JobProfiler",
+    "get_profile_store",
+    "get_job_profiler",
+    "ProfilingMiddleware",
+]
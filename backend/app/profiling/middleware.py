@@ -0,0 +1,58 @@
+"""
+요청 단위 프로파일링 ASGI 미들웨어 (opt-in)
+- X-Profile 헤더 값이 profile_secret 과 일치하거나, profile_sample_rate 확률로 선택된 요청만 cProfile
+- 저장될 파일명은 응답 헤더 X-Profile-Id 로 돌려준다
+- 한 번에 한 요청만 프로파일 (다른 요청/작업을 프로파일 중이면 그냥 통과, X-Profile-Id 없음)
+- 엔드포인트가 concurrency.run_in_threadpool 로 넘긴 작업은 스레드 풀 쪽 실행도 같은 파일에 합쳐 기록
+주의: 이벤트 루프 스레드의 cProfile 이므로 그동안 같은 루프에서 실행된 다른 요청의 코드도 함께 기록될 수 있다
+"""
+import hmac
+import random
+from typing import Optional
+
+from starlette.datastructures import Headers
+
+from .profiler import ProfileStore
+
+PROFILE_HEADER = "x-profile"
+
+
+class ProfilingMiddleware:
+    """
+    store: 프로파일 저장소
+    secret: X-Profile 헤더로 요청별 프로파일을 켜는 비밀값 (빈 값이면 헤더 무시)
+    sample_rate: 무작위 표본 비율 (0.0 ~ 1.0)
+    """
+
+    def __init__(self, app, store: ProfileStore, secret: str = "", sample_rate: float = 0.0,
+                 rng: Optional[random.Random] = None):
+        self.app = app
+        self.store = store
+        self.secret = secret.encode() if secret else b""
+        self.sample_rate = sample_rate
+        self._random = (rng or random.Random()).random
+
+    def _selected(self, scope) -> bool:
+        if self.secret:
+            value = Headers(scope=scope).get(PROFILE_HEADER)
+            if value is not None and hmac.compare_digest(value.encode(), self.secret):
+                return True
+        return self.sample_rate > 0 and self._random() < self.sample_rate
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not self._selected(scope):
+            await self.app(scope, receive, send)
+            return
+
+        with self.store.capture("http", scope["method"] + scope["path"]) as info:
+            if info is None:
+                await self.app(scope, receive, send)
+                return
+            profile_id = info["path"].name.encode()
+
+            async def send_wrapper(message):
+                if message["type"] == "http.response.start":
+                    message = {**message, "headers": [*message.get("headers", []), (b"x-profile-id", profile_id)]}
+                await send(message)
+
+            await self.app(scope, receive, send_wrapper)
@@ -0,0 +1,183 @@
+"""
+프로파일 캡처 / 보관
+- cProfile 결과를 로컬 디렉터리에 .prof 파일로 저장, 최신 keep 개만 유지 (순환)
+- 파일명: {시각}-{종류}-{라벨}.prof → 요약 CLI 에서 종류/라벨로 거를 수 있음
+"""
+import cProfile
+import logging
+import os
+import pstats
+import re
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from functools import partial
+from typing import Callable, Iterator, Optional, TypeVar
+
+from ..concurrency import wrap_threadpool_calls
+
+T = TypeVar("T")
+
+logger = logging.getLogger(__name__)
+
+PROFILE_SUFFIX = ".prof"
+
+_UNSAFE = re.compile(r"[^0-9A-Za-z_.{}-]+")
+
+# 프로세스 전체에서 한 번에 하나만 캡처: 3.12+ 의 cProfile 은 인터프리터 전역 훅이라 겹쳐 켜면 enable() 이 ValueError,
+# 그 이전 버전도 같은 스레드에서 겹치면 나중 것이 먼저 것의 훅을 덮어쓴다
+_active = threading.Lock()
+
+# 3.12+ 는 켜 둔 프로파일 하나가 모든 스레드를 기록 → 스레드 풀 쪽은 따로 켜지 않는다
+_GLOBAL_HOOK = sys.version_info >= (3, 12)
+
+
+def safe_label(label: str) -> str:
+    """파일명에 쓸 수 있게 라벨 정리 (/api/stocks/{stock_code} → api.stocks.{stock_code})"""
+    return _UNSAFE.sub("_", label.strip("/").replace("/", ".")) or "root"
+
+
+class ProfileStore:
+    """
+    directory: .prof 저장 디렉터리
+    keep: 보관할 최대 파일 수 (오래된 것부터 삭제)
+    """
+
+    def __init__(self, directory: Path, keep: int = 50):
+        self.directory = Path(directory)
+        self.keep = keep
+        self._lock = threading.Lock()
+        self._seq = 0
+        self.captured = 0
+        self.skipped = 0
+
+    def _next_path(self, kind: str, label: str) -> Path:
+        with self._lock:
+            self._seq += 1
+            seq = self._seq
+        stamp = time.strftime("%Y%m%dT%H%M%S")
+        return self.directory / f"{stamp}.{os.getpid()}.{seq:04d}-{kind}-{safe_label(label)}{PROFILE_SUFFIX}"
+
+    def save(self, profile: cProfile.Profile, path: Path, extra: tuple = ()) -> Path:
+        """프로파일 저장 (extra: 함께 합칠 스레드 풀 실행 프로파일)"""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        stats = pstats.Stats(profile)
+        for other in extra:
+            stats.add(other)
+        stats.dump_stats(str(path))
+        self.captured += 1
+        self._rotate()
+        return path
+
+    @contextmanager
+    def capture(self, kind: str, label: str) -> Iterator[dict]:
+        """
+        with 블록 프로파일링 후 저장 (블록 안에서 concurrency.run_in_threadpool 로 넘긴 작업 포함)
+        yield 된 dict: 저장될 경로("path", 시작 시점에 결정), 종료 후 소요 시간("elapsed")
+        다른 캡처가 진행 중이면 프로파일 없이 블록만 실행하고 None 을 yield
+        """
+        if not _active.acquire(blocking=False):
+            self.skipped += 1
+            yield None
+            return
+        try:
+            info: dict = {"path": self._next_path(kind, label)}
+            extra: list = []
+            profile = cProfile.Profile()
+            started = time.perf_counter()
+            profile.enable()
+            try:
+                if _GLOBAL_HOOK:
+                    yield info
+                else:
+                    with wrap_threadpool_calls(partial(_profiled_call, extra)):
+                        yield info
+            finally:
+                profile.disable()
+                info["elapsed"] = time.perf_counter() - started
+                try:
+                    self.save(profile, info["path"], tuple(extra))
+                except OSError as e:
+                    logger.error(f"프로파일 저장 실패 [{kind} {label}]: {e}")
+        finally:
+            _active.release()
+
+    def files(self) -> list[Path]:
+        """저장된 프로파일 (오래된 순)"""
+        if not self.directory.exists():
+            return []
+        return sorted(self.directory.glob(f"*{PROFILE_SUFFIX}"), key=lambda p: p.name)
+
+    def _rotate(self) -> None:
+        files = self.files()
+        for path in files[:max(0, len(files) - self.keep)]:
+            path.unlink(missing_ok=True)
+
+
+def _profiled_call(extra: list, func: Callable[..., T], *args, **kwargs) -> T:
+    """캡처 중 스레드 풀 쪽 실행 프로파일 → extra (저장 시 합침)"""
+    profile = cProfile.Profile()
+    profile.enable()
+    try:
+        return func(*args, **kwargs)
+    finally:
+        profile.disable()
+        extra.append(profile)
+
+
+class JobProfiler:
+    """
+    주기 작업 프로파일 훅 - every 번째 실행마다 한 번 프로파일링 (0 이면 끔)
+    사용: with profiler.cycle("aggregate"): ...
+    """
+
+    def __init__(self, store: Optional[ProfileStore], kind: str, every: int = 0):
+        self.store = store
+        self.kind = kind
+        self.every = every
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.store is not None and self.every > 0
+
+    def _due(self) -> bool:
+        with self._lock:
+            self.calls += 1
+            return self.calls % self.every == 0
+
+    @contextmanager
+    def cycle(self, label: str = "cycle") -> Iterator[Optional[dict]]:
+        if not self.enabled or not self._due():
+            yield None
+            return
+        with self.store.capture(self.kind, label) as info:
+            yield info
+        if info is not None:
+            logger.info(f"작업 프로파일 저장 [{self.kind}] #{self.calls}: {info.get('path')}")
+
+
+_store: Optional[ProfileStore] = None
+_store_lock = threading.Lock()
+
+
+def get_profile_store() -> ProfileStore:
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                from ..config import get_settings
+                settings = get_settings()
+                _store = ProfileStore(settings.profile_dir, keep=settings.profile_keep)
+    return _store
+
+
+def get_job_profiler(kind: str) -> JobProfiler:
+    """설정(profile_job_every)에 따른 작업 프로파일러 - 꺼져 있으면 아무 일도 하지 않음"""
+    from ..config import get_settings
+
+    every = get_settings().profile_job_every
+    return JobProfiler(get_profile_store() if every > 0 else None, kind, every)
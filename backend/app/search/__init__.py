@@ -0,0 +1,3 @@
+from .index import StockSearchIndex, SearchHit, get_search_index, to_chosung
+
+__all__ = ["StockSearchIndex", "SearchHit", "get_search_index", "to_chosung"]
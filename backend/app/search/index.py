@@ -0,0 +1,224 @@
+"""
+종목명/코드 검색 인덱스
+- 접두어 트라이 (종목명, 종목코드, 초성)
+- 초성 분해: "ㅅㅅㅈㅈ" → 삼성전자
+- n-gram 역색인 (부분 문자열 검색)
+종목 구성이 바뀔 때만 재구성하고, 조회는 메모리 내에서 바로 응답
+"""
+import logging
+from dataclasses import dataclass
+from typing import Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+CHOSUNG = [
+    "ㄱ", "ㄲ", "ㄴ", "ㄷ", "ㄸ", "ㄹ", "ㅁ", "ㅂ", "ㅃ", "ㅅ",
+    "ㅆ", "ㅇ", "ㅈ", "ㅉ", "ㅊ", "ㅋ", "ㅌ", "ㅍ", "ㅎ",
+]
+_HANGUL_BASE = 0xAC00
+_HANGUL_LAST = 0xD7A3
+_JUNG_JONG = 21 * 28
+_JAMO_FIRST = 0x3131  # ㄱ
+_JAMO_LAST = 0x314E   # ㅎ
+
+NGRAM_SIZES = (1, 2)
+QUERY_CACHE_SIZE = 512
+
+# 랭킹 (낮을수록 우선)
+RANK_EXACT = 0
+RANK_PREFIX = 1
+RANK_CHOSUNG_PREFIX = 2
+RANK_SUBSTRING = 3
+RANK_CHOSUNG_SUBSTRING = 4
+
+
+def normalize(text: str) -> str:
+    """소문자화 + 공백 제거"""
+    return "".join(text.lower().split())
+
+
+def to_chosung(text: str) -> str:
+    """한글 음절을 초성으로 분해 (그 외 문자는 그대로)"""
+    out = []
+    for ch in text:
+        code = ord(ch)
+        if _HANGUL_BASE <= code <= _HANGUL_LAST:
+            out.append(CHOSUNG[(code - _HANGUL_BASE) // _JUNG_JONG])
+        else:
+            out.append(ch)
+    return "".join(out)
+
+
+def is_chosung_query(text: str) -> bool:
+    """초성(자음)만 포함된 검색어인지 (영문/숫자 혼용 허용)"""
+    has_jamo = False
+    for ch in text:
+        code = ord(ch)
+        if _JAMO_FIRST <= code <= _JAMO_LAST:
+            has_jamo = True
+        elif _HANGUL_BASE <= code <= _HANGUL_LAST:
+            return False
+    return has_jamo
+
+
+@dataclass(frozen=True)
+class SearchHit:
+    code: str
+    name: str
+    rank: int
+
+
+class _TrieNode:
+    __slots__ = ("children", "ids")
+
+    def __init__(self):
+        self.children: dict[str, "_TrieNode"] = {}
+        self.ids: set[int] = set()
+
+
+class StockSearchIndex:
+    """
+    종목 검색 인덱스 (불변)
+    entries: (종목코드, 종목명) 목록
+    """
+
+    def __init__(self, entries: Iterable[tuple[str, str]]):
+        self.entries: tuple[tuple[str, str], ...] = tuple(entries)
+        self.fingerprint = hash(self.entries)
+
+        self._names = [normalize(name) for _, name in self.entries]
+        self._codes = [code for code, _ in self.entries]
+        self._chosungs = [to_chosung(name) for name in self._names]
+
+        self._trie = _TrieNode()
+        self._chosung_trie = _TrieNode()
+        self._grams: dict[str, set[int]] = {}
+        self._cache: dict[tuple[str, Optional[int]], list[SearchHit]] = {}
+
+        for i in range(len(self.entries)):
+            self._insert(self._trie, self._names[i], i)
+            self._insert(self._trie, self._codes[i], i)
+            self._insert(self._chosung_trie, self._chosungs[i], i)
+            for key in (self._names[i], self._codes[i], self._chosungs[i]):
+                for gram in self._ngrams(key):
+                    self._grams.setdefault(gram, set()).add(i)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    @staticmethod
+    def _insert(root: _TrieNode, key: str, idx: int) -> None:
+        node = root
+        for ch in key:
+            node = node.children.setdefault(ch, _TrieNode())
+            node.ids.add(idx)
+
+    @staticmethod
+    def _ngrams(key: str) -> set[str]:
+        grams = set()
+        for n in NGRAM_SIZES:
+            for i in range(len(key) - n + 1):
+                grams.add(key[i:i + n])
+        return grams
+
+    @staticmethod
+    def _prefix(root: _TrieNode, query: str) -> set[int]:
+        node = root
+        for ch in query:
+            node = node.children.get(ch)
+            if node is None:
+                return set()
+        return node.ids
+
+    def _substring(self, query: str) -> set[int]:
+        """n-gram 역색인 교집합으로 후보를 좁힌 뒤 실제 포함 여부 확인"""
+        n = max(size for size in NGRAM_SIZES if size <= len(query))
+        candidates: Optional[set[int]] = None
+        for i in range(len(query) - n + 1):
+            posting = self._grams.get(query[i:i + n])
+            if not posting:
+                return set()
+            candidates = set(posting) if candidates is None else candidates & posting
+            if not candidates:
+                return set()
+        return candidates or set()
+
+    def _rank(self, idx: int, query: str, chosung_query: bool) -> int:
+        name, code = self._names[idx], self._codes[idx]
+        if chosung_query:
+            return RANK_CHOSUNG_PREFIX if self._chosungs[idx].startswith(query) else RANK_CHOSUNG_SUBSTRING
+        if query == name or query == code:
+            return RANK_EXACT
+        if name.startswith(query) or code.startswith(query):
+            return RANK_PREFIX
+        return RANK_SUBSTRING
+
+    def _position(self, idx: int, query: str, chosung_query: bool) -> int:
+        key = self._chosungs[idx] if chosung_query else self._names[idx]
+        pos = key.find(query)
+        return pos if pos >= 0 else self._codes[idx].find(query)
+
+    def search(self, query: str, limit: Optional[int] = None) -> list[SearchHit]:
+        """
+        검색어에 맞는 종목을 랭킹 순으로 반환
+        정확 일치 > 접두어 > 초성 접두어 > 부분 문자열 > 초성 부분 문자열
+        """
+        query = normalize(query or "")
+        if not query:
+            return []
+
+        cache_key = (query, limit)
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        chosung_query = is_chosung_query(query)
+        if chosung_query:
+            matched = self._prefix(self._chosung_trie, query) | {
+                i for i in self._substring(query) if query in self._chosungs[i]
+            }
+        else:
+            matched = self._prefix(self._trie, query) | {
+                i for i in self._substring(query)
+                if query in self._names[i] or query in self._codes[i]
+            }
+
+        ranked = sorted(
+            matched,
+            key=lambda i: (
+                self._rank(i, query, chosung_query),
+                self._position(i, query, chosung_query),
+                len(self._names[i]),
+                self._names[i],
+            ),
+        )
+        if limit is not None:
+            ranked = ranked[:limit]
+
+        hits = [SearchHit(self._codes[i], self.entries[i][1], self._rank(i, query, chosung_query)) for i in ranked]
+        if len(self._cache) >= QUERY_CACHE_SIZE:
+            self._cache.clear()
+        self._cache[cache_key] = hits
+        return hits
+
+    def match_codes(self, query: str) -> set[str]:
+        """검색어에 맞는 종목코드 집합 (필터링용)"""
+        return {hit.code for hit in self.search(query)}
+
+
+_index: Optional[StockSearchIndex] = None
+
+
+def get_search_index(entries: Iterable[tuple[str, str]]) -> StockSearchIndex:
+    """
+    공유 검색 인덱스 반환
+    종목 구성(코드/이름 목록)이 바뀐 경우에만 재구성
+    """
+    global _index
+    entries = tuple(entries)
+    current = _index
+    if current is None or current.fingerprint != hash(entries) or current.entries != entries:
+        current = StockSearchIndex(entries)
+        _index = current
+        logger.info(f"검색 인덱스 재구성: {len(current)}개 종목")
+    return current
@@ -4,12 +4,19 @@
 토큰 절약을 위해 규칙 기반을 기본으로 사용
 """
 import re
+import time
 import logging
 from dataclasses import dataclass
 from enum import Enum
+from typing import Optional
+
+from ..metrics.instruments import AGGREGATE_SECONDS, ANALYZER_SECONDS, ANALYZER_TEXTS
 
 logger = logging.getLogger(__name__)
 
+_RULE_TEXTS = ANALYZER_TEXTS.labels("rule")
+_RULE_SECONDS = ANALYZER_SECONDS.labels("rule")
+
 
 class SentimentLabel(str, Enum):
     POSITIVE = "positive"
@@ -26,30 +33,40 @@ class SentimentResult:
 
     @property
     def emoji(self) -> str:
-        if self.normalized_score >= 70:
-            return "🔥"
-        elif self.normalized_score >= 55:
-            return "📈"
-        elif self.normalized_score >= 45:
-            return "😐"
-        elif self.normalized_score >= 30:
-            return "📉"
-        else:
-            return "💀"
+        return score_emoji(self.normalized_score)
 
     @property
     def grade(self) -> str:
         """A~E 등급"""
-        if self.normalized_score >= 80:
-            return "A"
-        elif self.normalized_score >= 65:
-            return "B"
-        elif self.normalized_score >= 45:
-            return "C"
-        elif self.normalized_score >= 30:
-            return "D"
-        else:
-            return "E"
+        return score_grade(self.normalized_score)
+
+
+def score_emoji(score: float) -> str:
+    """0~100 점수 → 표시 이모지"""
+    if score >= 70:
+        return "🔥"
+    elif score >= 55:
+        return "📈"
+    elif score >= 45:
+        return "😐"
+    elif score >= 30:
+        return "📉"
+    else:
+        return "💀"
+
+
+def score_grade(score: float) -> str:
+    """0~100 점수 → A~E 등급"""
+    if score >= 80:
+        return "A"
+    elif score >= 65:
+        return "B"
+    elif score >= 45:
+        return "C"
+    elif score >= 30:
+        return "D"
+    else:
+        return "E"
 
 
 # ─── 한국어 주식 감성 사전 ─────────────────────────────────────────────────────
@@ -96,6 +113,14 @@ class RuleBasedSentimentAnalyzer:
         Returns:
             SentimentResult
         """
+        started = time.perf_counter()
+        try:
+            return self._analyze(text)
+        finally:
+            _RULE_TEXTS.inc()
+            _RULE_SECONDS.observe(time.perf_counter() - started)
+
+    def _analyze(self, text: str) -> SentimentResult:
         if not text or not text.strip():
             return SentimentResult(
                 score=0.0,
@@ -167,14 +192,24 @@ class SentimentAggregator:
     """여러 댓글의 감성점수를 종목 단위로 집계"""
 
     @staticmethod
-    def aggregate(results: list[SentimentResult]) -> dict:
+    def aggregate(results: list[SentimentResult], weights: Optional[list[float]] = None) -> dict:
         """
         Args:
             results: 댓글별 감성분석 결과 리스트
+            weights: 댓글별 가중치 (선택, 예: 유사 중복/도배 댓글 하향 - sentiment.dedup)
+                     점수에만 반영하고 댓글 수는 그대로 센다
 
         Returns:
             종목 집계 결과 딕셔너리
         """
+        started = time.perf_counter()
+        try:
+            return SentimentAggregator._aggregate(results, weights)
+        finally:
+            AGGREGATE_SECONDS.observe(time.perf_counter() - started)
+
+    @staticmethod
+    def _aggregate(results: list[SentimentResult], weights: Optional[list[float]] = None) -> dict:
         if not results:
             return {
                 "score": 50.0,
@@ -191,8 +226,12 @@ class SentimentAggregator:
         total = len(results)
 
         # 가중 평균 점수 (신뢰도 반영)
-        weighted_sum = sum(r.normalized_score * r.confidence for r in results)
-        weight_total = sum(r.confidence for r in results)
+        if weights is None:
+            weighted_sum = sum(r.normalized_score * r.confidence for r in results)
+            weight_total = sum(r.confidence for r in results)
+        else:
+            weighted_sum = sum(r.normalized_score * r.confidence * w for r, w in zip(results, weights))
+            weight_total = sum(r.confidence * w for r, w in zip(results, weights))
         avg_score = weighted_sum / weight_total if weight_total > 0 else 50.0
 
         trend = "up" if avg_score > 55 else "down" if avg_score < 45 else "neutral"
@@ -0,0 +1,239 @@
+"""
+유사 중복 / 도배 댓글 감지 (MinHash + LSH)
+- 댓글을 정규화한 뒤 글자 n-gram 집합의 MinHash 서명을 만든다 (글자 몇 개 바꾼 복붙도 서명이 거의 같음)
+- 서명을 band 로 잘라 버킷에 넣고, 같은 버킷에 걸린 후보만 서명 일치율(자카드 추정)로 확인 → 전수 비교 없음
+- 유사 중복 묶음(클러스터)에 속한 댓글과 최근 댓글이 많은 작성자는 집계 가중치를 낮춘다
+    가중치 = 1 / 클러스터 크기 × min(1, author_limit / 작성자 댓글 수)
+  → 복붙 100개도 점수에는 댓글 1개만큼만 반영 (모두 색인한 뒤 가중치를 읽을 때 - aggregate_comments)
+  DB 에 저장하는 댓글은 묶음 id 만 저장하고 같은 식을 기간 집계 때 계산한다 (comments.bulk, jobs.aggregate)
+
+최근 max_items 개 댓글만 색인 (오래된 것부터 제거, 클러스터 크기/작성자 수도 함께 줄어듦)
+"""
+import re
+import threading
+import zlib
+from collections import Counter, OrderedDict
+from dataclasses import dataclass
+from typing import Hashable, Iterable, Optional
+
+import numpy as np
+
+from .analyzer import SentimentAggregator
+
+_PRIME = (1 << 31) - 1  # a*x+b 가 uint64 안에서 넘치지 않도록 31비트 소수
+_NOISE = re.compile(r"[^\w가-힣ㄱ-ㅎㅏ-ㅣ]+")
+_REPEAT = re.compile(r"(.)\1{2,}")
+
+
+def normalize(text: str) -> str:
+    """공백/기호 제거, 소문자, 같은 글자 3번 이상 반복은 2번으로 (ㅋㅋㅋㅋ → ㅋㅋ)"""
+    return _REPEAT.sub(r"\1\1", _NOISE.sub("", text.lower()))
+
+
+def shingles(text: str, n: int = 3) -> set[str]:
+    """정규화된 글자 n-gram 집합"""
+    if len(text) <= n:
+        return {text} if text else set()
+    return {text[i:i + n] for i in range(len(text) - n + 1)}
+
+
+@dataclass
+class _Entry:
+    signature: np.ndarray
+    cluster: Hashable
+    author: str
+    bands: tuple[bytes, ...]
+
+
+class NearDuplicateIndex:
+    """
+    num_perm: 서명 길이, bands: LSH 밴드 수 (rows = num_perm / bands)
+    threshold: 같은 묶음으로 볼 서명 일치율 (≈ 자카드 유사도)
+    min_chars: 정규화 후 이보다 짧은 댓글("가즈아", "ㅋㅋ")은 색인하지 않음 - 짧은 댓글은 원래 겹친다
+    max_candidates: 댓글 1건당 확인할 최대 후보 수 (도배로 버킷이 커져도 비용 상한)
+    """
+
+    def __init__(self, num_perm: int = 64, bands: int = 16, threshold: float = 0.6, ngram: int = 3,
+                 min_chars: int = 10, author_limit: int = 5, max_items: int = 200_000,
+                 max_candidates: int = 32, seed: int = 1):
+        if num_perm % bands:
+            raise ValueError("num_perm 은 bands 의 배수여야 합니다")
+        rng = np.random.default_rng(seed)
+        self._a = rng.integers(1, _PRIME, num_perm, dtype=np.uint64)
+        self._b = rng.integers(0, _PRIME, num_perm, dtype=np.uint64)
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.threshold = threshold
+        self.ngram = ngram
+        self.min_chars = min_chars
+        self.author_limit = author_limit
+        self.max_items = max_items
+        self.max_candidates = max_candidates
+
+        self._entries: OrderedDict[Hashable, _Entry] = OrderedDict()  # 입력 순서 = 제거 순서
+        self._buckets: list[dict[bytes, dict[Hashable, None]]] = [{} for _ in range(bands)]
+        self._cluster_sizes: Counter = Counter()
+        self._authors: Counter = Counter()
+        self._lock = threading.Lock()
+        self.added = 0
+        self.duplicates = 0
+
+    def signature(self, text: str) -> Optional[np.ndarray]:
+        """MinHash 서명 (색인 대상이 아니면 None)"""
+        text = normalize(text)
+        if len(text) < self.min_chars:
+            return None
+        hashes = np.fromiter(
+            (zlib.crc32(s.encode()) % _PRIME for s in shingles(text, self.ngram)), dtype=np.uint64
+        )
+        return ((np.outer(hashes, self._a) + self._b) % _PRIME).min(axis=0)
+
+    def _band_keys(self, signature: np.ndarray) -> tuple[bytes, ...]:
+        rows = self.rows
+        return tuple(signature[i * rows:(i + 1) * rows].tobytes() for i in range(self.bands))
+
+    def add(self, key: Hashable, text: str, author: str = "") -> Hashable:
+        """
+        댓글 색인 → 클러스터 id (처음 나온 원본 댓글의 key)
+        이미 색인된 key 는 그대로 둔다
+        """
+        signature = self.signature(text)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                return entry.cluster
+            self.added += 1
+            if author:
+                self._authors[author] += 1
+            if signature is None:
+                self._entries[key] = _Entry(None, key, author, ())
+                self._cluster_sizes[key] += 1
+                self._evict()
+                return key
+
+            bands = self._band_keys(signature)
+            cluster = self._match(signature, bands)
+            if cluster is None:
+                cluster = key
+            else:
+                self.duplicates += 1
+            self._entries[key] = _Entry(signature, cluster, author, bands)
+            self._cluster_sizes[cluster] += 1
+            for buckets, band in zip(self._buckets, bands):
+                buckets.setdefault(band, {})[key] = None
+            self._evict()
+            return cluster
+
+    def _match(self, signature: np.ndarray, bands: tuple[bytes, ...]) -> Optional[Hashable]:
+        """같은 버킷 후보 중 (최근 것부터) 서명 일치율이 threshold 이상인 첫 댓글의 클러스터"""
+        checked: set = set()
+        needed = self.threshold * self.num_perm
+        for buckets, band in zip(self._buckets, bands):
+            bucket = buckets.get(band)
+            if not bucket:
+                continue
+            for candidate in reversed(bucket):
+                if candidate in checked:
+                    continue
+                checked.add(candidate)
+                entry = self._entries[candidate]
+                if np.count_nonzero(entry.signature == signature) >= needed:
+                    return entry.cluster
+                if len(checked) >= self.max_candidates:
+                    return None
+        return None
+
+    def _evict(self) -> None:
+        while len(self._entries) > self.max_items:
+            key, entry = self._entries.popitem(last=False)
+            for buckets, band in zip(self._buckets, entry.bands):
+                bucket = buckets[band]
+                del bucket[key]
+                if not bucket:
+                    del buckets[band]
+            self._decrement(self._cluster_sizes, entry.cluster)
+            if entry.author:
+                self._decrement(self._authors, entry.author)
+
+    @staticmethod
+    def _decrement(counter: Counter, key) -> None:
+        counter[key] -= 1
+        if counter[key] <= 0:
+            del counter[key]
+
+    def cluster_size(self, key: Hashable) -> int:
+        entry = self._entries.get(key)
+        return self._cluster_sizes[entry.cluster] if entry is not None else 1
+
+    def weight(self, key: Hashable) -> float:
+        """집계 가중치 (색인에 없는 key 는 1)"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return 1.0
+            weight = 1.0 / self._cluster_sizes[entry.cluster]
+            if entry.author:
+                weight *= min(1.0, self.author_limit / self._authors[entry.author])
+            return weight
+
+    def weights(self, keys: Iterable[Hashable]) -> list[float]:
+        return [self.weight(k) for k in keys]
+
+    def stats(self) -> dict:
+        with self._lock:
+            clusters = sum(1 for size in self._cluster_sizes.values() if size > 1)
+            return {
+                "indexed": len(self._entries),
+                "added": self.added,
+                "duplicates": self.duplicates,
+                "duplicate_clusters": clusters,
+                "largest_cluster": max(self._cluster_sizes.values(), default=0),
+                "authors": len(self._authors),
+            }
+
+
+def comment_key(comment) -> tuple:
+    """
+    CommentData → 색인 key (같은 댓글을 다시 수집해도 같은 key)
+    수집 시각(crawled_at)은 넣지 않는다 - 다시 수집할 때마다 바뀌어 자기 자신과 한 묶음이 돼 버림
+    """
+    return (comment.stock_code, comment.source, comment.author, normalize(comment.content))
+
+
+def aggregate_comments(comments: list, analyzer=None, index: Optional[NearDuplicateIndex] = None) -> dict:
+    """
+    수집 댓글(CommentData) → 종목 집계 (유사 중복/도배 가중치 반영)
+    모든 댓글을 먼저 색인한 뒤 가중치를 읽으므로 같은 배치 안의 복붙도 서로 묶인다
+    """
+    if analyzer is None:
+        from .loader import get_analyzer
+        analyzer = get_analyzer()
+    if index is None:
+        index = get_duplicate_index()
+
+    keys = [comment_key(c) for c in comments]
+    for key, comment in zip(keys, comments):
+        index.add(key, comment.content, comment.author)
+    results = [analyzer.analyze(c.content) for c in comments]
+    return SentimentAggregator.aggregate(results, index.weights(keys))
+
+
+_index: Optional[NearDuplicateIndex] = None
+_index_lock = threading.Lock()
+
+
+def get_duplicate_index() -> NearDuplicateIndex:
+    """전 종목 공유 색인 (종목을 넘나드는 복붙 도배도 한 클러스터로 묶인다)"""
+    global _index
+    if _index is None:
+        with _index_lock:
+            if _index is None:
+                from ..config import get_settings
+                settings = get_settings()
+                _index = NearDuplicateIndex(
+                    threshold=settings.dedup_threshold,
+                    author_limit=settings.dedup_author_limit,
+                    max_items=settings.dedup_max_items,
+                )
+    return _index
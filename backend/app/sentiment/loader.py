@@ -0,0 +1,40 @@
+"""
+감성분석기 지연 로딩
+처음 필요할 때 한 번만 만든다 (모델 경로가 있으면 딥러닝, 없거나 실패하면 규칙 기반)
+"""
+import logging
+import threading
+from typing import Optional
+
+from ..config import get_settings
+from .analyzer import RuleBasedSentimentAnalyzer
+
+logger = logging.getLogger(__name__)
+
+_analyzer = None
+_lock = threading.Lock()
+
+
+def get_analyzer():
+    """공유 감성분석기"""
+    global _analyzer
+    if _analyzer is None:
+        with _lock:
+            if _analyzer is None:
+                _analyzer = _create(get_settings().sentiment_model_path)
+    return _analyzer
+
+
+def _create(model_path: Optional[str]):
+    if model_path:
+        try:
+            from .transformer import TransformerSentimentAnalyzer
+            return TransformerSentimentAnalyzer(model_path)
+        except Exception as e:
+            logger.warning(f"감성분석 모델 로드 실패, 규칙 기반 사용: {e}")
+    return RuleBasedSentimentAnalyzer()
+
+
+def warm_up() -> None:
+    """분석기 로드 + 첫 추론 (지연 초기화 비용을 기동 시점으로 당김)"""
+    get_analyzer().analyze("워밍업 문장입니다")
@@ -0,0 +1,64 @@
+"""
+딥러닝(transformers) 기반 감성분석기 (선택)
+sentiment_model_path 가 설정된 경우에만 사용
+transformers / torch 는 이 클래스를 처음 만들 때 import 한다 (웹 워커/크롤러 기동 시간 보호)
+"""
+import logging
+import time
+
+from ..metrics.instruments import ANALYZER_SECONDS, ANALYZER_TEXTS
+from .analyzer import SentimentLabel, SentimentResult
+
+logger = logging.getLogger(__name__)
+
+_MODEL_TEXTS = ANALYZER_TEXTS.labels("transformer")
+_MODEL_SECONDS = ANALYZER_SECONDS.labels("transformer")
+
+
+def _label_from_model(raw: str) -> SentimentLabel:
+    """모델 라벨명을 SentimentLabel로 (positive/LABEL_2/긍정 등)"""
+    raw = raw.lower()
+    if "pos" in raw or raw in ("label_2", "긍정"):
+        return SentimentLabel.POSITIVE
+    if "neg" in raw or raw in ("label_0", "부정"):
+        return SentimentLabel.NEGATIVE
+    return SentimentLabel.NEUTRAL
+
+
+class TransformerSentimentAnalyzer:
+    """
+    로컬 모델 디렉터리 기반 감성분류
+    model_path: HuggingFace 형식 모델 디렉터리
+    """
+
+    def __init__(self, model_path: str):
+        from transformers import pipeline  # 무거운 의존성 - 지연 import
+
+        self.model_path = model_path
+        self._pipeline = pipeline("text-classification", model=model_path, tokenizer=model_path)
+        logger.info(f"감성분석 모델 로드: {model_path}")
+
+    def analyze(self, text: str) -> SentimentResult:
+        started = time.perf_counter()
+        try:
+            return self._analyze(text)
+        finally:
+            _MODEL_TEXTS.inc()
+            _MODEL_SECONDS.observe(time.perf_counter() - started)
+
+    def _analyze(self, text: str) -> SentimentResult:
+        if not text or not text.strip():
+            return SentimentResult(score=0.0, label=SentimentLabel.NEUTRAL, confidence=0.5, normalized_score=50.0)
+
+        output = self._pipeline(text, truncation=True)[0]
+        label = _label_from_model(output["label"])
+        confidence = float(output["score"])
+        sign = 1.0 if label == SentimentLabel.POSITIVE else -1.0 if label == SentimentLabel.NEGATIVE else 0.0
+        score = sign * confidence
+
+        return SentimentResult(
+            score=score,
+            label=label,
+            confidence=confidence,
+            normalized_score=round((score + 1) / 2 * 100, 1),
+        )
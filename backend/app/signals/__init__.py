@@ -0,0 +1,21 @@
+from .detector import (
+    DetectorConfig, SignalEvent, SpikeDetector, SIGNAL_KINDS, PANIC, VOLUME_SPIKE, NEGATIVE_SPIKE, NEGATIVE_SHIFT,
+    get_detector,
+)
+from .store import MemorySignalStore, DatabaseSignalStore, BufferedSink, get_signal_store
+
+__all__ = [
+    "DetectorConfig",
+    "SignalEvent",
+    "SpikeDetector",
+    "SIGNAL_KINDS",
+    "PANIC",
+    "VOLUME_SPIKE",
+    "NEGATIVE_SPIKE",
+    "NEGATIVE_SHIFT",
+    "get_detector",
+    "MemorySignalStore",
+    "DatabaseSignalStore",
+    "BufferedSink",
+    "get_signal_store",
+]
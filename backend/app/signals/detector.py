@@ -0,0 +1,245 @@
+"""
+곡소리 급변 감지기 (스트리밍)
+- 종목별 댓글을 시간 구간(bucket)으로 묶어 댓글 수(volume)와 부정 댓글 비율을 관측
+- 지수가중 이동 평균/분산(EW)으로 평소 수준을 추적 → 종목당 고정 크기 상태, 댓글당 O(1) 갱신
+- 구간이 닫힐 때 z-score / CUSUM 이 임계값을 넘으면 신호 발생
+    volume_spike    댓글 수 급증
+    negative_spike  부정 비율 급증
+    panic           둘 다 (곡소리)
+    negative_shift  부정 비율의 지속적 상승 (CUSUM)
+"""
+import math
+import threading
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Callable, Optional
+
+VOLUME_SPIKE = "volume_spike"
+NEGATIVE_SPIKE = "negative_spike"
+PANIC = "panic"
+NEGATIVE_SHIFT = "negative_shift"
+SIGNAL_KINDS = (PANIC, VOLUME_SPIKE, NEGATIVE_SPIKE, NEGATIVE_SHIFT)
+
+
+@dataclass(frozen=True)
+class DetectorConfig:
+    bucket_seconds: int = 600       # 관측 구간 (10분)
+    alpha: float = 0.05             # EW 가중치 (약 20구간 기억)
+    z_threshold: float = 4.0
+    cusum_k: float = 1.0            # CUSUM 허용 편차 (표준편차 단위)
+    cusum_h: float = 8.0            # CUSUM 임계값
+    warmup_buckets: int = 12        # 기준선이 잡히기 전에는 신호 없음
+    min_volume: int = 5             # 부정 비율 신호에 필요한 구간 최소 댓글 수
+    min_volume_sd: float = 1.0      # 표준편차 하한 (조용한 종목에서 z 폭주 방지, 포아송 sqrt(평균)과 큰 쪽)
+    min_rate_sd: float = 0.05       # 부정 비율 표준오차 하한
+    cooldown_buckets: int = 6       # 같은 종목/종류 신호 재발생 억제
+    max_idle_buckets: int = 36      # 댓글 없는 구간은 최대 이 개수까지만 0으로 반영
+
+
+@dataclass(frozen=True)
+class SignalEvent:
+    stock_code: str
+    kind: str
+    window_start: datetime
+    window_end: datetime
+    value: float              # z-score 또는 CUSUM 값
+    volume: int
+    negative_rate: float
+    baseline_volume: float
+    baseline_negative_rate: float
+
+    def to_dict(self) -> dict:
+        return {
+            "stock_code": self.stock_code,
+            "kind": self.kind,
+            "window_start": self.window_start.isoformat(),
+            "window_end": self.window_end.isoformat(),
+            "value": round(self.value, 2),
+            "volume": self.volume,
+            "negative_rate": round(self.negative_rate, 3),
+            "baseline_volume": round(self.baseline_volume, 2),
+            "baseline_negative_rate": round(self.baseline_negative_rate, 3),
+        }
+
+
+class EWStats:
+    """지수가중 평균/분산 (상수 메모리)"""
+
+    __slots__ = ("alpha", "mean", "var", "n")
+
+    def __init__(self, alpha: float):
+        self.alpha = alpha
+        self.mean = 0.0
+        self.var = 0.0
+        self.n = 0
+
+    def update(self, x: float) -> None:
+        if self.n == 0:
+            self.mean = x
+        else:
+            diff = x - self.mean
+            incr = self.alpha * diff
+            self.mean += incr
+            self.var = (1 - self.alpha) * (self.var + diff * incr)
+        self.n += 1
+
+    def z(self, x: float, min_sd: float) -> float:
+        return (x - self.mean) / max(math.sqrt(self.var), min_sd)
+
+    def clip(self, x: float, limit: float, min_sd: float) -> float:
+        """평균 ± limit 표준편차로 자르기 - 급변 구간이 기준선(특히 분산)을 부풀리지 않게"""
+        if self.n == 0:
+            return x
+        bound = limit * max(math.sqrt(self.var), min_sd)
+        return min(max(x, self.mean - bound), self.mean + bound)
+
+
+class _StockState:
+    __slots__ = ("bucket", "volume", "negatives", "vol", "rate", "cusum", "seen", "cooldown")
+
+    def __init__(self, bucket: int, alpha: float):
+        self.bucket = bucket
+        self.volume = 0
+        self.negatives = 0
+        self.vol = EWStats(alpha)
+        self.rate = EWStats(alpha)
+        self.cusum = 0.0
+        self.seen = 0
+        self.cooldown: dict[str, int] = {}  # 신호 종류 → 억제가 끝나는 구간
+
+
+class SpikeDetector:
+    """
+    sink: 신호 발생 시 호출 (SignalEvent)
+    observe() 는 댓글 1건마다 호출 - 같은 종목의 댓글은 시간 순서대로 들어온다고 가정
+    (이미 닫힌 구간의 늦은 댓글은 현재 구간에 합산)
+    """
+
+    def __init__(self, config: Optional[DetectorConfig] = None, sink: Optional[Callable[[SignalEvent], None]] = None):
+        self.config = config or DetectorConfig()
+        self.sink = sink
+        self._states: dict[str, _StockState] = {}
+        self.observed = 0
+        self.emitted = 0
+
+    def observe(self, stock_code: str, timestamp: float, negative: bool) -> None:
+        """댓글 1건 (timestamp: epoch 초, negative: 부정 댓글 여부)"""
+        bucket = int(timestamp // self.config.bucket_seconds)
+        state = self._states.get(stock_code)
+        if state is None:
+            state = self._states[stock_code] = _StockState(bucket, self.config.alpha)
+        elif bucket > state.bucket:
+            self._advance(stock_code, state, bucket)
+        state.volume += 1
+        if negative:
+            state.negatives += 1
+        self.observed += 1
+
+    def flush(self, timestamp: float) -> None:
+        """timestamp 이전에 끝난 구간을 모두 닫기 (주기적 틱 / 재생 종료 시)"""
+        bucket = int(timestamp // self.config.bucket_seconds)
+        for code, state in self._states.items():
+            if bucket > state.bucket:
+                self._advance(code, state, bucket)
+
+    def _advance(self, code: str, state: _StockState, bucket: int) -> None:
+        self._close(code, state, state.bucket, state.volume, state.negatives)
+        idle = min(bucket - state.bucket - 1, self.config.max_idle_buckets)
+        for i in range(idle):
+            self._close(code, state, state.bucket + 1 + i, 0, 0)
+        state.bucket = bucket
+        state.volume = 0
+        state.negatives = 0
+
+    def _close(self, code: str, state: _StockState, bucket: int, volume: int, negatives: int) -> None:
+        cfg = self.config
+        rate = negatives / volume if volume else 0.0
+        enough = volume >= cfg.min_volume
+
+        if state.seen >= cfg.warmup_buckets:
+            z_volume = state.vol.z(volume, max(cfg.min_volume_sd, math.sqrt(state.vol.mean)))
+            z_rate = self._rate_z(state.rate.mean, rate, volume) if enough else 0.0
+            if enough:
+                state.cusum = max(0.0, state.cusum + z_rate - cfg.cusum_k)
+
+            volume_hit = z_volume >= cfg.z_threshold
+            rate_hit = z_rate >= cfg.z_threshold
+            if volume_hit and rate_hit:
+                self._emit(code, state, bucket, PANIC, min(z_volume, z_rate), volume, rate)
+            elif volume_hit:
+                self._emit(code, state, bucket, VOLUME_SPIKE, z_volume, volume, rate)
+            elif rate_hit:
+                self._emit(code, state, bucket, NEGATIVE_SPIKE, z_rate, volume, rate)
+            if state.cusum >= cfg.cusum_h:
+                self._emit(code, state, bucket, NEGATIVE_SHIFT, state.cusum, volume, rate)
+                state.cusum = 0.0
+
+        if state.seen >= cfg.warmup_buckets:
+            state.vol.update(state.vol.clip(volume, cfg.z_threshold, cfg.min_volume_sd))
+            if volume:
+                state.rate.update(state.rate.clip(rate, cfg.z_threshold, cfg.min_rate_sd))
+        else:
+            state.vol.update(volume)
+            if volume:
+                state.rate.update(rate)
+        state.seen += 1
+
+    def _rate_z(self, baseline: float, rate: float, volume: int) -> float:
+        """
+        부정 비율 z-score - 표준오차를 구간 댓글 수로 계산 (이항분포)
+        댓글이 많은 구간일수록 같은 비율 상승도 더 확실한 신호
+        """
+        p = min(max(baseline, 0.01), 0.99)
+        return (rate - p) / max(math.sqrt(p * (1 - p) / volume), self.config.min_rate_sd)
+
+    def _emit(self, code: str, state: _StockState, bucket: int, kind: str, value: float,
+              volume: int, rate: float) -> None:
+        if state.cooldown.get(kind, -1) > bucket:
+            return
+        state.cooldown[kind] = bucket + self.config.cooldown_buckets
+        self.emitted += 1
+        if self.sink is None:
+            return
+        size = self.config.bucket_seconds
+        self.sink(SignalEvent(
+            stock_code=code,
+            kind=kind,
+            window_start=datetime.fromtimestamp(bucket * size),
+            window_end=datetime.fromtimestamp((bucket + 1) * size),
+            value=value,
+            volume=volume,
+            negative_rate=rate,
+            baseline_volume=state.vol.mean,
+            baseline_negative_rate=state.rate.mean,
+        ))
+
+    def stats(self) -> dict:
+        return {"stocks": len(self._states), "observed": self.observed, "emitted": self.emitted}
+
+
+def detector_config(settings) -> DetectorConfig:
+    return DetectorConfig(
+        bucket_seconds=settings.signal_bucket_seconds,
+        z_threshold=settings.signal_z_threshold,
+        cusum_h=settings.signal_cusum_threshold,
+    )
+
+
+_detector: Optional[SpikeDetector] = None
+_detector_lock = threading.Lock()
+
+
+def get_detector() -> SpikeDetector:
+    """
+    댓글 수집 경로에서 공유하는 감지기
+    신호는 BufferedSink 에 모았다가 ingest 배치가 끝날 때 신호 저장소에 한 번에 기록 (신호마다 INSERT 하지 않음)
+    """
+    global _detector
+    if _detector is None:
+        with _detector_lock:
+            if _detector is None:
+                from ..config import get_settings
+                from .store import BufferedSink, get_signal_store
+
+                _detector = SpikeDetector(detector_config(get_settings()), sink=BufferedSink(get_signal_store()))
+    return _detector
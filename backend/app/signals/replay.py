@@ -0,0 +1,155 @@
+"""
+댓글 재생 → 급변 감지
+저장된 댓글(CSV/JSONL) 또는 합성 데이터를 시간 순서대로 감지기에 흘려 신호를 만든다
+
+입력 열: stock_code, crawled_at (ISO 또는 epoch 초), sentiment (positive/negative/neutral)
+         sentiment 가 없으면 content 를 규칙 기반 분석기로 분석
+
+실행: python -m app.signals.replay --file comments.jsonl [--persist]
+      python -m app.signals.replay --synthetic [--stocks 200] [--per-stock 2000] [--seed 7]
+"""
+import argparse
+import csv
+import json
+import logging
+import random
+import sys
+import time
+from collections import Counter
+from datetime import datetime
+from pathlib import Path
+from typing import Iterable, Iterator, Optional
+
+from .detector import SignalEvent, SpikeDetector, detector_config
+
+logger = logging.getLogger(__name__)
+
+Record = tuple[str, float, bool]  # (종목코드, epoch 초, 부정 여부)
+
+DAY_SECONDS = 24 * 60 * 60
+
+
+def _timestamp(value) -> float:
+    if isinstance(value, (int, float)):
+        return float(value)
+    text = str(value).strip()
+    try:
+        return float(text)
+    except ValueError:
+        return datetime.fromisoformat(text).timestamp()
+
+
+def load_comments(path: Path) -> Iterator[Record]:
+    """CSV/JSONL 댓글 → 재생 레코드"""
+    path = Path(path)
+    analyzer = None
+
+    def negative(row: dict) -> bool:
+        nonlocal analyzer
+        label = row.get("sentiment") or row.get("label")
+        if label:
+            return label == "negative"
+        if analyzer is None:
+            from ..sentiment.analyzer import RuleBasedSentimentAnalyzer
+            analyzer = RuleBasedSentimentAnalyzer()
+        return analyzer.analyze(row.get("content", "")).label.value == "negative"
+
+    with path.open(encoding="utf-8") as f:
+        rows = csv.DictReader(f) if path.suffix == ".csv" else (json.loads(line) for line in f if line.strip())
+        for row in rows:
+            yield row["stock_code"], _timestamp(row["crawled_at"]), negative(row)
+
+
+def synthetic_day(stocks: int = 200, per_stock: int = 2000, seed: int = 7, panic_ratio: float = 0.05,
+                  start: Optional[float] = None) -> tuple[list[Record], set[str]]:
+    """
+    하루치 합성 댓글 (시간순 정렬) + 곡소리 구간을 심은 종목코드
+    panic_ratio 비율의 종목에 30분간 댓글 폭증 + 부정 비율 급등을 넣는다
+    """
+    rng = random.Random(seed)
+    start = start if start is not None else datetime(2026, 1, 5).timestamp()
+    records: list[Record] = []
+    panicked: set[str] = set()
+    for i in range(stocks):
+        code = f"{100000 + i:06d}"
+        base_negative = rng.uniform(0.2, 0.4)
+        times = sorted(rng.uniform(0, DAY_SECONDS) for _ in range(per_stock))
+        records.extend((code, start + t, rng.random() < base_negative) for t in times)
+        if rng.random() < panic_ratio:
+            panicked.add(code)
+            onset = rng.uniform(DAY_SECONDS * 0.5, DAY_SECONDS * 0.9)
+            burst = per_stock // 8
+            records.extend(
+                (code, start + onset + rng.uniform(0, 1800), rng.random() < 0.85) for _ in range(burst)
+            )
+    records.sort(key=lambda r: r[1])
+    return records, panicked
+
+
+def replay(records: Iterable[Record], detector: SpikeDetector) -> float:
+    """레코드를 감지기에 흘리고 마지막 구간까지 닫는다 → 마지막 시각"""
+    observe = detector.observe
+    last = 0.0
+    for code, ts, negative in records:
+        observe(code, ts, negative)
+        last = ts
+    detector.flush(last + detector.config.bucket_seconds)
+    return last
+
+
+def main(argv=None) -> int:
+    from ..config import get_settings
+
+    parser = argparse.ArgumentParser(description="댓글 재생 급변 감지")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--file", help="CSV 또는 JSONL 댓글 파일")
+    source.add_argument("--synthetic", action="store_true", help="합성 하루치 데이터")
+    parser.add_argument("--stocks", type=int, default=200)
+    parser.add_argument("--per-stock", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--persist", action="store_true", help="신호를 신호 저장소(설정)에 기록")
+    parser.add_argument("--json", action="store_true", help="신호 목록을 JSON으로 출력")
+    args = parser.parse_args(argv)
+
+    settings = get_settings()
+    events: list[SignalEvent] = []
+    sink = events.append
+    buffered = None
+    if args.persist:
+        from .store import BufferedSink, get_signal_store
+        buffered = BufferedSink(get_signal_store())
+
+        def sink(event: SignalEvent) -> None:
+            events.append(event)
+            buffered(event)
+
+    detector = SpikeDetector(detector_config(settings), sink=sink)
+
+    if args.synthetic:
+        records, _ = synthetic_day(args.stocks, args.per_stock, args.seed)
+    else:
+        records = list(load_comments(Path(args.file)))
+
+    started = time.perf_counter()
+    replay(records, detector)
+    if buffered is not None:
+        buffered.flush()
+    elapsed = time.perf_counter() - started
+
+    if args.json:
+        print(json.dumps([e.to_dict() for e in events], ensure_ascii=False, indent=2))
+        return 0
+
+    stats = detector.stats()
+    print(f"댓글 {stats['observed']:,}건 / 종목 {stats['stocks']}개 재생: {elapsed:.2f}초 "
+          f"({stats['observed'] / max(elapsed, 1e-9):,.0f}건/초)")
+    for kind, count in Counter(e.kind for e in events).most_common():
+        print(f"  {kind:<16} {count}건")
+    if buffered is not None:
+        print(f"저장: {buffered.written}건")
+    return 0
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    sys.exit(main())
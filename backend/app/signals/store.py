@@ -0,0 +1,191 @@
+"""
+급변 신호 저장소
+- MemorySignalStore: 최근 신호를 프로세스 메모리에 보관 (개발/단일 워커)
+- DatabaseSignalStore: spike_signals 테이블에 배치 저장, 조회도 DB에서 (여러 워커 공유)
+"""
+import logging
+import threading
+import time
+from collections import deque
+from datetime import datetime
+from typing import Iterable, Optional
+
+from ..metrics.instruments import DB_WRITE_ROWS, DB_WRITE_SECONDS
+from .detector import SignalEvent
+
+logger = logging.getLogger(__name__)
+
+_WRITE_SECONDS = DB_WRITE_SECONDS.labels("spike_signals")
+_WRITE_ROWS = DB_WRITE_ROWS.labels("spike_signals")
+
+
+def _matches(event: SignalEvent, stock_code: Optional[str], kind: Optional[str], since: Optional[datetime]) -> bool:
+    return (
+        (stock_code is None or event.stock_code == stock_code)
+        and (kind is None or event.kind == kind)
+        and (since is None or event.window_end >= since)
+    )
+
+
+class MemorySignalStore:
+    """최근 max_events 개 신호 (오래된 것부터 밀려남)"""
+
+    def __init__(self, max_events: int = 1000):
+        self._events: deque[SignalEvent] = deque(maxlen=max_events)
+        self._lock = threading.Lock()
+
+    def add(self, events: Iterable[SignalEvent]) -> int:
+        events = list(events)
+        with self._lock:
+            self._events.extend(events)
+        return len(events)
+
+    def recent(self, stock_code: Optional[str] = None, kind: Optional[str] = None,
+               since: Optional[datetime] = None, limit: int = 50) -> list[SignalEvent]:
+        """최신순"""
+        with self._lock:
+            events = list(self._events)
+        found = []
+        for event in reversed(events):
+            if _matches(event, stock_code, kind, since):
+                found.append(event)
+                if len(found) >= limit:
+                    break
+        return found
+
+
+class DatabaseSignalStore:
+    """
+    session_factory: SQLAlchemy 세션 생성 함수 (기본: app.db.session.SessionLocal)
+    종목 마스터(stocks)에 없는 종목코드의 신호는 저장하지 않고 경고만 남긴다
+    """
+
+    def __init__(self, session_factory=None):
+        if session_factory is None:
+            from ..db.session import SessionLocal
+            session_factory = SessionLocal
+        self.session_factory = session_factory
+        self._stock_ids: dict[str, int] = {}
+
+    def _resolve(self, session, codes: set[str]) -> dict[str, int]:
+        from sqlalchemy import select
+        from ..models import Stock
+
+        missing = codes - self._stock_ids.keys()
+        if missing:
+            rows = session.execute(select(Stock.code, Stock.id).where(Stock.code.in_(missing)))
+            self._stock_ids.update({code: stock_id for code, stock_id in rows})
+        return self._stock_ids
+
+    def add(self, events: Iterable[SignalEvent]) -> int:
+        from sqlalchemy import insert
+        from ..models import SpikeSignal
+
+        events = list(events)
+        if not events:
+            return 0
+        started = time.perf_counter()
+        session = self.session_factory()
+        try:
+            ids = self._resolve(session, {e.stock_code for e in events})
+            rows = [
+                {
+                    "stock_id": ids[e.stock_code],
+                    "kind": e.kind,
+                    "window_start": e.window_start,
+                    "window_end": e.window_end,
+                    "value": e.value,
+                    "volume": e.volume,
+                    "negative_rate": e.negative_rate,
+                    "baseline_volume": e.baseline_volume,
+                    "baseline_negative_rate": e.baseline_negative_rate,
+                }
+                for e in events
+                if e.stock_code in ids
+            ]
+            if len(rows) < len(events):
+                logger.warning(f"종목 마스터에 없는 종목의 신호 {len(events) - len(rows)}건 저장 생략")
+            if rows:
+                session.execute(insert(SpikeSignal), rows)
+                session.commit()
+        finally:
+            session.close()
+        _WRITE_SECONDS.observe(time.perf_counter() - started)
+        _WRITE_ROWS.inc(len(rows))
+        return len(rows)
+
+    def recent(self, stock_code: Optional[str] = None, kind: Optional[str] = None,
+               since: Optional[datetime] = None, limit: int = 50) -> list[SignalEvent]:
+        from sqlalchemy import select
+        from ..models import SpikeSignal, Stock
+
+        query = select(SpikeSignal, Stock.code).join(Stock, SpikeSignal.stock_id == Stock.id)
+        if stock_code is not None:
+            query = query.where(Stock.code == stock_code)
+        if kind is not None:
+            query = query.where(SpikeSignal.kind == kind)
+        if since is not None:
+            query = query.where(SpikeSignal.window_end >= since)
+        query = query.order_by(SpikeSignal.window_end.desc(), SpikeSignal.id.desc()).limit(limit)
+
+        session = self.session_factory()
+        try:
+            return [
+                SignalEvent(
+                    stock_code=code,
+                    kind=s.kind,
+                    window_start=s.window_start,
+                    window_end=s.window_end,
+                    value=s.value,
+                    volume=s.volume,
+                    negative_rate=s.negative_rate,
+                    baseline_volume=s.baseline_volume,
+                    baseline_negative_rate=s.baseline_negative_rate,
+                )
+                for s, code in session.execute(query)
+            ]
+        finally:
+            session.close()
+
+
+class BufferedSink:
+    """
+    감지기 sink → 저장소 배치 쓰기
+    신호를 모았다가 batch_size 개마다 (또는 flush 시) 한 번에 저장
+    """
+
+    def __init__(self, store, batch_size: int = 200):
+        self.store = store
+        self.batch_size = batch_size
+        self._pending: list[SignalEvent] = []
+        self.written = 0
+
+    def __call__(self, event: SignalEvent) -> None:
+        self._pending.append(event)
+        if len(self._pending) >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> int:
+        pending, self._pending = self._pending, []
+        if pending:
+            self.written += self.store.add(pending)
+        return len(pending)
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_signal_store():
+    """설정(signal_store_backend)에 따른 공유 신호 저장소"""
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                from ..config import get_settings
+                settings = get_settings()
+                if settings.signal_store_backend == "database":
+                    _store = DatabaseSignalStore()
+                else:
+                    _store = MemorySignalStore(settings.signal_memory_size)
+    return _store
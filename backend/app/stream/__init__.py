@@ -0,0 +1,3 @@
+from .broadcaster import ScoreBroadcaster, ScoreEvent, compute_deltas, get_broadcaster
+
+__all__ = ["ScoreBroadcaster", "ScoreEvent", "compute_deltas", "get_broadcaster"]
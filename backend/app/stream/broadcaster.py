@@ -0,0 +1,156 @@
+"""
+실시간 점수 변경 브로드캐스터 (SSE 팬아웃)
+- 보드가 갱신되면 변경된 종목만 압축 델타로 만들어 한 번만 직렬화
+- 모든 연결은 공유 이벤트 하나를 기다리므로 유휴 연결은 메모리만 차지
+- 최근 이벤트를 순번(seq)과 함께 보관 → 재접속 시 커서 이후부터 이어받기
+- seq 는 프로세스마다 따로 세므로 이벤트 id 는 "{epoch}.{seq}" (epoch: 브로드캐스터마다 무작위)
+  다른 워커/재시작 전 프로세스가 준 id 로 재접속하면 이어받지 않고 전체 재조회(reset)
+"""
+import asyncio
+import json
+import logging
+import secrets
+import threading
+from collections import deque
+from dataclasses import dataclass
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+DELTA_FIELDS = ("score", "grade", "trend", "score_change")
+
+
+@dataclass(frozen=True)
+class ScoreEvent:
+    seq: int
+    data: str  # 직렬화된 델타 목록 (JSON)
+
+
+def compute_deltas(previous, snapshot) -> list[dict]:
+    """이전 스냅샷 대비 점수/등급/추세/변화량이 바뀐 종목"""
+    deltas = []
+    for row in snapshot.rows:
+        old = previous.get(row["code"]) if previous is not None else None
+        if old is None or any(old.get(f) != row.get(f) for f in DELTA_FIELDS):
+            deltas.append({
+                "code": row["code"],
+                "score": row["score"],
+                "grade": row["grade"],
+                "trend": row["trend"],
+                "score_change": row["score_change"],
+            })
+    return deltas
+
+
+class ScoreBroadcaster:
+    """
+    publish()는 어느 스레드에서든 호출 가능 (집계 작업 스레드 등)
+    wait()는 이벤트 루프별 공유 asyncio.Event 하나로 대기
+    """
+
+    def __init__(self, history: int = 256):
+        self._events: deque[ScoreEvent] = deque(maxlen=history)
+        self._seq = 0
+        self._lock = threading.Lock()
+        self._wakeups: dict[asyncio.AbstractEventLoop, asyncio.Event] = {}
+        self.epoch = secrets.token_hex(4)
+        self.connections = 0
+
+    @property
+    def latest_seq(self) -> int:
+        return self._seq
+
+    def event_id(self, seq: int) -> str:
+        """SSE 이벤트 id (이 브로드캐스터의 epoch + seq)"""
+        return f"{self.epoch}.{seq}"
+
+    def parse_event_id(self, value: str) -> Optional[int]:
+        """이 브로드캐스터가 준 이벤트 id → seq (다른 워커/재시작 전 id 이거나 형식이 틀리면 None)"""
+        epoch, _, seq = value.partition(".")
+        if epoch != self.epoch or not seq.isdigit():
+            return None
+        return int(seq)
+
+    def publish(self, deltas: list[dict]) -> Optional[int]:
+        """델타 묶음 발행 - 변경이 없으면 발행하지 않음"""
+        if not deltas:
+            return None
+        data = json.dumps(deltas, ensure_ascii=False, separators=(",", ":"))
+        with self._lock:
+            self._seq += 1
+            self._events.append(ScoreEvent(self._seq, data))
+            loops = list(self._wakeups)
+        for loop in loops:
+            try:
+                loop.call_soon_threadsafe(self._wake, loop)
+            except RuntimeError:
+                # 종료된 이벤트 루프
+                with self._lock:
+                    self._wakeups.pop(loop, None)
+        return self._seq
+
+    def on_board_refresh(self, previous, snapshot) -> None:
+        """StockBoard.subscribe 용 리스너"""
+        seq = self.publish(compute_deltas(previous, snapshot))
+        if seq is not None:
+            logger.info(f"점수 델타 발행: seq={seq}")
+
+    def _wake(self, loop) -> None:
+        event = self._wakeups.get(loop)
+        if event is not None:
+            # 대기 중인 연결 전체를 깨우고 다음 발행용 이벤트로 교체
+            self._wakeups[loop] = asyncio.Event()
+            event.set()
+
+    def _wakeup_event(self) -> asyncio.Event:
+        loop = asyncio.get_running_loop()
+        event = self._wakeups.get(loop)
+        if event is None:
+            with self._lock:
+                event = self._wakeups.setdefault(loop, asyncio.Event())
+        return event
+
+    def since(self, cursor: int) -> tuple[list[ScoreEvent], bool]:
+        """
+        커서 이후 이벤트 반환
+        Returns: (이벤트 목록, reset 여부) - 보관 범위를 벗어난 커서면 reset=True (전체 재조회 필요)
+        """
+        with self._lock:
+            latest = self._seq
+            if cursor == latest:
+                return [], False
+            oldest = self._events[0].seq if self._events else latest + 1
+            if cursor > latest or cursor < oldest - 1:
+                return [], True
+            return [e for e in self._events if e.seq > cursor], False
+
+    async def wait(self, cursor: int, timeout: float) -> tuple[list[ScoreEvent], bool]:
+        """새 이벤트가 생기거나 timeout까지 대기"""
+        event = self._wakeup_event()
+        events, reset = self.since(cursor)
+        if events or reset:
+            return events, reset
+        try:
+            await asyncio.wait_for(event.wait(), timeout)
+        except asyncio.TimeoutError:
+            return [], False
+        return self.since(cursor)
+
+    def stats(self) -> dict:
+        return {
+            "epoch": self.epoch,
+            "latest_seq": self._seq,
+            "buffered_events": len(self._events),
+            "connections": self.connections,
+        }
+
+
+_broadcaster: Optional[ScoreBroadcaster] = None
+
+
+def get_broadcaster() -> ScoreBroadcaster:
+    global _broadcaster
+    if _broadcaster is None:
+        from ..config import get_settings
+        _broadcaster = ScoreBroadcaster(history=get_settings().stream_history)
+    return _broadcaster
@@ -0,0 +1,97 @@
+"""
+감성 신호 백테스트
+종가 파일과 감성 점수 이력(DB 또는 파일)으로 규칙 하나를 평가하거나 파라미터 격자를 훑는다
+
+실행: python -m app.tools.backtest --prices prices/ --scores-db --rule "score<30x2" --hold 5
+      python -m app.tools.backtest --prices prices.parquet --scores scores.csv --sweep --values 20,25,30,35
+      python -m app.tools.backtest --synthetic --sweep          (합성 200종목 × 10년)
+"""
+import argparse
+import json
+import sys
+import time
+
+RESULT_COLUMNS = ("rule", "trades", "hit_rate", "avg_return", "excess_return", "total_return", "max_drawdown")
+
+
+def _ints(text: str) -> list[int]:
+    return [int(v) for v in text.split(",") if v.strip()]
+
+
+def _values(text: str) -> list:
+    values = [v.strip() for v in text.split(",") if v.strip()]
+    try:
+        return [float(v) for v in values]
+    except ValueError:
+        return values
+
+
+def _print_table(rows: list[dict]) -> None:
+    print(f"{'규칙':<26}{'거래':>8}{'적중률':>9}{'평균':>9}{'초과':>9}{'누적':>10}{'최대낙폭':>10}")
+    for r in rows:
+        print(f"{r['rule']:<26}{r['trades']:>8,}{r['hit_rate']:>9.1%}{r['avg_return']:>9.2%}"
+              f"{r['excess_return']:>9.2%}{r['total_return']:>10.1%}{r['max_drawdown']:>10.1%}")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="감성 신호 백테스트 (벡터화)")
+    data = parser.add_mutually_exclusive_group(required=True)
+    data.add_argument("--prices", help="종가 CSV/Parquet 파일 또는 디렉터리")
+    data.add_argument("--synthetic", action="store_true", help="합성 종가/점수")
+    scores = parser.add_mutually_exclusive_group()
+    scores.add_argument("--scores", help="점수 CSV/Parquet 파일 또는 디렉터리")
+    scores.add_argument("--scores-db", action="store_true", help="sentiment_scores 테이블에서 읽기")
+    parser.add_argument("--stocks", type=int, default=200, help="합성 데이터 종목 수")
+    parser.add_argument("--days", type=int, default=2500, help="합성 데이터 거래일 수")
+    parser.add_argument("--rule", action="append", help='규칙 (여러 번 가능), 예: "score<30x2", "grade==E"')
+    parser.add_argument("--hold", type=int, default=5, help="보유 거래일 수")
+    parser.add_argument("--short", action="store_true", help="신호에 매도 (공매도 수익률)")
+    parser.add_argument("--sweep", action="store_true", help="파라미터 격자 탐색")
+    parser.add_argument("--field", default="score", help="격자 탐색 필드 (score/grade/trend)")
+    parser.add_argument("--op", default="<", help="격자 탐색 비교")
+    parser.add_argument("--values", default="15,20,25,30,35,40,45")
+    parser.add_argument("--periods", default="1,2,3,5")
+    parser.add_argument("--holds", default="1,5,10,20")
+    parser.add_argument("--min-trades", type=int, default=30)
+    parser.add_argument("--top", type=int, default=15)
+    parser.add_argument("--json", action="store_true", help="JSON 출력")
+    args = parser.parse_args(argv)
+
+    from ..backtest import Backtest, load_prices, load_scores_db, load_scores_file, parse_rule, synthetic_universe
+
+    started = time.perf_counter()
+    if args.synthetic:
+        prices, score_rows = synthetic_universe(args.stocks, args.days)
+    else:
+        if not (args.scores or args.scores_db):
+            parser.error("--scores 또는 --scores-db 필요")
+        prices = load_prices(args.prices)
+        score_rows = load_scores_db() if args.scores_db else load_scores_file(args.scores)
+    engine = Backtest(prices, score_rows)
+    loaded = time.perf_counter() - started
+
+    side = "short" if args.short else "long"
+    started = time.perf_counter()
+    if args.sweep:
+        frame = engine.sweep(args.field, args.op, _values(args.values), _ints(args.periods), _ints(args.holds),
+                             side=side, min_trades=args.min_trades)
+        rows = frame.head(args.top).to_dict("records")
+        combos = len(_values(args.values)) * len(_ints(args.periods)) * len(_ints(args.holds))
+    else:
+        rules = args.rule or ["score<30x2"]
+        rows = [engine.run(parse_rule(r, hold=args.hold, side=side)).to_dict() for r in rules]
+        combos = len(rules)
+    elapsed = time.perf_counter() - started
+
+    if args.json:
+        print(json.dumps(rows, ensure_ascii=False, indent=2))
+        return 0
+
+    days, stocks = engine.shape
+    print(f"거래일 {days:,} × 종목 {stocks} (준비 {loaded:.2f}초) / 규칙 {combos}개 평가: {elapsed:.2f}초")
+    _print_table(rows)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,393 @@
+"""
+부하 테스트 하네스
+시드 고정 가짜 데이터로 보드를 채우고, 트래픽 프로파일 비율대로 요청을 섞어 보낸 뒤
+엔드포인트별 지연 백분위(p50/p90/p99)와 처리량(RPS)을 JSON 리포트로 남긴다
+
+대상:
+  inproc       - 같은 프로세스의 ASGI 앱에 직접 (네트워크 없음)
+  uvicorn      - 같은 프로세스에서 로컬 uvicorn 을 띄우고 HTTP 로 (가짜 데이터 주입 가능)
+  http://...   - 이미 떠 있는 서버 (가짜 데이터 주입 불가, 서버 데이터 그대로 사용)
+
+실행: python -m app.tools.loadtest [--target inproc] [--concurrency 32] [--duration 10]
+                                 [--profile stocks_list=40,stock_detail=35,share=15,analyze=10]
+                                 [--seed 42] [--stocks 200] [--out report.json] [--baseline old.json]
+"""
+import argparse
+import asyncio
+import json
+import logging
+import random
+import shutil
+import socket
+import sys
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Optional
+
+SORTS = ("score_desc", "score_asc", "name", "trend_up", "trend_down")
+
+ANALYZE_TEXTS = (
+    "오늘 급등 기대합니다 ㅋㅋ", "하한가 가겠네 손절각", "실적개선 호재 매수", "그냥 지켜봐야할듯",
+    "외인매수 들어온다", "악재 터졌다 폭락 조심", "배당 괜찮은 종목", "작전주 같아서 불안",
+)
+
+DEFAULT_PROFILE = {"stocks_list": 40, "stock_detail": 35, "share": 15, "analyze": 10}
+
+
+@dataclass(frozen=True)
+class RequestSpec:
+    method: str
+    path: str
+    json: Optional[dict] = None
+
+
+def _stocks_list(rng: random.Random, codes: list[str]) -> RequestSpec:
+    sort = rng.choice(SORTS)
+    page = 1 if rng.random() < 0.8 else rng.randint(2, 4)
+    query = "" if sort == "score_desc" and page == 1 else f"?sort={sort}&page={page}"
+    return RequestSpec("GET", f"/api/stocks/{query}")
+
+
+def _stock_detail(rng: random.Random, codes: list[str]) -> RequestSpec:
+    return RequestSpec("GET", f"/api/stocks/{rng.choice(codes)}")
+
+
+def _share(rng: random.Random, codes: list[str]) -> RequestSpec:
+    return RequestSpec("GET", f"/api/share/{rng.choice(codes)}")
+
+
+def _analyze(rng: random.Random, codes: list[str]) -> RequestSpec:
+    return RequestSpec("POST", "/api/sentiment/analyze", {"text": rng.choice(ANALYZE_TEXTS)})
+
+
+ENDPOINTS: dict[str, Callable[[random.Random, list[str]], RequestSpec]] = {
+    "stocks_list": _stocks_list,
+    "stock_detail": _stock_detail,
+    "share": _share,
+    "analyze": _analyze,
+}
+
+
+def parse_profile(value: Optional[str]) -> dict[str, float]:
+    """'stocks_list=40,share=10' 또는 JSON 파일 경로 → 엔드포인트별 가중치"""
+    if not value:
+        return dict(DEFAULT_PROFILE)
+    if value.endswith(".json"):
+        profile = json.loads(Path(value).read_text(encoding="utf-8"))
+    else:
+        profile = {}
+        for part in value.split(","):
+            name, _, weight = part.partition("=")
+            profile[name.strip()] = float(weight)
+    unknown = set(profile) - set(ENDPOINTS)
+    if unknown:
+        raise ValueError(f"알 수 없는 엔드포인트: {', '.join(sorted(unknown))} (가능: {', '.join(ENDPOINTS)})")
+    profile = {k: float(v) for k, v in profile.items() if float(v) > 0}
+    if not profile:
+        raise ValueError("트래픽 프로파일 가중치가 모두 0")
+    return profile
+
+
+def percentile(sorted_values: list[float], pct: float) -> float:
+    """최근접 순위 백분위 (정렬된 값)"""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, int(round(pct / 100 * len(sorted_values) + 0.5 - 1e-9)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+@dataclass
+class EndpointStats:
+    latencies: list[float] = field(default_factory=list)  # 초
+    statuses: dict[int, int] = field(default_factory=dict)
+    errors: int = 0  # 응답 없음(연결 실패 등) 또는 5xx
+
+    def record(self, elapsed: float, status: int) -> None:
+        self.latencies.append(elapsed)
+        self.statuses[status] = self.statuses.get(status, 0) + 1
+        if status >= 500 or status == 0:
+            self.errors += 1
+
+    def summary(self, duration: float) -> dict:
+        values = sorted(self.latencies)
+        ms = lambda s: round(s * 1000, 3)  # noqa: E731
+        return {
+            "requests": len(values),
+            "errors": self.errors,
+            "statuses": {str(k): v for k, v in sorted(self.statuses.items())},
+            "rps": round(len(values) / duration, 1) if duration > 0 else 0.0,
+            "latency_ms": {
+                "mean": ms(sum(values) / len(values)) if values else 0.0,
+                "p50": ms(percentile(values, 50)),
+                "p90": ms(percentile(values, 90)),
+                "p99": ms(percentile(values, 99)),
+                "max": ms(values[-1]) if values else 0.0,
+            },
+        }
+
+
+def build_report(stats: dict[str, EndpointStats], duration: float, meta: dict) -> dict:
+    overall = EndpointStats()
+    for s in stats.values():
+        overall.latencies.extend(s.latencies)
+        overall.errors += s.errors
+        for status, n in s.statuses.items():
+            overall.statuses[status] = overall.statuses.get(status, 0) + n
+    return {
+        "meta": {**meta, "duration_s": round(duration, 3)},
+        "overall": overall.summary(duration),
+        "endpoints": {name: stats[name].summary(duration) for name in sorted(stats)},
+    }
+
+
+async def run_load(
+    client,
+    codes: list[str],
+    profile: dict[str, float],
+    concurrency: int = 32,
+    duration: Optional[float] = 10.0,
+    total_requests: Optional[int] = None,
+    seed: int = 42,
+) -> tuple[dict[str, EndpointStats], float]:
+    """
+    closed-loop 부하: concurrency 개 작업자가 응답을 받는 즉시 다음 요청
+    duration(초) 또는 total_requests 중 먼저 도달하는 조건에서 멈춘다
+    """
+    names = list(profile)
+    weights = [profile[n] for n in names]
+    stats = {name: EndpointStats() for name in names}
+    remaining = [total_requests if total_requests is not None else -1]
+    started = time.perf_counter()
+    deadline = started + duration if duration else None
+
+    def take() -> bool:
+        if deadline is not None and time.perf_counter() >= deadline:
+            return False
+        if remaining[0] == 0:
+            return False
+        if remaining[0] > 0:
+            remaining[0] -= 1
+        return True
+
+    async def worker(index: int) -> None:
+        rng = random.Random(seed * 1000 + index)
+        while take():
+            name = rng.choices(names, weights)[0]
+            spec = ENDPOINTS[name](rng, codes)
+            t = time.perf_counter()
+            try:
+                response = await client.request(spec.method, spec.path, json=spec.json)
+                status = response.status_code
+            except Exception:
+                status = 0
+            stats[name].record(time.perf_counter() - t, status)
+
+    await asyncio.gather(*(worker(i) for i in range(concurrency)))
+    return stats, time.perf_counter() - started
+
+
+def compare(report: dict, baseline: dict) -> dict:
+    """이전 리포트 대비 변화율(%) - p50/p99 는 +가 느려짐, rps 는 +가 빨라짐"""
+    def delta(new: float, old: float) -> Optional[float]:
+        return round((new - old) / old * 100, 1) if old else None
+
+    result = {}
+    for name, now in {"overall": report["overall"], **report["endpoints"]}.items():
+        before = baseline["overall"] if name == "overall" else baseline.get("endpoints", {}).get(name)
+        if before is None:
+            continue
+        result[name] = {
+            "p50": delta(now["latency_ms"]["p50"], before["latency_ms"]["p50"]),
+            "p99": delta(now["latency_ms"]["p99"], before["latency_ms"]["p99"]),
+            "rps": delta(now["rps"], before["rps"]),
+        }
+    return result
+
+
+# ─── 대상 준비 ─────────────────────────────────────────────────────────────────
+def install_fake_backend(seed: int, stocks: int) -> list[str]:
+    """시드 고정 가짜 행으로 보드 교체 (DB 대신) → 종목코드 목록"""
+    from ..board import get_board
+    from ..board.mock import fake_rows
+
+    snapshot = get_board().refresh(fake_rows(seed, stocks))
+    _settle()
+    return [row["code"] for row in snapshot.rows]
+
+
+@contextmanager
+def temp_card_dir():
+    """가짜 보드로 렌더링되는 공유 카드를 임시 디렉터리에 (설정된 카드 디렉터리를 건드리지 않음, 끝나면 원래대로)"""
+    from ..cards import store as store_module
+    from ..config import get_settings
+
+    settings = get_settings()
+    directory = tempfile.mkdtemp(prefix="goksori-loadtest-cards-")
+    saved = settings.share_card_dir
+    store = store_module._store  # 이미 만들어진 저장소 (앱 import 시 보드 리스너로 등록됨)
+    saved_store_dir = store.directory if store is not None else None
+    settings.share_card_dir = directory
+    if store is not None:
+        store.directory = Path(directory)
+    try:
+        yield directory
+    finally:
+        _settle()
+        settings.share_card_dir = saved
+        if store is not None:
+            store.directory = saved_store_dir
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+def _settle(timeout: float = 30.0) -> None:
+    """보드 갱신으로 예약된 공유 카드 렌더링이 끝날 때까지 대기 (측정 중 백그라운드 작업 배제)"""
+    from ..config import get_settings
+
+    if not get_settings().share_card_enabled:
+        return
+    from ..cards import get_card_store
+
+    store = get_card_store()
+    deadline = time.monotonic() + timeout
+    while store.stats()["pending"] and time.monotonic() < deadline:
+        time.sleep(0.05)
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def start_uvicorn(app) -> tuple[object, str]:
+    """같은 프로세스의 별도 스레드에서 uvicorn 실행 → (서버, base_url)"""
+    import uvicorn
+
+    port = _free_port()
+    server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning", lifespan="off"))
+    thread = threading.Thread(target=server.run, name="loadtest-uvicorn", daemon=True)
+    thread.start()
+    deadline = time.monotonic() + 10
+    while not server.started:
+        if time.monotonic() > deadline:
+            raise RuntimeError("uvicorn 기동 시간 초과")
+        time.sleep(0.02)
+    return server, f"http://127.0.0.1:{port}"
+
+
+async def _remote_codes(client) -> list[str]:
+    response = await client.get("/api/stocks/", params={"size": 200})
+    response.raise_for_status()
+    return [row["code"] for row in response.json()["stocks"]]
+
+
+async def run_target(target: str, args) -> dict:
+    if target in ("inproc", "uvicorn"):
+        with temp_card_dir():
+            return await _run_target(target, args)
+    return await _run_target(target, args)
+
+
+async def _run_target(target: str, args) -> dict:
+    import httpx
+
+    profile = parse_profile(args.profile)
+    meta = {
+        "target": target if target in ("inproc", "uvicorn") else "http",
+        "concurrency": args.concurrency,
+        "seed": args.seed,
+        "profile": profile,
+        "started_at": datetime.now().isoformat(timespec="seconds"),
+    }
+    server = None
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+
+    if target in ("inproc", "uvicorn"):
+        from ..main import app
+
+        logging.getLogger("httpx").setLevel(logging.WARNING)  # 앱의 INFO 로깅 설정 → 요청마다 로그가 측정을 왜곡
+        codes = install_fake_backend(args.seed, args.stocks)
+        meta["stocks"] = len(codes)
+        if target == "inproc":
+            client = httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://loadtest")
+        else:
+            server, base_url = start_uvicorn(app)
+            client = httpx.AsyncClient(base_url=base_url, limits=limits, timeout=30)
+    else:
+        client = httpx.AsyncClient(base_url=target, limits=limits, timeout=30)
+        codes = None
+
+    try:
+        async with client:
+            if codes is None:
+                codes = await _remote_codes(client)
+                meta["stocks"] = len(codes)
+            if args.warmup:
+                await run_load(client, codes, profile, concurrency=1, duration=None,
+                               total_requests=args.warmup, seed=args.seed + 1)
+            stats, elapsed = await run_load(
+                client, codes, profile,
+                concurrency=args.concurrency,
+                duration=args.duration,
+                total_requests=args.requests,
+                seed=args.seed,
+            )
+    finally:
+        if server is not None:
+            server.should_exit = True
+
+    return build_report(stats, elapsed, meta)
+
+
+def _print_report(report: dict, deltas: Optional[dict]) -> None:
+    meta = report["meta"]
+    print(f"대상 {meta['target']} · 동시성 {meta['concurrency']} · {meta['duration_s']}초 · 종목 {meta['stocks']}개")
+    print(f"{'엔드포인트':<14} {'요청':>8} {'오류':>6} {'RPS':>9} {'p50(ms)':>9} {'p90(ms)':>9} {'p99(ms)':>9}")
+    for name, s in {**report["endpoints"], "overall": report["overall"]}.items():
+        lat = s["latency_ms"]
+        line = f"{name:<14} {s['requests']:>8} {s['errors']:>6} {s['rps']:>9} {lat['p50']:>9} {lat['p90']:>9} {lat['p99']:>9}"
+        if deltas and name in deltas:
+            d = deltas[name]
+            line += f"   Δp50 {d['p50']}% Δp99 {d['p99']}% ΔRPS {d['rps']}%"
+        print(line)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="읽기/분석 API 부하 테스트")
+    parser.add_argument("--target", default="inproc", help="inproc | uvicorn | http://host:port")
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--duration", type=float, default=10.0, help="측정 시간(초)")
+    parser.add_argument("--requests", type=int, help="총 요청 수 (지정 시 먼저 도달한 조건에서 종료)")
+    parser.add_argument("--warmup", type=int, default=50, help="측정 전 워밍업 요청 수")
+    parser.add_argument("--profile", help="name=weight,... 또는 JSON 파일 (기본 " +
+                        ",".join(f"{k}={v}" for k, v in DEFAULT_PROFILE.items()) + ")")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--stocks", type=int, default=200, help="가짜 데이터 종목 수 (inproc/uvicorn)")
+    parser.add_argument("--out", help="JSON 리포트 저장 경로")
+    parser.add_argument("--baseline", help="비교할 이전 JSON 리포트")
+    parser.add_argument("--json", action="store_true", help="JSON으로 출력")
+    args = parser.parse_args(argv)
+
+    report = asyncio.run(run_target(args.target, args))
+    deltas = None
+    if args.baseline:
+        deltas = compare(report, json.loads(Path(args.baseline).read_text(encoding="utf-8")))
+        report["baseline_delta_pct"] = deltas
+
+    text = json.dumps(report, ensure_ascii=False, indent=2, sort_keys=True)
+    if args.out:
+        Path(args.out).write_text(text + "\n", encoding="utf-8")
+    if args.json:
+        print(text)
+    else:
+        _print_report(report, deltas)
+    return 0 if report["overall"]["errors"] == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,88 @@
+"""
+프로파일 요약
+profile_dir 에 쌓인 .prof 파일을 합쳐 상위 함수를 출력한다
+
+실행: python -m app.tools.profile_summary [--dir DIR] [--kind http|aggregate|crawl] [--match 문자열]
+                                        [--sort cumulative|tottime|ncalls] [--top 25] [--json]
+"""
+import argparse
+import json
+import pstats
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+from ..profiling.profiler import PROFILE_SUFFIX
+
+SORT_KEYS = ("cumulative", "tottime", "ncalls")
+
+
+@dataclass
+class FunctionStat:
+    function: str      # 파일:줄(함수)
+    ncalls: int
+    tottime: float
+    cumtime: float
+
+
+def select_profiles(directory: Path, kind: Optional[str] = None, match: Optional[str] = None) -> list[Path]:
+    """파일명({시각}-{종류}-{라벨}.prof) 기준 선택"""
+    files = sorted(Path(directory).glob(f"*{PROFILE_SUFFIX}"))
+    if kind:
+        files = [p for p in files if p.name.split("-", 2)[1:2] == [kind]]
+    if match:
+        files = [p for p in files if match in p.name]
+    return files
+
+
+def summarize(files: list[Path], sort: str = "cumulative", top: int = 25) -> list[FunctionStat]:
+    """여러 프로파일을 합쳐 sort 기준 상위 top 개 함수"""
+    if not files:
+        return []
+    stats = pstats.Stats(str(files[0]))
+    for path in files[1:]:
+        stats.add(str(path))
+
+    rows = []
+    for (filename, line, name), (_, ncalls, tottime, cumtime, _) in stats.stats.items():
+        rows.append(FunctionStat(f"{filename}:{line}({name})", ncalls, tottime, cumtime))
+
+    key = {"cumulative": lambda r: r.cumtime, "tottime": lambda r: r.tottime, "ncalls": lambda r: r.ncalls}[sort]
+    return sorted(rows, key=key, reverse=True)[:top]
+
+
+def main(argv=None) -> int:
+    from ..config import get_settings
+
+    parser = argparse.ArgumentParser(description="캡처된 프로파일 상위 함수 요약")
+    parser.add_argument("--dir", default=get_settings().profile_dir)
+    parser.add_argument("--kind", help="http / aggregate / crawl")
+    parser.add_argument("--match", help="파일명(라벨)에 포함된 문자열")
+    parser.add_argument("--sort", choices=SORT_KEYS, default="cumulative")
+    parser.add_argument("--top", type=int, default=25)
+    parser.add_argument("--json", action="store_true", help="JSON으로 출력")
+    args = parser.parse_args(argv)
+
+    files = select_profiles(Path(args.dir), args.kind, args.match)
+    if not files:
+        print(f"프로파일 없음: {args.dir}", file=sys.stderr)
+        return 1
+    rows = summarize(files, args.sort, args.top)
+
+    if args.json:
+        print(json.dumps({
+            "profiles": len(files),
+            "sort": args.sort,
+            "functions": [r.__dict__ for r in rows],
+        }, ensure_ascii=False, indent=2))
+    else:
+        print(f"프로파일 {len(files)}개 합산 ({args.sort} 기준 상위 {args.top})")
+        print(f"{'호출':>10} {'자체(ms)':>10} {'누적(ms)':>10}  함수")
+        for r in rows:
+            print(f"{r.ncalls:>10} {r.tottime * 1000:>10.1f} {r.cumtime * 1000:>10.1f}  {r.function}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
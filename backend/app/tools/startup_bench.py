@@ -0,0 +1,115 @@
+"""
+앱 콜드 스타트 벤치마크
+새 인터프리터에서 app.main 을 import 하고 모듈별 import 시간을 보고한다
+예산(startup_budget_seconds)을 넘거나 무거운 모듈이 기동 시 로드되면 실패(exit 1)
+
+실행: python -m app.tools.startup_bench [--budget 2.0] [--top 15] [--module app.main]
+"""
+import argparse
+import json
+import subprocess
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).parent.parent.parent
+
+# 기동 시 로드되면 안 되는 모듈 (필요한 시점에 지연 로드)
+HEAVY_MODULES = ("torch", "transformers", "konlpy", "selenium", "requests", "bs4", "lxml", "psycopg2", "sqlalchemy", "numpy", "pandas")
+
+_PROBE = """
+import json, sys, time
+t = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - t
+print(json.dumps({{"elapsed": elapsed, "modules": sorted(sys.modules)}}))
+"""
+
+
+@dataclass
+class StartupReport:
+    module: str
+    elapsed: float
+    budget: float
+    imports: list[tuple[str, int, int]] = field(default_factory=list)  # (모듈, self us, 누적 us)
+    heavy_loaded: list[str] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        return self.elapsed <= self.budget and not self.heavy_loaded
+
+    def top(self, n: int) -> list[tuple[str, int, int]]:
+        return sorted(self.imports, key=lambda x: x[2], reverse=True)[:n]
+
+
+def parse_importtime(stderr: str) -> list[tuple[str, int, int]]:
+    """-X importtime 출력 파싱"""
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3 or not parts[0].strip().isdigit():
+            continue  # 헤더 행
+        rows.append((parts[2].strip(), int(parts[0]), int(parts[1])))
+    return rows
+
+
+def measure_startup(module: str = "app.main", budget: float = 2.0) -> StartupReport:
+    """새 프로세스에서 module import 시간 측정"""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _PROBE.format(module=module)],
+        cwd=str(BACKEND_DIR),
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    result = json.loads(proc.stdout.strip().splitlines()[-1])
+    loaded = set(result["modules"])
+    return StartupReport(
+        module=module,
+        elapsed=result["elapsed"],
+        budget=budget,
+        imports=parse_importtime(proc.stderr),
+        heavy_loaded=[m for m in HEAVY_MODULES if m in loaded],
+    )
+
+
+def main(argv=None) -> int:
+    from ..config import get_settings
+
+    parser = argparse.ArgumentParser(description="앱 콜드 스타트 벤치마크")
+    parser.add_argument("--module", default="app.main")
+    parser.add_argument("--budget", type=float, default=get_settings().startup_budget_seconds)
+    parser.add_argument("--top", type=int, default=15)
+    parser.add_argument("--json", action="store_true", help="JSON으로 출력")
+    args = parser.parse_args(argv)
+
+    report = measure_startup(args.module, args.budget)
+
+    if args.json:
+        print(json.dumps({
+            "module": report.module,
+            "elapsed": round(report.elapsed, 4),
+            "budget": report.budget,
+            "ok": report.ok,
+            "heavy_loaded": report.heavy_loaded,
+            "top_imports": [{"module": m, "self_us": s, "cumulative_us": c} for m, s, c in report.top(args.top)],
+        }, ensure_ascii=False, indent=2))
+    else:
+        print(f"{report.module} 콜드 스타트: {report.elapsed:.3f}초 (예산 {report.budget:.3f}초)")
+        print(f"{'누적(ms)':>10} {'자체(ms)':>10}  모듈")
+        for name, self_us, cum_us in report.top(args.top):
+            print(f"{cum_us / 1000:>10.1f} {self_us / 1000:>10.1f}  {name}")
+        if report.heavy_loaded:
+            print(f"❌ 기동 시 무거운 모듈 로드됨: {', '.join(report.heavy_loaded)}")
+        if report.elapsed > report.budget:
+            print("❌ 콜드 스타트 예산 초과")
+        if report.ok:
+            print("✅ 예산 이내")
+
+    return 0 if report.ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
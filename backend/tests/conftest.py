@@ -0,0 +1,14 @@
+"""
+테스트 공통 설정
+- 공유 카드 저장 디렉터리를 세션 임시 디렉터리로 (앱 import 시 보드 갱신 리스너가 카드를 렌더링 → 작업 트리 오염 방지)
+"""
+import os
+import shutil
+import tempfile
+
+_card_dir = tempfile.mkdtemp(prefix="goksori-cards-")
+os.environ["SHARE_CARD_DIR"] = _card_dir
+
+
+def pytest_sessionfinish(session, exitstatus):
+    shutil.rmtree(_card_dir, ignore_errors=True)
@@ -0,0 +1,98 @@
+"""
+주식 API TDD 테스트
+실행: pytest backend/tests/test_api/ -v
+"""
+import pytest
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "../../.."))
+
+from fastapi.testclient import TestClient
+
+from app.main import app
+
+
+@pytest.fixture
+def client():
+    return TestClient(app)
+
+
+class TestStocksAPI:
+
+    def test_list_stocks(self, client):
+        res = client.get("/api/stocks/?size=10")
+        assert res.status_code == 200
+        data = res.json()
+        assert data["total"] >= 10
+        assert len(data["stocks"]) == 10
+
+    def test_search_by_chosung(self, client):
+        data = client.get("/api/stocks/", params={"search": "ㅅㅅㅈㅈ"}).json()
+        assert [s["code"] for s in data["stocks"]] == ["005930"]
+
+    def test_search_by_code(self, client):
+        data = client.get("/api/stocks/", params={"search": "005930"}).json()
+        assert data["total"] == 1
+
+    def test_autocomplete(self, client):
+        res = client.get("/api/stocks/autocomplete", params={"q": "삼성전"})
+        assert res.status_code == 200
+        results = res.json()["results"]
+        assert {"code": "005930", "name": "삼성전자"} in results
+        assert all(r["name"].startswith("삼성전") for r in results)
+
+    def test_autocomplete_requires_query(self, client):
+        assert client.get("/api/stocks/autocomplete").status_code == 422
+
+    def test_stock_detail(self, client):
+        data = client.get("/api/stocks/005930").json()
+        assert data["code"] == "005930"
+        assert data["name"] == "삼성전자"
+        assert len(data["comments"]) > 0
+
+
+class TestBundleAPI:
+
+    def test_bundle_all_fields(self, client):
+        data = client.get("/api/stocks/005930/bundle", params={"days": 10}).json()
+        assert data["code"] == "005930"
+        assert set(data) >= {"detail", "comments", "share", "history"}
+        assert len(data["history"]) == 10
+        # 하나의 스냅샷: 상세와 공유 점수/등급이 일치
+        assert data["detail"]["score"] == data["share"]["score"]
+        assert data["detail"]["grade"] == data["share"]["grade"]
+        assert "comments" not in data["detail"]
+
+    def test_bundle_matches_individual_endpoints(self, client):
+        bundle = client.get("/api/stocks/005930/bundle").json()
+        detail = client.get("/api/stocks/005930").json()
+        share = client.get("/api/share/005930").json()
+        history = client.get("/api/sentiment/005930/history?days=30").json()["history"]
+        assert bundle["detail"]["score"] == detail["score"] == share["score"]
+        assert bundle["history"] == history
+        assert [(c["id"], c["likes"]) for c in bundle["comments"]["comments"]] == \
+            [(c["id"], c["likes"]) for c in detail["comments"]]
+
+    def test_bundle_field_selection(self, client):
+        data = client.get("/api/stocks/005930/bundle", params={"fields": "share"}).json()
+        assert "share" in data
+        assert "detail" not in data and "history" not in data
+
+    def test_bundle_comments_page(self, client):
+        data = client.get("/api/stocks/005930/bundle",
+                          params={"fields": "comments", "comments_page": 2, "comments_size": 5}).json()
+        assert data["comments"]["page"] == 2
+        assert data["comments"]["comments"][0]["id"] == 6
+
+    def test_bundle_unknown_field(self, client):
+        res = client.get("/api/stocks/005930/bundle", params={"fields": "detail,bogus"})
+        assert res.status_code == 400
+
+    def test_multi_bundle(self, client):
+        data = client.get("/api/stocks/bundle", params={"codes": "005930,000660,005930"}).json()
+        assert list(data["bundles"]) == ["005930", "000660"]
+        assert set(data["bundles"]["000660"]) == {"detail", "share"}
+
+    def test_multi_bundle_limit(self, client):
+        codes = ",".join(f"{i:06d}" for i in range(51))
+        assert client.get("/api/stocks/bundle", params={"codes": codes}).status_code == 400
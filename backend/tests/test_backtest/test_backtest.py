@@ -0,0 +1,163 @@
+"""
+감성 신호 백테스트 TDD 테스트
+실행: pytest backend/tests/test_backtest/ -v
+"""
+import json
+import time
+import pytest
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "../../.."))
+
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from app.backtest import (
+    Backtest, Rule, align_scores, load_prices, load_scores_db, load_scores_file, parse_rule, synthetic_universe,
+)
+
+DATES = pd.bdate_range("2026-01-05", periods=8)
+
+
+def _prices(closes: dict) -> pd.DataFrame:
+    return pd.DataFrame(closes, index=DATES[:len(next(iter(closes.values())))], dtype=float)
+
+
+def _scores(code: str, values: list, trend=None) -> pd.DataFrame:
+    """거래일 d 의 전날 밤 집계 → d 에 쓰이는 점수"""
+    rows = {
+        "period_end": [d - pd.Timedelta(hours=4) for d in DATES[:len(values)]],
+        "code": code,
+        "score": values,
+    }
+    if trend is not None:
+        rows["trend"] = trend
+    return pd.DataFrame(rows)
+
+
+class TestData:
+
+    def test_load_prices_per_stock_and_long_files(self, tmp_path):
+        per_stock = tmp_path / "per_stock"
+        per_stock.mkdir()
+        pd.DataFrame({"date": ["2026-01-05", "2026-01-06"], "close": [100, 110]}).to_csv(per_stock / "005930.csv", index=False)
+        pd.DataFrame({"date": ["2026-01-06", "2026-01-05"], "close": [55, 50]}).to_csv(per_stock / "660.csv", index=False)
+        wide = load_prices(per_stock)
+        assert list(wide.columns) == ["000660", "005930"]
+        assert wide["000660"].tolist() == [50.0, 55.0]  # 날짜순 정렬
+
+        pd.DataFrame({"date": ["2026-01-05"] * 2, "code": ["005930", "000660"], "close": [1.0, 2.0]}) \
+            .to_parquet(tmp_path / "long.parquet")
+        assert load_prices(tmp_path / "long.parquet").loc["2026-01-05", "000660"] == 2.0
+
+    def test_align_has_no_lookahead_and_limits_staleness(self):
+        prices = _prices({"005930": [100] * 8})
+        scores = pd.DataFrame({
+            "period_end": [datetime(2026, 1, 5, 0, 0), datetime(2026, 1, 5, 14, 0)],
+            "code": ["5930", "005930"],
+            "score": [20.0, 80.0],
+        })
+        from app.backtest.data import _clean_scores
+        aligned = align_scores(_clean_scores(scores), prices, stale_days=2)["005930"]
+        # 1/5 0시에 끝난 집계는 1/5 에, 장중 집계는 다음 거래일부터
+        assert aligned.iloc[:4].tolist() == [20.0, 80.0, 80.0, 80.0]
+        assert aligned.iloc[4:].isna().all()  # 2거래일 넘게 새 집계가 없으면 비움
+
+    def test_scores_from_database(self):
+        from sqlalchemy import create_engine
+        from sqlalchemy.orm import sessionmaker
+        from sqlalchemy.pool import StaticPool
+        from app.models import Base, SentimentScore, Stock
+
+        engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+        Base.metadata.create_all(engine)
+        factory = sessionmaker(bind=engine)
+        with factory() as session:
+            stock = Stock(code="005930", name="삼성전자")
+            session.add(stock)
+            session.flush()
+            session.add(SentimentScore(stock_id=stock.id, score=25.0, total_count=10, trend="down",
+                                       period_start=datetime(2026, 1, 4, 20), period_end=datetime(2026, 1, 5)))
+            session.commit()
+
+        scores = load_scores_db(factory)
+        assert scores[["code", "score", "trend"]].values.tolist() == [["005930", 25.0, "down"]]
+
+
+class TestRules:
+
+    def test_parse(self):
+        assert parse_rule("score<30x2", hold=3) == Rule("score", "<", 30.0, 2, 3)
+        assert parse_rule("grade==E") == Rule("grade", "==", "E", 1, 5)
+        assert parse_rule("trend==down x3").periods == 3
+
+    @pytest.mark.parametrize("text", ["score~30", "price<3", "trend>down", "grade==F", "score<30x0"])
+    def test_invalid(self, text):
+        with pytest.raises(ValueError):
+            parse_rule(text)
+
+
+class TestBacktest:
+
+    def test_entries_need_fresh_streak(self):
+        prices = _prices({"005930": [100] * 8})
+        bt = Backtest(prices, _scores("005930", [50, 25, 25, 25, 50, 25, 25, 25]))
+        entries = bt.entries(parse_rule("score<30x2"))[:, 0]
+        assert np.flatnonzero(entries).tolist() == [2, 6]
+        assert np.flatnonzero(bt.entries(parse_rule("score<30"))[:, 0]).tolist() == [1, 5]
+
+    def test_trade_returns_hit_rate_and_drawdown(self):
+        # A: 1일 진입 → 2일 뒤 +10%, B: 1일 진입 → 2일 뒤 -20%
+        prices = _prices({"A": [100, 100, 105, 110, 110], "B": [100, 100, 90, 80, 80]})
+        scores = pd.concat([_scores("A", [50, 20, 50, 50, 50]), _scores("B", [50, 20, 50, 50, 50])])
+        result = Backtest(prices, scores).run(Rule("score", "<", 30.0, 1, 2))
+
+        assert result.trades == 2
+        assert result.hit_rate == 0.5
+        assert result.avg_return == pytest.approx(-0.05)
+        # 포트폴리오: 2일 (5% - 10%)/2, 3일 (4.76% - 11.1%)/2
+        expected = (1 + (0.05 - 0.10) / 2) * (1 + (110 / 105 - 1 + 80 / 90 - 1) / 2) - 1
+        assert result.total_return == pytest.approx(expected)
+        assert result.max_drawdown == pytest.approx(expected)
+        assert result.exposure == pytest.approx(2 / 5)
+
+        short = Backtest(prices, scores).run(Rule("score", "<", 30.0, 1, 2, side="short"))
+        assert short.avg_return == pytest.approx(0.05)
+
+    def test_missing_values_never_match(self):
+        prices = _prices({"A": [100] * 4, "B": [100] * 4})
+        scores = _scores("A", [50, 50, 50, 50], trend=["up"] * 4)
+        bt = Backtest(prices, scores)
+        assert not bt.condition(parse_rule("trend!=down"))[:, 1].any()
+        assert not bt.condition(parse_rule("grade!=A"))[:, 1].any()
+        assert bt.condition(parse_rule("grade==C"))[:, 0].all()
+
+    def test_full_universe_sweep_is_fast(self):
+        prices, scores = synthetic_universe(stocks=200, days=2500, seed=3)
+        bt = Backtest(prices, scores)
+        started = time.perf_counter()
+        frame = bt.sweep(values=(20, 25, 30, 35, 40), periods=(1, 2, 3), holds=(1, 5, 20))
+        assert time.perf_counter() - started < 10.0
+        assert frame["excess_return"].is_monotonic_decreasing
+        assert (frame["trades"] >= 30).all()
+        # 합성 데이터에는 저점수 이후 반등 효과를 심어둠
+        assert bt.run("score<30").excess_return > 0
+
+
+class TestCLI:
+
+    def test_json_output(self, capsys, tmp_path):
+        from app.tools.backtest import main
+
+        prices, scores = synthetic_universe(stocks=5, days=60, seed=1)
+        prices.reset_index(names="date").melt(id_vars="date", var_name="code", value_name="close") \
+            .to_csv(tmp_path / "prices.csv", index=False)
+        scores.to_csv(tmp_path / "scores.csv", index=False)
+
+        assert main(["--prices", str(tmp_path / "prices.csv"), "--scores", str(tmp_path / "scores.csv"),
+                     "--rule", "score<45", "--rule", "trend==down", "--json"]) == 0
+        rows = json.loads(capsys.readouterr().out)
+        assert [r["rule"] for r in rows] == ["score<45x1 hold5", "trend==downx1 hold5"]
+        assert Backtest(prices, scores).run("score<45").to_dict() == rows[0]
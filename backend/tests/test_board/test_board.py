@@ -0,0 +1,75 @@
+"""
+종목 보드 TDD 테스트
+실행: pytest backend/tests/test_board/ -v
+"""
+import pytest
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "../../.."))
+
+from app.board import StockBoard, SORT_KEYS
+from app.board.mock import mock_rows, mock_sentiment_row
+from app.cache import current_generation
+
+
+def _row(code, name, score, trend):
+    return {"code": code, "name": name, "score": score, "trend": trend}
+
+
+ROWS = [
+    _row("000001", "가나", 60.0, "up"),
+    _row("000002", "다라", 30.0, "down"),
+    _row("000003", "마바", 50.0, "neutral"),
+    _row("000004", "사아", 70.0, "up"),
+]
+
+
+@pytest.fixture
+def board():
+    return StockBoard(loader=lambda: ROWS)
+
+
+class TestStockBoard:
+
+    def test_orderings(self, board):
+        snap = board.snapshot
+        assert [r["score"] for r in snap.ordered("score_desc")] == [30.0, 50.0, 60.0, 70.0]
+        assert [r["score"] for r in snap.ordered("score_asc")] == [70.0, 60.0, 50.0, 30.0]
+        assert [r["name"] for r in snap.ordered("name")] == ["가나", "다라", "마바", "사아"]
+        assert [r["code"] for r in snap.ordered("trend_up")] == ["000001", "000004", "000002", "000003"]
+        assert snap.ordered("trend_down")[0]["code"] == "000002"
+        assert set(snap.orderings) == set(SORT_KEYS)
+
+    def test_page_slices(self, board):
+        total, rows = board.snapshot.page("score_desc", page=2, size=3)
+        assert total == 4
+        assert [r["code"] for r in rows] == ["000004"]
+
+    def test_page_with_search(self, board):
+        total, rows = board.snapshot.page("score_asc", 1, 10, search="ㄱㄴ")
+        assert total == 1
+        assert rows[0]["code"] == "000001"
+
+    def test_refresh_swaps_and_bumps_generation(self, board):
+        old = board.snapshot
+        before = current_generation()
+        new = board.refresh([_row("000009", "자차", 40.0, "down")])
+        assert board.snapshot is new
+        assert new.generation == before + 1 == current_generation()
+        # 이전 스냅샷은 그대로 (읽는 중인 요청 보호)
+        assert len(old) == 4 and len(new) == 1
+
+    def test_refresh_notifies_listeners(self, board):
+        seen = []
+        board.subscribe(lambda prev, snap: seen.append((prev, snap)))
+        board.subscribe(lambda prev, snap: 1 / 0)  # 실패해도 다른 리스너/갱신에 영향 없음
+        first = board.snapshot
+        new = board.refresh(ROWS)
+        assert seen == [(first, new)]
+
+
+class TestMockRows:
+
+    def test_mock_rows_are_deterministic(self):
+        assert mock_sentiment_row("005930", "삼성전자")["score"] == mock_sentiment_row("005930", "삼성전자")["score"]
+        assert len(mock_rows()) >= 50
@@ -0,0 +1,115 @@
+"""
+컬럼형 바이너리 응답 TDD 테스트
+실행: pytest backend/tests/test_board/ -v
+"""
+import pytest
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "../../.."))
+
+from fastapi.testclient import TestClient
+
+from app.board.columnar import MEDIA_TYPE, MISSING, accepts_columnar, decode, encode_history, encode_stocks
+from app.main import app, response_cache
+
+COLUMNAR = {"Accept": MEDIA_TYPE}
+
+
+@pytest.fixture
+def client():
+    response_cache.clear()
+    return TestClient(app)
+
+
+def _stock(code, score, spark=()):
+    return {
+        "code": code, "name": f"종목{code}", "sector": "반도체", "score": score, "grade": "C", "emoji": "😐",
+        "trend": "neutral", "score_change": -3.4, "positive_count": 3, "negative_count": 2, "neutral_count": 1,
+        "total_count": 6, "updated_at": "2025-03-03T09:00:05", "spark": list(spark),
+    }
+
+
+class TestCodec:
+
+    def test_history_round_trip(self):
+        history = [{"date": "2025-03-01", "score": 49.5}, {"date": "2025-03-02", "score": 81.2},
+                   {"date": "2025-03-04", "score": 10.0}]
+        data = encode_history("005930", history)
+        decoded = decode(data)
+        assert decoded["header"]["base_date"] == "2025-03-01"
+        assert decoded["columns"]["day"] == [0, 1, 3]
+        assert decoded["columns"]["score"] == [49.5, 81.2, 10.0]
+
+    def test_columns_aligned_for_typed_arrays(self):
+        data = encode_stocks(2, 1, 50, [_stock("005930", 55.5), _stock("000660", 40.1)])
+        header = decode(data)["header"]
+        base = 8 + int.from_bytes(data[4:8], "little")
+        assert base % 4 == 0
+        assert all((base + c["offset"]) % 4 == 0 for c in header["columns"])
+
+    def test_stocks_with_sparkline_matrix(self):
+        spark_a = [{"date": "2025-03-01", "score": 50.0}, {"date": "2025-03-02", "score": 52.3}]
+        spark_b = [{"date": "2025-03-02", "score": 30.5}]
+        stocks = [_stock("005930", 55.5, spark_a), _stock("000660", 40.1, spark_b)]
+        decoded = decode(encode_stocks(2, 1, 50, stocks, spark_days=2))
+        columns = decoded["columns"]
+        assert decoded["header"]["spark"] == {"base_date": "2025-03-01", "days": 2}
+        assert columns["code"] == ["005930", "000660"]
+        assert columns["name"] == ["종목005930", "종목000660"]
+        assert columns["score"] == [55.5, 40.1]
+        assert columns["score_change"] == [-3.4, -3.4]
+        assert columns["trend"] == ["neutral", "neutral"]
+        assert columns["spark"] == [50.0, 52.3, None, 30.5]
+
+    def test_empty_page(self):
+        decoded = decode(encode_stocks(0, 3, 50, [], spark_days=7))
+        assert decoded["header"]["rows"] == 0
+        assert decoded["columns"]["code"] == []
+
+    def test_accept_negotiation(self):
+        assert accepts_columnar(f"{MEDIA_TYPE}, application/json;q=0.5")
+        assert not accepts_columnar(f"{MEDIA_TYPE};q=0")
+        assert not accepts_columnar(f"{MEDIA_TYPE}; q=0.000")
+        assert accepts_columnar(f"{MEDIA_TYPE};q=0.1")
+        assert not accepts_columnar("application/json")
+        assert not accepts_columnar(None)
+        assert MISSING == 0xFFFF
+
+
+class TestColumnarAPI:
+
+    def test_stocks_match_json(self, client):
+        rows = client.get("/api/stocks/?size=20&spark=7").json()["stocks"]
+        res = client.get("/api/stocks/?size=20&spark=7", headers=COLUMNAR)
+        assert res.headers["content-type"] == MEDIA_TYPE
+        columns = decode(res.content)["columns"]
+        assert columns["code"] == [r["code"] for r in rows]
+        assert columns["score"] == [r["score"] for r in rows]
+        assert columns["score_change"] == [r["score_change"] for r in rows]
+        assert columns["spark"] == [p["score"] for r in rows for p in r["spark"]]
+        json_size = len(client.get("/api/stocks/?size=20&spark=7").content)
+        assert len(res.content) < json_size / 2
+
+    def test_history(self, client):
+        history = client.get("/api/sentiment/005930/history?days=365").json()["history"]
+        decoded = decode(client.get("/api/sentiment/005930/history?days=365", headers=COLUMNAR).content)
+        assert decoded["columns"]["score"] == [h["score"] for h in history]
+        assert decoded["columns"]["day"] == list(range(365))
+
+    def test_cache_varies_by_accept(self, client):
+        json_res = client.get("/api/stocks/?size=5")
+        binary = client.get("/api/stocks/?size=5", headers=COLUMNAR)
+        assert binary.headers["x-cache"] == "MISS"
+        assert binary.content.startswith(b"GKC1")
+        assert client.get("/api/stocks/?size=5", headers=COLUMNAR).headers["x-cache"] == "HIT"
+        again = client.get("/api/stocks/?size=5")
+        assert again.headers["x-cache"] == "HIT"
+        assert again.json() == json_res.json()
+        assert "Accept" in binary.headers["vary"]
+
+    def test_refused_columnar_does_not_poison_cache(self, client):
+        refused = client.get("/api/stocks/?size=5", headers={"Accept": f"{MEDIA_TYPE};q=0"})
+        assert refused.headers["content-type"].startswith("application/json")
+        binary = client.get("/api/stocks/?size=5", headers=COLUMNAR)
+        assert binary.headers["content-type"] == MEDIA_TYPE
+        assert binary.content.startswith(b"GKC1")
@@ -0,0 +1,66 @@
+"""
+DB 점수 → 보드 행 TDD 테스트
+실행: pytest backend/tests/test_board/ -v
+"""
+import pytest
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "../../.."))
+
+from datetime import datetime, timedelta
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.board.mock import mock_rows
+from app.board.scores import get_row_source, latest_score_rows
+from app.models import Base, SentimentScore, Stock
+
+T0 = datetime(2025, 3, 3, 9, 0)
+
+
+@pytest.fixture
+def factory():
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(engine)
+    return sessionmaker(bind=engine)
+
+
+def _score(stock_id, score, end, **counts):
+    return SentimentScore(stock_id=stock_id, score=score, trend="up" if score > 55 else "neutral",
+                          score_change=1.5, period_start=end - timedelta(hours=4), period_end=end, **counts)
+
+
+class TestLatestScoreRows:
+
+    def test_latest_period_per_active_stock(self, factory):
+        with factory() as session:
+            session.add_all([
+                Stock(id=1, code="005930", name="삼성전자", sector="반도체"),
+                Stock(id=2, code="000660", name="SK하이닉스"),
+                Stock(id=3, code="035720", name="카카오", is_active=0),
+                Stock(id=4, code="035420", name="NAVER"),  # 아직 점수 없음
+            ])
+            session.add_all([
+                _score(1, 40.0, T0),
+                _score(1, 72.5, T0 + timedelta(hours=4), positive_count=5, negative_count=1, total_count=6),
+                _score(2, 50.0, T0),
+                _score(3, 90.0, T0),
+            ])
+            session.commit()
+
+        rows = latest_score_rows(factory)
+        assert [r["code"] for r in rows] == ["000660", "005930"]
+        samsung = rows[1]
+        assert samsung["score"] == 72.5
+        assert (samsung["grade"], samsung["emoji"], samsung["trend"]) == ("B", "🔥", "up")
+        assert (samsung["positive_count"], samsung["total_count"]) == (5, 6)
+        assert samsung["sector"] == "반도체"
+        assert samsung["updated_at"] == (T0 + timedelta(hours=4)).isoformat()
+        assert set(samsung) == set(mock_rows()[0])  # 목업과 같은 행 모양
+        assert rows[0]["sector"] == ""
+
+    def test_row_source_setting(self, factory):
+        assert get_row_source("mock") is mock_rows
+        assert get_row_source("database", factory)() == []
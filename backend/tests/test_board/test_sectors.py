@@ -0,0 +1,111 @@
+"""
+업종 / 시장 집계 TDD 테스트
+실행: pytest backend/tests/test_board/ -v
+"""
+import pytest
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "../../.."))
+
+from fastapi.testclient import TestClient
+
+from app.board import BoardSnapshot
+from app.board.mock import mock_rows
+from app.board.sectors import SectorAggregates, SectorBoard
+
+
+def _row(code, sector, score, total, trend="neutral"):
+    return {
+        "code": code, "name": code, "sector": sector, "score": score, "trend": trend,
+        "total_count": total, "positive_count": total // 2, "negative_count": total // 4,
+        "neutral_count": total - total // 2 - total // 4,
+    }
+
+
+ROWS = [
+    _row("A1", "반도체", 80.0, 30, "up"),
+    _row("A2", "반도체", 40.0, 10, "down"),
+    _row("B1", "금융", 25.0, 20, "down"),
+    _row("C1", "", 50.0, 0),
+]
+
+
+def _by_sector(payload):
+    return {s["sector"]: s for s in payload["sectors"]}
+
+
+class TestSectorAggregates:
+
+    def test_weighted_by_comment_volume(self):
+        payload = SectorAggregates(ROWS).payload()
+        semi = _by_sector(payload)["반도체"]
+        assert semi["score"] == 70.0         # (80*30 + 40*10) / 40
+        assert semi["avg_score"] == 60.0
+        assert semi["stock_count"] == 2
+        assert semi["comment_count"] == 40
+        assert semi["hot_count"] == 1
+        assert semi["up_count"] == 1 and semi["down_count"] == 1
+        assert semi["trend"] == "up"
+
+    def test_unclassified_and_zero_weight(self):
+        other = _by_sector(SectorAggregates(ROWS).payload())["기타"]
+        assert other["score"] == 50.0  # 댓글이 없으면 단순 평균
+        assert other["comment_count"] == 0
+
+    def test_market_matches_python_reference(self):
+        rows = mock_rows()
+        market = SectorAggregates(rows).payload()["market"]
+        total = sum(r["total_count"] for r in rows)
+        expected = sum(r["score"] * r["total_count"] for r in rows) / total
+        assert market["score"] == round(expected, 1)
+        assert market["stock_count"] == len(rows)
+        assert market["hot_count"] == sum(r["score"] >= 70 for r in rows)
+        assert market["cold_count"] == sum(r["score"] <= 30 for r in rows)
+
+    def test_incremental_update_equals_full_rebuild(self):
+        state = SectorAggregates(ROWS)
+        before = _by_sector(state.payload())
+        changed = [dict(r) for r in ROWS]
+        changed[2] = _row("B1", "금융", 65.0, 50, "up")
+
+        touched = state.update(changed)
+        assert [state.sectors[i] for i in touched] == ["금융"]
+        after = _by_sector(state.payload())
+        assert after["반도체"] is before["반도체"]  # 바뀌지 않은 업종은 재사용
+        assert state.payload() == SectorAggregates(changed).payload()
+
+
+class TestSectorBoard:
+
+    def test_per_generation_and_incremental(self):
+        sectors = SectorBoard()
+        first = sectors.for_snapshot(BoardSnapshot(ROWS, generation=1))
+        assert sectors.for_snapshot(BoardSnapshot(ROWS, generation=1)) is first
+
+        changed = [dict(r, score=r["score"] + 1) if r["code"] == "A2" else r for r in ROWS]
+        second = sectors.for_snapshot(BoardSnapshot(changed, generation=2))
+        assert second["generation"] == 2
+        assert sectors.stats() == {"full_builds": 1, "incremental_updates": 1}
+
+        # 종목 구성이 바뀌면 전체 재계산
+        sectors.for_snapshot(BoardSnapshot(ROWS[:3], generation=3))
+        assert sectors.stats()["full_builds"] == 2
+
+
+class TestSectorsAPI:
+
+    @pytest.fixture
+    def client(self):
+        from app.main import app
+        return TestClient(app)
+
+    def test_sectors_endpoint_cached(self, client):
+        first = client.get("/api/sectors")
+        assert first.status_code == 200
+        data = first.json()
+        assert data["market"]["stock_count"] == sum(s["stock_count"] for s in data["sectors"])
+        assert "반도체" in {s["sector"] for s in data["sectors"]}
+
+        second = client.get("/api/sectors")
+        assert second.headers["x-cache"] == "HIT"
+        assert client.get("/api/sectors", headers={"If-None-Match": second.headers["etag"]}).status_code == 304
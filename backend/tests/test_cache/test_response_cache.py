@@ -0,0 +1,88 @@
+"""
+응답 캐시 TDD 테스트
+실행: pytest backend/tests/test_cache/ -v
+"""
+import pytest
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "../../.."))
+
+from fastapi.testclient import TestClient
+
+from app.main import app, response_cache
+from app.cache import bump_generation, current_generation
+from app.cache.response_cache import ResponseCache, ResponseCacheMiddleware, build_entry, etag_matches
+
+
+@pytest.fixture
+def client():
+    response_cache.clear()
+    return TestClient(app)
+
+
+class TestResponseCache:
+
+    def test_second_request_is_hit(self, client):
+        first = client.get("/api/stocks/?size=5")
+        second = client.get("/api/stocks/?size=5")
+        assert first.headers["x-cache"] == "MISS"
+        assert second.headers["x-cache"] == "HIT"
+        assert first.content == second.content
+        assert first.headers["etag"] == second.headers["etag"]
+
+    def test_query_order_shares_entry(self, client):
+        client.get("/api/stocks/?size=5&page=1")
+        res = client.get("/api/stocks/?page=1&size=5")
+        assert res.headers["x-cache"] == "HIT"
+
+    def test_if_none_match_returns_304(self, client):
+        etag = client.get("/api/share/005930").headers["etag"]
+        res = client.get("/api/share/005930", headers={"If-None-Match": etag})
+        assert res.status_code == 304
+        assert res.content == b""
+        assert res.headers["etag"] == etag
+
+    def test_generation_bump_invalidates(self, client):
+        client.get("/api/sentiment/005930/history?days=7")
+        bump_generation()
+        res = client.get("/api/sentiment/005930/history?days=7")
+        assert res.headers["x-cache"] == "MISS"
+
+    def test_gzip_precompressed(self, client):
+        client.get("/api/stocks/")
+        res = client.get("/api/stocks/", headers={"Accept-Encoding": "gzip"})
+        assert res.headers["content-encoding"] == "gzip"
+        assert res.json()["total"] > 0
+
+    def test_errors_not_cached(self, client):
+        first = client.get("/api/stocks/?page=0")
+        second = client.get("/api/stocks/?page=0")
+        assert first.status_code == second.status_code == 422
+        assert "x-cache" not in second.headers
+
+    def test_uncached_route_passthrough(self, client):
+        res = client.get("/health")
+        assert "x-cache" not in res.headers
+
+    def test_discard_drops_matching_keys(self):
+        cache = ResponseCache()
+        entry, generation = build_entry(200, [], b"{}"), current_generation()
+        for key in ("/api/stocks/005930?", "/api/stocks/000660?"):
+            cache.put(key, generation, entry)
+        discards = cache.discards  # 렌더링 시작 전에 읽은 값
+
+        assert cache.discard(lambda key: "005930" in key) == 1
+        assert cache.get("/api/stocks/005930?", generation) is None
+        assert cache.get("/api/stocks/000660?", generation) is entry
+        # 렌더링 도중 무효화가 있었으면 그 응답은 저장하지 않음
+        cache.put("/api/stocks/005930?", generation, entry, discards)
+        assert cache.get("/api/stocks/005930?", generation) is None
+
+    def test_cache_key_sorted(self):
+        key = ResponseCacheMiddleware.cache_key({"path": "/a", "query_string": b"b=2&a=1"})
+        assert key == "/a?a=1&b=2"
+
+    def test_etag_matches(self):
+        assert etag_matches('W/"abc", "def"', '"def"')
+        assert etag_matches("*", '"x"')
+        assert not etag_matches(None, '"x"')
@@ -0,0 +1,108 @@
+"""
+동일 요청 병합 (single-flight) TDD 테스트
+실행: pytest backend/tests/test_cache/ -v
+"""
+import asyncio
+import pytest
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "../../.."))
+
+from app.cache import SingleFlight, singleflight_stats
+
+
+def _slow(counter, value="v", delay=0.02):
+    async def fn():
+        counter.append(1)
+        await asyncio.sleep(delay)
+        return value
+    return fn
+
+
+class TestSingleFlight:
+
+    def test_concurrent_calls_share_one_execution(self):
+        flight = SingleFlight("test_share")
+        runs = []
+
+        async def scenario():
+            return await asyncio.gather(*[flight.do("k", _slow(runs)) for _ in range(100)])
+
+        results = asyncio.run(scenario())
+        assert results == ["v"] * 100
+        assert len(runs) == 1
+        assert flight.stats()["coalesced"] == 99
+        assert flight.stats()["executions"] == 1
+
+    def test_different_keys_run_separately(self):
+        flight = SingleFlight("test_keys")
+        runs = []
+
+        async def scenario():
+            return await asyncio.gather(flight.do("a", _slow(runs, "a")), flight.do("b", _slow(runs, "b")))
+
+        assert asyncio.run(scenario()) == ["a", "b"]
+        assert len(runs) == 2
+
+    def test_no_grace_runs_again_after_completion(self):
+        flight = SingleFlight("test_nograce")
+        runs = []
+
+        async def scenario():
+            await flight.do("k", _slow(runs, delay=0))
+            await flight.do("k", _slow(runs, delay=0))
+
+        asyncio.run(scenario())
+        assert len(runs) == 2
+
+    def test_grace_window_reuses_result(self):
+        flight = SingleFlight("test_grace", grace=60)
+        runs = []
+
+        async def scenario():
+            await flight.do("k", _slow(runs, delay=0))
+            return await flight.do("k", _slow(runs, "new", delay=0))
+
+        assert asyncio.run(scenario()) == "v"
+        assert len(runs) == 1
+        assert flight.stats()["grace_hits"] == 1
+
+    def test_exception_propagates_to_all_and_is_not_cached(self):
+        flight = SingleFlight("test_error", grace=60)
+
+        async def boom():
+            await asyncio.sleep(0.01)
+            raise ValueError("x")
+
+        async def scenario():
+            return await asyncio.gather(*[flight.do("k", boom) for _ in range(3)], return_exceptions=True)
+
+        results = asyncio.run(scenario())
+        assert all(isinstance(r, ValueError) for r in results)
+
+        runs = []
+        assert asyncio.run(flight.do("k", _slow(runs, delay=0))) == "v"
+
+    def test_cancelled_leader_does_not_fail_followers(self):
+        flight = SingleFlight("test_cancel", grace=60)
+        runs = []
+
+        async def scenario():
+            leader = asyncio.ensure_future(flight.do("k", _slow(runs, delay=0.05)))
+            await asyncio.sleep(0)
+            followers = [asyncio.ensure_future(flight.do("k", _slow(runs))) for _ in range(3)]
+            await asyncio.sleep(0.01)
+            leader.cancel()  # 첫 요청의 클라이언트 연결 끊김
+            results = await asyncio.gather(*followers)
+            with pytest.raises(asyncio.CancelledError):
+                await leader
+            return results, await flight.do("k", _slow(runs, "new"))
+
+        results, later = asyncio.run(scenario())
+        assert results == ["v"] * 3
+        assert later == "v"  # 취소와 무관하게 완료된 결과는 grace 동안 재사용
+        assert len(runs) == 1
+
+    def test_stats_registry(self):
+        SingleFlight("test_registry")
+        assert "test_registry" in singleflight_stats()
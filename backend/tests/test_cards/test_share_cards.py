@@ -0,0 +1,130 @@
+"""
+공유 카드 렌더러/캐시 TDD 테스트
+실행: pytest backend/tests/test_cards/ -v
+"""
+import struct
+import zlib
+import pytest
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "../../.."))
+
+from fastapi.testclient import TestClient
+
+from app.board import StockBoard, get_board
+from app.cards import ShareCardStore, card_key, card_url, render_card
+from app.cards.renderer import WIDTH, HEIGHT
+from app.main import app
+
+
+def _row(code="005930", score=72.4, grade="B", emoji="🔥", trend="up"):
+    return {"code": code, "name": code, "score": score, "grade": grade, "emoji": emoji,
+            "trend": trend, "score_change": 0.0}
+
+
+@pytest.fixture
+def store(tmp_path):
+    s = ShareCardStore(tmp_path, workers=2)
+    yield s
+    s.shutdown()
+
+
+class TestRenderer:
+
+    def test_valid_png(self):
+        png = render_card(_row())
+        assert png.startswith(b"\x89PNG\r\n\x1a\n")
+        width, height = struct.unpack(">II", png[16:24])
+        assert (width, height) == (WIDTH, HEIGHT)
+        # IDAT 압축 해제 크기 = 높이 × (필터 1바이트 + 폭 × 3)
+        idat_len = struct.unpack(">I", png[33:37])[0]
+        raw = zlib.decompress(png[41:41 + idat_len])
+        assert len(raw) == HEIGHT * (1 + WIDTH * 3)
+
+    def test_card_key_depends_on_content(self):
+        assert card_key(_row()) == card_key(_row())
+        assert card_key(_row()) != card_key(_row(score=72.5))
+        assert card_key(_row()) != card_key(_row(grade="C"))
+        assert card_url(_row()).endswith(f"og_005930.{card_key(_row())}.png")
+
+
+class TestShareCardStore:
+
+    def test_rerenders_only_changed_cards(self, store):
+        board = StockBoard()
+        board.subscribe(store.on_board_refresh)
+        board.refresh([_row("000001"), _row("000002")])
+        for row in board.snapshot.rows:
+            store.get(row)
+        assert store.rendered == 2
+
+        board.refresh([_row("000001"), _row("000002", score=30.0, grade="D", emoji="📉", trend="down")])
+        store.get(board.snapshot.get("000002"))
+        assert store.rendered == 3
+        assert store.skipped == 1
+
+    def test_directory_created_on_first_render(self, tmp_path):
+        store = ShareCardStore(tmp_path / "cards")
+        try:
+            assert not store.directory.exists()
+            assert store.get(_row()).exists()
+        finally:
+            store.shutdown()
+
+    def test_get_renders_on_demand(self, store):
+        path = store.get(_row())
+        assert path.exists()
+        assert path.read_bytes().startswith(b"\x89PNG")
+
+    def test_prune_keeps_previous_card(self, store):
+        first = store.get(_row(score=10.0, grade="E"))
+        second = store.get(_row(score=20.0, grade="E"))
+        third = store.get(_row(score=30.0, grade="D"))
+        assert third.exists() and second.exists()
+        assert not first.exists()
+
+
+class TestShareCardAPI:
+
+    @pytest.fixture(autouse=True)
+    def app_store(self, tmp_path, monkeypatch):
+        """API 가 쓰는 공유 카드 저장소를 테스트 전용 임시 디렉터리로"""
+        from app.cards import store as store_module
+
+        s = ShareCardStore(tmp_path, workers=2)
+        monkeypatch.setattr(store_module, "_store", s)
+        yield s
+        s.shutdown()
+
+    def test_share_payload_points_to_hashed_card(self):
+        client = TestClient(app)
+        row = get_board().snapshot.get("005930")
+        data = client.get("/api/share/005930").json()
+        assert data["kakao_share"]["image_url"].endswith(card_url(row))
+
+    def test_serve_card_with_immutable_cache(self):
+        client = TestClient(app)
+        row = get_board().snapshot.get("005930")
+        res = client.get(card_url(row))
+        assert res.status_code == 200
+        assert res.headers["content-type"] == "image/png"
+        assert "immutable" in res.headers["cache-control"]
+
+    def test_stale_or_unhashed_card_redirects(self):
+        client = TestClient(app)
+        row = get_board().snapshot.get("005930")
+        for name in ("og_005930.png", "og_005930.deadbeef0000.png"):
+            res = client.get(f"/api/share/cards/{name}", follow_redirects=False)
+            assert res.status_code == 302
+            assert res.headers["location"] == card_url(row)
+
+    def test_no_card_url_for_codes_off_board(self):
+        client = TestClient(app)
+        assert card_url(_row("999999")) is None
+        data = client.get("/api/share/999999").json()
+        assert data["kakao_share"]["image_url"] is None
+
+    def test_unknown_card(self):
+        client = TestClient(app)
+        assert client.get("/api/share/cards/og_999999.png").status_code == 404
+        assert client.get("/api/share/cards/evil.txt").status_code == 404
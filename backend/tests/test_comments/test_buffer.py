@@ -0,0 +1,247 @@
+"""
+종목별 최근 댓글 버퍼 TDD 테스트
+실행: pytest backend/tests/test_comments/ -v
+"""
+import pytest
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "../../.."))
+
+from datetime import datetime, timedelta
+
+from fastapi.testclient import TestClient
+
+from app.comments import CommentRing, CommentRecord, CommentTail, CrawlSink, RecentComments, ingest, warm_load
+from app.comments.bulk import CommentWriter
+from app.comments import buffer as buffer_module
+from app.crawler.naver_crawler import CommentData
+from app.sentiment.analyzer import RuleBasedSentimentAnalyzer
+from app.signals import SpikeDetector
+
+T0 = datetime(2026, 1, 5, 9, 0)
+
+
+def _factory():
+    """종목 마스터에 삼성전자만 있는 인메모리 SQLite"""
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import sessionmaker
+    from sqlalchemy.pool import StaticPool
+    from app.models import Base, Stock
+
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(engine)
+    factory = sessionmaker(bind=engine)
+    with factory() as session:
+        session.add(Stock(code="005930", name="삼성전자"))
+        session.commit()
+    return factory
+
+
+def _crawled():
+    """토론방 목록 순서 (최신순)"""
+    return [
+        CommentData("005930", "naver_discuss", "폭락 손절합니다", author="a", posted_at=T0 + timedelta(minutes=2)),
+        CommentData("005930", "naver_discuss", "급등 기대 매수", author="b", posted_at=T0 + timedelta(minutes=1)),
+        CommentData("005930", "naver_discuss", "그냥 보는중", author="c", posted_at=T0),
+    ]
+
+
+def _record(i: int) -> CommentRecord:
+    return CommentRecord(i, f"댓글 {i}", f"user{i}", 0, "neutral", "naver_discuss", T0.timestamp())
+
+
+@pytest.fixture
+def shared_buffer():
+    """공유 버퍼를 테스트 전용으로 교체 (응답 캐시 무효화 등 구독자는 그대로)"""
+    saved = buffer_module._recent
+    buffer_module._recent = RecentComments(capacity=10)
+    for listener in saved._listeners if saved is not None else []:
+        buffer_module._recent.subscribe(listener)
+    yield buffer_module._recent
+    buffer_module._recent = saved
+
+
+class TestCommentRing:
+
+    def test_overwrites_oldest_and_reads_newest_first(self):
+        ring = CommentRing(3)
+        evicted = [ring.push(_record(i)) for i in range(1, 6)]
+        assert [r.id if r else None for r in evicted] == [None, None, None, 1, 2]
+        assert len(ring) == 3
+        assert [r.id for r in ring.newest()] == [5, 4, 3]
+        assert [r.id for r in ring.newest(1, 1)] == [4]
+        assert ring.newest(5, 10) == []
+        assert ("user2", "댓글 2") not in ring
+        assert ("user5", "댓글 5") in ring
+
+    def test_records_use_slots(self):
+        assert not hasattr(_record(1), "__dict__")
+
+
+class TestRecentComments:
+
+    def test_skips_recrawled_comments(self):
+        recent = RecentComments(capacity=2)
+        assert recent.add("005930", "같은 글", "개미")
+        assert not recent.add("005930", "같은 글", "개미")
+        assert recent.add("000660", "같은 글", "개미")  # 종목이 다르면 별개
+        recent.add("005930", "a", "x")
+        recent.add("005930", "b", "x")  # '같은 글' 이 밀려남
+        assert recent.add("005930", "같은 글", "개미")
+        assert recent.stats()["skipped_duplicates"] == 1
+
+    def test_memory_is_bounded(self):
+        recent = RecentComments(capacity=5, max_stocks=3, max_chars=20)
+        for i in range(200):
+            recent.add(f"{i // 20 % 7:06d}", "긴 댓글 " * 50 + str(i), f"user{i}", sentiment="부정")
+        stats = recent.stats()
+        assert stats["stocks"] == 3
+        assert stats["comments"] == 15 == stats["max_comments"]
+        assert stats["evicted_stocks"] > 0
+
+        total, comments = recent.page(f"{199 // 20 % 7:06d}", size=10)
+        assert total == 5
+        assert len(comments[0]["content"]) == 20
+        assert comments[0]["sentiment"] == "negative"
+
+        # 증분 계산한 메모리 = 남아 있는 레코드 합
+        expected = sum(r.nbytes() for ring in recent._rings.values() for r in ring.records())
+        assert stats["bytes"] - sys.getsizeof([None] * 5) * 3 == expected
+
+
+class TestIngest:
+
+    def test_fills_buffer_and_detector(self):
+        recent = RecentComments(capacity=10)
+        detector = SpikeDetector()
+        crawled = [
+            CommentData("005930", "naver_discuss", "폭락 손절합니다", author="a", crawled_at=T0 + timedelta(minutes=2)),
+            CommentData("005930", "naver_discuss", "급등 기대 매수", author="b", crawled_at=T0 + timedelta(minutes=1)),
+            CommentData("005930", "naver_discuss", "그냥 보는중", author="c", crawled_at=T0),
+        ]
+        results = ingest(crawled, RuleBasedSentimentAnalyzer(), recent, detector)
+
+        assert [r.label.value for r in results] == ["negative", "positive", "neutral"]
+        _, comments = recent.page("005930")
+        assert [(c["author"], c["sentiment"]) for c in comments] == [("a", "negative"), ("b", "positive"), ("c", "neutral")]
+        assert detector.stats()["observed"] == 3
+
+    def test_warm_load_latest_per_stock(self):
+        from sqlalchemy import create_engine
+        from sqlalchemy.orm import sessionmaker
+        from sqlalchemy.pool import StaticPool
+        from app.models import Base, Comment, CommentSentiment, Stock
+
+        engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+        Base.metadata.create_all(engine)
+        factory = sessionmaker(bind=engine)
+        with factory() as session:
+            stocks = [Stock(code="005930", name="삼성전자"), Stock(code="000660", name="SK하이닉스")]
+            session.add_all(stocks)
+            session.flush()
+            for stock in stocks:
+                for i in range(5):
+                    comment = Comment(stock_id=stock.id, source="naver_discuss", content=f"{stock.code} 댓글 {i}",
+                                      author=f"user{i}", likes=i, crawled_at=T0 + timedelta(minutes=i))
+                    session.add(comment)
+                    session.flush()
+                    if i % 2 == 0:
+                        session.add(CommentSentiment(comment_id=comment.id, score=-0.5, label="부정"))
+            session.commit()
+
+        recent = RecentComments(capacity=10)
+        assert warm_load(recent, factory, per_stock=3) == 6
+        total, comments = recent.page("005930")
+        assert total == 3
+        assert [c["content"] for c in comments] == ["005930 댓글 4", "005930 댓글 3", "005930 댓글 2"]
+        assert [c["sentiment"] for c in comments] == ["negative", "neutral", "negative"]
+        assert comments[0]["crawled_at"] == (T0 + timedelta(minutes=4)).isoformat()
+
+
+class TestCrawlSink:
+
+    def test_saves_then_ingests_only_new_comments(self):
+        factory = _factory()
+        recent, detector = RecentComments(capacity=10), SpikeDetector()
+        sink = CrawlSink(CommentWriter(factory, RuleBasedSentimentAnalyzer(), dedup_index=False), recent, detector)
+
+        results = sink(_crawled())
+        assert [r.label.value for r in results] == ["negative", "positive", "neutral"]
+        assert detector.stats()["observed"] == 3
+        assert sink(_crawled()) == []  # 다시 수집한 글은 감지기에 두 번 안 들어감
+        assert detector.stats()["observed"] == 3
+        assert recent.page("005930")[0] == 3
+
+    def test_without_database_still_ingests(self):
+        class BrokenWriter:
+            def insert(self, comments):
+                raise RuntimeError("DB 없음")
+
+        recent, detector = RecentComments(capacity=10), SpikeDetector()
+        assert len(CrawlSink(BrokenWriter(), recent, detector)(_crawled())) == 3
+        assert detector.stats()["observed"] == 3
+
+
+class TestCommentTail:
+
+    def test_follows_rows_saved_by_another_process(self):
+        factory = _factory()
+        writer = CommentWriter(factory, RuleBasedSentimentAnalyzer(), dedup_index=False)
+        writer.write(_crawled()[2:])  # 꼬리 시작 전 글은 warm_load 몫
+        recent = RecentComments(capacity=10)
+        tail = CommentTail(recent, factory)
+
+        assert tail() == 0
+        writer.write(_crawled()[:2])
+        assert tail() == 2
+        assert tail() == 0
+        _, comments = recent.page("005930")
+        assert [(c["author"], c["sentiment"]) for c in comments] == [("a", "negative"), ("b", "positive")]
+        assert comments[0]["crawled_at"] == (T0 + timedelta(minutes=2)).isoformat()
+
+
+class TestCommentsAPI:
+
+    @pytest.fixture
+    def client(self):
+        from app.main import app
+        return TestClient(app)
+
+    def test_served_from_memory(self, client, shared_buffer):
+        for i in range(12):
+            shared_buffer.add("005930", f"실시간 댓글 {i}", f"user{i}", crawled_at=T0 + timedelta(minutes=i))
+
+        data = client.get("/api/stocks/005930/comments", params={"size": 5}).json()
+        assert data["total"] == 10
+        assert [c["content"] for c in data["comments"]][:2] == ["실시간 댓글 11", "실시간 댓글 10"]
+
+        bundle = client.get("/api/stocks/005930/bundle", params={"fields": "comments"}).json()
+        assert bundle["comments"]["comments"][0]["content"] == "실시간 댓글 11"
+
+    def test_cached_detail_follows_ingest(self, client, shared_buffer):
+        from app.main import response_cache
+        response_cache.clear()
+        shared_buffer.add("005930", "먼저 들어온 댓글", "a", crawled_at=T0)
+        paths = ["/api/stocks/005930", "/api/stocks/005930/bundle?fields=comments",
+                 "/api/stocks/bundle?codes=005930,000660&fields=comments"]
+        for path in paths + ["/api/stocks/000660"]:
+            client.get(path)
+        assert all(client.get(p).headers["x-cache"] == "HIT" for p in paths)
+
+        ingest([CommentData("005930", "naver_discuss", "방금 올라온 댓글", author="b", posted_at=T0 + timedelta(minutes=1))],
+               RuleBasedSentimentAnalyzer(), detector=False)
+
+        detail = client.get(paths[0])
+        assert detail.headers["x-cache"] == "MISS"
+        assert detail.json()["comments"][0]["content"] == "방금 올라온 댓글"
+        bundle = client.get(paths[1]).json()
+        assert bundle["comments"]["comments"][0]["content"] == "방금 올라온 댓글"
+        bundles = client.get(paths[2]).json()["bundles"]
+        assert bundles["005930"]["comments"]["comments"][0]["content"] == "방금 올라온 댓글"
+        # 새 댓글이 없는 종목은 그대로 캐시 적중
+        assert client.get("/api/stocks/000660").headers["x-cache"] == "HIT"
+
+    def test_falls_back_to_mock_for_unbuffered_stock(self, client, shared_buffer):
+        data = client.get("/api/stocks/000660/comments").json()
+        assert data["total"] == 20
+        assert data["comments"][0]["id"] == 1
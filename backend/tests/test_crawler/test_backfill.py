@@ -0,0 +1,350 @@
+"""
+과거 댓글 백필 (구간 병렬 수집 / 체크포인트 재개 / DB 일괄 저장) TDD 테스트
+실행: pytest backend/tests/test_crawler/ -v
+"""
+import threading
+import pytest
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "../../.."))
+
+from collections import Counter
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+from app.crawler.backfill import Backfill, Checkpoint, Chunk, parse_pages, plan_chunks
+from app.crawler.engine import FetchEngine
+from app.crawler.sources import CommentData, SourceAdapter
+
+BOARD_PAGES = {"005930": 23, "000660": 7}  # 종목별 게시판 페이지 수
+PER_PAGE = 3
+BASE_TIME = datetime(2025, 3, 3, 9, 0)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        query = parse_qs(urlsplit(self.path).query)
+        code, page = query["code"][0], int(query["page"][0])
+        with self.server.lock:
+            self.server.requests.append((code, page))
+        if self.path.startswith("/dated"):  # 최신 글이 앞에 오는 게시판 (글 번호 내림차순)
+            posts = self.server.posts[(page - 1) * PER_PAGE:page * PER_PAGE]
+            lines = [f"{post}|{(BASE_TIME + timedelta(minutes=post)).isoformat()}" for post in posts]
+        else:
+            lines = [f"{code} p{page} 댓글{i}" for i in range(PER_PAGE)] if page <= BOARD_PAGES[code] else []
+        body = "\n".join(lines).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture(scope="module")
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    httpd.lock = threading.Lock()
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+
+
+@pytest.fixture(autouse=True)
+def reset_server(server):
+    server.requests = []
+    server.posts = []
+
+
+class LineAdapter(SourceAdapter):
+    name = "board"
+
+    def __init__(self, base_url: str):
+        self.base_url = base_url
+
+    def build_url(self, stock_code, cursor):
+        return f"{self.base_url}/board?code={stock_code}&page={cursor}"
+
+    def parse(self, text, stock_code, url):
+        return [CommentData(stock_code, self.name, line) for line in text.splitlines() if line]
+
+
+class DatedAdapter(LineAdapter):
+    """'글번호|게시 시각' 줄 → 게시 시각이 있는 댓글"""
+    name = "dated"
+
+    def build_url(self, stock_code, cursor):
+        return f"{self.base_url}/dated?code={stock_code}&page={cursor}"
+
+    def parse(self, text, stock_code, url):
+        rows = [line.split("|") for line in text.splitlines() if line]
+        return [CommentData(stock_code, self.name, post, posted_at=datetime.fromisoformat(at)) for post, at in rows]
+
+
+class ListSink:
+    """받은 배치를 쌓아 두는 sink (fail_after 번째 호출부터 예외)"""
+
+    def __init__(self, fail_after=None, fail_on=()):
+        self.comments = []
+        self.calls = 0
+        self.fail_after = fail_after
+        self.fail_on = set(fail_on)
+        self.lock = threading.Lock()
+
+    def __call__(self, batch):
+        with self.lock:
+            self.calls += 1
+            if self.fail_after is not None and self.calls > self.fail_after:
+                raise RuntimeError("DB 연결 끊김")
+            if self.fail_on.intersection(c.content for c in batch):
+                raise RuntimeError("DB 연결 끊김")
+            self.comments.extend(c.content for c in batch)
+
+
+def _expected(code):
+    return {f"{code} p{p} 댓글{i}" for p in range(1, BOARD_PAGES[code] + 1) for i in range(PER_PAGE)}
+
+
+def _backfill(server, path, sink, workers=4, flush_size=6):
+    engine = FetchEngine(rate=0)
+    adapter = LineAdapter(f"http://127.0.0.1:{server.server_port}")
+    return Backfill(engine, [adapter], Checkpoint(path), sink, workers=workers, flush_size=flush_size)
+
+
+class TestPlan:
+
+    def test_chunks_cover_range_front_first(self):
+        chunks = plan_chunks(["board"], ["005930", "000660"], 1, 25, 10)
+        assert chunks[:2] == [Chunk("board", "005930", 1, 10), Chunk("board", "000660", 1, 10)]
+        assert chunks[-1] == Chunk("board", "000660", 21, 25)
+        assert len(chunks) == 6
+
+    def test_parse_pages(self):
+        assert parse_pages("1-3000") == (1, 3000)
+        assert parse_pages("500") == (1, 500)
+        with pytest.raises(ValueError):
+            parse_pages("10-5")
+
+
+class TestBackfill:
+
+    def test_fetches_every_page_once_and_stops_at_board_end(self, server, tmp_path):
+        sink = ListSink()
+        backfill = _backfill(server, str(tmp_path / "ckpt.jsonl"), sink)
+        report = backfill.run(plan_chunks(["board"], list(BOARD_PAGES), 1, 100, 5))
+        backfill.checkpoint.close()
+
+        assert Counter(sink.comments) == Counter(_expected("005930") | _expected("000660"))
+        assert report.errors == 0
+        assert report.comments == len(sink.comments)
+        assert backfill.checkpoint.ends == {("board", "005930"): 23, ("board", "000660"): 7}
+        # 끝 페이지 뒤 구간은 요청 없이 건너뛰거나 빈 페이지 하나에서 멈춤
+        pages = Counter(server.requests)
+        assert all(n == 1 for n in pages.values())
+        assert max(p for code, p in server.requests if code == "000660") <= 10
+        assert report.skipped > 0
+
+    def test_resumes_after_crash_without_refetching(self, server, tmp_path):
+        path = str(tmp_path / "ckpt.jsonl")
+        chunks = plan_chunks(["board"], ["005930"], 1, 23, 8)
+
+        crashed = ListSink(fail_after=3)
+        first = _backfill(server, path, crashed, workers=1)
+        report = first.run(chunks)
+        first.checkpoint.close()
+        assert report.errors > 0
+        saved = set(crashed.comments)
+        fetched_before = list(server.requests)
+
+        server.requests = []
+        resumed = ListSink()
+        second = _backfill(server, path, resumed, workers=2)
+        report = second.run(chunks)
+        second.checkpoint.close()
+
+        assert report.errors == 0
+        assert saved.isdisjoint(resumed.comments)  # 저장된 댓글은 다시 저장하지 않음
+        assert Counter(crashed.comments + resumed.comments) == Counter(_expected("005930"))
+        saved_pages = {("005930", int(c.split()[1][1:])) for c in saved}
+        assert saved_pages.isdisjoint(server.requests)  # 저장된 페이지는 다시 요청하지 않음
+        # 다시 요청한 것은 실패한 구간마다 저장 못 한 배치 하나 (flush_size 6 = 2쪽) 뿐
+        assert len(fetched_before) + len(server.requests) <= 23 + 3 * 2
+
+        server.requests = []
+        third = _backfill(server, path, ListSink())
+        assert third.run(chunks).pages == 0
+        third.checkpoint.close()
+
+    def _crash_then_resume(self, server, tmp_path, change):
+        """
+        글 30개 (10쪽) 를 5쪽씩 두 구간으로 백필 - 앞 구간은 3쪽 저장에서 죽고 뒤 구간은 완료
+        → 게시판을 change 로 바꾼 뒤 재개 → (처음 저장한 글 번호, 재개 때 저장한 글 번호)
+        """
+        server.posts = list(range(29, -1, -1))
+        path = str(tmp_path / "ckpt.jsonl")
+        chunks = plan_chunks(["dated"], ["005930"], 1, 10, 5)
+        adapter = DatedAdapter(f"http://127.0.0.1:{server.server_port}")
+
+        crashed = ListSink(fail_on={"23"})
+        with Checkpoint(path) as checkpoint:
+            report = Backfill(FetchEngine(rate=0), [adapter], checkpoint, crashed, workers=1, flush_size=3).run(chunks)
+        assert report.errors == 1
+
+        change(server.posts)
+        resumed = ListSink()
+        with Checkpoint(path) as checkpoint:
+            report = Backfill(FetchEngine(rate=0), [adapter], checkpoint, resumed, workers=1, flush_size=3).run(chunks)
+        assert report.errors == 0
+        return [int(c) for c in crashed.comments], [int(c) for c in resumed.comments]
+
+    def test_resume_follows_cursor_when_new_posts_push_pages(self, server, tmp_path):
+        def push(posts):
+            posts[:0] = [33, 32, 31, 30]
+
+        saved, resumed = self._crash_then_resume(server, tmp_path, push)
+        assert server.posts[:4] == [33, 32, 31, 30]
+        # 밀린 쪽 번호가 아니라 저장한 마지막 글 다음부터 → 빠진 글 없음, 앞 구간은 뒤 구간이 시작한 글까지 이어서 내려감
+        assert set(saved) | set(resumed) == set(range(30))
+        assert set(resumed).isdisjoint({30, 31, 32, 33})  # 백필 뒤에 올라온 글은 정기 수집 몫
+        # 다시 보낸 글은 커서 시각의 글(24)과 뒤 구간이 이미 저장한 경계 근처 글뿐 (DB 저장은 post_key 로 걸러짐)
+        assert set(saved) & set(resumed) <= {24} | set(range(15))
+
+    def test_resume_steps_back_when_deleted_posts_pull_pages(self, server, tmp_path):
+        def delete(posts):
+            del posts[:4]
+
+        saved, resumed = self._crash_then_resume(server, tmp_path, delete)
+        assert server.posts[0] == 25
+        assert set(saved) | set(resumed) == set(range(30))  # 당겨진 22~20 도 빠지지 않음
+        assert set(saved) & set(resumed) <= {24} | set(range(15))
+
+    def test_truncated_checkpoint_line_is_ignored(self, tmp_path):
+        path = str(tmp_path / "ckpt.jsonl")
+        chunk = Chunk("board", "005930", 1, 10)
+        with Checkpoint(path) as checkpoint:
+            checkpoint.record(chunk, 4)
+        with open(path, "a", encoding="utf-8") as f:
+            f.write('{"chunk": "board:005930:1-10", "pa')  # 기록 도중 종료
+
+        with Checkpoint(path) as checkpoint:
+            assert checkpoint.resume_page(chunk) == 5
+            checkpoint.record(chunk, 10, done=True)
+        with Checkpoint(path) as checkpoint:
+            assert checkpoint.resume_page(chunk) is None
+
+    def test_rejects_cursor_sources(self, tmp_path):
+        class CursorAdapter(LineAdapter):
+            name = "cursor"
+
+            def first_cursor(self, stock_code):
+                return "latest"
+
+        with Checkpoint(str(tmp_path / "ckpt.jsonl")) as checkpoint:
+            with pytest.raises(ValueError):
+                Backfill(FetchEngine(rate=0), [CursorAdapter("")], checkpoint, ListSink())
+
+
+class TestCommentWriter:
+
+    def test_bulk_insert_with_sentiment(self):
+        from sqlalchemy import create_engine, func, select
+        from sqlalchemy.orm import sessionmaker
+        from sqlalchemy.pool import StaticPool
+        from app.comments import CommentWriter
+        from app.models import Base, Comment, CommentSentiment, Stock
+        from app.sentiment.analyzer import RuleBasedSentimentAnalyzer
+
+        engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+        Base.metadata.create_all(engine)
+        factory = sessionmaker(bind=engine)
+        with factory() as session:
+            session.add(Stock(code="005930", name="삼성전자"))
+            session.commit()
+
+        writer = CommentWriter(factory, RuleBasedSentimentAnalyzer(), dedup_index=False)
+        batch = [
+            CommentData("005930", "naver_discuss", "급등 호재 대박", author="a"),
+            CommentData("005930", "naver_discuss", "폭락 손절 망했다", author="b"),
+            CommentData("999999", "naver_discuss", "없는 종목", author="c"),
+        ]
+        assert writer.write(batch) == 2
+        assert writer.write([]) == 0
+
+        with factory() as session:
+            rows = session.execute(
+                select(Comment.content, CommentSentiment.label)
+                .join(CommentSentiment, CommentSentiment.comment_id == Comment.id)
+                .order_by(Comment.id)
+            ).all()
+            assert [tuple(r) for r in rows] == [("급등 호재 대박", "긍정"), ("폭락 손절 망했다", "부정")]
+            assert session.scalar(select(func.count()).select_from(Comment)) == 2
+
+    def test_dedup_weights_follow_cluster_growth(self):
+        from sqlalchemy import create_engine, select
+        from sqlalchemy.orm import sessionmaker
+        from sqlalchemy.pool import StaticPool
+        from app.comments import CommentWriter
+        from app.jobs.aggregate import dedup_weight
+        from app.models import Base, Comment, CommentSentiment, Stock
+        from app.sentiment.analyzer import RuleBasedSentimentAnalyzer
+        from app.sentiment.dedup import NearDuplicateIndex
+
+        engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+        Base.metadata.create_all(engine)
+        factory = sessionmaker(bind=engine)
+        with factory() as session:
+            session.add_all([Stock(code="005930", name="삼성전자"), Stock(code="000660", name="SK하이닉스")])
+            session.commit()
+
+        spam = "지금 바로 리딩방 입장하면 내일 상한가 종목 무료로 알려드립니다"
+        writer = CommentWriter(factory, RuleBasedSentimentAnalyzer(), dedup_index=NearDuplicateIndex())
+        for i in range(4):  # 종목/수집 배치마다 따로 들어오는 도배
+            code = "005930" if i % 2 else "000660"
+            writer.write([CommentData(code, "naver_discuss", spam + "!" * i, author=f"봇{i}")])
+        writer.write([CommentData("005930", "naver_discuss", "배당 받고 장기 보유할 생각입니다 존버", author="개미")])
+
+        with factory() as session:
+            clusters = session.scalars(select(CommentSentiment.cluster).order_by(CommentSentiment.comment_id)).all()
+            weights = session.scalars(
+                select(dedup_weight(5)).join(Comment, Comment.id == CommentSentiment.comment_id).order_by(Comment.id)
+            ).all()
+        assert len(set(clusters[:4])) == 1 and clusters[4] != clusters[0]
+        assert weights == [0.25, 0.25, 0.25, 0.25, 1.0]  # 먼저 저장된 복사본도 묶음이 커진 만큼 하향
+
+    def test_rewrite_is_idempotent_and_keeps_post_time(self):
+        from sqlalchemy import create_engine, func, select
+        from sqlalchemy.orm import sessionmaker
+        from sqlalchemy.pool import StaticPool
+        from app.comments import CommentWriter
+        from app.models import Base, Comment, CommentSentiment, Stock
+        from app.sentiment.analyzer import RuleBasedSentimentAnalyzer
+
+        engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+        Base.metadata.create_all(engine)
+        factory = sessionmaker(bind=engine)
+        with factory() as session:
+            session.add(Stock(code="005930", name="삼성전자"))
+            session.commit()
+
+        posted = datetime(2025, 3, 3, 9, 12)
+        writer = CommentWriter(factory, RuleBasedSentimentAnalyzer(), dedup_index=False)
+        first = [CommentData("005930", "naver_discuss", "급등 호재 대박", author="a", posted_at=posted),
+                 CommentData("005930", "naver_discuss", "급등 호재 대박", author="a", posted_at=posted)]
+        assert writer.write(first) == 1  # 배치 안의 같은 글
+        again = [CommentData("005930", "naver_discuss", "급등 호재 대박", author="a", posted_at=posted),
+                 CommentData("005930", "naver_discuss", "급등 호재 대박", author="a", posted_at=posted + timedelta(minutes=1)),
+                 CommentData("005930", "naver_discuss", "폭락 손절", author="b", posted_at=posted)]
+        assert writer.write(again) == 2  # 다시 수집한 글은 건너뛰고 새 글만
+        assert writer.written == 3
+
+        with factory() as session:
+            assert session.scalar(select(func.count()).select_from(Comment)) == 3
+            assert session.scalar(select(func.count()).select_from(CommentSentiment)) == 3
+            times = session.scalars(select(Comment.posted_at).order_by(Comment.id)).all()
+        assert times == [posted, posted + timedelta(minutes=1), posted]
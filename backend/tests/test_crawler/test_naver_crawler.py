@@ -3,6 +3,7 @@
 실행: pytest backend/tests/test_crawler/ -v
 """
 import pytest
+from datetime import datetime
 from unittest.mock import patch, MagicMock
 import sys
 import os
@@ -59,6 +60,18 @@ class TestNaverDiscussCrawler:
         assert comment.source == "naver_discuss"
         assert len(comment.content) > 0
 
+    def test_parses_post_date(self, crawler):
+        html = """
+        <table class="type2"><tr class="bg">
+          <td><span class="tah p10 gray03">2025.03.03 09:12</span></td>
+          <td class="title"><a href="/item/board_read.naver?code=005930&nid=7">실적 기대됩니다</a></td>
+          <td class="writer">투자자3</td><td><span>120</span></td><td><strong>4</strong></td><td><strong>1</strong></td>
+        </tr></table>
+        """
+        [comment] = crawler._parse_comments(html, "005930", "http://test.url")
+        assert comment.posted_at == datetime(2025, 3, 3, 9, 12)
+        assert crawler._parse_comments(SAMPLE_HTML, "005930", "url")[0].posted_at is None
+
     def test_empty_html_returns_empty_list(self, crawler):
         comments = crawler._parse_comments("<html></html>", "005930", "url")
         assert comments == []
@@ -74,15 +87,16 @@ class TestNaverDiscussCrawler:
             assert hasattr(comment, "dislikes")
             assert hasattr(comment, "crawled_at")
 
-    @patch("app.crawler.naver_crawler.requests.Session.get")
-    def test_get_comments_with_mock(self, mock_get, crawler):
+    def test_get_comments_with_mock(self, crawler):
         mock_response = MagicMock()
         mock_response.text = SAMPLE_HTML
         mock_response.encoding = "euc-kr"
         mock_response.raise_for_status = MagicMock()
-        mock_get.return_value = mock_response
 
-        comments = crawler.get_comments("005930", max_comments=10)
+        # 요청은 공용 FetchEngine 의 세션으로 나간다
+        with patch.object(crawler.engine.session, "get", return_value=mock_response) as mock_get:
+            comments = crawler.get_comments("005930", max_comments=10)
+        assert mock_get.called
         assert len(comments) <= 10
         assert all(isinstance(c, CommentData) for c in comments)
 
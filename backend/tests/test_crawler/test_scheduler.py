@@ -0,0 +1,204 @@
+"""
+다중 소스 수집 (공용 엔진 / 스케줄러) TDD 테스트
+실행: pytest backend/tests/test_crawler/ -v
+"""
+import threading
+import time
+import pytest
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "../../.."))
+
+from unittest.mock import patch
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+from app.crawler.engine import FetchEngine, RateBudget, parse_host_rates
+from app.crawler.naver_crawler import NaverDiscussAdapter, NaverDiscussCrawler
+from app.crawler.scheduler import CrawlScheduler, crawl_stock
+from app.crawler.sources import CommentData, SourceAdapter, create_adapters
+
+PAGES_PER_STOCK = 3
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive
+
+    def do_GET(self):
+        parts = urlsplit(self.path)
+        query = parse_qs(parts.query)
+        code, page = query["code"][0], int(query["page"][0])
+        with self.server.lock:
+            self.server.connections.add(self.client_address)
+            self.server.requests.append((self.headers["Host"], parts.path, code, page))
+        if code == "999999" or (code == "888888" and page == 2):
+            self._reply(500, "error")
+        elif page > PAGES_PER_STOCK:
+            self._reply(200, "")
+        else:
+            self._reply(200, "\n".join(f"{parts.path} {code} p{page} 댓글{i}" for i in range(2)))
+
+    def _reply(self, status: int, text: str):
+        body = text.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "text/plain; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture(scope="module")
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    httpd.lock = threading.Lock()
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+
+
+@pytest.fixture(autouse=True)
+def reset_server(server):
+    server.connections = set()
+    server.requests = []
+
+
+class LineAdapter(SourceAdapter):
+    """줄마다 댓글 1개인 테스트 소스"""
+
+    def __init__(self, name: str, base_url: str):
+        self.name = name
+        self.base_url = base_url
+
+    def build_url(self, stock_code, cursor):
+        return f"{self.base_url}/{self.name}?code={stock_code}&page={cursor}"
+
+    def parse(self, text, stock_code, url):
+        return [CommentData(stock_code, self.name, line) for line in text.splitlines() if line]
+
+
+class TestRateBudget:
+
+    def test_spaces_requests_by_reservation(self):
+        now = [0.0]
+        budget = RateBudget(rate=2.0, clock=lambda: now[0], sleep=lambda s: None)
+        assert [budget.acquire() for _ in range(3)] == [0.0, 0.5, 1.0]
+        now[0] = 10.0  # 충분히 쉬면 다시 바로 (burst 까지만)
+        assert [budget.acquire() for _ in range(2)] == [0.0, 0.5]
+
+    def test_zero_rate_is_unlimited(self):
+        assert RateBudget(rate=0).acquire() == 0.0
+
+    def test_parse_host_rates(self):
+        assert parse_host_rates("finance.naver.com=2, example.com=0.5") == {"finance.naver.com": 2.0, "example.com": 0.5}
+        assert parse_host_rates("") == {}
+
+
+class TestFetchEngine:
+
+    def test_sources_share_pooled_connections(self, server):
+        port = server.server_address[1]
+        base = f"http://127.0.0.1:{port}"
+        with FetchEngine(rate=0, pool_maxsize=2) as engine:
+            scheduler = CrawlScheduler(engine, [LineAdapter("a", base), LineAdapter("b", base)], workers=4)
+            report = scheduler.run([f"{i:06d}" for i in range(10)])
+
+        assert report.comments == 2 * 10 * PAGES_PER_STOCK * 2
+        assert len(server.requests) == 2 * 10 * (PAGES_PER_STOCK + 1)  # 빈 페이지에서 멈춤
+        assert len(server.connections) <= 2  # 소스가 둘이어도 호스트당 연결 풀 하나
+
+    def test_hosts_have_independent_budgets(self, server):
+        port = server.server_address[1]
+        adapters = [LineAdapter("a", f"http://127.0.0.1:{port}"), LineAdapter("b", f"http://localhost:{port}")]
+        with FetchEngine(rate=20) as engine:
+            started = time.perf_counter()
+            CrawlScheduler(engine, adapters, workers=4).run([f"{i:06d}" for i in range(3)])
+            elapsed = time.perf_counter() - started
+            stats = engine.stats()
+
+        # 호스트마다 12회 @ 20회/초 ≈ 0.55초 - 두 호스트가 번갈아 기다리면 1.1초 이상
+        assert 0.5 < elapsed < 1.0
+        assert {s["requests"] for s in stats.values()} == {12}
+
+    def test_http_error_raises(self, server):
+        port = server.server_address[1]
+        import requests
+        with FetchEngine(rate=0) as engine, pytest.raises(requests.HTTPError):
+            engine.fetch(f"http://127.0.0.1:{port}/a?code=999999&page=1", "a")
+
+
+class TestCrawlScheduler:
+
+    def test_interleaves_sources(self):
+        scheduler = CrawlScheduler(None, [LineAdapter("a", ""), LineAdapter("b", "")])
+        assert [(a.name, c) for a, c in scheduler.tasks(["1", "2"])] == [("a", "1"), ("b", "1"), ("a", "2"), ("b", "2")]
+
+    def test_sink_report_and_errors(self, server):
+        port = server.server_address[1]
+        received = []
+        adapter = LineAdapter("a", f"http://127.0.0.1:{port}")
+        adapter.max_pages = 2
+        with FetchEngine(rate=0) as engine:
+            report = CrawlScheduler(engine, [adapter], sink=received.append, max_comments=3).run(["000001", "999999"])
+
+        assert report.sources["a"].errors == 1
+        assert report.sources["a"].stocks == 2
+        assert [len(batch) for batch in received] == [3]
+        assert report.to_dict()["comments"] == 3
+
+    def test_cursor_ends_pagination(self, server):
+        class OnePage(LineAdapter):
+            def next_cursor(self, cursor, comments):
+                return None
+
+        port = server.server_address[1]
+        with FetchEngine(rate=0) as engine:
+            comments, pages, errors = crawl_stock(engine, OnePage("a", f"http://127.0.0.1:{port}"), "000001", 100)
+        assert (len(comments), pages, errors) == (2, 1, 0)
+
+    def test_failed_page_keeps_earlier_pages(self, server):
+        port = server.server_address[1]
+        received = []
+        with FetchEngine(rate=0) as engine:
+            report = CrawlScheduler(engine, [LineAdapter("a", f"http://127.0.0.1:{port}")],
+                                    sink=received.append).run(["888888"])
+
+        assert [c.content for batch in received for c in batch] == ["/a 888888 p1 댓글0", "/a 888888 p1 댓글1"]
+        assert (report.sources["a"].pages, report.sources["a"].errors) == (2, 1)
+
+
+class TestSources:
+
+    def test_adapter_contract(self):
+        class Incomplete(SourceAdapter):
+            name = "incomplete"
+
+            def build_url(self, stock_code, cursor):
+                return ""
+
+        with pytest.raises(TypeError):
+            Incomplete()
+        with pytest.raises(TypeError):
+            NaverDiscussAdapter.headers["X-Test"] = "1"  # 클래스 속성 헤더는 읽기 전용
+
+    def test_registry(self):
+        [adapter] = create_adapters(["naver_discuss"], max_pages=2)
+        assert isinstance(adapter, NaverDiscussAdapter)
+        assert adapter.max_pages == 2
+        assert adapter.build_url("005930", 3) == "https://finance.naver.com/item/board.naver?code=005930&page=3"
+        with pytest.raises(ValueError):
+            create_adapters(["nope"])
+
+    def test_crawler_keeps_shared_engine_open(self):
+        engine = FetchEngine(rate=0)
+        with patch.object(engine, "close") as close:
+            with NaverDiscussCrawler(delay=0, engine=engine) as crawler:
+                assert crawler.session is engine.session
+            close.assert_not_called()  # 공용 엔진은 닫지 않음
+        with patch.object(FetchEngine, "close") as close:
+            with NaverDiscussCrawler(delay=0):
+                pass
+            close.assert_called_once()
@@ -0,0 +1,76 @@
+"""
+정적 스냅샷 내보내기 TDD 테스트
+실행: pytest backend/tests/test_export/ -v
+"""
+import gzip
+import json
+import pytest
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "../../.."))
+
+from app.board import StockBoard
+from app.board.mock import mock_rows
+from app.config import get_settings
+from app.export import StaticExporter
+
+
+@pytest.fixture
+def board():
+    return StockBoard(loader=mock_rows)
+
+
+@pytest.fixture
+def exporter(tmp_path):
+    return StaticExporter(tmp_path, get_settings(), keep=2)
+
+
+class TestStaticExporter:
+
+    def test_export_writes_pages_and_json(self, exporter, board):
+        version = exporter.export(board.snapshot)
+        current = exporter.current_link
+        assert current.is_symlink()
+        assert current.resolve() == version.resolve()
+
+        assert "곡소리" in (current / "index.html").read_text(encoding="utf-8")
+        for row in board.snapshot.rows:
+            code = row["code"]
+            assert code in (current / "stock" / f"{code}.html").read_text(encoding="utf-8")
+            detail = json.loads((current / "api" / "stocks" / f"{code}.json").read_text(encoding="utf-8"))
+            share = json.loads((current / "api" / "share" / f"{code}.json").read_text(encoding="utf-8"))
+            assert detail["score"] == share["score"] == row["score"]
+            assert (current / "api" / "sentiment" / code / "history.json").exists()
+            assert (current / "api" / "stocks" / code / "bundle.json").exists()
+
+        listing = json.loads((current / "api" / "stocks" / "index.json").read_text(encoding="utf-8"))
+        assert listing["total"] == len(board.snapshot)
+        sectors = json.loads((current / "api" / "sectors.json").read_text(encoding="utf-8"))
+        assert sectors["market"]["stock_count"] == len(board.snapshot)
+
+    def test_precompressed_siblings(self, exporter, board):
+        exporter.export(board.snapshot)
+        path = exporter.current_link / "api" / "stocks" / "index.json"
+        gz = path.with_name("index.json.gz")
+        assert gzip.decompress(gz.read_bytes()) == path.read_bytes()
+
+    def test_swap_and_prune(self, exporter, board):
+        first = exporter.export(board.snapshot)
+        second = exporter.export(board.refresh(mock_rows()))
+        third = exporter.export(board.refresh(mock_rows()))
+        assert exporter.current_link.resolve() == third.resolve()
+        assert not first.exists()  # keep=2
+        assert second.exists()
+
+    def test_prune_survives_generation_reset(self, exporter):
+        import time
+        from app.board.board import BoardSnapshot
+
+        stale = exporter.export(BoardSnapshot(mock_rows(), 900))
+        restarted = []
+        for generation in (1, 2):  # 재시작 후 세대가 다시 작게 시작
+            time.sleep(0.002)
+            restarted.append(exporter.export(BoardSnapshot(mock_rows(), generation)))
+        assert exporter.current_link.resolve() == restarted[-1].resolve()
+        assert not stale.exists()
+        assert all(d.exists() for d in restarted)
@@ -0,0 +1,174 @@
+"""
+DB 내 감성 점수 집계 (INSERT … SELECT) TDD 테스트
+실행: pytest backend/tests/test_jobs/ -v
+"""
+import random
+import pytest
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "../../.."))
+
+from datetime import datetime, timedelta
+
+from sqlalchemy import Column, Float, MetaData, Table, create_engine, event, select
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.jobs.aggregate import aggregate_period, round1, round1_signed
+from app.models import Base, Comment, CommentSentiment, SentimentScore, Stock
+from app.sentiment.analyzer import SentimentAggregator, SentimentLabel, SentimentResult
+
+T0 = datetime(2025, 3, 3, 9, 0)
+LABELS = {"긍정": SentimentLabel.POSITIVE, "부정": SentimentLabel.NEGATIVE, "중립": SentimentLabel.NEUTRAL}
+
+
+@pytest.fixture
+def factory():
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(engine)
+    factory = sessionmaker(bind=engine)
+    factory.engine = engine
+    return factory
+
+
+def _result(score, label, confidence):
+    """DB 행 → 파이썬 집계기 입력 (분석기와 같은 0~100 정규화)"""
+    return SentimentResult(score, LABELS.get(label, label), confidence, round((score + 1) / 2 * 100, 1))
+
+
+def _seed(factory, stocks=30, seed=7):
+    """종목별 무작위 댓글 (첫 기간 + 둘째 기간), 일부 종목은 댓글 없음 → 종목코드별 기간 (결과, 가중치) 목록"""
+    rng = random.Random(seed)
+    periods = {}
+    comment_id = 0
+    with factory() as session:
+        for i in range(stocks):
+            stock = Stock(code=f"{i:06d}", name=f"종목{i}", is_active=0 if i == stocks - 1 else 1)
+            session.add(stock)
+            session.flush()
+            for period in range(2):
+                results = periods.setdefault((stock.code, period), [])
+                if i % 7 == 3:
+                    continue
+                for j in range(rng.randint(1, 60)):
+                    score = rng.choice([
+                        rng.uniform(-1, 1),
+                        round(rng.uniform(-1, 1), 3),  # 49.55 처럼 반올림 경계에 걸리는 값
+                        rng.choice([0.0, 0.5, -0.21, 0.8, -1.0, 1.0]),
+                    ])
+                    label = "긍정" if score > 0.15 else "부정" if score < -0.15 else rng.choice(["중립", "neutral"])
+                    confidence = rng.choice([rng.uniform(0, 1), 0.5, 1.0, 0.0])
+                    weight = rng.choice([1.0, 1.0, 0.25, 0.5, 1 / 3])  # 유사 중복 묶음 크기별 가중치
+                    comment_id += 1
+                    session.add(Comment(id=comment_id, stock_id=stock.id, source="naver_discuss",
+                                        content=f"댓글 {j}", posted_at=T0 + timedelta(hours=4 * period, minutes=j)))
+                    session.add(CommentSentiment(comment_id=comment_id, score=score, label=label,
+                                                 confidence=confidence, weight=weight))
+                    results.append((_result(score, label, confidence), weight))
+        session.commit()
+    return periods
+
+
+class TestRound1:
+
+    def test_matches_python_round(self, factory):
+        rng = random.Random(1)
+        samples = [rng.uniform(0, 100) for _ in range(3000)]
+        samples += [(round(rng.uniform(-1, 1), 3) + 1) / 2 * 100 for _ in range(3000)]
+        samples += [49.55, 84.74999999999999, 0.05, 0.0, 99.95, 100.0, 0.25]
+        signed = [-0.05, -3.35, -12.25, -81.25, 0.15, -49.55]
+        table = Table("samples", MetaData(), Column("v", Float))
+        with factory.engine.connect() as conn:
+            table.create(conn)
+            conn.execute(table.insert(), [{"v": v} for v in samples + signed])
+            rows = conn.execute(select(table.c.v, round1(table.c.v), round1_signed(table.c.v))).all()
+        for value, got, got_signed in rows:
+            assert got_signed == round(value, 1), value
+            if value >= 0:
+                assert got == round(value, 1), value
+
+
+class TestAggregatePeriod:
+
+    def test_matches_python_aggregator(self, factory):
+        periods = _seed(factory)
+        for period in range(2):
+            start = T0 + timedelta(hours=4 * period)
+            assert aggregate_period(start, start + timedelta(hours=4), factory) == 29  # 비활성 종목 제외
+
+        with factory() as session:
+            rows = session.execute(
+                select(Stock.code, SentimentScore).join(Stock, Stock.id == SentimentScore.stock_id)
+                .order_by(SentimentScore.period_start, Stock.code)
+            ).all()
+        assert len(rows) == 58
+        previous = {}
+        for code, row in rows:
+            period = 0 if row.period_start == T0 else 1
+            results, weights = zip(*periods[(code, period)]) if periods[(code, period)] else ((), ())
+            expected = SentimentAggregator.aggregate(list(results), list(weights))
+            assert row.score == expected["score"], (code, period)
+            assert row.trend == expected["trend"]
+            for key in ("positive_count", "negative_count", "neutral_count", "total_count"):
+                assert getattr(row, key) == expected[key]
+            change = round(expected["score"] - previous[code], 1) if code in previous else 0.0
+            assert row.score_change == change
+            previous[code] = expected["score"]
+
+    def test_weights_downweight_duplicates(self, factory):
+        with factory() as session:
+            session.add(Stock(id=1, code="005930", name="삼성전자"))
+            rows = [(1.0, "긍정", 1.0)] + [(-1.0, "부정", 0.25)] * 4  # 도배 4건 = 1건 몫
+            for i, (score, label, weight) in enumerate(rows, start=1):
+                session.add(Comment(id=i, stock_id=1, source="naver_discuss", content=f"댓글 {i}",
+                                    posted_at=T0 + timedelta(minutes=i)))
+                session.add(CommentSentiment(comment_id=i, score=score, label=label, confidence=1.0, weight=weight))
+            session.commit()
+
+        aggregate_period(T0, T0 + timedelta(hours=4), factory)
+        with factory() as session:
+            row = session.scalars(select(SentimentScore)).one()
+        assert (row.score, row.negative_count, row.total_count) == (50.0, 4, 5)  # 가중치 없으면 20.0
+
+    def test_cluster_weights_span_batches_and_stocks(self, factory):
+        with factory() as session:
+            session.add_all([Stock(id=1, code="005930", name="삼성전자"), Stock(id=2, code="000660", name="SK하이닉스"),
+                             Stock(id=3, code="035720", name="카카오")])
+            rows = [(1, 1.0, "긍정", "원본", "개미")]
+            rows += [(stock, -1.0, "부정", "spam", f"봇{i}") for i in range(100) for stock in [1 + i % 2]]  # 두 종목 도배 100개
+            rows += [(3, -1.0, "부정", f"p{i}", "다작") for i in range(10)] + [(3, 1.0, "긍정", "q", "과묵")]
+            for i, (stock_id, score, label, cluster, author) in enumerate(rows, start=1):
+                session.add(Comment(id=i, stock_id=stock_id, source="naver_discuss", content=f"댓글 {i}", author=author,
+                                    posted_at=T0 + timedelta(minutes=i % 200)))
+                session.add(CommentSentiment(comment_id=i, score=score, label=label, confidence=1.0, cluster=cluster))
+            session.commit()
+
+        aggregate_period(T0, T0 + timedelta(hours=4), factory)
+        with factory() as session:
+            scores = dict(session.execute(
+                select(Stock.code, SentimentScore.score).join(Stock, Stock.id == SentimentScore.stock_id)
+            ).all())
+        positive, negative = _result(1.0, "긍정", 1.0), _result(-1.0, "부정", 1.0)
+        flooded = SentimentAggregator.aggregate([positive] + [negative] * 50, [1.0] + [1 / 100] * 50)
+        prolific = SentimentAggregator.aggregate([negative] * 10 + [positive], [5 / 10] * 10 + [1.0])  # DEDUP_AUTHOR_LIMIT=5
+        assert scores["005930"] == flooded["score"]
+        assert scores["000660"] == 0.0
+        assert scores["035720"] == prolific["score"]
+
+    def test_single_statement_for_all_stocks(self, factory):
+        _seed(factory, stocks=200, seed=3)
+        statements = []
+        event.listen(factory.engine, "before_cursor_execute",
+                     lambda conn, cursor, statement, *args: statements.append(statement))
+
+        assert aggregate_period(T0, T0 + timedelta(hours=4), factory) == 199
+        assert len([s for s in statements if s.lstrip().upper().startswith(("INSERT", "SELECT"))]) == 1
+        assert statements[0].lstrip().upper().startswith("INSERT INTO SENTIMENT_SCORES")
+
+    def test_empty_period_is_neutral(self, factory):
+        _seed(factory, stocks=3)
+        later = T0 + timedelta(days=10)
+        aggregate_period(later, later + timedelta(hours=4), factory)
+        with factory() as session:
+            rows = session.scalars(select(SentimentScore).where(SentimentScore.period_start == later)).all()
+        assert {(r.score, r.trend, r.total_count) for r in rows} == {(50.0, "neutral", 0)}
@@ -0,0 +1,85 @@
+"""
+집계 주기 작업 TDD 테스트
+실행: pytest backend/tests/test_jobs/ -v
+"""
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "../../.."))
+
+from datetime import datetime, timedelta
+
+from app.board import StockBoard
+from app.config import get_settings
+from app.jobs import AggregationCycle, build_default_cycle
+
+
+ROWS = [{"code": "000001", "name": "가나", "score": 50.0, "trend": "neutral"}]
+
+
+class TestAggregationCycle:
+
+    def test_run_refreshes_board_then_stages(self):
+        board = StockBoard()
+        calls = []
+        cycle = AggregationCycle(board, row_source=lambda: ROWS)
+        cycle.add_stage("first", lambda snap: calls.append(("first", snap)))
+        cycle.add_stage("second", lambda snap: calls.append(("second", snap)))
+
+        snapshot = cycle.run()
+        assert board.snapshot is snapshot
+        assert calls == [("first", snapshot), ("second", snapshot)]
+        assert cycle.runs == 1
+
+    def test_failing_stage_does_not_stop_others(self):
+        board = StockBoard()
+        calls = []
+        cycle = AggregationCycle(board, row_source=lambda: ROWS)
+        cycle.add_stage("broken", lambda snap: 1 / 0)
+        cycle.add_stage("ok", lambda snap: calls.append(snap))
+        snapshot = cycle.run()
+        assert calls == [snapshot]
+
+    def test_empty_rows_keep_board(self):
+        board = StockBoard()
+        AggregationCycle(board, row_source=lambda: ROWS).run()
+        before = board.snapshot
+        assert AggregationCycle(board, row_source=list).run() is before
+        assert board.snapshot is before
+
+
+class TestDefaultCycle:
+
+    def test_database_rows_reach_board_and_export(self, tmp_path, monkeypatch):
+        from sqlalchemy import create_engine
+        from sqlalchemy.orm import sessionmaker
+        from sqlalchemy.pool import StaticPool
+        from app.board import sectors
+        from app.models import Base, Comment, CommentSentiment, SentimentScore, Stock
+
+        monkeypatch.setattr(sectors, "_sector_board", sectors.SectorBoard())  # 공유 보드와 세대가 겹치는 별도 보드
+        engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+        Base.metadata.create_all(engine)
+        factory = sessionmaker(bind=engine)
+        with factory() as session:
+            session.add(Stock(id=1, code="005930", name="삼성전자"))
+            session.add(SentimentScore(stock_id=1, score=30.0, trend="down", period_start=datetime(2025, 3, 3, 5),
+                                       period_end=datetime(2025, 3, 3, 9)))
+            session.add(Comment(id=1, stock_id=1, source="naver_discuss", content="실적 기대",
+                                posted_at=datetime.now() - timedelta(hours=1)))
+            session.add(CommentSentiment(comment_id=1, score=0.22, label="긍정", confidence=1.0))
+            session.commit()
+
+        settings = get_settings()
+        monkeypatch.setattr(settings, "board_source", "database")
+        monkeypatch.setattr(settings, "static_export_enabled", True)
+        monkeypatch.setattr(settings, "static_export_dir", str(tmp_path))
+        board = StockBoard()
+        snapshot = build_default_cycle(board, session_factory=factory).run()
+
+        # 직전 주기 댓글을 집계해 기록한 새 점수가 보드에 반영
+        assert [r["code"] for r in snapshot.rows] == ["005930"]
+        assert snapshot.get("005930")["score"] == 61.0
+        assert snapshot.get("005930")["score_change"] == 31.0
+        with factory() as session:
+            assert session.query(SentimentScore).count() == 2
+        assert (tmp_path / "current" / "stock" / "005930.html").exists()
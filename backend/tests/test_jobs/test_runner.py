@@ -0,0 +1,188 @@
+"""
+앱 내 주기 작업 (lifespan 백그라운드 태스크) TDD 테스트
+실행: pytest backend/tests/test_jobs/ -v
+"""
+import asyncio
+import time
+import pytest
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "../../.."))
+
+from fastapi.testclient import TestClient
+
+from app.board import StockBoard, get_board
+from app.board.mock import mock_rows
+from app.config import get_settings
+from app.jobs import AggregationCycle
+from app.jobs import runner as runner_module
+from app.jobs.runner import JobRunner, acquire_lock
+
+
+def _rows(score):
+    """목업 보드에서 삼성전자 점수만 바꾼 행"""
+    rows = mock_rows()
+    rows[0] = {**rows[0], "score": score}
+    return rows
+
+
+def _wait(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "시간 초과"
+        time.sleep(0.01)
+
+
+@pytest.fixture
+def in_process_jobs(monkeypatch):
+    """JOBS_ENABLED 로 lifespan 이 공유 보드 주기 작업을 띄우게 한다 (끝나면 목업 보드로 되돌림)"""
+    settings = get_settings()
+    monkeypatch.setattr(settings, "jobs_enabled", True)
+    monkeypatch.setattr(settings, "share_card_enabled", False)  # lifespan 종료 시 공유 카드 풀을 닫지 않게
+    runners = []
+
+    def build(score):
+        def factory():
+            runner = JobRunner(AggregationCycle(get_board(), row_source=lambda: _rows(score)), interval=3600)
+            runners.append(runner)
+            return runner
+        monkeypatch.setattr(runner_module, "build_job_runner", factory)
+        return runners
+
+    yield build
+    get_board().refresh(mock_rows())
+
+
+class TestJobRunner:
+
+    def test_lifespan_cycle_updates_stocks_and_etag(self, in_process_jobs):
+        from app.main import app, response_cache
+
+        response_cache.clear()
+        before = TestClient(app).get("/api/stocks/?size=50")
+        runners = in_process_jobs(99.5)
+        generation = get_board().snapshot.generation
+
+        with TestClient(app) as client:
+            _wait(lambda: runners[0].cycle.runs == 1)  # 보드 갱신 뒤 단계까지 끝난 주기
+            after = client.get("/api/stocks/?size=50")
+            assert runners[0].leader is True
+            assert get_board().snapshot.generation != generation
+
+        assert after.headers["etag"] != before.headers["etag"]
+        scores = {s["code"]: s["score"] for s in after.json()["stocks"]}
+        assert scores["005930"] == 99.5
+        assert scores["005930"] != {s["code"]: s["score"] for s in before.json()["stocks"]}["005930"]
+        assert runners[0]._task is None  # 종료 시 태스크 정리
+
+    def test_failed_cycle_keeps_running(self):
+        calls = []
+
+        def rows():
+            calls.append(1)
+            if len(calls) == 1:
+                raise RuntimeError("DB 연결 끊김")
+            return _rows(10.0)
+
+        async def scenario():
+            runner = JobRunner(AggregationCycle(StockBoard(), row_source=rows), interval=0.01)
+            runner.start()
+            while len(calls) < 2:
+                await asyncio.sleep(0.01)
+            await runner.stop()
+
+        asyncio.run(scenario())
+        assert len(calls) >= 2
+
+    def test_only_one_worker_leads(self, tmp_path):
+        path = str(tmp_path / "jobs.lock")
+        refreshed = []
+        versions = iter([1, 1, 2, 2])
+
+        def reload_rows():
+            refreshed.append(1)
+            return _rows(40.0)
+
+        async def scenario():
+            leader = JobRunner(AggregationCycle(StockBoard(), row_source=lambda: _rows(20.0)), interval=3600,
+                               lock_path=path)
+            follower = JobRunner(AggregationCycle(StockBoard(), row_source=lambda: _rows(30.0)), interval=3600,
+                                 lock_path=path, poll_interval=0.01, version=lambda: next(versions, 2),
+                                 follower_cycle=AggregationCycle(StockBoard(), row_source=reload_rows))
+            leader.start()
+            while leader.leader is None:
+                await asyncio.sleep(0.01)
+            follower.start()
+            await asyncio.sleep(0.2)
+            await follower.stop()
+            await leader.stop()
+            return leader, follower
+
+        leader, follower = asyncio.run(scenario())
+        assert (leader.leader, follower.leader) == (True, False)
+        assert leader.cycle.runs == 1 and follower.cycle.runs == 0
+        assert refreshed == [1]  # DB 점수 버전이 바뀐 한 번만 다시 읽음
+        handle = acquire_lock(path)  # 리더가 멈추면 잠금 해제
+        assert handle is not None
+        handle.close()
+
+    def test_leader_crawls_before_cycle_and_followers_tail(self, tmp_path):
+        path = str(tmp_path / "jobs.lock")
+        calls = []
+
+        def rows():
+            calls.append("cycle")
+            return _rows(20.0)
+
+        async def scenario():
+            leader = JobRunner(AggregationCycle(StockBoard(), row_source=rows), interval=3600, lock_path=path,
+                               crawl=lambda: calls.append("crawl"), tail=lambda: calls.append("leader tail"))
+            follower = JobRunner(AggregationCycle(StockBoard(), row_source=rows), interval=3600, lock_path=path,
+                                 crawl=lambda: calls.append("follower crawl"), poll_interval=0.01,
+                                 tail=lambda: calls.append("tail"))
+            leader.start()
+            while leader.cycle.runs == 0:
+                await asyncio.sleep(0.01)
+            follower.start()
+            await asyncio.sleep(0.1)
+            await follower.stop()
+            await leader.stop()
+
+        asyncio.run(scenario())
+        assert calls[:2] == ["crawl", "cycle"]  # 새 댓글이 DB 에 들어간 뒤 집계
+        assert calls.count("tail") >= 2  # 수집 안 하는 워커는 확인 주기마다 새 댓글을 버퍼로
+        assert "follower crawl" not in calls and "leader tail" not in calls
+
+    def test_failed_crawl_still_aggregates(self):
+        def crawl():
+            raise RuntimeError("네이버 응답 없음")
+
+        runner = JobRunner(AggregationCycle(StockBoard(), row_source=lambda: _rows(20.0)), interval=3600, crawl=crawl)
+        asyncio.run(runner.run_once())
+        assert runner.cycle.runs == 1
+
+    def test_cycle_run_pushes_sse_event(self):
+        import json
+        from app.api.stream import stream_scores
+        from app.main import app  # noqa: F401  (보드 → 브로드캐스터 구독)
+
+        runner = JobRunner(AggregationCycle(get_board(), row_source=lambda: _rows(12.5)), interval=3600)
+
+        async def scenario():
+            response = await stream_scores(since=None, last_event_id=None)
+            events = response.body_iterator
+            ready = await asyncio.wait_for(events.__anext__(), 5)
+            await runner.run_once()
+            pushed = await asyncio.wait_for(events.__anext__(), 5)
+            await events.aclose()
+            return ready, pushed
+
+        try:
+            ready, pushed = asyncio.run(scenario())
+        finally:
+            get_board().refresh(mock_rows())
+        assert "event: ready" in ready
+        lines = dict(line.split(": ", 1) for line in pushed.strip().splitlines())
+        assert lines["event"] == "scores"
+        changed = {d["code"]: d for d in json.loads(lines["data"])}
+        assert changed["005930"]["score"] == 12.5
@@ -0,0 +1,126 @@
+"""
+메트릭 레지스트리 / /metrics 엔드포인트 TDD 테스트
+실행: pytest backend/tests/test_metrics/ -v
+"""
+import pytest
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "../../.."))
+
+from fastapi.testclient import TestClient
+
+from app.metrics import Registry, Counter, Gauge, Histogram, CallbackGauge, write_textfile
+
+
+@pytest.fixture
+def registry():
+    return Registry()
+
+
+class TestRegistry:
+
+    def test_counter_children_are_prebound(self, registry):
+        counter = Counter("jobs", "작업 수", ("kind",), registry=registry)
+        child = counter.labels("crawl")
+        assert counter.labels("crawl") is child
+        child.inc()
+        child.inc(2)
+        assert 'jobs_total{kind="crawl"} 3' in registry.render()
+
+    def test_label_count_mismatch(self, registry):
+        counter = Counter("jobs", "작업 수", ("kind",), registry=registry)
+        with pytest.raises(ValueError):
+            counter.labels("a", "b")
+
+    def test_duplicate_name_rejected(self, registry):
+        Gauge("g", "게이지", registry=registry)
+        with pytest.raises(ValueError):
+            Gauge("g", "게이지", registry=registry)
+
+    def test_histogram_buckets_are_cumulative(self, registry):
+        hist = Histogram("latency", "지연", buckets=(0.1, 1.0), registry=registry)
+        for value in (0.05, 0.1, 0.5, 3.0):
+            hist.observe(value)
+        text = registry.render()
+        assert 'latency_bucket{le="0.1"} 2' in text
+        assert 'latency_bucket{le="1"} 3' in text
+        assert 'latency_bucket{le="+Inf"} 4' in text
+        assert "latency_count 4" in text
+        assert "latency_sum 3.65" in text
+        assert "# TYPE latency histogram" in text
+
+    def test_callback_gauge_evaluated_at_scrape(self, registry):
+        state = {"n": 1}
+        CallbackGauge("live", "현재 값", lambda: [({"field": "n"}, state["n"])], registry=registry)
+        assert 'live{field="n"} 1' in registry.render()
+        state["n"] = 7
+        assert 'live{field="n"} 7' in registry.render()
+
+    def test_failing_callback_does_not_break_scrape(self, registry):
+        def boom():
+            raise RuntimeError("x")
+        CallbackGauge("broken", "실패", boom, registry=registry)
+        Gauge("ok", "정상", registry=registry).set(2)
+        text = registry.render()
+        assert "ok 2" in text
+        assert "broken 수집 실패" in text
+
+    def test_label_values_escaped(self, registry):
+        Counter("c", "카운터", ("path",), registry=registry).labels('a"b').inc()
+        assert 'c_total{path="a\\"b"} 1' in registry.render()
+
+
+class TestTextfile:
+
+    def test_writes_labelled_prom_file(self, registry, tmp_path):
+        Counter("rows", "행 수", ("table",), registry=registry).labels("comments").inc(3)
+        path = write_textfile("backfill", str(tmp_path / "prom"), registry)
+
+        assert path == tmp_path / "prom" / "goksori_backfill.prom"
+        assert 'rows_total{task="backfill",table="comments"} 3' in path.read_text(encoding="utf-8")
+        assert [p.name for p in path.parent.iterdir()] == ["goksori_backfill.prom"]  # 임시 파일 없음
+
+    def test_disabled_without_directory(self, registry):
+        assert write_textfile("crawl", "", registry) is None
+
+    def test_cli_cycle_leaves_metrics(self, tmp_path, monkeypatch):
+        from app.board import get_board
+        from app.board.mock import mock_rows
+        from app.config import get_settings
+        from app.jobs import cycle
+
+        monkeypatch.setattr(get_settings(), "metrics_textfile_dir", str(tmp_path))
+        try:
+            assert cycle.main([]) == 0
+        finally:
+            get_board().refresh(mock_rows())
+        text = (tmp_path / "goksori_cycle.prom").read_text(encoding="utf-8")
+        assert 'goksori_cycle_duration_seconds_count{task="cycle"}' in text
+
+
+class TestMetricsEndpoint:
+
+    @pytest.fixture
+    def client(self):
+        from app.main import app
+        return TestClient(app)
+
+    def test_exposition_format(self, client):
+        response = client.get("/metrics")
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain")
+        assert "# TYPE goksori_http_request_duration_seconds histogram" in response.text
+
+    def test_http_latency_labelled_by_route_template(self, client):
+        client.get("/api/stocks/005930")
+        client.get("/api/stocks/000660")
+        client.get("/api/stocks/005930")  # 응답 캐시 적중도 같은 템플릿으로 집계
+        text = client.get("/metrics").text
+        assert 'route="/api/stocks/{stock_code}"' in text
+        assert 'route="/api/stocks/005930"' not in text
+
+    def test_hot_path_metrics_recorded(self, client):
+        client.post("/api/sentiment/analyze", json={"text": "삼성전자 급등 기대"})
+        text = client.get("/metrics").text
+        assert 'goksori_analyzer_texts_total{backend="rule"}' in text
+        assert "goksori_response_cache" in text
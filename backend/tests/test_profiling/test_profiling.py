@@ -0,0 +1,156 @@
+"""
+요청/작업 프로파일링 훅 TDD 테스트
+실행: pytest backend/tests/test_profiling/ -v
+"""
+import asyncio
+import random
+import pytest
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "../../.."))
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.concurrency import run_in_threadpool
+from app.profiling import JobProfiler, ProfileStore, ProfilingMiddleware
+from app.tools.profile_summary import main as summary_main, select_profiles, summarize
+
+
+def _work(n=2000):
+    return sum(i * i for i in range(n))
+
+
+def _threaded_work():
+    return _work(5000)
+
+
+@pytest.fixture
+def store(tmp_path):
+    return ProfileStore(tmp_path / "profiles", keep=3)
+
+
+def _app(store, **kwargs):
+    app = FastAPI()
+
+    @app.get("/work")
+    async def work():
+        return {"v": _work()}
+
+    @app.get("/slow")
+    async def slow():
+        await asyncio.sleep(0.05)
+        return {"v": await run_in_threadpool(_threaded_work)}
+
+    app.add_middleware(ProfilingMiddleware, store=store, **kwargs)
+    return TestClient(app)
+
+
+def _profile_functions(path):
+    return {r.function for r in summarize([path], top=500)}
+
+
+class TestProfileStore:
+
+    def test_capture_writes_profile(self, store):
+        with store.capture("aggregate", "cycle") as info:
+            _work()
+        assert info["path"].exists()
+        assert "-aggregate-cycle" in info["path"].name
+        assert info["elapsed"] > 0
+
+    def test_rotation_keeps_newest(self, store):
+        paths = []
+        for _ in range(5):
+            with store.capture("crawl", "005930") as info:
+                _work(10)
+            paths.append(info["path"])
+        assert store.files() == paths[-3:]
+
+
+class TestJobProfiler:
+
+    def test_every_nth_cycle(self, store):
+        profiler = JobProfiler(store, "aggregate", every=3)
+        captured = []
+        for _ in range(7):
+            with profiler.cycle() as info:
+                captured.append(info is not None)
+        assert captured == [False, False, True, False, False, True, False]
+        assert len(store.files()) == 2
+
+    def test_disabled_is_noop(self, store):
+        profiler = JobProfiler(store, "crawl", every=0)
+        with profiler.cycle() as info:
+            _work(10)
+        assert info is None
+        assert store.files() == []
+
+    def test_cycle_hook(self, store):
+        from app.board import StockBoard
+        from app.board.mock import mock_rows
+        from app.jobs import AggregationCycle
+
+        cycle = AggregationCycle(StockBoard(), row_source=mock_rows, profiler=JobProfiler(store, "aggregate", every=2))
+        cycle.run()
+        cycle.run()
+        assert len(store.files()) == 1
+
+
+class TestProfilingMiddleware:
+
+    def test_secret_header_triggers_profile(self, store):
+        client = _app(store, secret="s3cret")
+        assert "x-profile-id" not in client.get("/work").headers
+        assert "x-profile-id" not in client.get("/work", headers={"X-Profile": "wrong"}).headers
+
+        response = client.get("/work", headers={"X-Profile": "s3cret"})
+        assert response.status_code == 200
+        profile_id = response.headers["x-profile-id"]
+        assert (store.directory / profile_id).exists()
+        assert "-http-GET.work" in profile_id
+
+    def test_threadpool_work_is_recorded(self, store):
+        response = _app(store, secret="s3cret").get("/slow", headers={"X-Profile": "s3cret"})
+        assert any("_threaded_work" in f for f in _profile_functions(store.directory / response.headers["x-profile-id"]))
+
+    def test_overlapping_requests_profile_one_at_a_time(self, store):
+        import httpx
+
+        client = _app(store, sample_rate=1.0)
+
+        async def scenario():
+            transport = httpx.ASGITransport(app=client.app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as http:
+                return await asyncio.gather(*[http.get("/slow") for _ in range(4)])
+
+        responses = asyncio.run(scenario())
+        assert [r.status_code for r in responses] == [200] * 4
+        assert sum("x-profile-id" in r.headers for r in responses) == 1
+        assert store.skipped == 3
+
+    def test_sample_rate(self, store):
+        client = _app(store, sample_rate=0.5, rng=random.Random(1))
+        profiled = sum("x-profile-id" in client.get("/work").headers for _ in range(20))
+        assert 0 < profiled < 20
+
+
+class TestProfileSummary:
+
+    def test_summarize_top_functions(self, store):
+        for kind in ("http", "aggregate"):
+            with store.capture(kind, "x"):
+                _work()
+        files = select_profiles(store.directory)
+        assert len(files) == 2
+        assert len(select_profiles(store.directory, kind="http")) == 1
+
+        rows = summarize(files, sort="cumulative", top=50)
+        assert any("_work" in r.function for r in rows)
+
+    def test_cli(self, store, capsys):
+        with store.capture("crawl", "005930"):
+            _work()
+        assert summary_main(["--dir", str(store.directory), "--json", "--top", "5"]) == 0
+        assert '"profiles": 1' in capsys.readouterr().out
+        assert summary_main(["--dir", str(store.directory / "none")]) == 1
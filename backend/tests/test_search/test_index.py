@@ -0,0 +1,74 @@
+"""
+종목 검색 인덱스 TDD 테스트
+실행: pytest backend/tests/test_search/ -v
+"""
+import pytest
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "../../.."))
+
+from app.search.index import StockSearchIndex, get_search_index, to_chosung
+
+
+ENTRIES = [
+    ("005930", "삼성전자"), ("000660", "SK하이닉스"), ("207940", "삼성바이오로직스"),
+    ("006400", "삼성SDI"), ("035420", "NAVER"), ("066570", "LG전자"),
+    ("028260", "삼성물산"), ("035720", "카카오"),
+]
+
+
+@pytest.fixture
+def index():
+    return StockSearchIndex(ENTRIES)
+
+
+class TestStockSearchIndex:
+
+    def test_to_chosung(self):
+        assert to_chosung("삼성전자") == "ㅅㅅㅈㅈ"
+        assert to_chosung("sk하이닉스") == "skㅎㅇㄴㅅ"
+
+    def test_exact_name_ranks_first(self, index):
+        hits = index.search("삼성전자")
+        assert hits[0].code == "005930"
+
+    def test_prefix_search(self, index):
+        codes = [h.code for h in index.search("삼성")]
+        assert set(codes) == {"005930", "207940", "006400", "028260"}
+        # 짧은 종목명이 먼저
+        assert codes.index("005930") < codes.index("207940")
+
+    def test_code_prefix(self, index):
+        codes = [h.code for h in index.search("035")]
+        assert set(codes) == {"035420", "035720"}
+
+    def test_chosung_query(self, index):
+        hits = index.search("ㅅㅅㅈㅈ")
+        assert [h.code for h in hits] == ["005930"]
+
+    def test_chosung_substring(self, index):
+        codes = {h.code for h in index.search("ㅈㅈ")}
+        assert codes == {"005930", "066570"}
+
+    def test_substring_search(self, index):
+        codes = {h.code for h in index.search("전자")}
+        assert codes == {"005930", "066570"}
+        assert {h.code for h in index.search("하이닉")} == {"000660"}
+
+    def test_case_insensitive(self, index):
+        assert index.search("naver")[0].code == "035420"
+        assert index.search("sk")[0].code == "000660"
+
+    def test_no_match_and_empty(self, index):
+        assert index.search("없는종목") == []
+        assert index.search("   ") == []
+
+    def test_limit(self, index):
+        assert len(index.search("삼성", limit=2)) == 2
+
+    def test_rebuild_only_when_constituents_change(self):
+        first = get_search_index(ENTRIES)
+        assert get_search_index(list(ENTRIES)) is first
+        changed = get_search_index(ENTRIES + [("000270", "기아")])
+        assert changed is not first
+        assert changed.search("기아")[0].code == "000270"
@@ -0,0 +1,135 @@
+"""
+유사 중복 / 도배 댓글 감지 TDD 테스트
+실행: pytest backend/tests/test_sentiment/ -v
+"""
+import random
+import time
+import pytest
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "../../.."))
+
+from datetime import datetime
+
+from app.crawler.naver_crawler import CommentData
+from app.sentiment.analyzer import RuleBasedSentimentAnalyzer, SentimentAggregator
+from app.sentiment.dedup import NearDuplicateIndex, aggregate_comments, comment_key, normalize
+
+SPAM = "지금 바로 리딩방 입장하면 내일 상한가 종목 무료로 알려드립니다 급등 확정"
+
+
+def _variant(rng: random.Random, text: str = SPAM) -> str:
+    """글자 하나 바꾸고 기호/반복 덧붙인 복붙"""
+    chars = list(text)
+    chars[rng.randrange(len(chars))] = rng.choice("!?~ㅋ")
+    return "".join(chars) + rng.choice(["!!!", " ㅋㅋㅋㅋ", "~~", ""])
+
+
+@pytest.fixture
+def index():
+    return NearDuplicateIndex()
+
+
+class TestNormalize:
+
+    def test_strips_noise_and_repeats(self):
+        assert normalize("삼성  가즈아!!!! ㅋㅋㅋㅋㅋ") == "삼성가즈아ㅋㅋ"
+        assert normalize("SK Hynix 매수") == "skhynix매수"
+
+
+class TestNearDuplicateIndex:
+
+    def test_variants_join_one_cluster(self, index):
+        rng = random.Random(1)
+        clusters = {index.add(i, _variant(rng)) for i in range(20)}
+        assert clusters == {0}
+        assert index.cluster_size(19) == 20
+        assert index.weight(5) == pytest.approx(1 / 20)
+
+    def test_unrelated_comments_stay_apart(self, index):
+        texts = [
+            "삼성전자 이번 분기 실적 발표 기대됩니다",
+            "외국인 순매도 계속되면 손절 고민해야겠네요",
+            "배당 받고 장기 보유할 생각입니다 존버",
+            "하이닉스 HBM 수주 뉴스 보고 추가 매수했어요",
+        ]
+        assert [index.add(i, t) for i, t in enumerate(texts)] == [0, 1, 2, 3]
+        assert index.weights(range(4)) == [1.0] * 4
+
+    def test_short_comments_are_not_indexed(self, index):
+        assert [index.add(i, "가즈아!!") for i in range(5)] == [0, 1, 2, 3, 4]
+        assert index.weight(3) == 1.0
+
+    def test_prolific_author_is_down_weighted(self):
+        index = NearDuplicateIndex(author_limit=2)
+        rng = random.Random(2)
+        words = "오늘 내일 실적 발표 기대 매수 매도 손절 반등 저점 고점 배당 공시 뉴스 외인 기관".split()
+        for i in range(8):
+            index.add(i, " ".join(rng.sample(words, 8)) + f" {i}번째", author="작전세력")
+        index.add("other", "저는 오늘 처음 글 남겨봅니다 잘 부탁드려요", author="개미")
+        assert index.weight(0) == pytest.approx(2 / 8)
+        assert index.weight("other") == 1.0
+        assert index.weight("unknown") == 1.0
+
+    def test_eviction_shrinks_clusters(self):
+        index = NearDuplicateIndex(max_items=5)
+        rng = random.Random(3)
+        for i in range(5):
+            index.add(i, _variant(rng))
+        assert index.cluster_size(4) == 5
+        index.add("new", "완전히 다른 내용의 새 댓글이 들어왔습니다")
+        assert index.cluster_size(4) == 4
+        assert index.weight(0) == 1.0  # 밀려난 댓글
+        assert index.stats()["indexed"] == 5
+
+    def test_keeps_up_with_ingest(self, index):
+        rng = random.Random(4)
+        words = "삼성 하이닉스 오늘 내일 실적 발표 기대 매수 매도 손절 폭락 급등 외인 기관 개미 존버 반등 저점 배당 공시".split()
+        texts = [" ".join(rng.choice(words) for _ in range(rng.randint(5, 12))) for _ in range(10000)]
+        texts += [_variant(rng) for _ in range(300)]
+        rng.shuffle(texts)
+        started = time.perf_counter()
+        for i, text in enumerate(texts):
+            index.add(i, text, author=f"user{rng.randrange(3000)}")
+        assert len(texts) / (time.perf_counter() - started) > 3000  # 댓글/초, 단일 코어
+        assert index.stats()["largest_cluster"] >= 300
+
+
+class TestCommentKey:
+
+    def test_recrawl_keeps_key_and_weight(self, index):
+        text = "하이닉스 HBM 수주 뉴스 보고 추가 매수했어요"
+        for hour in range(3):  # 같은 글을 세 번 수집 (수집 시각만 다름)
+            comment = CommentData("000660", "naver_discuss", text, author="개미", crawled_at=datetime(2026, 1, 5, hour))
+            index.add(comment_key(comment), comment.content, comment.author)
+        assert index.weight(comment_key(comment)) == 1.0
+        assert index.stats()["indexed"] == 1
+        assert index.stats()["duplicates"] == 0
+
+
+class TestWeightedAggregation:
+
+    def test_default_weights_unchanged(self):
+        analyzer = RuleBasedSentimentAnalyzer()
+        results = [analyzer.analyze(t) for t in ("급등 기대", "폭락 손절", "그냥 그렇네")]
+        assert SentimentAggregator.aggregate(results) == SentimentAggregator.aggregate(results, [1.0] * 3)
+
+    def test_spam_flood_does_not_swing_score(self, index):
+        rng = random.Random(5)
+        organic = ["실적 악재 나와서 손절했습니다", "외국인 매도 폭탄 걱정되네요",
+                   "하락 추세라 불안합니다 조심하세요", "오늘도 폭락이네 관리종목 가는거 아님?"]
+        comments = [CommentData("005930", "naver_discuss", t, author=f"개미{i}") for i, t in enumerate(organic)]
+        comments += [
+            CommentData("005930", "naver_discuss", _variant(rng), author=f"봇{i}", crawled_at=datetime(2026, 1, 5, 9, i))
+            for i in range(40)
+        ]
+        analyzer = RuleBasedSentimentAnalyzer()
+
+        naive = SentimentAggregator.aggregate([analyzer.analyze(c.content) for c in comments])
+        weighted = aggregate_comments(comments, analyzer, index)
+        one_copy = SentimentAggregator.aggregate([analyzer.analyze(c.content) for c in comments[:5]])
+
+        assert naive["score"] > 55                         # 복붙 40개가 분위기를 뒤집음
+        assert weighted["score"] < 45                      # 묶음은 댓글 1개 몫
+        assert weighted["total_count"] == 44               # 댓글 수는 그대로
+        assert weighted["score"] == pytest.approx(one_copy["score"], abs=1.0)
@@ -0,0 +1,258 @@
+"""
+곡소리 급변 감지기 TDD 테스트
+실행: pytest backend/tests/test_signals/ -v
+"""
+import random
+import time
+import pytest
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "../../.."))
+
+from datetime import datetime, timedelta
+
+from fastapi.testclient import TestClient
+
+from app.signals import (
+    DatabaseSignalStore, DetectorConfig, MemorySignalStore, SignalEvent, SpikeDetector,
+    BufferedSink, PANIC, VOLUME_SPIKE, NEGATIVE_SHIFT,
+)
+from app.signals.detector import EWStats
+from app.signals.replay import load_comments, replay, synthetic_day
+
+BUCKET = 600
+START = datetime(2026, 1, 5).timestamp()
+
+
+def _feed(detector, code, buckets, volume, negative_rate, rng, offset=0):
+    """buckets 개 구간에 구간당 volume 개 댓글"""
+    for b in range(offset, offset + buckets):
+        for i in range(volume):
+            ts = START + b * BUCKET + (i + 0.5) * BUCKET / volume
+            detector.observe(code, ts, rng.random() < negative_rate)
+
+
+@pytest.fixture
+def events():
+    return []
+
+
+@pytest.fixture
+def detector(events):
+    return SpikeDetector(DetectorConfig(bucket_seconds=BUCKET), sink=events.append)
+
+
+class TestEWStats:
+
+    def test_tracks_mean_and_variance(self):
+        stats = EWStats(alpha=0.01)
+        rng = random.Random(1)
+        for _ in range(20000):
+            stats.update(rng.gauss(10, 2))
+        assert stats.mean == pytest.approx(10, abs=0.5)
+        assert stats.var == pytest.approx(4, rel=0.3)
+
+    def test_clip_limits_outliers(self):
+        stats = EWStats(alpha=0.1)
+        for x in (10, 10, 10):
+            stats.update(x)
+        assert stats.clip(100, limit=3, min_sd=1) == 13
+
+
+class TestSpikeDetector:
+
+    def test_steady_flow_is_quiet(self, detector, events):
+        _feed(detector, "005930", 60, 15, 0.3, random.Random(2))
+        detector.flush(START + 61 * BUCKET)
+        assert [e for e in events if e.kind == PANIC] == []
+
+    def test_panic_burst(self, detector, events):
+        rng = random.Random(3)
+        _feed(detector, "005930", 30, 15, 0.3, rng)
+        _feed(detector, "005930", 1, 120, 0.9, rng, offset=30)
+        detector.flush(START + 40 * BUCKET)
+
+        panic = [e for e in events if e.kind == PANIC]
+        assert len(panic) == 1
+        assert panic[0].stock_code == "005930"
+        assert panic[0].window_start == datetime.fromtimestamp(START + 30 * BUCKET)
+        assert panic[0].volume == 120
+        assert panic[0].baseline_volume < 20
+
+    def test_volume_only_spike(self, detector, events):
+        rng = random.Random(4)
+        _feed(detector, "000660", 30, 15, 0.3, rng)
+        _feed(detector, "000660", 1, 120, 0.3, rng, offset=30)
+        detector.flush(START + 32 * BUCKET)
+        assert {e.kind for e in events} >= {VOLUME_SPIKE}
+        assert PANIC not in {e.kind for e in events}
+
+    def test_no_signal_during_warmup(self, detector, events):
+        rng = random.Random(5)
+        _feed(detector, "005930", 3, 10, 0.3, rng)
+        _feed(detector, "005930", 1, 200, 1.0, rng, offset=3)
+        detector.flush(START + 5 * BUCKET)
+        assert events == []
+
+    def test_sustained_shift_cusum(self, detector, events):
+        rng = random.Random(6)
+        _feed(detector, "035720", 30, 20, 0.25, rng)
+        _feed(detector, "035720", 12, 20, 0.6, rng, offset=30)
+        detector.flush(START + 43 * BUCKET)
+        assert NEGATIVE_SHIFT in {e.kind for e in events}
+
+    def test_cooldown_suppresses_repeats(self, events):
+        detector = SpikeDetector(DetectorConfig(bucket_seconds=BUCKET, cooldown_buckets=10), sink=events.append)
+        rng = random.Random(7)
+        _feed(detector, "005930", 30, 15, 0.3, rng)
+        _feed(detector, "005930", 3, 150, 0.9, rng, offset=30)
+        detector.flush(START + 34 * BUCKET)
+        assert len([e for e in events if e.kind == PANIC]) == 1
+
+    def test_replay_full_day_universe_quickly(self):
+        records, planted = synthetic_day(stocks=200, per_stock=1000, seed=11)
+        found = []
+        detector = SpikeDetector(sink=found.append)
+        started = time.perf_counter()
+        replay(records, detector)
+        assert time.perf_counter() - started < 5.0
+        assert detector.stats()["stocks"] == 200
+        assert {e.stock_code for e in found if e.kind == PANIC} == planted
+
+
+def _event(code, kind=PANIC, minutes=0):
+    end = datetime(2026, 1, 5, 10) + timedelta(minutes=minutes)
+    return SignalEvent(code, kind, end - timedelta(minutes=10), end, 5.0, 100, 0.8, 12.0, 0.3)
+
+
+class TestSignalStores:
+
+    def test_memory_store_filters_newest_first(self):
+        store = MemorySignalStore(max_events=3)
+        store.add([_event("A", minutes=0), _event("B", minutes=10), _event("A", VOLUME_SPIKE, 20), _event("A", minutes=30)])
+        assert [e.window_end.minute for e in store.recent()] == [30, 20, 10]  # 가장 오래된 것은 밀려남
+        assert [e.kind for e in store.recent(stock_code="A")] == [PANIC, VOLUME_SPIKE]
+        assert len(store.recent(kind=PANIC, limit=1)) == 1
+
+    def test_database_store_round_trip(self):
+        from sqlalchemy import create_engine
+        from sqlalchemy.orm import sessionmaker
+        from sqlalchemy.pool import StaticPool
+        from app.models import Base, Stock
+
+        engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+        Base.metadata.create_all(engine)
+        factory = sessionmaker(bind=engine)
+        with factory() as session:
+            session.add_all([Stock(code="005930", name="삼성전자"), Stock(code="000660", name="SK하이닉스")])
+            session.commit()
+
+        store = DatabaseSignalStore(factory)
+        sink = BufferedSink(store, batch_size=2)
+        for event in (_event("005930"), _event("000660", minutes=10), _event("999999", minutes=20)):
+            sink(event)
+        sink.flush()
+        assert sink.written == 2  # 종목 마스터에 없는 종목은 저장하지 않음
+
+        recent = store.recent()
+        assert [e.stock_code for e in recent] == ["000660", "005930"]
+        assert recent[0] == _event("000660", minutes=10)
+        assert store.recent(stock_code="005930", kind=VOLUME_SPIKE) == []
+
+    def test_live_ingest_writes_signals_per_batch(self):
+        from app.comments import RecentComments, ingest
+        from app.crawler.sources import CommentData
+        from app.sentiment.analyzer import RuleBasedSentimentAnalyzer
+
+        class CountingStore(MemorySignalStore):
+            calls = 0
+
+            def add(self, events):
+                CountingStore.calls += 1
+                return super().add(events)
+
+        store = CountingStore()
+        detector = SpikeDetector(DetectorConfig(bucket_seconds=BUCKET), sink=BufferedSink(store))
+        rng = random.Random(8)
+        comments = []
+        for code in ("005930", "000660"):
+            for b in range(32):
+                volume, negative = (120, 0.9) if b == 30 else (15, 0.3) if b < 30 else (1, 0.0)
+                for i in range(volume):
+                    text = "폭락 손절합니다" if rng.random() < negative else "그냥 보는중"
+                    comments.append(CommentData(code, "naver_discuss", text, author=f"u{b}-{i}",
+                                                crawled_at=datetime.fromtimestamp(START + b * BUCKET + i)))
+
+        ingest(comments, RuleBasedSentimentAnalyzer(), RecentComments(capacity=10), detector, newest_first=False)
+        assert {(e.stock_code, e.kind) for e in store.recent()} >= {("005930", PANIC), ("000660", PANIC)}
+        assert CountingStore.calls == 1  # 신호마다가 아니라 배치마다 한 번 저장
+
+    def test_steady_crawl_batches_are_quiet(self):
+        from app.comments import RecentComments, ingest
+        from app.crawler.sources import CommentData
+        from app.sentiment.analyzer import RuleBasedSentimentAnalyzer
+
+        events = []
+        detector = SpikeDetector(DetectorConfig(bucket_seconds=BUCKET), sink=events.append)
+        recent = RecentComments(capacity=10)
+        rng = random.Random(9)
+        interval = 4 * 3600
+        for crawl in range(30):  # 4시간마다 지난 4시간치 100건 (목록 순서 = 최신순)
+            crawled_at = datetime.fromtimestamp(START + (crawl + 1) * interval)
+            batch = [
+                CommentData("005930", "naver_discuss", "폭락 손절합니다" if rng.random() < 0.3 else "그냥 보는중",
+                            author=f"u{crawl}-{i}", crawled_at=crawled_at,
+                            posted_at=datetime.fromtimestamp(START + crawl * interval + (i + 0.5) * interval / 100))
+                for i in reversed(range(100))
+            ]
+            ingest(batch, RuleBasedSentimentAnalyzer(), recent, detector)
+
+        assert events == []  # 수집 시각으로 넣으면 배치마다 volume_spike
+        _, comments = recent.page("005930", size=1)
+        assert comments[0]["crawled_at"] == batch[0].posted_at.isoformat()  # 버퍼도 게시 시각 (warm_load 와 같음)
+
+    def test_shared_detector_buffers_signals(self):
+        from app.signals import detector as detector_module
+
+        saved = detector_module._detector
+        detector_module._detector = None
+        try:
+            assert isinstance(detector_module.get_detector().sink, BufferedSink)
+        finally:
+            detector_module._detector = saved
+
+
+class TestReplayInput:
+
+    def test_load_jsonl_with_and_without_labels(self, tmp_path):
+        path = tmp_path / "comments.jsonl"
+        path.write_text(
+            '{"stock_code": "005930", "crawled_at": "2026-01-05T09:00:00", "sentiment": "negative"}\n'
+            '{"stock_code": "005930", "crawled_at": 1767571200, "content": "폭락 손절 악재"}\n'
+            '{"stock_code": "005930", "crawled_at": 1767571300, "content": "급등 기대 매수"}\n',
+            encoding="utf-8",
+        )
+        records = list(load_comments(path))
+        assert [r[2] for r in records] == [True, True, False]
+        assert records[1][1] == 1767571200.0
+
+
+class TestSignalsAPI:
+
+    @pytest.fixture
+    def client(self):
+        from app.main import app
+        return TestClient(app)
+
+    def test_list_and_filter(self, client):
+        from app.signals import get_signal_store
+        get_signal_store().add([_event("005930", minutes=1000), _event("000660", VOLUME_SPIKE, 1001)])
+
+        data = client.get("/api/signals/", params={"limit": 2}).json()
+        assert [s["stock_code"] for s in data["signals"]] == ["000660", "005930"]
+
+        one = client.get("/api/signals/005930", params={"kind": PANIC}).json()
+        assert one["stock_code"] == "005930"
+        assert all(s["kind"] == PANIC for s in one["signals"])
+
+        assert client.get("/api/signals/", params={"kind": "nope"}).status_code == 400
@@ -0,0 +1,116 @@
+"""
+실시간 점수 브로드캐스터 TDD 테스트
+실행: pytest backend/tests/test_stream/ -v
+"""
+import asyncio
+import json
+import threading
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "../../.."))
+
+from app.board import StockBoard
+from app.stream import ScoreBroadcaster, compute_deltas
+
+
+def _row(code, score, grade="C", trend="neutral", change=0.0):
+    return {"code": code, "name": code, "score": score, "grade": grade, "trend": trend, "score_change": change}
+
+
+class TestComputeDeltas:
+
+    def test_only_changed_rows(self):
+        board = StockBoard(loader=lambda: [_row("A", 50.0), _row("B", 60.0)])
+        prev = board.snapshot
+        new = board.refresh([_row("A", 50.0), _row("B", 40.0, "D", "down", -20.0)])
+        deltas = compute_deltas(prev, new)
+        assert deltas == [{"code": "B", "score": 40.0, "grade": "D", "trend": "down", "score_change": -20.0}]
+
+    def test_first_snapshot_is_full(self):
+        board = StockBoard()
+        new = board.refresh([_row("A", 50.0)])
+        assert len(compute_deltas(None, new)) == 1
+
+
+class TestScoreBroadcaster:
+
+    def test_publish_and_since(self):
+        b = ScoreBroadcaster(history=3)
+        assert b.publish([]) is None
+        for i in range(5):
+            b.publish([{"code": str(i)}])
+        events, reset = b.since(3)
+        assert [e.seq for e in events] == [4, 5]
+        assert not reset
+        assert json.loads(events[0].data) == [{"code": "3"}]
+
+    def test_since_out_of_range_resets(self):
+        b = ScoreBroadcaster(history=2)
+        for i in range(5):
+            b.publish([{"code": str(i)}])
+        assert b.since(1) == ([], True)     # 보관 범위 밖
+        assert b.since(99) == ([], True)    # 서버 재시작 등으로 커서가 앞섬
+        assert b.since(5) == ([], False)
+
+    def test_wait_wakes_on_publish_from_other_thread(self):
+        b = ScoreBroadcaster()
+
+        async def scenario():
+            waiters = [asyncio.create_task(b.wait(0, timeout=5)) for _ in range(50)]
+            await asyncio.sleep(0.01)
+            threading.Thread(target=b.publish, args=([{"code": "A"}],)).start()
+            return await asyncio.gather(*waiters)
+
+        results = asyncio.run(scenario())
+        assert all([e.seq for e in events] == [1] and not reset for events, reset in results)
+
+    def test_wait_timeout(self):
+        b = ScoreBroadcaster()
+        assert asyncio.run(b.wait(0, timeout=0.01)) == ([], False)
+
+    def test_board_listener_publishes(self):
+        b = ScoreBroadcaster()
+        board = StockBoard(loader=lambda: [_row("A", 50.0)])
+        board.snapshot
+        board.subscribe(b.on_board_refresh)
+        board.refresh([_row("A", 50.0)])
+        assert b.latest_seq == 0  # 변경 없음
+        board.refresh([_row("A", 70.0, "B", "up", 20.0)])
+        assert b.latest_seq == 1
+
+
+class TestStreamResume:
+
+    async def _first_events(self, last_event_id, count):
+        from app.api.stream import stream_scores
+
+        response = await stream_scores(since=None, last_event_id=last_event_id)
+        events = response.body_iterator
+        chunks = [await asyncio.wait_for(events.__anext__(), 5) for _ in range(count)]
+        await events.aclose()
+        return [dict(line.split(": ", 1) for line in c.strip().splitlines() if ": " in line) for c in chunks]
+
+    def test_resumes_own_ids(self, monkeypatch):
+        from app.stream import broadcaster as module
+
+        b = ScoreBroadcaster()
+        monkeypatch.setattr(module, "_broadcaster", b)
+        b.publish([{"code": "A"}])
+        missed = b.publish([{"code": "B"}])
+        ready, scores = asyncio.run(self._first_events(b.event_id(missed - 1), 2))
+        assert ready["event"] == "ready"
+        assert (scores["event"], scores["id"]) == ("scores", b.event_id(missed))
+        assert json.loads(scores["data"]) == [{"code": "B"}]
+
+    def test_foreign_id_forces_resync(self, monkeypatch):
+        from app.stream import broadcaster as module
+
+        b = ScoreBroadcaster()
+        monkeypatch.setattr(module, "_broadcaster", b)
+        for code in "ABC":
+            b.publish([{"code": code}])
+        other = ScoreBroadcaster()  # 다른 워커 (seq 는 같아도 epoch 가 다름)
+        for key in (other.event_id(1), "2", "garbage"):
+            ready, reset = asyncio.run(self._first_events(key, 2))
+            assert reset["event"] == "reset"
+            assert reset["id"] == b.event_id(3)
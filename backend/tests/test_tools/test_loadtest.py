@@ -0,0 +1,87 @@
+"""
+부하 테스트 하네스 TDD 테스트
+실행: pytest backend/tests/test_tools/ -v
+"""
+import asyncio
+import pytest
+from pathlib import Path
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "../../.."))
+
+import httpx
+
+from app.board.mock import fake_rows
+from app.tools.loadtest import (
+    DEFAULT_PROFILE, build_report, compare, install_fake_backend, parse_profile, percentile, run_load, temp_card_dir,
+)
+
+
+class TestLoadTestHelpers:
+
+    def test_parse_profile(self):
+        assert parse_profile(None) == DEFAULT_PROFILE
+        assert parse_profile("stocks_list=3,analyze=1,share=0") == {"stocks_list": 3.0, "analyze": 1.0}
+        with pytest.raises(ValueError):
+            parse_profile("unknown=1")
+        with pytest.raises(ValueError):
+            parse_profile("share=0")
+
+    def test_percentile_nearest_rank(self):
+        values = [float(i) for i in range(1, 101)]
+        assert percentile(values, 50) == 50.0
+        assert percentile(values, 99) == 99.0
+        assert percentile(values, 100) == 100.0
+        assert percentile([], 50) == 0.0
+
+    def test_fake_rows_seeded(self):
+        rows = fake_rows(7, 120)
+        assert len(rows) == 120
+        assert len({r["code"] for r in rows}) == 120
+        assert [r["code"] for r in fake_rows(7, 120)] == [r["code"] for r in rows]
+        assert [r["code"] for r in fake_rows(8, 120)] != [r["code"] for r in rows]
+
+    def test_compare_against_baseline(self):
+        def report(p50, p99, rps):
+            return {"overall": {"latency_ms": {"p50": p50, "p99": p99}, "rps": rps}, "endpoints": {}}
+        delta = compare(report(2.0, 10.0, 90.0), report(1.0, 10.0, 100.0))
+        assert delta["overall"] == {"p50": 100.0, "p99": 0.0, "rps": -10.0}
+
+
+@pytest.fixture
+def restore_board():
+    yield
+    from app.board import get_board
+    from app.board.mock import mock_rows
+    get_board().refresh(mock_rows())
+
+
+class TestRunLoad:
+
+    def test_inproc_run_report(self, restore_board):
+        from app.cards import get_card_store
+        from app.main import app
+
+        configured = get_card_store().directory
+
+        async def scenario():
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://loadtest") as client:
+                return await run_load(client, codes, DEFAULT_PROFILE, concurrency=4, duration=None,
+                                      total_requests=60, seed=1)
+
+        with temp_card_dir() as directory:
+            codes = install_fake_backend(seed=3, stocks=80)
+            assert len(codes) == 80
+            assert get_card_store().directory == Path(directory)
+            stats, elapsed = asyncio.run(scenario())
+        assert get_card_store().directory == configured
+        assert not Path(directory).exists()
+        report = build_report(stats, elapsed, {"target": "inproc"})
+
+        assert report["overall"]["requests"] == 60
+        assert report["overall"]["errors"] == 0
+        assert set(report["endpoints"]) == set(DEFAULT_PROFILE)
+        for summary in report["endpoints"].values():
+            assert set(summary["statuses"]) <= {"200"}
+            assert summary["latency_ms"]["p50"] <= summary["latency_ms"]["p99"] <= summary["latency_ms"]["max"]
@@ -0,0 +1,41 @@
+"""
+기동 시간 벤치마크 / 지연 로딩 TDD 테스트
+실행: pytest backend/tests/test_tools/ -v
+"""
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "../../.."))
+
+from app.tools.startup_bench import measure_startup, parse_importtime
+
+
+class TestStartupBench:
+
+    def test_parse_importtime(self):
+        stderr = (
+            "import time: self [us] | cumulative | imported package\n"
+            "import time:       120 |        120 |   _io\n"
+            "import time:      3000 |       5000 | app.main\n"
+        )
+        assert parse_importtime(stderr) == [("_io", 120, 120), ("app.main", 3000, 5000)]
+
+    def test_app_cold_start_skips_heavy_modules(self):
+        report = measure_startup("app.main", budget=30.0)
+        assert report.heavy_loaded == []
+        assert report.ok
+        assert any(name == "app.main" for name, _, _ in report.imports)
+
+
+class TestLazyLoading:
+
+    def test_analyzer_created_on_first_use(self):
+        from app.sentiment import loader
+        from app.sentiment.analyzer import RuleBasedSentimentAnalyzer
+        analyzer = loader.get_analyzer()
+        assert isinstance(analyzer, RuleBasedSentimentAnalyzer)
+        assert loader.get_analyzer() is analyzer
+
+    def test_missing_model_falls_back_to_rules(self):
+        from app.sentiment.loader import _create
+        from app.sentiment.analyzer import RuleBasedSentimentAnalyzer
+        assert isinstance(_create("/nonexistent/model"), RuleBasedSentimentAnalyzer)
@@ -23,8 +23,10 @@ function toast(msg) {
 
 async function loadDetail() {
   try {
-    const res = await fetch(`${API_BASE}/stocks/${STOCK_CODE}`);
-    const data = await res.json();
+    // 상세 + 댓글 + 공유 + 30일 추이를 한 번에
+    const res = await fetch(`${API_BASE}/stocks/${STOCK_CODE}/bundle`);
+    const bundle = await res.json();
+    const data = { ...bundle.detail, comments: bundle.comments.comments };
 
     document.getElementById('detailLoading').style.display  = 'none';
     document.getElementById('detailContent').style.display = 'block';
@@ -59,12 +61,11 @@ async function loadDetail() {
       `https://dart.fss.or.kr/corp/searchCorp.do?firmName=${encodeURIComponent(data.name)}`;
 
     // 차트
-    if (data.score_history) renderChart(data.score_history);
+    renderChart(bundle.history || data.score_history);
 
     // 공유 버튼
     document.getElementById('detailKakaoShare').addEventListener('click', async () => {
-      const share = await fetch(`${API_BASE}/share/${STOCK_CODE}`).then(r => r.json());
-      await navigator.clipboard.writeText(share.share_text);
+      await navigator.clipboard.writeText(bundle.share.share_text);
       toast('📋 공유 텍스트가 복사되었습니다!');
     });
     document.getElementById('detailLinkCopy').addEventListener('click', () => {
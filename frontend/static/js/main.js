@@ -6,6 +6,8 @@
 'use strict';
 
 // ── 상태 관리 ──────────────────────────────────────────────────────────────
+const SPARK_DAYS = 30;
+
 const State = {
   currentPage: 1,
   pageSize: 50,
@@ -13,36 +15,157 @@ const State = {
   search: '',
   totalStocks: 0,
   allStocks: [],
+  bundles: new Map(),   // 종목코드 → 미리 불러온 번들 (현재 페이지)
   currentStock: null,
   chartInstance: null,
 };
 
+// ── 컬럼형 바이너리 응답 (Accept: application/vnd.goksori.columnar) ─────────────
+// "GKC1" | u32 헤더 길이 | 헤더 JSON | 열 데이터 (4바이트 정렬) → 숫자 열은 TypedArray 뷰로 복사 없이 읽음
+const Columnar = {
+  TYPE: 'application/vnd.goksori.columnar',
+  MISSING: 0xffff,
+  ARRAYS: { u8: Uint8Array, u16: Uint16Array, i16: Int16Array, u32: Uint32Array },
+
+  async fetch(url) {
+    const res = await fetch(url, { headers: { Accept: Columnar.TYPE } });
+    if (!res.ok) return res;
+    // 정적 스냅샷 등 JSON 으로 응답한 경우는 그대로
+    if (!(res.headers.get('content-type') || '').startsWith(Columnar.TYPE)) return res;
+    const decoded = Columnar.decode(await res.arrayBuffer());
+    return { ok: true, json: async () => Columnar[decoded.header.kind](decoded) };
+  },
+
+  decode(buffer) {
+    const text = new TextDecoder();
+    if (text.decode(new Uint8Array(buffer, 0, 4)) !== 'GKC1') throw new Error('알 수 없는 응답 형식');
+    const headerLength = new DataView(buffer).getUint32(4, true);
+    const header = JSON.parse(text.decode(new Uint8Array(buffer, 8, headerLength)));
+    const base = 8 + headerLength;
+    const columns = {};
+    header.columns.forEach(col => {
+      const offset = base + col.offset;
+      if (col.type === 'str') {
+        columns[col.name] = header.rows ? text.decode(new Uint8Array(buffer, offset, col.length)).split('\n') : [];
+      } else if (col.type === 'enum') {
+        columns[col.name] = Array.from(new Uint8Array(buffer, offset, col.length), i => col.values[i]);
+      } else {
+        columns[col.name] = new Columnar.ARRAYS[col.type](buffer, offset, col.length);
+        columns[col.name].scale = col.scale || 1;
+      }
+    });
+    return { header, columns };
+  },
+
+  addDays(isoDate, days) {
+    const d = new Date(`${isoDate}T00:00:00Z`);
+    d.setUTCDate(d.getUTCDate() + days);
+    return d.toISOString().slice(0, 10);
+  },
+
+  history({ header, columns }) {
+    const { day, score } = columns;
+    return {
+      stock_code: header.stock_code,
+      history: Array.from(day, (offset, i) => ({
+        date: Columnar.addDays(header.base_date, offset),
+        score: score[i] / score.scale,
+      })),
+    };
+  },
+
+  stocks({ header, columns: c }) {
+    const base = new Date(header.base_time).getTime();
+    const days = header.spark ? header.spark.days : 0;
+    const stocks = c.code.map((code, i) => {
+      const stock = {
+        code, name: c.name[i], sector: c.sector[i],
+        score: c.score[i] / c.score.scale,
+        grade: c.grade[i], emoji: c.emoji[i], trend: c.trend[i],
+        score_change: c.score_change[i] / c.score_change.scale,
+        positive_count: c.positive_count[i], negative_count: c.negative_count[i],
+        neutral_count: c.neutral_count[i], total_count: c.total_count[i],
+        updated_at: new Date(base + c.updated_at[i] * 1000).toISOString(),
+      };
+      if (days) {
+        // 스파크라인은 행 × 일 행렬의 한 행 (빈 날은 null)
+        stock.spark = Array.from(c.spark.subarray(i * days, (i + 1) * days),
+          v => (v === Columnar.MISSING ? null : v / c.spark.scale));
+      }
+      return stock;
+    });
+    return { total: header.total, page: header.page, size: header.size, stocks };
+  },
+};
+
 // ── API ────────────────────────────────────────────────────────────────────
 const API = {
   base: '/api',
 
   async getStocks(page = 1, size = 50, sort = 'score_desc', search = '') {
-    const params = new URLSearchParams({ page, size, sort });
+    // 기본값은 생략 → 첫 화면은 정적 스냅샷(/api/stocks/)으로 바로 응답
+    const params = new URLSearchParams();
+    if (page !== 1) params.append('page', page);
+    if (size !== 50) params.append('size', size);
+    if (sort !== 'score_desc') params.append('sort', sort);
     if (search) params.append('search', search);
-    const res = await fetch(`${API.base}/stocks/?${params}`);
+    const qs = params.toString();
+    const res = await fetch(`${API.base}/stocks/${qs ? `?${qs}` : ''}`);
     if (!res.ok) throw new Error('종목 데이터 로딩 실패');
     return res.json();
   },
 
+  async getSparklines(page = 1, size = 50, sort = 'score_desc', search = '', days = SPARK_DAYS) {
+    // 그리드 전체 행의 N일 추이를 컬럼형 바이너리 요청 한 번으로
+    const params = new URLSearchParams({ page, size, sort, spark: days });
+    if (search) params.append('search', search);
+    const res = await Columnar.fetch(`${API.base}/stocks/?${params}`);
+    if (!res.ok) throw new Error('추이 로딩 실패');
+    return res.json();
+  },
+
   async getStockDetail(code) {
     const res = await fetch(`${API.base}/stocks/${code}`);
     if (!res.ok) throw new Error('종목 상세 로딩 실패');
     return res.json();
   },
 
+  async getBundle(code) {
+    // 기본 번들(전체 항목, 30일 추이)은 정적 스냅샷으로 서빙 가능하도록 쿼리 없이 요청
+    const res = await fetch(`${API.base}/stocks/${code}/bundle`);
+    if (!res.ok) throw new Error('종목 상세 로딩 실패');
+    return res.json();
+  },
+
+  async getBundles(codes, fields = 'detail,comments,share') {
+    const params = new URLSearchParams({ codes: codes.join(','), fields });
+    const res = await fetch(`${API.base}/stocks/bundle?${params}`);
+    if (!res.ok) throw new Error('번들 로딩 실패');
+    return res.json();
+  },
+
+  async getSectors() {
+    const res = await fetch(`${API.base}/sectors`);
+    if (!res.ok) throw new Error('업종 집계 로딩 실패');
+    return res.json();
+  },
+
   async getShareData(code) {
     const res = await fetch(`${API.base}/share/${code}`);
     if (!res.ok) throw new Error('공유 데이터 로딩 실패');
     return res.json();
   },
 
+  async autocomplete(q, limit = 8) {
+    const params = new URLSearchParams({ q, limit });
+    const res = await fetch(`${API.base}/stocks/autocomplete?${params}`);
+    if (!res.ok) throw new Error('자동완성 로딩 실패');
+    return res.json();
+  },
+
   async getScoreHistory(code, days = 30) {
-    const res = await fetch(`${API.base}/sentiment/${code}/history?days=${days}`);
+    const qs = days === 30 ? '' : `?days=${days}`;
+    const res = await Columnar.fetch(`${API.base}/sentiment/${code}/history${qs}`);
     if (!res.ok) throw new Error('히스토리 로딩 실패');
     return res.json();
   },
@@ -62,6 +185,14 @@ const Utils = {
     return 'bar-color-low';
   },
 
+  scoreEmoji(score) {
+    if (score >= 70) return '🔥';
+    if (score >= 55) return '📈';
+    if (score >= 45) return '😐';
+    if (score >= 30) return '📉';
+    return '💀';
+  },
+
   trendLabel(trend) {
     const map = { up: '📈 상승', down: '📉 하락', neutral: '➡️ 중립' };
     return map[trend] || trend;
@@ -136,6 +267,7 @@ const Render = {
         <div class="score-bar-wrap">
           <div class="score-bar-fill ${barClass}" style="width:${stock.score}%"></div>
         </div>
+        <svg class="sparkline" data-code="${stock.code}" viewBox="0 0 100 20" preserveAspectRatio="none"></svg>
       </div>
 
       <!-- 추세 / 등급 -->
@@ -166,22 +298,46 @@ const Render = {
     }
 
     // 이벤트 바인딩
-    grid.querySelectorAll('.stock-row').forEach(row => {
-      row.addEventListener('click', () => Modal.open(row.dataset.code, row.dataset.name));
-    });
+    grid.querySelectorAll('.stock-row').forEach(Render.bindRow);
+  },
+
+  bindRow(row) {
+    row.addEventListener('click', () => Modal.open(row.dataset.code, row.dataset.name));
   },
 
-  statsBar(stocks, total) {
-    const hot  = stocks.filter(s => s.score >= 70).length;
-    const cold = stocks.filter(s => s.score <= 30).length;
-    const avg  = stocks.length
-      ? (stocks.reduce((a, s) => a + s.score, 0) / stocks.length).toFixed(1)
-      : '-';
+  patchRow(stock, rank) {
+    // 행 하나만 다시 그림 - 이미 그린 스파크라인 SVG 는 새 행으로 옮겨 유지
+    const row = document.querySelector(`#stockGrid .stock-row[data-code="${stock.code}"]`);
+    if (!row) return;
+    const tpl = document.createElement('template');
+    tpl.innerHTML = Render.stockRow(stock, rank).trim();
+    const fresh = tpl.content.firstElementChild;
+    fresh.querySelector('.sparkline').replaceWith(row.querySelector('.sparkline'));
+    Render.bindRow(fresh);
+    row.replaceWith(fresh);
+  },
+
+  sparklines(stocks) {
+    // 점수 0~100 → 높이 20, 빈 날은 건너뜀
+    const byCode = new Map(stocks.map(s => [s.code, s.spark || []]));
+    document.querySelectorAll('#stockGrid .sparkline').forEach(svg => {
+      const spark = byCode.get(svg.dataset.code);
+      if (!spark || spark.length < 2) return;
+      const step = 100 / (spark.length - 1);
+      const points = spark
+        .map((v, i) => (v === null ? null : `${(i * step).toFixed(1)},${(20 - v / 5).toFixed(1)}`))
+        .filter(Boolean)
+        .join(' ');
+      svg.innerHTML = `<polyline points="${points}" />`;
+    });
+  },
 
-    document.getElementById('statTotal').textContent = total;
-    document.getElementById('statHot').textContent   = `${hot}개`;
-    document.getElementById('statCold').textContent  = `${cold}개`;
-    document.getElementById('statAvg').textContent   = `${avg}점`;
+  statsBar(market) {
+    // 시장 전체 집계는 서버(/api/sectors)에서 댓글 수 가중으로 계산
+    document.getElementById('statTotal').textContent = market.stock_count;
+    document.getElementById('statHot').textContent   = `${market.hot_count}개`;
+    document.getElementById('statCold').textContent  = `${market.cold_count}개`;
+    document.getElementById('statAvg').textContent   = `${market.score.toFixed(1)}점`;
     document.getElementById('statNextUpdate').textContent = Utils.nextUpdateTime();
     document.getElementById('lastUpdate').textContent =
       `${new Date().toLocaleTimeString('ko-KR', {hour:'2-digit', minute:'2-digit'})} 업데이트`;
@@ -206,20 +362,24 @@ async function loadStocks() {
   document.getElementById('stockGrid').style.display = 'none';
 
   try {
-    const data = await API.getStocks(
-      State.currentPage, State.pageSize, State.sort, State.search
-    );
+    const [data, sectors] = await Promise.all([
+      API.getStocks(State.currentPage, State.pageSize, State.sort, State.search),
+      API.getSectors().catch(() => null),
+    ]);
 
     State.totalStocks = data.total;
     State.allStocks   = data.stocks;
 
     Render.stockGrid(data.stocks);
-    Render.statsBar(data.stocks, data.total);
+    if (sectors) Render.statsBar(sectors.market);
     Render.pagination(data.total, State.currentPage, State.pageSize);
 
     document.getElementById('loadingState').style.display = 'none';
     document.getElementById('stockGrid').style.display    = 'flex';
 
+    prefetchBundles(data.stocks.map(s => s.code));
+    loadSparklines();
+
   } catch (err) {
     document.getElementById('loadingState').innerHTML =
       `<p style="color:var(--negative)">⚠️ 데이터 로딩 실패: ${err.message}</p>`;
@@ -227,6 +387,30 @@ async function loadStocks() {
   }
 }
 
+// 보이는 행의 모달 데이터를 한 번의 요청으로 미리 받아둠 (유휴 시간에)
+function prefetchBundles(codes) {
+  State.bundles.clear();
+  if (!codes.length) return;
+  const run = async () => {
+    try {
+      const { bundles } = await API.getBundles(codes);
+      Object.entries(bundles).forEach(([code, b]) => State.bundles.set(code, b));
+    } catch (err) { console.warn(err); }
+  };
+  (window.requestIdleCallback || setTimeout)(run);
+}
+
+// 목록은 정적 스냅샷으로 먼저 그리고, 전체 행의 추이는 바이너리 요청 한 번으로 채움
+function loadSparklines() {
+  const run = async () => {
+    try {
+      const { stocks } = await API.getSparklines(State.currentPage, State.pageSize, State.sort, State.search);
+      Render.sparklines(stocks);
+    } catch (err) { console.warn(err); }
+  };
+  (window.requestIdleCallback || setTimeout)(run);
+}
+
 // ── 모달 ──────────────────────────────────────────────────────────────────
 const Modal = {
   el: null,
@@ -290,7 +474,11 @@ const Modal = {
     document.getElementById('tab-overview').classList.add('active');
 
     try {
-      const data = await API.getStockDetail(code);
+      // 미리 받은 번들이 있으면 요청 없이 바로 표시, 없으면 번들 1회 요청
+      const bundle = State.bundles.get(code) || await API.getBundle(code);
+      const data = { ...bundle.detail, comments: bundle.comments?.comments || [] };
+      data._share = bundle.share;
+      if (bundle.history) data._history = bundle.history;
       State.currentStock = data;
       this.populate(data);
     } catch (err) {
@@ -340,10 +528,7 @@ const Modal = {
     const dartUrl = `https://dart.fss.or.kr/corp/searchCorp.do?firmName=${encodeURIComponent(data.name)}`;
     document.getElementById('dartLink').href = dartUrl;
 
-    // 점수 추이 차트는 탭 클릭 시 로딩 (성능 최적화)
-    if (data.score_history) {
-      State.currentStock._history = data.score_history;
-    }
+    // 점수 추이 차트는 탭 클릭 시 로딩 (번들에 포함됐으면 재요청 없음)
   },
 
   close() {
@@ -440,22 +625,27 @@ const KakaoShare = {
 
   async shareStock(code) {
     try {
-      const data = await API.getShareData(code);
+      const cached = State.currentStock?.code === code
+        ? State.currentStock._share
+        : State.bundles.get(code)?.share;
+      const data = cached || await API.getShareData(code);
 
       if (this.initialized && typeof Kakao !== 'undefined') {
-        Kakao.Share.sendDefault({
-          objectType: 'feed',
-          content: {
-            title: data.kakao_share.title,
-            description: data.kakao_share.description,
-            imageUrl: data.kakao_share.image_url,
-            link: { mobileWebUrl: data.kakao_share.link_url, webUrl: data.kakao_share.link_url },
-          },
-          buttons: [{
-            title: '상세보기',
-            link: { mobileWebUrl: data.kakao_share.link_url, webUrl: data.kakao_share.link_url },
-          }],
-        });
+        const link = { mobileWebUrl: data.kakao_share.link_url, webUrl: data.kakao_share.link_url };
+        const buttons = [{ title: '상세보기', link }];
+        // 카드 이미지가 없는 종목(보드에 없음)은 텍스트 템플릿으로
+        Kakao.Share.sendDefault(data.kakao_share.image_url
+          ? {
+            objectType: 'feed',
+            content: {
+              title: data.kakao_share.title,
+              description: data.kakao_share.description,
+              imageUrl: data.kakao_share.image_url,
+              link,
+            },
+            buttons,
+          }
+          : { objectType: 'text', text: data.share_text, link, buttons });
       } else {
         // 카카오 SDK 없을 때 텍스트 복사 fallback
         await navigator.clipboard.writeText(data.share_text);
@@ -481,10 +671,22 @@ function bindEvents() {
     });
   });
 
-  // 검색
-  let searchTimer;
+  // 검색 (자동완성 + 목록 필터)
+  let searchTimer, suggestTimer;
   document.getElementById('searchInput').addEventListener('input', e => {
     clearTimeout(searchTimer);
+    clearTimeout(suggestTimer);
+    const q = e.target.value.trim();
+    if (q) {
+      suggestTimer = setTimeout(async () => {
+        try {
+          const { results } = await API.autocomplete(q);
+          document.getElementById('searchSuggestions').innerHTML = results
+            .map(r => `<option value="${r.name}">${r.code}</option>`)
+            .join('');
+        } catch (err) { console.warn(err); }
+      }, 100);
+    }
     searchTimer = setTimeout(() => {
       State.search = e.target.value.trim();
       State.currentPage = 1;
@@ -503,6 +705,37 @@ function bindEvents() {
   });
 }
 
+// ── 실시간 점수 스트림 (SSE) ──────────────────────────────────────────────
+const LiveScores = {
+  source: null,
+
+  init() {
+    if (typeof EventSource === 'undefined') return false;
+    // 재접속 시 브라우저가 Last-Event-ID 를 보내 놓친 변경분부터 이어받는다
+    this.source = new EventSource(`${API.base}/stream/scores`);
+    this.source.addEventListener('scores', e => this.apply(JSON.parse(e.data)));
+    this.source.addEventListener('reset', () => loadStocks());
+    return true;
+  },
+
+  apply(deltas) {
+    const byCode = new Map(deltas.map(d => [d.code, d]));
+    let changed = false;
+    State.allStocks.forEach((stock, i) => {
+      const d = byCode.get(stock.code);
+      if (!d) return;
+      Object.assign(stock, d);
+      stock.emoji = Utils.scoreEmoji(stock.score);
+      // 바뀐 행만 제자리에서 다시 그림 (전체 재조회/스파크라인 재요청 없음)
+      Render.patchRow(stock, (State.currentPage - 1) * State.pageSize + i + 1);
+      changed = true;
+    });
+    if (!changed) return;
+    // 시장 집계는 서버가 새 세대로 한 번 계산해 둔 값을 받아옴
+    API.getSectors().then(s => Render.statsBar(s.market)).catch(() => {});
+  },
+};
+
 // ── 자동 새로고침 (4시간마다) ─────────────────────────────────────────────
 function scheduleAutoRefresh() {
   // 1분마다 다음 업데이트 카운트다운 갱신
@@ -511,7 +744,8 @@ function scheduleAutoRefresh() {
     if (el) el.textContent = Utils.nextUpdateTime();
   }, 60_000);
 
-  // 4시간마다 데이터 재로딩
+  // 실시간 스트림을 쓸 수 없는 브라우저만 4시간마다 데이터 재로딩
+  if (LiveScores.init()) return;
   setInterval(() => {
     State.currentPage = 1;
     loadStocks();